@@ -0,0 +1,255 @@
+"""
+Módulo del Almacén de Resultados
+
+Este módulo guarda en una base de datos SQLite local los desarrollos de Taylor ya calculados,
+indexados por el hash de la función, el punto de expansión, el orden y el motor numérico.
+Cada desarrollo conserva sus coeficientes exactos (como srepr de SymPy), el tiempo
+que costó calcularlos, los errores máximos medidos en intervalos, las evaluaciones en puntos
+concretos y las rutas de los archivos generados a partir de él.
+
+Recuperar los coeficientes de un desarrollo guardado es una consulta por índice (milisegundos)
+en lugar de volver a derivar, y los errores por intervalo permiten consultas como "todos los
+desarrollos de f con error < 1e-8 en [a, b]".
+"""
+
+import json
+import os
+import sqlite3
+import time
+import numpy as np
+import sympy as sp
+from typing import Dict, List, Optional, Sequence, Tuple
+from polinomio import PolinomioTaylor
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS expansiones (
+    id INTEGER PRIMARY KEY,
+    func_hash TEXT NOT NULL,
+    funcion TEXT NOT NULL,
+    x0 REAL NOT NULL,
+    orden INTEGER NOT NULL,
+    motor TEXT NOT NULL,
+    metodo TEXT,
+    coeficientes TEXT NOT NULL,
+    tiempo REAL,
+    creado REAL NOT NULL,
+    UNIQUE (func_hash, x0, orden, motor)
+);
+CREATE INDEX IF NOT EXISTS idx_expansiones_punto ON expansiones (func_hash, x0, orden);
+CREATE TABLE IF NOT EXISTS errores (
+    expansion_id INTEGER NOT NULL REFERENCES expansiones (id) ON DELETE CASCADE,
+    minimo REAL NOT NULL,
+    maximo REAL NOT NULL,
+    puntos INTEGER NOT NULL,
+    error_maximo REAL,
+    UNIQUE (expansion_id, minimo, maximo)
+);
+CREATE INDEX IF NOT EXISTS idx_errores_intervalo ON errores (minimo, maximo, error_maximo);
+CREATE TABLE IF NOT EXISTS evaluaciones (
+    expansion_id INTEGER NOT NULL REFERENCES expansiones (id) ON DELETE CASCADE,
+    x REAL NOT NULL,
+    exacto REAL,
+    aproximacion REAL,
+    error REAL,
+    UNIQUE (expansion_id, x)
+);
+CREATE TABLE IF NOT EXISTS artefactos (
+    expansion_id INTEGER NOT NULL REFERENCES expansiones (id) ON DELETE CASCADE,
+    tipo TEXT NOT NULL,
+    ruta TEXT NOT NULL,
+    creado REAL NOT NULL,
+    UNIQUE (expansion_id, tipo, ruta)
+);
+"""
+
+# Nombres de SymPy con los que se reconstruyen los coeficientes a partir de su srepr
+_ESPACIO_SYMPY = {nombre: getattr(sp, nombre) for nombre in dir(sp) if not nombre.startswith("_")}
+_ESPACIO_SYMPY["__builtins__"] = {}
+
+
+def _desde_srepr(texto: str) -> sp.Expr:
+    """
+    Reconstruye una expresión guardada con sp.srepr.
+
+    srepr produce llamadas a constructores de SymPy que eval reconstruye directamente, unas
+    diez veces más rápido que sympify, que vuelve a analizar el texto como una expresión.
+    """
+    return eval(texto, _ESPACIO_SYMPY)
+
+
+class AlmacenResultados:
+    """
+    Almacén SQLite de desarrollos de Taylor, errores, evaluaciones y archivos generados.
+    """
+
+    def __init__(self, ruta: str):
+        """
+        Abre (o crea) el almacén.
+
+        Args:
+            ruta: Ruta del archivo SQLite. ":memory:" crea un almacén temporal en memoria.
+        """
+        directorio = os.path.dirname(ruta)
+        if directorio and ruta != ":memory:":
+            os.makedirs(directorio, exist_ok=True)
+        self.ruta = ruta
+        self.conexion = sqlite3.connect(ruta)
+        self.conexion.row_factory = sqlite3.Row
+        # WAL y synchronous=NORMAL: cada escritura no espera a sincronizar el disco
+        self.conexion.execute("PRAGMA journal_mode=WAL")
+        self.conexion.execute("PRAGMA synchronous=NORMAL")
+        self.conexion.execute("PRAGMA foreign_keys=ON")
+        self.conexion.executescript(ESQUEMA)
+        self.conexion.commit()
+
+    def __enter__(self) -> "AlmacenResultados":
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+    def cerrar(self) -> None:
+        """Cierra la conexión con la base de datos."""
+        self.conexion.close()
+
+    def guardar_expansion(self, func_hash: str, funcion: str, polinomio: PolinomioTaylor,
+                          motor: str, metodo: str = None, tiempo: float = None) -> int:
+        """
+        Guarda (o reemplaza) un desarrollo de Taylor.
+
+        Args:
+            func_hash: Hash de la expresión canónica (AproximacionTaylor.hash_expresion).
+            funcion: La función tal como la escribió el usuario.
+            polinomio: El polinomio con coeficientes exactos.
+            motor: Motor numérico con el que se calculó.
+            metodo: Método con el que se obtuvieron los coeficientes.
+            tiempo: Segundos que costó calcular los coeficientes.
+
+        Returns:
+            El identificador del desarrollo.
+        """
+        coeficientes = json.dumps([sp.srepr(c) for c in polinomio.coeficientes])
+        with self.conexion:
+            self.conexion.execute(
+                "INSERT INTO expansiones (func_hash, funcion, x0, orden, motor, metodo, coeficientes, "
+                "tiempo, creado) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (func_hash, x0, orden, motor) DO UPDATE SET funcion = excluded.funcion, "
+                "metodo = excluded.metodo, coeficientes = excluded.coeficientes, "
+                "tiempo = COALESCE(excluded.tiempo, tiempo)",
+                (func_hash, funcion, float(polinomio.centro), polinomio.orden, motor, metodo,
+                 coeficientes, tiempo, time.time()))
+        return self.identificador(func_hash, float(polinomio.centro), polinomio.orden, motor)
+
+    def identificador(self, func_hash: str, x0: float, orden: int, motor: str) -> Optional[int]:
+        """Devuelve el identificador de un desarrollo guardado, o None si no existe."""
+        fila = self.conexion.execute(
+            "SELECT id FROM expansiones WHERE func_hash = ? AND x0 = ? AND orden = ? AND motor = ?",
+            (func_hash, float(x0), orden, motor)).fetchone()
+        return fila["id"] if fila else None
+
+    def buscar_coeficientes(self, func_hash: str, x0: float, orden: int) -> Optional[Tuple[List[sp.Expr], str]]:
+        """
+        Busca los coeficientes 0..orden de un desarrollo guardado con orden mayor o igual.
+
+        Los coeficientes no dependen del motor numérico, así que sirve el de cualquier motor.
+
+        Returns:
+            Tupla (coeficientes exactos, método), o None si no hay ninguno.
+        """
+        fila = self.conexion.execute(
+            "SELECT coeficientes, metodo FROM expansiones WHERE func_hash = ? AND x0 = ? AND orden >= ? "
+            "ORDER BY orden LIMIT 1", (func_hash, float(x0), orden)).fetchone()
+        if fila is None:
+            return None
+        textos = json.loads(fila["coeficientes"])[:orden + 1]
+        return [_desde_srepr(texto) for texto in textos], fila["metodo"]
+
+    def guardar_error(self, expansion_id: int, rango_x: Tuple[float, float], puntos: int,
+                      error_maximo: float) -> None:
+        """Guarda el error máximo |f - P| medido en un intervalo con el número de puntos indicado."""
+        with self.conexion:
+            self.conexion.execute(
+                "INSERT OR REPLACE INTO errores (expansion_id, minimo, maximo, puntos, error_maximo) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (expansion_id, float(rango_x[0]), float(rango_x[1]), puntos,
+                 None if np.isnan(error_maximo) else float(error_maximo)))
+
+    def guardar_evaluaciones(self, expansion_id: int,
+                             filas: Sequence[Tuple[float, float, float, float]]) -> None:
+        """Guarda las filas (x, exacto, aproximación, error) evaluadas en puntos concretos."""
+        with self.conexion:
+            self.conexion.executemany(
+                "INSERT OR REPLACE INTO evaluaciones (expansion_id, x, exacto, aproximacion, error) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(expansion_id,) + tuple(float(v) for v in fila) for fila in filas])
+
+    def guardar_artefacto(self, expansion_id: int, tipo: str, ruta: str) -> None:
+        """Registra un archivo generado (informe, gráfica, núcleo, animación...) de un desarrollo."""
+        with self.conexion:
+            self.conexion.execute(
+                "INSERT OR REPLACE INTO artefactos (expansion_id, tipo, ruta, creado) VALUES (?, ?, ?, ?)",
+                (expansion_id, tipo, os.path.abspath(ruta), time.time()))
+
+    def consultar(self, func_hash: str = None, x0: float = None, orden_minimo: int = None,
+                  motor: str = None, error_maximo: float = None,
+                  rango_x: Tuple[float, float] = None) -> List[Dict]:
+        """
+        Lista los desarrollos guardados que cumplen los filtros indicados.
+
+        Con error_maximo y/o rango_x solo se devuelven desarrollos con un error medido en un
+        intervalo que contiene a rango_x (el error en un subintervalo no puede ser mayor) y
+        menor que error_maximo.
+
+        Args:
+            func_hash: Hash de la función.
+            x0: Punto de expansión.
+            orden_minimo: Orden mínimo del desarrollo.
+            motor: Motor numérico.
+            error_maximo: Cota superior del error máximo medido.
+            rango_x: Intervalo (min, max) en el que se exige la cota.
+
+        Returns:
+            Lista de diccionarios con funcion, x0, orden, motor, metodo, tiempo, error, intervalo
+            (del error), evaluaciones y artefactos, ordenada por función, x0 y orden.
+        """
+        condiciones, parametros = [], []
+        for columna, operador, valor in (("e.func_hash", "=", func_hash), ("e.x0", "=", x0),
+                                         ("e.orden", ">=", orden_minimo), ("e.motor", "=", motor)):
+            if valor is not None:
+                condiciones.append(f"{columna} {operador} ?")
+                parametros.append(valor)
+
+        filtro_error = error_maximo is not None or rango_x is not None
+        union_errores = "LEFT JOIN errores r ON r.expansion_id = e.id"
+        if filtro_error:
+            union_errores = "JOIN errores r ON r.expansion_id = e.id AND r.error_maximo IS NOT NULL"
+            if rango_x is not None:
+                union_errores += " AND r.minimo <= ? AND r.maximo >= ?"
+                parametros = [float(rango_x[0]), float(rango_x[1])] + parametros
+            if error_maximo is not None:
+                condiciones.append("r.error_maximo < ?")
+                parametros.append(error_maximo)
+
+        donde = f"WHERE {' AND '.join(condiciones)}" if condiciones else ""
+        consulta = f"""
+            SELECT e.id, e.funcion, e.x0, e.orden, e.motor, e.metodo, e.tiempo,
+                   MIN(r.error_maximo) AS error, r.minimo, r.maximo,
+                   (SELECT COUNT(*) FROM evaluaciones v WHERE v.expansion_id = e.id) AS evaluaciones,
+                   (SELECT COUNT(*) FROM artefactos a WHERE a.expansion_id = e.id) AS artefactos
+            FROM expansiones e {union_errores}
+            {donde}
+            GROUP BY e.id
+            ORDER BY e.funcion, e.x0, e.orden, e.motor
+        """
+        resultados = []
+        for fila in self.conexion.execute(consulta, parametros):
+            resultado = dict(fila)
+            minimo, maximo = resultado.pop("minimo"), resultado.pop("maximo")
+            resultado["intervalo"] = (minimo, maximo) if resultado["error"] is not None else None
+            resultados.append(resultado)
+        return resultados
+
+    def artefactos(self, expansion_id: int) -> List[Tuple[str, str]]:
+        """Devuelve los archivos (tipo, ruta) registrados para un desarrollo."""
+        return [(fila["tipo"], fila["ruta"]) for fila in self.conexion.execute(
+            "SELECT tipo, ruta FROM artefactos WHERE expansion_id = ? ORDER BY creado", (expansion_id,))]
@@ -0,0 +1,179 @@
+"""
+Módulo de Animaciones
+
+Este módulo escribe animaciones a partir de una única figura de matplotlib cuyos artistas se
+actualizan en cada fotograma. La figura se dibuja completa una sola vez; en cada fotograma se
+restaura ese fondo y solo se vuelven a dibujar los artistas que cambian (blitting), así que
+los ejes, las marcas y las etiquetas no se recalculan.
+
+Formatos:
+
+- GIF: la cuantización a paleta de cada fotograma se reparte en un grupo de hilos y Pillow
+  escribe el archivo al final.
+- MP4: los fotogramas se envían a ffmpeg, que codifica en su propio proceso en paralelo con
+  el dibujo (requiere ffmpeg instalado).
+- PNG: secuencia de archivos comprimidos en un grupo de hilos (Pillow libera el GIL al comprimir).
+"""
+
+import os
+import shutil
+import subprocess
+import numpy as np
+import matplotlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+from typing import Callable, Iterable, Iterator, List
+
+FORMATOS_ANIMACION = ("gif", "mp4", "png")
+
+
+def formato_animacion(ruta: str) -> str:
+    """
+    Deduce el formato de salida de la ruta: ".gif", ".mp4", ".png" o un directorio (secuencia de PNG).
+
+    Raises:
+        ValueError: Si la extensión no corresponde a ningún formato soportado.
+    """
+    extension = os.path.splitext(ruta)[1].lower().lstrip(".")
+    if not extension:
+        return "png"
+    if extension not in FORMATOS_ANIMACION:
+        raise ValueError(f"Formato de animación no soportado: .{extension}. Opciones: "
+                         f"{', '.join('.' + f for f in FORMATOS_ANIMACION)} o un directorio")
+    return extension
+
+
+def _ruta_ffmpeg() -> str:
+    """Devuelve el ejecutable de ffmpeg configurado en matplotlib, o None si no está instalado."""
+    return shutil.which(matplotlib.rcParams["animation.ffmpeg_path"])
+
+
+def _fotogramas(figura, actualizar: Callable[[int], Iterable], fotogramas: int,
+                dpi: int) -> Iterator[np.ndarray]:
+    """
+    Genera los píxeles RGBA de cada fotograma redibujando solo los artistas que cambian.
+
+    El fondo se captura tras el primer fotograma con los artistas devueltos por actualizar
+    marcados como animados, de modo que el dibujo completo de la figura los omite.
+    """
+    figura.set_dpi(dpi)
+    canvas = figura.canvas
+    artistas = list(actualizar(0))
+    for artista in artistas:
+        artista.set_animated(True)
+    try:
+        canvas.draw()
+        fondo = canvas.copy_from_bbox(figura.bbox)
+        for i in range(fotogramas):
+            if i > 0:
+                artistas = list(actualizar(i))
+            canvas.restore_region(fondo)
+            for artista in artistas:
+                figura.draw_artist(artista)
+            yield np.asarray(canvas.buffer_rgba()).copy()
+    finally:
+        for artista in artistas:
+            artista.set_animated(False)
+
+
+def _escribir_png(pixeles: Iterator[np.ndarray], ruta: str, hilos: int) -> List[str]:
+    """Escribe una secuencia de PNG comprimiendo los fotogramas en paralelo."""
+    if os.path.splitext(ruta)[1]:
+        directorio, prefijo = os.path.split(os.path.splitext(ruta)[0])
+    else:
+        directorio, prefijo = ruta, "fotograma"
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+
+    def guardar(fotograma: np.ndarray, archivo: str) -> None:
+        Image.fromarray(fotograma).save(archivo)
+
+    archivos = []
+    pendientes = deque()
+    with ThreadPoolExecutor(max_workers=hilos) as grupo:
+        for i, fotograma in enumerate(pixeles):
+            archivo = os.path.join(directorio, f"{prefijo}_{i:04d}.png")
+            pendientes.append(grupo.submit(guardar, fotograma, archivo))
+            archivos.append(archivo)
+            # Limitar los fotogramas rasterizados en memoria a la espera de comprimirse
+            while len(pendientes) > 2 * hilos:
+                pendientes.popleft().result()
+        for pendiente in pendientes:
+            pendiente.result()
+    return archivos
+
+
+def _escribir_gif(pixeles: Iterator[np.ndarray], ruta: str, fps: int, hilos: int) -> List[str]:
+    """Escribe un GIF cuantizando los fotogramas a paleta en paralelo."""
+    def cuantizar(fotograma: np.ndarray) -> Image.Image:
+        return Image.fromarray(fotograma).convert("RGB").quantize()
+
+    with ThreadPoolExecutor(max_workers=hilos) as grupo:
+        # Solo se conservan los fotogramas ya cuantizados (1 byte por píxel)
+        imagenes = [futuro.result() for futuro in [grupo.submit(cuantizar, f) for f in pixeles]]
+    imagenes[0].save(ruta, save_all=True, append_images=imagenes[1:], duration=round(1000 / fps), loop=0)
+    return [ruta]
+
+
+def _escribir_mp4(pixeles: Iterator[np.ndarray], ruta: str, fps: int) -> List[str]:
+    """Envía los fotogramas a un proceso de ffmpeg que los codifica en H.264."""
+    proceso = None
+    try:
+        for fotograma in pixeles:
+            if proceso is None:
+                alto, ancho = fotograma.shape[:2]
+                proceso = subprocess.Popen(
+                    [_ruta_ffmpeg(), "-y", "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "rgba",
+                     "-s", f"{ancho}x{alto}", "-r", str(fps), "-i", "-",
+                     "-vcodec", "libx264", "-pix_fmt", "yuv420p", "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+                     ruta],
+                    stdin=subprocess.PIPE)
+            proceso.stdin.write(fotograma.tobytes())
+    finally:
+        if proceso is not None:
+            proceso.stdin.close()
+            if proceso.wait() != 0:
+                raise RuntimeError(f"ffmpeg terminó con código {proceso.returncode} al escribir {ruta}")
+    return [ruta]
+
+
+def escribir_animacion(figura, actualizar: Callable[[int], Iterable], fotogramas: int, ruta: str,
+                       fps: int = 10, dpi: int = 100, hilos: int = None) -> List[str]:
+    """
+    Escribe una animación actualizando los artistas de una misma figura en cada fotograma.
+
+    Args:
+        figura: La figura de matplotlib (con un lienzo Agg o derivado).
+        actualizar: Función que recibe el índice del fotograma, modifica los artistas y devuelve
+            los que cambian a lo largo de la animación, como en FuncAnimation con blit=True.
+        fotogramas: Número de fotogramas.
+        ruta: Archivo .gif o .mp4, patrón .png (se añade _0000, _0001, ...) o directorio
+            para una secuencia de PNG.
+        fps: Fotogramas por segundo (GIF y MP4).
+        dpi: Resolución de los fotogramas.
+        hilos: Hilos de codificación de GIF y PNG. Si es None, usa el número de CPUs.
+
+    Returns:
+        Lista de archivos escritos.
+
+    Raises:
+        ValueError: Si el formato no está soportado o ffmpeg no está disponible para MP4.
+    """
+    if fotogramas < 1:
+        raise ValueError("La animación necesita al menos un fotograma")
+    formato = formato_animacion(ruta)
+    if formato == "mp4" and _ruta_ffmpeg() is None:
+        raise ValueError("Exportar MP4 requiere ffmpeg, que no está instalado; use .gif o una secuencia de PNG")
+
+    hilos = hilos or os.cpu_count() or 1
+    pixeles = _fotogramas(figura, actualizar, fotogramas, dpi)
+    if formato == "png":
+        return _escribir_png(pixeles, ruta, hilos)
+
+    directorio = os.path.dirname(ruta)
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+    if formato == "gif":
+        return _escribir_gif(pixeles, ruta, fps, hilos)
+    return _escribir_mp4(pixeles, ruta, fps)
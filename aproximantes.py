@@ -0,0 +1,171 @@
+"""
+Módulo de Aproximantes Alternativos
+
+Este módulo construye, a partir de los coeficientes de Taylor ya calculados, aproximantes
+más baratos de evaluar lejos del punto de expansión: aproximantes racionales de Padé [L/M]
+y polinomios economizados con series de Chebyshev sobre un intervalo. También compara el
+coste de evaluación de varios aproximantes.
+"""
+
+import time
+import numpy as np
+from typing import Callable, Dict, List, Tuple
+from polinomio import PolinomioTaylor
+
+
+class AproximanteRacional:
+    """
+    Aproximante racional P(x) / Q(x), con P y Q expandidos alrededor del mismo centro y Q(centro) = 1.
+    """
+
+    def __init__(self, numerador: PolinomioTaylor, denominador: PolinomioTaylor):
+        """
+        Inicializa el aproximante.
+
+        Args:
+            numerador: Polinomio P de grado L.
+            denominador: Polinomio Q de grado M.
+        """
+        self.numerador = numerador
+        self.denominador = denominador
+        self.centro = numerador.centro
+
+    @property
+    def grados(self) -> Tuple[int, int]:
+        """Los grados (L, M) del numerador y el denominador."""
+        return self.numerador.orden, self.denominador.orden
+
+    @property
+    def operaciones(self) -> int:
+        """Número de operaciones aritméticas de una evaluación (dos Horner y una división)."""
+        return self.numerador.operaciones + self.denominador.operaciones + 1
+
+    def __repr__(self) -> str:
+        return f"AproximanteRacional(grados={self.grados}, centro={self.centro})"
+
+    def evaluar(self, x):
+        """
+        Evalúa P(x) / Q(x).
+
+        Args:
+            x: Un escalar o arreglo de NumPy con los puntos de evaluación.
+        """
+        return self.numerador.evaluar(x) / self.denominador.evaluar(x)
+
+    def __call__(self, x):
+        return self.evaluar(x)
+
+
+def pade(polinomio: PolinomioTaylor, L: int, M: int) -> AproximanteRacional:
+    """
+    Calcula el aproximante de Padé [L/M] a partir de los coeficientes de Taylor c_0..c_(L+M).
+
+    Los coeficientes b_1..b_M del denominador (con b_0 = 1) resuelven el sistema de Toeplitz
+    sum(b_j * c_(L+i-j), j=1..M) = -c_(L+i) para i = 1..M, y el numerador es
+    a_i = sum(b_j * c_(i-j), j=0..min(i, M)).
+
+    Args:
+        polinomio: Polinomio de Taylor de orden al menos L + M.
+        L: Grado del numerador.
+        M: Grado del denominador.
+
+    Returns:
+        El aproximante racional.
+    """
+    if L < 0 or M < 0:
+        raise ValueError("Los grados del aproximante de Padé deben ser no negativos")
+    if polinomio.orden < L + M:
+        raise ValueError(f"Se necesitan al menos {L + M + 1} coeficientes para el aproximante [{L}/{M}]")
+
+    flotante = polinomio.a_flotantes()
+    c = flotante.coeficientes[:L + M + 1]
+    # c_k = 0 para k < 0
+    coef = lambda k: c[k] if k >= 0 else 0.0
+
+    b = np.ones(M + 1, dtype=c.dtype)
+    if M > 0:
+        indices = L + np.arange(1, M + 1)[:, None] - np.arange(1, M + 1)[None, :]
+        matriz = np.where(indices >= 0, c[np.clip(indices, 0, None)], 0.0)
+        try:
+            b[1:] = np.linalg.solve(matriz, -c[L + 1:L + M + 1])
+        except np.linalg.LinAlgError:
+            raise ValueError(f"El sistema de Padé [{L}/{M}] es singular; pruebe otros grados")
+
+    a = np.array([sum(b[j] * coef(i - j) for j in range(min(i, M) + 1)) for i in range(L + 1)],
+                 dtype=c.dtype)
+    return AproximanteRacional(PolinomioTaylor(a, flotante.centro), PolinomioTaylor(b, flotante.centro))
+
+
+def economizar_chebyshev(polinomio: PolinomioTaylor, rango_x: Tuple[float, float],
+                         tolerancia: float) -> Tuple[PolinomioTaylor, float]:
+    """
+    Reduce el grado de un polinomio en un intervalo mediante economización de Chebyshev.
+
+    El polinomio se expresa en la base de Chebyshev sobre rango_x y se descartan los términos
+    de mayor grado mientras la suma de sus coeficientes (cota de su contribución, pues
+    |T_k| <= 1 en el intervalo) no supere la tolerancia.
+
+    Args:
+        polinomio: El polinomio a economizar.
+        rango_x: Tupla (min_x, max_x) del intervalo.
+        tolerancia: Error máximo admitido por la economización.
+
+    Returns:
+        Tupla (polinomio economizado centrado en el punto medio del intervalo, cota del error añadido).
+    """
+    a, b = rango_x
+    if not a < b:
+        raise ValueError("El intervalo de economización debe cumplir min_x < max_x")
+
+    flotante = polinomio.a_flotantes()
+    medio, radio = (a + b) / 2, (b - a) / 2
+    # x - centro = (medio - centro) + radio * t, con t en [-1, 1]
+    en_t = np.polynomial.Polynomial(flotante.coeficientes)(
+        np.polynomial.Polynomial([medio - flotante.centro, radio]))
+    cheb = np.polynomial.chebyshev.poly2cheb(en_t.coef)
+
+    grado = len(cheb) - 1
+    descartado = 0.0
+    while grado > 0 and descartado + abs(cheb[grado]) <= tolerancia:
+        descartado += abs(cheb[grado])
+        grado -= 1
+
+    en_t = np.polynomial.chebyshev.cheb2poly(cheb[:grado + 1])
+    # Volver a potencias de (x - medio): d_k * t^k = d_k / radio^k * (x - medio)^k
+    coeficientes = en_t / radio ** np.arange(len(en_t))
+    return PolinomioTaylor(coeficientes, medio), float(descartado)
+
+
+def comparar_costes(aproximantes: Dict[str, object], func_num: Callable, x_vals: np.ndarray,
+                    repeticiones: int = 5) -> List[Dict]:
+    """
+    Compara el error máximo y el coste de evaluación de varios aproximantes.
+
+    Args:
+        aproximantes: Diccionario nombre -> objeto con evaluar(x) y la propiedad operaciones.
+        func_num: La función exacta, vectorizada con NumPy.
+        x_vals: Puntos donde medir error y tiempo.
+        repeticiones: Número de evaluaciones cronometradas (se toma la mejor).
+
+    Returns:
+        Lista de diccionarios con "nombre", "operaciones", "tiempo" (segundos por evaluación
+        del arreglo completo) y "error_maximo".
+    """
+    with np.errstate(all='ignore'):
+        exactos = np.broadcast_to(func_num(x_vals), x_vals.shape)
+
+    filas = []
+    for nombre, aproximante in aproximantes.items():
+        mejor = np.inf
+        for _ in range(max(1, repeticiones)):
+            inicio = time.perf_counter()
+            with np.errstate(all='ignore'):
+                valores = aproximante.evaluar(x_vals)
+            mejor = min(mejor, time.perf_counter() - inicio)
+        filas.append({
+            "nombre": nombre,
+            "operaciones": aproximante.operaciones,
+            "tiempo": mejor,
+            "error_maximo": float(np.nanmax(np.abs(exactos - valores))),
+        })
+    return filas
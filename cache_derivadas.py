@@ -0,0 +1,175 @@
+"""
+Módulo de la Caché de Derivadas
+
+Este módulo proporciona una caché de derivadas simbólicas con tamaño medido y límite de
+memoria. El tamaño de cada entrada es el número de nodos distintos de su árbol de SymPy
+multiplicado por una estimación de bytes por nodo; al superar el límite se desalojan las
+entradas usadas hace más tiempo.
+
+Opcionalmente, las expresiones se guardan como un grafo acíclico compartido: cada
+subexpresión se interna en una tabla común, de modo que los subárboles que se repiten entre
+órdenes de derivación se guardan una sola vez. En ese modo la memoria contabilizada es la de
+los nodos distintos de la tabla.
+"""
+
+import sympy as sp
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional
+
+# Bytes aproximados de un nodo de SymPy (objeto, tupla de argumentos, hash y suposiciones en caché)
+BYTES_POR_NODO = 1024
+
+
+def nodos_distintos(expr: sp.Basic) -> List[sp.Basic]:
+    """Devuelve los nodos distintos (por identidad) de una expresión de SymPy."""
+    vistos = {}
+    pendientes = [expr]
+    while pendientes:
+        nodo = pendientes.pop()
+        if id(nodo) in vistos:
+            continue
+        vistos[id(nodo)] = nodo
+        pendientes.extend(nodo.args)
+    return list(vistos.values())
+
+
+def contar_nodos(expr: sp.Basic) -> int:
+    """Cuenta los nodos distintos (por identidad) de una expresión de SymPy."""
+    return len(nodos_distintos(expr))
+
+
+class CacheDerivadas:
+    """
+    Caché orden -> derivada con política LRU y límite de memoria estimada.
+
+    Se usa como un diccionario (in, [], []=, len, get); el desalojo ocurre al insertar.
+    """
+
+    def __init__(self, limite_bytes: Optional[int] = None, compartida: bool = False):
+        """
+        Inicializa la caché.
+
+        Args:
+            limite_bytes: Memoria estimada máxima. Si es None, la caché no tiene límite.
+            compartida: Si se deben internar las subexpresiones para guardar una sola vez
+                los subárboles repetidos entre entradas.
+        """
+        self.limite_bytes = limite_bytes
+        self.compartida = compartida
+        self._entradas = OrderedDict()  # orden -> expresión, de menos a más reciente
+        self._nodos = {}  # orden -> nodos distintos de la entrada
+        self._tabla = {}  # subexpresión -> instancia compartida (modo compartido)
+        self._usos = {}  # id de la subexpresión compartida -> entradas que la contienen
+        self._miembros = {}  # orden -> nodos distintos de la entrada (modo compartido)
+        self.desalojos = 0
+
+    def __contains__(self, orden: int) -> bool:
+        return orden in self._entradas
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._entradas)
+
+    def __getitem__(self, orden: int) -> sp.Expr:
+        expr = self._entradas[orden]
+        self._entradas.move_to_end(orden)
+        return expr
+
+    def get(self, orden: int, por_defecto=None):
+        return self[orden] if orden in self._entradas else por_defecto
+
+    def __setitem__(self, orden: int, expr: sp.Expr) -> None:
+        if orden in self._entradas:
+            self._retirar(orden)
+        if self.compartida:
+            expr = self._internar(expr, {})
+            miembros = nodos_distintos(expr)
+            for nodo in miembros:
+                self._tabla.setdefault(nodo, nodo)
+                self._usos[id(nodo)] = self._usos.get(id(nodo), 0) + 1
+            self._miembros[orden] = miembros
+            self._nodos[orden] = len(miembros)
+        else:
+            self._nodos[orden] = contar_nodos(expr)
+        self._entradas[orden] = expr
+        self._ajustar(proteger=orden)
+
+    def clear(self) -> None:
+        self._entradas.clear()
+        self._nodos.clear()
+        self._tabla.clear()
+        self._usos.clear()
+        self._miembros.clear()
+
+    @property
+    def nodos(self) -> int:
+        """Nodos guardados: los distintos entre todas las entradas si se comparten, o la suma por entrada."""
+        if self.compartida:
+            return len(self._usos)
+        return sum(self._nodos.values())
+
+    @property
+    def bytes_estimados(self) -> int:
+        """Memoria estimada de las expresiones guardadas."""
+        return self.nodos * BYTES_POR_NODO
+
+    def estadisticas(self) -> Dict:
+        """Entradas, nodos, bytes estimados, límite y desalojos de la caché."""
+        return {"entradas": len(self), "nodos": self.nodos, "bytes_estimados": self.bytes_estimados,
+                "limite_bytes": self.limite_bytes, "desalojos": self.desalojos,
+                "compartida": self.compartida}
+
+    def establecer_limite(self, limite_bytes: Optional[int]) -> None:
+        """Cambia el límite de memoria y desaloja entradas si hace falta."""
+        self.limite_bytes = limite_bytes
+        self._ajustar()
+
+    def _retirar(self, orden: int) -> None:
+        """Quita una entrada y, en modo compartido, las subexpresiones que ninguna otra usa."""
+        del self._entradas[orden]
+        del self._nodos[orden]
+        if not self.compartida:
+            return
+        for nodo in self._miembros.pop(orden):
+            usos = self._usos[id(nodo)] - 1
+            if usos:
+                self._usos[id(nodo)] = usos
+            else:
+                del self._usos[id(nodo)]
+                if self._tabla.get(nodo) is nodo:
+                    del self._tabla[nodo]
+
+    def _ajustar(self, proteger: int = None) -> None:
+        """Desaloja las entradas menos recientes hasta cumplir el límite (salvo la protegida)."""
+        if self.limite_bytes is None:
+            return
+        while self.bytes_estimados > self.limite_bytes:
+            candidatos = [orden for orden in self._entradas if orden != proteger]
+            if not candidatos:
+                break
+            self._retirar(candidatos[0])
+            self.desalojos += 1
+
+    def _internar(self, expr: sp.Basic, vistos: Dict) -> sp.Basic:
+        """
+        Reconstruye la expresión reutilizando las subexpresiones ya presentes en la tabla.
+
+        Args:
+            expr: La expresión a internar.
+            vistos: Subexpresiones ya reconstruidas en esta llamada (para las repetidas
+                dentro de la propia expresión).
+        """
+        existente = self._tabla.get(expr)
+        if existente is None:
+            existente = vistos.get(expr)
+        if existente is not None:
+            return existente
+        original = expr
+        if expr.args:
+            argumentos = tuple(self._internar(arg, vistos) for arg in expr.args)
+            if any(nuevo is not viejo for nuevo, viejo in zip(argumentos, expr.args)):
+                expr = expr.func(*argumentos)
+        vistos[original] = expr
+        return expr
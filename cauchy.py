@@ -0,0 +1,206 @@
+"""
+Módulo de Coeficientes de Taylor Numéricos (Integral de Cauchy)
+
+Este módulo obtiene los coeficientes de Taylor de una función analítica sin derivarla,
+a partir de muestras en una circunferencia del plano complejo:
+
+    c_k = 1/(2πi) ∮ f(z) / (z - x0)^(k+1) dz ≈ (1/N) sum_j f(x0 + r ω^j) ω^(-jk) / r^k,
+
+con ω = e^(2πi/N). La regla del trapecio sobre la circunferencia converge geométricamente
+y todos los coeficientes salen de una sola FFT de las N muestras, con coste O(N log N).
+
+El radio r equilibra dos errores: el de redondeo, ε·max|f| / r^k, que crece al reducir r, y
+el de truncamiento (solapamiento de los coeficientes c_(k+N) r^N), que crece al acercarse a
+la singularidad más cercana. Se prueba una malla geométrica creciente de radios hasta el
+primero que encierra una singularidad, y cada coeficiente toma el valor del radio con menor
+error estimado; la misma estimación se devuelve como error de cada coeficiente.
+
+La función puede ser cualquier función de Python o NumPy que acepte arreglos complejos.
+"""
+
+import numpy as np
+from typing import Callable, Dict
+
+# Radios candidatos: RADIO_MINIMO * 2^(k/2), k = 0..2*OCTAVAS_RADIO
+RADIO_MINIMO = 2.0**-10
+OCTAVAS_RADIO = 20
+# Muestras mínimas en la circunferencia y sobremuestreo respecto al número de coeficientes
+MUESTRAS_MINIMAS = 256
+SOBREMUESTREO = 2
+# Fracción final de la FFT (coeficientes altos o potencias negativas) que estima el truncamiento
+FRACCION_COLA = 4
+# Cola máxima relativa a max|f| para aceptar un radio. Por encima, la circunferencia encierra
+# una singularidad (la FFT mide entonces la serie de Laurent exterior) o está demasiado cerca
+TOLERANCIA_COLA = 1e-8
+# Un radio se rechaza también si sus coeficientes difieren de los ya aceptados en más de
+# CONSISTENCIA veces la suma de los errores estimados: la circunferencia ha cruzado una
+# singularidad cuya contribución a max|f| es despreciable (un polo junto a un factor exp(z))
+CONSISTENCIA = 100
+# Bisecciones (en escala logarítmica) entre el mayor radio aceptado y el primero rechazado
+REFINAMIENTOS = 4
+
+
+def numero_muestras(orden: int) -> int:
+    """Potencia de dos con al menos SOBREMUESTREO * (orden + 1) muestras."""
+    return max(MUESTRAS_MINIMAS, 1 << int(np.ceil(np.log2(SOBREMUESTREO * (orden + 1)))))
+
+
+def _muestrear(funcion: Callable, z: np.ndarray) -> np.ndarray:
+    """Evalúa la función en puntos complejos; los valores no finitos quedan como NaN."""
+    with np.errstate(all='ignore'):
+        try:
+            valores = np.asarray(funcion(z), dtype=complex)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"La función debe aceptar arreglos de NumPy complejos: {e}")
+    valores = np.broadcast_to(valores, z.shape)
+    return np.where(np.isfinite(valores), valores, np.nan)
+
+
+def coeficientes_en_radio(funcion: Callable, x0: float, orden: int, radio: float,
+                          muestras: int = None) -> Dict:
+    """
+    Calcula los coeficientes 0..orden con una FFT de muestras en |z - x0| = radio.
+
+    Args:
+        funcion: Función vectorizada que acepta arreglos complejos.
+        x0: Centro del desarrollo.
+        orden: Último coeficiente a calcular.
+        radio: Radio de la circunferencia.
+        muestras: Número de muestras. Si es None, se usa numero_muestras(orden).
+
+    Returns:
+        Diccionario con "coeficientes" (complejos), "errores" (estimación del error absoluto
+        de cada coeficiente), "maximo" (max|f|) y "valido" (False si alguna muestra no es
+        finita o la cola supera TOLERANCIA_COLA; entonces los errores son inf).
+    """
+    muestras = muestras or numero_muestras(orden)
+    z = x0 + radio * np.exp(2j * np.pi * np.arange(muestras) / muestras)
+    valores = _muestrear(funcion, z)
+    invalido = {"coeficientes": np.full(orden + 1, np.nan, dtype=complex),
+                "errores": np.full(orden + 1, np.inf), "maximo": np.inf, "valido": False}
+    if np.isnan(valores).any():
+        return invalido
+
+    # b_k = c_k r^k: coeficientes de la serie escalada, todos de una FFT
+    escalados = np.fft.fft(valores) / muestras
+    maximo = float(np.max(np.abs(valores)))
+    # Redondeo: ε max|f|; truncamiento: lo que queda en la cola de la FFT (coeficientes altos
+    # que se solapan con los bajos, o potencias negativas si hay un polo dentro del círculo)
+    cola = float(np.max(np.abs(escalados[-(muestras // FRACCION_COLA):])))
+    if cola > TOLERANCIA_COLA * maximo:
+        return dict(invalido, maximo=maximo)
+    ruido = np.finfo(float).eps * maximo + cola
+
+    k = np.arange(orden + 1)
+    with np.errstate(over='ignore', under='ignore'):
+        potencias = radio ** -k.astype(float)
+    return {"coeficientes": escalados[:orden + 1] * potencias, "errores": ruido * potencias,
+            "maximo": maximo, "valido": True}
+
+
+def coeficientes_cauchy(funcion: Callable, x0: float, orden: int, radio: float = None,
+                        muestras: int = None) -> Dict:
+    """
+    Calcula los coeficientes de Taylor 0..orden de una función analítica en x0.
+
+    Args:
+        funcion: Función vectorizada que acepta arreglos complejos de NumPy.
+        x0: Centro del desarrollo.
+        orden: Último coeficiente a calcular.
+        radio: Radio de la circunferencia. Si es None, se elige por coeficiente en una malla
+            geométrica de radios (ver el docstring del módulo).
+        muestras: Muestras por circunferencia. Si es None, se usa numero_muestras(orden).
+
+    Returns:
+        Diccionario con "coeficientes" (float64 si la función es real en el eje real, complex128
+        si no), "errores" (error absoluto estimado de cada coeficiente), "radios" (radio usado
+        para cada coeficiente), "error_relativo" (máximo error estimado relativo al mayor
+        coeficiente), "cota" ((M, r): max|f| en el mayor radio aceptado, para acotar el resto)
+        y "evaluaciones" (número de muestras de f).
+
+    Raises:
+        ValueError: Si ningún radio es aceptable (la función no es analítica en x0 o no
+            acepta argumentos complejos).
+    """
+    if orden < 0:
+        raise ValueError("El orden no puede ser negativo")
+    muestras = muestras or numero_muestras(orden)
+    radios = [radio] if radio is not None else RADIO_MINIMO * 2.0**(np.arange(2 * OCTAVAS_RADIO + 1) / 2)
+
+    mejores, errores = None, np.full(orden + 1, np.inf)
+    usados = np.full(orden + 1, np.nan)
+    cota, rechazado, evaluaciones = None, None, 0
+
+    def probar(r: float) -> bool:
+        nonlocal mejores, cota, evaluaciones
+        evaluaciones += muestras
+        resultado = coeficientes_en_radio(funcion, x0, orden, r, muestras)
+        if not resultado["valido"]:
+            return False
+        if mejores is None:
+            mejores = resultado["coeficientes"].copy()
+        else:
+            with np.errstate(all='ignore'):
+                diferencia = np.abs(resultado["coeficientes"] - mejores)
+                permitido = CONSISTENCIA * (resultado["errores"] + errores)
+            if np.any(diferencia > permitido):
+                return False
+        # Cada coeficiente se queda con el radio de menor error estimado
+        mejor = resultado["errores"] < errores
+        mejores[mejor] = resultado["coeficientes"][mejor]
+        errores[mejor] = resultado["errores"][mejor]
+        usados[mejor] = r
+        # El mayor radio aceptado da la cota del resto más amplia
+        if cota is None or r > cota[1]:
+            cota = (resultado["maximo"], r)
+        return True
+
+    # Todos los radios mayores que el primero rechazado encierran la misma singularidad
+    for r in radios:
+        if not probar(float(r)) and cota is not None:
+            rechazado = float(r)
+            break
+
+    # Los coeficientes altos ganan precisión con el radio más cercano a la singularidad:
+    # se afina la frontera entre el último radio aceptado y el primero rechazado
+    if radio is None and cota is not None and rechazado is not None:
+        aceptado = cota[1]
+        for _ in range(REFINAMIENTOS):
+            medio = float(np.sqrt(aceptado * rechazado))
+            if probar(medio):
+                aceptado = medio
+            else:
+                rechazado = medio
+
+    if mejores is None:
+        raise ValueError(f"La función no es analítica en ninguna circunferencia alrededor de x0 = {x0}")
+
+    # Función real en el eje real: la parte imaginaria de los coeficientes es solo ruido
+    if np.all(np.abs(mejores.imag) <= np.maximum(errores, 1e-300) * 10):
+        mejores = mejores.real.copy()
+    escala = float(np.max(np.abs(mejores))) or 1.0
+    return {"coeficientes": mejores, "errores": errores, "radios": usados,
+            "error_relativo": float(np.max(errores) / escala), "cota": cota,
+            "evaluaciones": evaluaciones}
+
+
+def cota_resto(cota, orden: int, distancias: np.ndarray) -> np.ndarray:
+    """
+    Cota de Cauchy del resto de Taylor: |R_n(x)| <= M (t/r)^(n+1) / (1 - t/r), con t = |x - x0| < r.
+
+    Args:
+        cota: Tupla (M, r) con max|f| en |z - x0| = r, como la de coeficientes_cauchy.
+        orden: Orden n del polinomio.
+        distancias: Arreglo de distancias t = |x - x0|.
+
+    Returns:
+        Arreglo con la cota (inf si t >= r o si no hay cota).
+    """
+    distancias = np.abs(np.asarray(distancias, dtype=float))
+    if cota is None:
+        return np.where(distancias == 0, 0.0, np.inf)
+    maximo, radio = cota
+    cociente = distancias / radio
+    with np.errstate(all='ignore'):
+        resto = maximo * cociente**(orden + 1) / (1 - cociente)
+    return np.where(cociente < 1, resto, np.inf)
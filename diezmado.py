@@ -0,0 +1,207 @@
+"""
+Módulo de Diezmado de Curvas
+
+Este módulo reduce curvas muestreadas en millones de puntos a unos pocos miles sin cambiar su
+aspecto al dibujarlas, para exportar los datos de las gráficas a paneles web:
+
+- LTTB (Largest Triangle Three Buckets): divide los puntos en cubos consecutivos y de cada
+  cubo conserva el que forma el triángulo de mayor área con el punto ya elegido del cubo
+  anterior y la media del siguiente. Conserva picos y cambios de pendiente.
+- minmax: divide el rango de x en columnas de igual anchura (una por píxel) y conserva el
+  mínimo y el máximo de cada una, de modo que la envolvente dibujada es exacta.
+
+Los puntos no finitos (singularidades, fuera del dominio) no participan en la selección; entre
+dos puntos conservados que tenían un hueco en medio se conserva un punto no finito, así que las
+curvas se siguen cortando donde se cortaban. Las curvas de error se diezman sobre log10 del
+valor, que es como se dibujan.
+
+Las series se guardan en JSON (listas de números, null en los huecos) o en .npz.
+"""
+
+import json
+import os
+import numpy as np
+from typing import Dict, Tuple
+from informes import _lista_json
+
+METODOS = ("lttb", "minmax")
+# Puntos por serie por defecto (del orden de la anchura en píxeles de una gráfica)
+PUNTOS_SERIE = 2000
+# Puntos en los que se evalúan las curvas por defecto antes de diezmarlas
+MUESTRAS = 10**6
+
+
+def lttb(x: np.ndarray, y: np.ndarray, puntos: int) -> np.ndarray:
+    """
+    Índices de los puntos elegidos por LTTB.
+
+    Args:
+        x, y: Coordenadas finitas, con x creciente.
+        puntos: Número de puntos a conservar (incluidos el primero y el último).
+
+    Returns:
+        Índices crecientes de los puntos conservados.
+    """
+    n = len(x)
+    if puntos >= n:
+        return np.arange(n)
+    if puntos < 3:
+        return np.array([0, n - 1])[:max(puntos, 1)]
+
+    # puntos - 2 cubos interiores entre el primer y el último punto (todos no vacíos porque n > puntos)
+    bordes = np.linspace(1, n - 1, puntos - 1).astype(np.int64)
+    longitudes = np.diff(bordes)
+    medias_x = np.add.reduceat(x[:-1], bordes[:-1]) / longitudes
+    medias_y = np.add.reduceat(y[:-1], bordes[:-1]) / longitudes
+    medias_x = np.append(medias_x[1:], x[-1])
+    medias_y = np.append(medias_y[1:], y[-1])
+
+    seleccion = np.empty(puntos, dtype=np.int64)
+    seleccion[0], seleccion[-1] = 0, n - 1
+    a = 0
+    for i in range(puntos - 2):
+        inicio, fin = bordes[i], bordes[i + 1]
+        # El doble del área del triángulo (a, punto del cubo, media del cubo siguiente)
+        areas = np.abs((x[a] - medias_x[i]) * (y[inicio:fin] - y[a])
+                       - (x[a] - x[inicio:fin]) * (medias_y[i] - y[a]))
+        a = inicio + int(np.argmax(areas))
+        seleccion[i + 1] = a
+    return seleccion
+
+
+def minmax(x: np.ndarray, y: np.ndarray, pixeles: int) -> np.ndarray:
+    """
+    Índices del mínimo y el máximo de y en cada columna de igual anchura del rango de x.
+
+    Args:
+        x, y: Coordenadas finitas, con x creciente.
+        pixeles: Número de columnas; se conservan como mucho 2 * pixeles + 2 puntos.
+
+    Returns:
+        Índices crecientes de los puntos conservados (incluidos el primero y el último).
+    """
+    n = len(x)
+    if 2 * pixeles + 2 >= n:
+        return np.arange(n)
+    inicios = np.unique(np.searchsorted(x, np.linspace(x[0], x[-1], pixeles + 1)[:-1]))
+    finales = np.append(inicios[1:], n)
+    seleccion = np.empty(2 * len(inicios) + 2, dtype=np.int64)
+    seleccion[0], seleccion[-1] = 0, n - 1
+    for i, (inicio, fin) in enumerate(zip(inicios.tolist(), finales.tolist())):
+        columna = y[inicio:fin]
+        seleccion[2 * i + 1] = inicio + int(np.argmin(columna))
+        seleccion[2 * i + 2] = inicio + int(np.argmax(columna))
+    return np.unique(seleccion)
+
+
+def diezmar(x: np.ndarray, y: np.ndarray, puntos: int = PUNTOS_SERIE, metodo: str = "lttb",
+            logaritmico: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce una curva a unos `puntos` puntos conservando su aspecto.
+
+    Args:
+        x: Abscisas crecientes.
+        y: Ordenadas reales; los valores no finitos marcan cortes de la curva.
+        puntos: Puntos finitos a conservar (minmax usa puntos // 2 columnas).
+        metodo: "lttb" o "minmax".
+        logaritmico: Si la curva se dibuja con el eje y logarítmico (errores); la selección se
+            hace sobre log10(y).
+
+    Returns:
+        Tupla (x, y) diezmada. Además de los puntos elegidos, contiene un punto no finito por
+        cada hueco entre ellos, de modo que como mucho tiene 2 * puntos + 1 puntos.
+
+    Raises:
+        ValueError: Si el método es desconocido o puntos no es positivo.
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"Método de diezmado desconocido: {metodo} (disponibles: {', '.join(METODOS)})")
+    if puntos < 1:
+        raise ValueError("El número de puntos por serie debe ser positivo")
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    finitos = np.isfinite(y)
+    indices = np.flatnonzero(finitos)
+    if indices.size == 0:
+        return x[:1], y[:1]
+
+    if indices.size > puntos:
+        # Sin huecos se trabaja sobre los arreglos originales, sin copiar millones de puntos
+        completos = indices.size == y.size
+        abscisas, valores = (x, y) if completos else (x[indices], y[indices])
+        if logaritmico:
+            valores = np.log10(np.maximum(valores, np.finfo(float).tiny))
+        if metodo == "lttb":
+            elegidos = lttb(abscisas, valores, puntos)
+        else:
+            elegidos = minmax(abscisas, valores, max(puntos // 2 - 1, 1))
+        indices = elegidos if completos else indices[elegidos]
+
+    # Un punto no finito por hueco: el primero tras cada punto elegido, si llega antes del siguiente
+    huecos = np.flatnonzero(~finitos)
+    if huecos.size:
+        posiciones = np.searchsorted(huecos, indices, side="right")
+        siguientes = np.append(indices[1:], len(y))
+        validos = posiciones < huecos.size
+        candidatos = huecos[np.minimum(posiciones, huecos.size - 1)]
+        cortes = candidatos[validos & (candidatos < siguientes)]
+        if huecos[0] < indices[0]:
+            cortes = np.append(cortes, huecos[0])
+        indices = np.union1d(indices, cortes)
+    return x[indices], y[indices]
+
+
+def guardar_series(ruta: str, datos: Dict) -> str:
+    """
+    Guarda las series diezmadas en un archivo .json o, con cualquier otra extensión, .npz.
+
+    Args:
+        ruta: Archivo de salida.
+        datos: Metadatos serializables y "series": lista de diccionarios con "nombre", "tipo",
+            "orden", "x" e "y".
+
+    Returns:
+        La ruta del archivo escrito (se añade .npz si falta).
+    """
+    directorio = os.path.dirname(ruta)
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+    metadatos = {clave: valor for clave, valor in datos.items() if clave != "series"}
+    descripciones = [{clave: serie[clave] for clave in ("nombre", "tipo", "orden")} for serie in datos["series"]]
+
+    if ruta.endswith(".json"):
+        # Los metadatos pasan por json; las coordenadas se añaden ya convertidas a texto
+        series = ",".join(f"{json.dumps(descripcion, ensure_ascii=False)[:-1]},"
+                          f"\"x\":{_lista_json(serie['x'])},\"y\":{_lista_json(serie['y'])}}}"
+                          for descripcion, serie in zip(descripciones, datos["series"]))
+        with open(ruta, "w", encoding="utf-8") as f:
+            f.write(json.dumps(metadatos, ensure_ascii=False)[:-1] + (", " if metadatos else ""))
+            f.write(f"\"series\":[{series}]}}")
+        return ruta
+
+    if not ruta.endswith(".npz"):
+        ruta += ".npz"
+    arreglos = {}
+    for serie in datos["series"]:
+        arreglos[f"x_{serie['nombre']}"] = np.asarray(serie["x"], dtype=float)
+        arreglos[f"y_{serie['nombre']}"] = np.asarray(serie["y"], dtype=float)
+    metadatos["series"] = descripciones
+    np.savez_compressed(ruta, metadatos=np.array(json.dumps(metadatos)), **arreglos)
+    return ruta
+
+
+def cargar_series(ruta: str) -> Dict:
+    """Carga las series guardadas con guardar_series (.json o .npz), con x e y como arreglos."""
+    if ruta.endswith(".json"):
+        with open(ruta, encoding="utf-8") as f:
+            datos = json.load(f)
+        for serie in datos["series"]:
+            for eje in ("x", "y"):
+                serie[eje] = np.array([np.nan if v is None else v for v in serie[eje]], dtype=float)
+        return datos
+
+    with np.load(ruta) as archivo:
+        datos = json.loads(str(archivo["metadatos"]))
+        for serie in datos["series"]:
+            serie["x"] = archivo[f"x_{serie['nombre']}"]
+            serie["y"] = archivo[f"y_{serie['nombre']}"]
+    return datos
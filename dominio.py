@@ -0,0 +1,272 @@
+"""
+Módulo de Análisis de Dominio
+
+Este módulo comprueba, antes de derivar, si una función es analítica en el punto de
+expansión. Recorre una sola vez el árbol de la expresión y anota las condiciones que la
+harían singular (denominadores que se anulan, raíces y logaritmos de argumentos nulos o
+negativos, polos de tan/cot, bordes de asin/acos/atanh/acosh) o no analítica (Abs, sign,
+Heaviside, floor, ceiling, frac, Min, Max, Piecewise). Comprobar un punto solo requiere
+evaluar esos argumentos en x0.
+
+Las piezas no analíticas cuyo argumento no está en su punto de ruptura se sustituyen por su
+forma local analítica (por ejemplo, Abs(x - 1) por x - 1 cerca de x0 = 2), que coincide con
+la función en un entorno de x0 y tiene la misma serie de Taylor.
+"""
+
+import sympy as sp
+from typing import List, Tuple
+
+# Valor absoluto por debajo del cual un argumento evaluado en x0 se considera nulo
+TOLERANCIA_CERO = 1e-12
+
+PIEZAS_NO_ANALITICAS = (sp.Abs, sp.sign, sp.Heaviside, sp.floor, sp.ceiling, sp.frac,
+                        sp.Min, sp.Max, sp.Piecewise)
+
+
+class PuntoNoAnalitico(ValueError):
+    """La función es singular, no analítica o no está definida (en los reales) en el punto pedido."""
+
+
+def condiciones_dominio(expr: sp.Expr, x: sp.Symbol) -> List[Tuple[str, sp.Expr, sp.Expr]]:
+    """
+    Anota las subexpresiones que pueden hacer a la función singular o no analítica.
+
+    Args:
+        expr: La expresión de SymPy.
+        x: La variable de la función.
+
+    Returns:
+        Lista de tuplas (tipo, subexpresión, argumento a evaluar en x0), con las subexpresiones
+        internas antes que las externas.
+    """
+    condiciones = []
+    for e in sp.postorder_traversal(expr):
+        if not isinstance(e, sp.Basic) or not e.has(x):
+            continue
+        if e.is_Pow:
+            base, exponente = e.args
+            entero = exponente.is_integer or (exponente.is_Float and float(exponente).is_integer())
+            if exponente.has(x):
+                condiciones.append(("log", e, base))
+            elif exponente.is_number and not entero:
+                condiciones.append(("rama", e, base))
+            elif exponente.is_number and exponente.is_negative:
+                condiciones.append(("polo", e, base))
+        elif isinstance(e, sp.log):
+            condiciones.append(("log", e, e.args[0]))
+        elif isinstance(e, (sp.tan, sp.sec)):
+            condiciones.append(("polo", e, sp.cos(e.args[0])))
+        elif isinstance(e, (sp.cot, sp.csc)):
+            condiciones.append(("polo", e, sp.sin(e.args[0])))
+        elif isinstance(e, (sp.coth, sp.csch)):
+            condiciones.append(("polo", e, e.args[0]))
+        elif isinstance(e, (sp.asin, sp.acos)):
+            condiciones.append(("intervalo", e, e.args[0]))
+        elif isinstance(e, sp.atanh):
+            condiciones.append(("atanh", e, e.args[0]))
+        elif isinstance(e, sp.acosh):
+            condiciones.append(("acosh", e, e.args[0]))
+        elif isinstance(e, PIEZAS_NO_ANALITICAS):
+            condiciones.append(("pieza", e, e))
+    return condiciones
+
+
+def _valor(expr: sp.Expr, x: sp.Symbol, x0) -> complex:
+    """Evalúa una expresión en x0; los valores infinitos o indefinidos se devuelven como NaN."""
+    try:
+        return complex(sp.N(expr.subs(x, x0)))
+    except (TypeError, ValueError):
+        return complex(float("nan"))
+
+
+def _es_cero(valor: complex) -> bool:
+    return abs(valor) <= TOLERANCIA_CERO
+
+
+def _ruptura_pieza(pieza: sp.Expr, x: sp.Symbol, x0) -> bool:
+    """Indica si x0 es un punto de ruptura (salto o esquina) de una pieza no analítica."""
+    if isinstance(pieza, (sp.Abs, sp.sign, sp.Heaviside)):
+        return _es_cero(_valor(pieza.args[0], x, x0))
+    if isinstance(pieza, (sp.floor, sp.ceiling, sp.frac)):
+        valor = _valor(pieza.args[0], x, x0).real
+        return abs(valor - round(valor)) <= TOLERANCIA_CERO
+    if isinstance(pieza, (sp.Min, sp.Max)):
+        valores = sorted(_valor(arg, x, x0).real for arg in pieza.args)
+        extremo = valores[0] if isinstance(pieza, sp.Min) else valores[-1]
+        return sum(abs(v - extremo) <= TOLERANCIA_CERO for v in valores) > 1
+    # Piecewise: x0 en la frontera de alguna condición relacional
+    for _, condicion in pieza.args:
+        for relacion in condicion.atoms(sp.core.relational.Relational):
+            if _es_cero(_valor(relacion.lhs - relacion.rhs, x, x0)):
+                return True
+    return False
+
+
+def verificar_punto(expr: sp.Expr, x: sp.Symbol, x0,
+                    condiciones: List[Tuple[str, sp.Expr, sp.Expr]] = None) -> sp.Expr:
+    """
+    Comprueba que la función es analítica en x0 y devuelve su forma local.
+
+    Args:
+        expr: La expresión de SymPy.
+        x: La variable de la función.
+        x0: El punto de expansión (real).
+        condiciones: Resultado de condiciones_dominio, si ya se calculó.
+
+    Returns:
+        La expresión con las piezas no analíticas sustituidas por su forma en un entorno de x0
+        (la propia expresión si no tiene ninguna).
+
+    Raises:
+        PuntoNoAnalitico: Si x0 es una singularidad, un punto de ramificación, un punto de
+            ruptura de una pieza no analítica o está fuera del dominio real.
+    """
+    if condiciones is None:
+        condiciones = condiciones_dominio(expr, x)
+
+    for tipo, subexpresion, argumento in condiciones:
+        if tipo == "pieza":
+            if _ruptura_pieza(subexpresion, x, x0):
+                raise PuntoNoAnalitico(f"{subexpresion} no es analítica en x0 = {x0} (punto de ruptura)")
+            continue
+
+        valor = _valor(argumento, x, x0)
+        if valor != valor:
+            # El propio argumento es singular: ya lo habría detectado una condición interna
+            continue
+        real = valor.real if abs(valor.imag) <= TOLERANCIA_CERO else None
+
+        if tipo == "polo" and _es_cero(valor):
+            _comprobar_evitable(expr, x, x0)
+            raise PuntoNoAnalitico(f"x0 = {x0} es un polo de {subexpresion}")
+        if tipo in ("rama", "log") and _es_cero(valor):
+            nombre = "una singularidad logarítmica" if tipo == "log" else "un punto de ramificación"
+            raise PuntoNoAnalitico(f"x0 = {x0} es {nombre} de {subexpresion} ({argumento} se anula)")
+        if tipo in ("rama", "log") and real is not None and real < 0:
+            raise PuntoNoAnalitico(f"x0 = {x0} está fuera del dominio real de {subexpresion} "
+                                   f"({argumento} = {real:g} < 0)")
+        if tipo in ("intervalo", "atanh") and real is not None and abs(real) >= 1 - TOLERANCIA_CERO:
+            if abs(real) > 1 + TOLERANCIA_CERO:
+                raise PuntoNoAnalitico(f"x0 = {x0} está fuera del dominio real de {subexpresion} "
+                                       f"(|{argumento}| = {abs(real):g} > 1)")
+            nombre = "una singularidad logarítmica" if tipo == "atanh" else "un punto de ramificación"
+            raise PuntoNoAnalitico(f"x0 = {x0} es {nombre} de {subexpresion} (|{argumento}| = 1)")
+        if tipo == "acosh" and real is not None and real <= 1 + TOLERANCIA_CERO:
+            if real < 1 - TOLERANCIA_CERO:
+                raise PuntoNoAnalitico(f"x0 = {x0} está fuera del dominio real de {subexpresion} "
+                                       f"({argumento} = {real:g} < 1)")
+            raise PuntoNoAnalitico(f"x0 = {x0} es un punto de ramificación de {subexpresion} ({argumento} = 1)")
+
+    local = expresion_local(expr, x, x0) if any(tipo == "pieza" for tipo, _, _ in condiciones) else expr
+
+    # Último recurso: la función debe tener un valor finito en x0 (tan(pi/2) exacto, 0/0, ...)
+    valor = _valor(local, x, x0)
+    if valor != valor or abs(valor) == float("inf"):
+        _comprobar_evitable(local, x, x0)
+        raise PuntoNoAnalitico(f"La función {expr} no está definida en x0 = {x0}")
+    return local
+
+
+def _comprobar_evitable(expr: sp.Expr, x: sp.Symbol, x0) -> None:
+    """Si la función tiene límite finito en x0 (como sin(x)/x en 0), lanza un error que lo indica."""
+    try:
+        limite = sp.limit(expr, x, sp.nsimplify(x0, [sp.pi, sp.E]))
+        valor = abs(complex(limite))
+    except Exception:
+        return
+    # Un x0 de punto flotante junto a un polo irracional da un límite finito pero enorme
+    if limite.is_finite and valor < 1 / TOLERANCIA_CERO:
+        raise PuntoNoAnalitico(f"x0 = {x0} es una singularidad evitable de {expr} (límite {limite}); "
+                               f"reescriba la función sin la indeterminación o use otro punto de expansión")
+
+
+def expresion_local(expr: sp.Expr, x: sp.Symbol, x0) -> sp.Expr:
+    """
+    Sustituye las piezas no analíticas por la rama que rige en un entorno de x0.
+
+    Abs(g) pasa a ser ±g, sign(g) y Heaviside(g) constantes, floor(g) y ceiling(g) su valor
+    en x0, frac(g) = g - floor(g(x0)), Min/Max el argumento extremo y Piecewise la rama activa.
+    Supone que x0 no es un punto de ruptura (ver verificar_punto).
+    """
+    def localizar(e):
+        if not e.args or not e.has(x):
+            return e
+        e = e.func(*[localizar(arg) for arg in e.args])
+        if not isinstance(e, PIEZAS_NO_ANALITICAS):
+            return e
+
+        if isinstance(e, sp.Piecewise):
+            for rama, condicion in e.args:
+                if bool(condicion.subs(x, x0)):
+                    return rama
+            raise PuntoNoAnalitico(f"Ninguna rama de {e} está definida en x0 = {x0}")
+        if isinstance(e, (sp.Min, sp.Max)):
+            valores = [_valor(arg, x, x0).real for arg in e.args]
+            elegido = valores.index(min(valores) if isinstance(e, sp.Min) else max(valores))
+            return e.args[elegido]
+
+        argumento = e.args[0]
+        valor = _valor(argumento, x, x0).real
+        if isinstance(e, sp.Abs):
+            return argumento if valor > 0 else -argumento
+        if isinstance(e, sp.sign):
+            return sp.Integer(1 if valor > 0 else -1)
+        if isinstance(e, sp.Heaviside):
+            return sp.Integer(1 if valor > 0 else 0)
+        if isinstance(e, sp.floor):
+            return sp.Integer(int(sp.floor(valor)))
+        if isinstance(e, sp.ceiling):
+            return sp.Integer(int(sp.ceiling(valor)))
+        return argumento - sp.Integer(int(sp.floor(valor)))
+
+    return localizar(expr)
+
+
+def singularidades_en_rango(expr: sp.Expr, x: sp.Symbol, rango_x: Tuple[float, float],
+                            condiciones: List[Tuple[str, sp.Expr, sp.Expr]] = None) -> List[float]:
+    """
+    Busca los puntos reales de un intervalo donde la función es singular o no analítica.
+
+    Solo se incluyen las soluciones que SymPy devuelve como conjunto finito; el resto de
+    puntos problemáticos (por ejemplo, regiones fuera del dominio real) aparecen como NaN al
+    evaluar la función.
+
+    Args:
+        expr: La expresión de SymPy.
+        x: La variable de la función.
+        rango_x: Tupla (min_x, max_x).
+        condiciones: Resultado de condiciones_dominio, si ya se calculó.
+
+    Returns:
+        Lista ordenada de abscisas.
+    """
+    if condiciones is None:
+        condiciones = condiciones_dominio(expr, x)
+    intervalo = sp.Interval(sp.nsimplify(rango_x[0]), sp.nsimplify(rango_x[1]))
+    x_real = sp.Symbol(x.name, real=True)
+
+    ecuaciones = []
+    for tipo, subexpresion, argumento in condiciones:
+        if tipo in ("polo", "rama", "log"):
+            ecuaciones.append(argumento)
+        elif tipo in ("intervalo", "atanh"):
+            ecuaciones.extend([argumento - 1, argumento + 1])
+        elif tipo == "acosh":
+            ecuaciones.append(argumento - 1)
+        elif isinstance(subexpresion, (sp.Abs, sp.sign, sp.Heaviside)):
+            ecuaciones.append(subexpresion.args[0])
+        elif isinstance(subexpresion, (sp.Min, sp.Max)) and len(subexpresion.args) == 2:
+            ecuaciones.append(subexpresion.args[0] - subexpresion.args[1])
+        elif isinstance(subexpresion, sp.Piecewise):
+            for _, condicion in subexpresion.args:
+                ecuaciones.extend(r.lhs - r.rhs for r in condicion.atoms(sp.core.relational.Relational))
+
+    puntos = set()
+    for ecuacion in ecuaciones:
+        try:
+            soluciones = sp.solveset(ecuacion.subs(x, x_real), x_real, intervalo)
+        except Exception:
+            continue
+        if isinstance(soluciones, sp.FiniteSet):
+            puntos.update(float(s) for s in soluciones if s.is_real)
+    return sorted(puntos)
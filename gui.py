@@ -10,11 +10,12 @@ from tkinter import ttk, messagebox, filedialog
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 import numpy as np
-import sympy as sp
 import os
-import threading
 import time
-from taylor_series import AproximacionTaylor
+from metricas import RegistroMetricas
+from trabajador import ProcesoCalculo, RUTA_ALMACEN
+from plano_complejo import dibujar_disco
+from multivariable import dibujar_superficie_error
 
 class InterfazTaylor:
     """Interfaz Gráfica para la Herramienta de Aproximación de Series de Taylor."""
@@ -30,8 +31,11 @@ class InterfazTaylor:
         style = ttk.Style()
         style.theme_use('clam')  # Usar un tema moderno
         
-        # Crear objeto de aproximación de Taylor
-        self.taylor = AproximacionTaylor()
+        # Proceso hijo con la instancia persistente de AproximacionTaylor
+        self.calculo = ProcesoCalculo()
+        self.estado_calculo = {}  # Últimas métricas informadas por el proceso de cálculo
+        self.metricas_dibujo = RegistroMetricas()  # Tiempo de dibujo en el hilo de Tk
+        self.root.protocol("WM_DELETE_WINDOW", self.cerrar)
         
         # Valores predeterminados
         self.funcion_predeterminada = "sin(x)"
@@ -70,6 +74,9 @@ class InterfazTaylor:
         self.entrada_x_min.insert(0, str(self.rango_predeterminado[0]))
         self.entrada_x_max.insert(0, str(self.rango_predeterminado[1]))
         
+        # Recoger las respuestas del proceso de cálculo desde el bucle de eventos
+        self.revisar_resultados()
+        
         # Inicializar con función predeterminada
         self.actualizar_funcion()
     
@@ -97,8 +104,16 @@ class InterfazTaylor:
         
         # Punto de expansión
         ttk.Label(self.panel_izquierdo, text="Punto de expansión (x₀):").grid(row=4, column=0, sticky=tk.W, pady=(10, 5))
-        self.entrada_x0 = ttk.Entry(self.panel_izquierdo, width=10)
-        self.entrada_x0.grid(row=5, column=0, sticky=tk.W, pady=(0, 10))
+        marco_x0 = ttk.Frame(self.panel_izquierdo)
+        marco_x0.grid(row=5, column=0, sticky=tk.W, pady=(0, 10))
+        
+        self.entrada_x0 = ttk.Entry(marco_x0, width=10)
+        self.entrada_x0.pack(side=tk.LEFT)
+        
+        # Vista previa: recentrar los coeficientes en caché en lugar de recalcular
+        self.var_vista_previa = tk.BooleanVar(value=False)
+        ttk.Checkbutton(marco_x0, text="Vista previa rápida (recentrar)", 
+                       variable=self.var_vista_previa).pack(side=tk.LEFT, padx=(10, 0))
         
         # Orden
         ttk.Label(self.panel_izquierdo, text="Orden de aproximación:").grid(row=6, column=0, sticky=tk.W, pady=(0, 5))
@@ -150,6 +165,7 @@ class InterfazTaylor:
         ttk.Button(marco_botones, text="Actualizar", command=self.actualizar_funcion).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(marco_botones, text="Evaluar", command=self.evaluar_puntos).pack(side=tk.LEFT, padx=5)
         ttk.Button(marco_botones, text="Guardar Informe", command=self.guardar_informe).pack(side=tk.LEFT, padx=5)
+        ttk.Button(marco_botones, text="Exportar Datos", command=self.exportar_datos).pack(side=tk.LEFT, padx=5)
         
         # Añadir un separador
         ttk.Separator(self.panel_izquierdo, orient=tk.HORIZONTAL).grid(row=16, column=0, sticky=tk.W+tk.E, pady=10)
@@ -183,9 +199,71 @@ class InterfazTaylor:
         self.marco_error = ttk.Frame(self.notebook)
         self.notebook.add(self.marco_error, text="Error")
         
+        # Plano complejo
+        self.marco_complejo = ttk.Frame(self.notebook)
+        self.notebook.add(self.marco_complejo, text="Plano complejo")
+        
+        # Funciones de varias variables
+        self.marco_multivariable = ttk.Frame(self.notebook)
+        self.notebook.add(self.marco_multivariable, text="Multivariable")
+        
+        # Panel de rendimiento
+        self.marco_metricas = ttk.Frame(self.notebook)
+        self.notebook.add(self.marco_metricas, text="Rendimiento")
+        self.crear_panel_metricas()
+        
         # Crear figuras iniciales
         self.crear_figuras()
     
+    def crear_panel_metricas(self):
+        """Crear el panel de estado con el desglose de tiempos por etapa."""
+        marco_botones = ttk.Frame(self.marco_metricas)
+        marco_botones.pack(side=tk.TOP, fill=tk.X, pady=5)
+        
+        ttk.Button(marco_botones, text="Reiniciar métricas", 
+                  command=self.reiniciar_metricas).pack(side=tk.LEFT, padx=5)
+        
+        # El almacén de resultados solo se usa si se activa, como --almacen en la línea de comandos
+        self.var_almacen = tk.BooleanVar(value=False)
+        ttk.Checkbutton(marco_botones, text=f"Reutilizar y guardar resultados en {RUTA_ALMACEN}",
+                       variable=self.var_almacen, command=self.cambiar_almacen).pack(side=tk.LEFT, padx=5)
+        
+        self.texto_metricas = tk.Text(self.marco_metricas, wrap=tk.NONE, font=("Courier", 10))
+        self.texto_metricas.pack(fill=tk.BOTH, expand=True)
+    
+    def actualizar_panel_metricas(self, estado=None):
+        """Mostrar las métricas del proceso de cálculo y el tiempo de dibujo en el panel de rendimiento."""
+        if estado is not None:
+            self.estado_calculo = estado
+        
+        self.texto_metricas.delete(1.0, tk.END)
+        self.texto_metricas.insert(tk.END, "Proceso de cálculo:\n")
+        self.texto_metricas.insert(tk.END, self.estado_calculo.get("metricas", "") + "\n")
+        self.texto_metricas.insert(tk.END, f"Derivadas en caché: {self.estado_calculo.get('entradas_cache', 0)} "
+                                           f"({self.estado_calculo.get('memoria_cache', 0) / 1024**2:.2f} MiB estimados)\n\n")
+        if self.estado_calculo.get("entradas_multivariable"):
+            self.texto_metricas.insert(tk.END, "Desarrollos multivariables:\n")
+            self.texto_metricas.insert(tk.END, self.estado_calculo["metricas_multivariable"] + "\n")
+            self.texto_metricas.insert(tk.END, f"Derivadas parciales en caché: "
+                                               f"{self.estado_calculo['entradas_multivariable']}\n\n")
+        self.texto_metricas.insert(tk.END, "Interfaz:\n")
+        self.texto_metricas.insert(tk.END, f"render: {self.metricas_dibujo.llamadas['render']} llamadas, "
+                                           f"{self.metricas_dibujo.tiempos['render']:.6f} s\n")
+    
+    def cambiar_almacen(self):
+        """Conectar o desconectar el almacén de resultados según la casilla."""
+        def fallo(mensaje_error):
+            self.var_almacen.set(False)
+            self.mostrar_error(f"No se pudo abrir el almacén: {mensaje_error}")
+        
+        ruta = RUTA_ALMACEN if self.var_almacen.get() else None
+        self.calculo.establecer_almacen(ruta, self.actualizar_panel_metricas, fallo)
+    
+    def reiniciar_metricas(self):
+        """Poner a cero las métricas y refrescar el panel."""
+        self.metricas_dibujo.reiniciar()
+        self.calculo.solicitar("reiniciar_metricas", (), self.actualizar_panel_metricas, self.mostrar_error)
+    
     def crear_figuras(self):
         """Crear figuras de matplotlib para graficar."""
         # Figura de aproximación
@@ -207,6 +285,58 @@ class InterfazTaylor:
         # Añadir barra de herramientas
         self.barra_error = NavigationToolbar2Tk(self.canvas_error, self.marco_error)
         self.barra_error.update()
+        
+        # Figura del plano complejo, con sus controles encima
+        marco_controles = ttk.Frame(self.marco_complejo)
+        marco_controles.pack(side=tk.TOP, fill=tk.X, pady=5)
+        
+        ttk.Label(marco_controles, text="Mostrar:").pack(side=tk.LEFT, padx=(5, 5))
+        self.modos_complejo = {"Error log₁₀|f - Pₙ|": "error", "f(z)": "funcion", "Pₙ(z)": "polinomio"}
+        self.combo_modo_complejo = ttk.Combobox(marco_controles, values=list(self.modos_complejo), 
+                                                state="readonly", width=20)
+        self.combo_modo_complejo.current(0)
+        self.combo_modo_complejo.pack(side=tk.LEFT)
+        ttk.Button(marco_controles, text="Calcular", 
+                  command=self.calcular_plano_complejo).pack(side=tk.LEFT, padx=5)
+        
+        self.fig_complejo, self.ax_complejo = plt.subplots(figsize=(8, 6))
+        self.canvas_complejo = FigureCanvasTkAgg(self.fig_complejo, master=self.marco_complejo)
+        self.canvas_complejo.draw()
+        self.canvas_complejo.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        self.barra_complejo = NavigationToolbar2Tk(self.canvas_complejo, self.marco_complejo)
+        self.barra_complejo.update()
+        self.barra_color_complejo = None
+        
+        # Figura multivariable (curvas de nivel y superficie de error), con sus controles encima
+        marco_multi = ttk.Frame(self.marco_multivariable)
+        marco_multi.pack(side=tk.TOP, fill=tk.X, pady=5)
+        
+        ttk.Label(marco_multi, text="f:").pack(side=tk.LEFT, padx=(5, 2))
+        self.entrada_funcion_multi = ttk.Entry(marco_multi, width=25)
+        self.entrada_funcion_multi.insert(0, "exp(x)*sin(y)")
+        self.entrada_funcion_multi.pack(side=tk.LEFT)
+        ttk.Label(marco_multi, text="Variables:").pack(side=tk.LEFT, padx=(10, 2))
+        self.entrada_variables_multi = ttk.Entry(marco_multi, width=8)
+        self.entrada_variables_multi.pack(side=tk.LEFT)
+        ttk.Label(marco_multi, text="Punto:").pack(side=tk.LEFT, padx=(10, 2))
+        self.entrada_punto_multi = ttk.Entry(marco_multi, width=12)
+        self.entrada_punto_multi.insert(0, "0, 0")
+        self.entrada_punto_multi.pack(side=tk.LEFT)
+        ttk.Label(marco_multi, text="Orden:").pack(side=tk.LEFT, padx=(10, 2))
+        self.spinbox_orden_multi = ttk.Spinbox(marco_multi, from_=0, to=30, width=4)
+        self.spinbox_orden_multi.set("4")
+        self.spinbox_orden_multi.pack(side=tk.LEFT)
+        ttk.Button(marco_multi, text="Calcular", 
+                  command=self.calcular_multivariable).pack(side=tk.LEFT, padx=5)
+        
+        self.fig_multi = plt.figure(figsize=(8, 6))
+        self.canvas_multi = FigureCanvasTkAgg(self.fig_multi, master=self.marco_multivariable)
+        self.canvas_multi.draw()
+        self.canvas_multi.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        self.barra_multi = NavigationToolbar2Tk(self.canvas_multi, self.marco_multivariable)
+        self.barra_multi.update()
     
     def establecer_funcion_ejemplo(self, func):
         """Establecer una función de ejemplo en el campo de entrada."""
@@ -243,6 +373,21 @@ class InterfazTaylor:
             messagebox.showerror("Error", "Rango de visualización inválido")
             return self.rango_predeterminado
     
+    def revisar_resultados(self):
+        """Recoger periódicamente las respuestas del proceso de cálculo desde el hilo de Tk."""
+        self.calculo.procesar_respuestas()
+        self.root.after(50, self.revisar_resultados)
+    
+    def mostrar_error(self, mensaje_error):
+        """Mostrar un error devuelto por el proceso de cálculo."""
+        self.var_estado.set(f"Error: {mensaje_error}")
+        messagebox.showerror("Error", mensaje_error)
+    
+    def cerrar(self):
+        """Detener el proceso de cálculo y cerrar la ventana."""
+        self.calculo.cerrar()
+        self.root.destroy()
+    
     def actualizar_funcion(self):
         """Actualizar la función y las gráficas."""
         # Obtener función y parámetros
@@ -257,88 +402,83 @@ class InterfazTaylor:
             messagebox.showerror("Error", "Punto de expansión inválido")
             return
         
+        # Obtener órdenes y rango
+        ordenes = self.obtener_ordenes_seleccionados()
+        rango_x = self.obtener_rango_grafica()
+        
         # Actualizar estado
         self.var_estado.set("Calculando aproximaciones...")
-        self.root.update_idletasks()
         
-        # Ejecutar el cálculo en un hilo separado para evitar congelar la interfaz
-        threading.Thread(target=self.dibujar_aproximaciones, 
-                         args=(func_str, x0)).start()
+        # El cálculo se ejecuta en el proceso hijo; al terminar solo se dibuja
+        self.calculo.solicitar("graficas", (func_str, x0, ordenes, rango_x, 1000, self.var_vista_previa.get()),
+                               lambda resultado: self.dibujar_aproximaciones(resultado, x0, ordenes),
+                               self.mostrar_error)
     
-    def dibujar_aproximaciones(self, func_str, x0):
-        """Función de hilo para actualizar la función y las gráficas."""
-        try:
-            # Establecer la función
-            self.taylor.establecer_funcion(func_str)
-            
-            # Obtener órdenes y rango
-            ordenes = self.obtener_ordenes_seleccionados()
-            rango_x = self.obtener_rango_grafica()
-            
-            # Actualizar gráficas
-            self.actualizar_graficas(x0, ordenes, rango_x)
-            
-            # Actualizar texto de resultados
-            self.actualizar_resultados(x0, ordenes[0])
-            
-            # Actualizar estado
-            self.var_estado.set(f"Función actualizada: f(x) = {func_str}")
-        
-        except Exception as e:
-            # Manejar errores
-            mensaje_error = str(e)
-            self.var_estado.set(f"Error: {mensaje_error}")
-            messagebox.showerror("Error", mensaje_error)
+    def dibujar_aproximaciones(self, resultado, x0, ordenes):
+        """Dibujar las curvas calculadas por el proceso hijo y mostrar los resultados."""
+        # Actualizar gráficas
+        self.actualizar_graficas(resultado, x0, ordenes)
+        
+        # Actualizar texto de resultados
+        self.actualizar_resultados(resultado, x0, ordenes[0])
+        
+        # Actualizar panel de rendimiento
+        self.actualizar_panel_metricas(resultado)
+        
+        # Actualizar estado
+        info_recentrado = resultado["info_recentrado"]
+        estado = f"Función actualizada: f(x) = {resultado['func_str']}"
+        if info_recentrado:
+            metodos = sorted({info["metodo"] for info in info_recentrado.values()})
+            error = max(info["error_estimado"] for info in info_recentrado.values())
+            estado += f" | Vista previa: {', '.join(metodos)} (error estimado {error:.2e})"
+        self.var_estado.set(estado)
     
-    def actualizar_graficas(self, x0, ordenes, rango_x):
-        """Actualizar las gráficas con nueva función y parámetros."""
+    def actualizar_graficas(self, resultado, x0, ordenes):
+        """Actualizar las gráficas con las curvas muestreadas por el proceso de cálculo."""
         # Limpiar gráficas anteriores
         self.ax_aprox.clear()
         self.ax_error.clear()
         
-        # Graficar aproximaciones
-        x_vals = np.linspace(rango_x[0], rango_x[1], 1000)
-        
-        # Crear una función para evaluación numérica
-        x = sp.Symbol('x')
-        func_num = sp.lambdify(x, self.taylor.func, "numpy")
+        x_vals = resultado["x"]
+        y_vals = resultado["y"]
+        func_str = resultado["func_str"]
         
         # Graficar la función original
-        try:
-            y_vals = func_num(x_vals)
-            self.ax_aprox.plot(x_vals, y_vals, 'k-', linewidth=2, label=f'f(x) = {self.taylor.func_str}')
-        except Exception as e:
-            print(f"Error al graficar la función original: {e}")
+        if y_vals is not None:
+            self.ax_aprox.plot(x_vals, y_vals, 'k-', linewidth=2, label=f'f(x) = {func_str}')
+        else:
+            print(f"Error al graficar la función original: {resultado['fallos'].get('f')}")
         
         # Graficar las aproximaciones
         colores = plt.cm.viridis(np.linspace(0, 1, len(ordenes)))
         
         for i, orden in enumerate(ordenes):
-            aprox = self.taylor.visualizar_serie_taylor(x0, orden)
-            aprox_num = sp.lambdify(x, aprox, "numpy")
+            if orden not in resultado["aproximaciones"]:
+                print(f"Error al graficar la aproximación de orden {orden}: {resultado['fallos'].get(orden)}")
+                continue
+            
+            y_aprox = resultado["aproximaciones"][orden]
+            self.ax_aprox.plot(x_vals, y_aprox, '-', color=colores[i], linewidth=1.5, 
+                              label=f'Orden {orden}')
             
-            try:
-                y_aprox = aprox_num(x_vals)
-                self.ax_aprox.plot(x_vals, y_aprox, '-', color=colores[i], linewidth=1.5, 
-                                  label=f'Orden {orden}')
-                
-                # Graficar errores
+            # Graficar errores
+            if y_vals is not None:
                 errores = np.abs(y_vals - y_aprox)
                 self.ax_error.plot(x_vals, errores, '-', color=colores[i], linewidth=1.5, 
                                  label=f'Orden {orden}')
-            except Exception as e:
-                print(f"Error al graficar la aproximación de orden {orden}: {e}")
         
         # Marcar el punto de expansión
+        y0 = resultado["y0"]
         self.ax_aprox.axvline(x=x0, color='gray', linestyle='--', alpha=0.5)
-        self.ax_aprox.scatter([x0], [func_num(x0)], color='red', s=50, zorder=5)
-        self.ax_aprox.annotate(f'x₀ = {x0}', (x0, func_num(x0)), xytext=(10, -20), 
+        self.ax_aprox.scatter([x0], [y0], color='red', s=50, zorder=5)
+        self.ax_aprox.annotate(f'x₀ = {x0}', (x0, y0), xytext=(10, -20), 
                               textcoords='offset points', color='red')
         
         # Establecer propiedades de la gráfica
         self.ax_aprox.grid(True, alpha=0.3)
         self.ax_aprox.legend(loc='best')
-        self.ax_aprox.set_title(f'Aproximaciones de Taylor para f(x) = {self.taylor.func_str}')
+        self.ax_aprox.set_title(f'Aproximaciones de Taylor para f(x) = {func_str}')
         self.ax_aprox.set_xlabel('x')
         self.ax_aprox.set_ylabel('y')
         
@@ -354,33 +494,139 @@ class InterfazTaylor:
         self.ax_error.axvline(x=x0, color='gray', linestyle='--', alpha=0.5)
         
         # Actualizar lienzos
-        self.canvas_aprox.draw()
-        self.canvas_error.draw()
+        with self.metricas_dibujo.medir("render"):
+            self.canvas_aprox.draw()
+            self.canvas_error.draw()
     
-    def actualizar_resultados(self, x0, orden):
+    def actualizar_resultados(self, resultado, x0, orden):
         """Actualizar el área de texto de resultados con información de aproximación."""
         # Limpiar resultados anteriores
         self.texto_resultados.delete(1.0, tk.END)
         
-        # Calcular la aproximación
-        aprox = self.taylor.visualizar_serie_taylor(x0, orden)
-        
         # Mostrar información de la función
-        self.texto_resultados.insert(tk.END, f"Función: f(x) = {self.taylor.func_str}\n\n")
+        self.texto_resultados.insert(tk.END, f"Función: f(x) = {resultado['func_str']}\n\n")
         self.texto_resultados.insert(tk.END, f"Punto de expansión: x₀ = {x0}\n\n")
         self.texto_resultados.insert(tk.END, f"Orden de aproximación: {orden}\n\n")
         
         # Mostrar la aproximación
-        self.texto_resultados.insert(tk.END, "Polinomio de Taylor:\n")
-        self.texto_resultados.insert(tk.END, f"{aprox}\n\n")
+        if "polinomio" in resultado:
+            self.texto_resultados.insert(tk.END, "Polinomio de Taylor:\n")
+            self.texto_resultados.insert(tk.END, f"{resultado['polinomio']}\n\n")
+            self.texto_resultados.insert(tk.END, "Forma simplificada:\n")
+            self.texto_resultados.insert(tk.END, f"{resultado['simplificado']}\n\n")
+            self.texto_resultados.insert(tk.END, f"Método de coeficientes: {resultado['metodo_coeficientes']}\n\n")
+    
+    def calcular_plano_complejo(self):
+        """Pedir al proceso de cálculo la imagen del plano complejo para la función actual."""
+        func_str = self.entrada_funcion.get()
+        if not func_str:
+            messagebox.showerror("Error", "Por favor ingrese una función")
+            return
         
-        # Intentar simplificar
         try:
-            simplificado = sp.simplify(aprox)
-            self.texto_resultados.insert(tk.END, "Forma simplificada:\n")
-            self.texto_resultados.insert(tk.END, f"{simplificado}\n\n")
-        except Exception:
-            pass
+            x0 = float(self.entrada_x0.get())
+            orden = int(self.spinbox_orden.get())
+        except ValueError:
+            messagebox.showerror("Error", "Parámetros inválidos")
+            return
+        
+        modo = self.modos_complejo[self.combo_modo_complejo.get()]
+        self.var_estado.set("Calculando el plano complejo...")
+        self.calculo.solicitar("plano_complejo", (func_str, x0, orden, (500, 500), modo),
+                               lambda resultado: self.dibujar_plano_complejo(resultado, func_str, orden),
+                               self.mostrar_error)
+    
+    def dibujar_plano_complejo(self, resultado, func_str, orden):
+        """Dibujar la imagen del plano complejo con el disco de convergencia superpuesto."""
+        if self.barra_color_complejo is not None:
+            self.barra_color_complejo.remove()
+            self.barra_color_complejo = None
+        self.ax_complejo.clear()
+        
+        modo = resultado["modo"]
+        if modo == "error":
+            mapa = self.ax_complejo.imshow(resultado["imagen"], origin='lower', extent=resultado["extension"], 
+                                           cmap='magma', aspect='equal')
+            self.barra_color_complejo = self.fig_complejo.colorbar(mapa, ax=self.ax_complejo, 
+                                                                   label='log₁₀|f(z) - Pₙ(z)|')
+            titulo = f'Error de orden {orden} de f(z) = {func_str}'
+        else:
+            self.ax_complejo.imshow(resultado["imagen"], origin='lower', extent=resultado["extension"], 
+                                    aspect='equal')
+            titulo = f'f(z) = {func_str}' if modo == "funcion" else f'P_{orden}(z) de f(z) = {func_str}'
+        
+        dibujar_disco(self.ax_complejo, resultado["disco"])
+        self.ax_complejo.set_xlim(resultado["extension"][:2])
+        self.ax_complejo.set_ylim(resultado["extension"][2:])
+        self.ax_complejo.set_title(titulo)
+        if self.ax_complejo.get_legend_handles_labels()[0]:
+            self.ax_complejo.legend(loc='upper right')
+        
+        with self.metricas_dibujo.medir("render"):
+            self.canvas_complejo.draw()
+        
+        self.actualizar_panel_metricas(resultado)
+        disco = resultado["disco"]
+        self.var_estado.set(f"Plano complejo calculado (radio de convergencia: {disco['radio']:.4g}, "
+                            f"método: {disco['metodo']})")
+    
+    def calcular_multivariable(self):
+        """Pedir al proceso de cálculo el desarrollo multivariable y su superficie de error."""
+        func_str = self.entrada_funcion_multi.get()
+        if not func_str:
+            messagebox.showerror("Error", "Por favor ingrese una función")
+            return
+        
+        try:
+            punto = tuple(float(c.strip()) for c in self.entrada_punto_multi.get().split(","))
+            orden = int(self.spinbox_orden_multi.get())
+        except ValueError:
+            messagebox.showerror("Error", "Punto u orden inválido")
+            return
+        variables = [v.strip() for v in self.entrada_variables_multi.get().replace(",", " ").split()]
+        
+        # Los rangos de la gráfica principal se aplican a las dos variables de la malla
+        rango = self.obtener_rango_grafica()
+        rangos = (rango, rango) if len(punto) >= 2 else None
+        
+        self.var_estado.set("Calculando el desarrollo multivariable...")
+        self.calculo.solicitar("multivariable", (func_str, variables, punto, orden, rangos),
+                               lambda resultado: self.dibujar_multivariable(resultado, punto, orden),
+                               self.mostrar_error)
+    
+    def dibujar_multivariable(self, resultado, punto, orden):
+        """Dibujar las curvas de nivel y el error del desarrollo multivariable y mostrar sus datos."""
+        self.fig_multi.clf()
+        if resultado["superficie"] is not None:
+            dibujar_superficie_error(self.fig_multi, resultado["superficie"], punto, (0, 1), 
+                                     resultado["func_str"], orden)
+            with self.metricas_dibujo.medir("render"):
+                self.canvas_multi.draw()
+        
+        nombres = ", ".join(resultado["variables"])
+        self.texto_resultados.delete(1.0, tk.END)
+        self.texto_resultados.insert(tk.END, f"Función: f({nombres}) = {resultado['func_str']}\n\n")
+        self.texto_resultados.insert(tk.END, f"Punto de expansión: {punto}\n\n")
+        self.texto_resultados.insert(tk.END, f"Orden total: {orden} ({resultado['terminos']} términos)\n\n")
+        self.texto_resultados.insert(tk.END, f"Polinomio de Taylor:\n{resultado['polinomio']}\n\n")
+        if resultado["gradiente"] is not None:
+            self.texto_resultados.insert(tk.END, "Sensibilidades:\n")
+            for nombre, valor in zip(resultado["variables"], resultado["gradiente"]):
+                self.texto_resultados.insert(tk.END, f"  ∂f/∂{nombre} = {valor:.8g}\n")
+        if resultado["hessiana"] is not None:
+            self.texto_resultados.insert(tk.END, f"Hessiana:\n{np.array2string(resultado['hessiana'], precision=5)}\n")
+        
+        self.actualizar_panel_metricas(resultado)
+        self.var_estado.set(f"Desarrollo multivariable calculado ({resultado['terminos']} términos)")
+    
+    def obtener_puntos_evaluacion(self):
+        """Obtener los puntos de evaluación del campo de entrada, o None si son inválidos."""
+        puntos_str = self.entrada_puntos_eval.get()
+        try:
+            return [float(x.strip()) for x in puntos_str.split(",")]
+        except ValueError:
+            messagebox.showerror("Error", "Puntos de evaluación inválidos")
+            return None
     
     def evaluar_puntos(self):
         """Evaluar la aproximación en puntos específicos."""
@@ -393,63 +639,40 @@ class InterfazTaylor:
             return
         
         # Obtener puntos de evaluación
-        puntos_str = self.entrada_puntos_eval.get()
-        try:
-            puntos = [float(x.strip()) for x in puntos_str.split(",")]
-        except ValueError:
-            messagebox.showerror("Error", "Puntos de evaluación inválidos")
+        puntos = self.obtener_puntos_evaluacion()
+        if puntos is None:
             return
         
         # Actualizar estado
         self.var_estado.set("Evaluando puntos...")
-        self.root.update_idletasks()
         
-        # Ejecutar evaluación en un hilo separado
-        threading.Thread(target=self.ejecutar_evaluacion, 
-                         args=(x0, orden, puntos)).start()
+        # Ejecutar evaluación en el proceso de cálculo
+        self.calculo.solicitar("evaluar", (x0, orden, puntos), self.mostrar_evaluacion, self.mostrar_error)
     
-    def ejecutar_evaluacion(self, x0, orden, puntos):
-        """Función de hilo para evaluar puntos."""
-        try:
-            # Calcular la aproximación
-            aprox = self.taylor.visualizar_serie_taylor(x0, orden)
-            
-            # Crear funciones numéricas
-            x = sp.Symbol('x')
-            func_num = sp.lambdify(x, self.taylor.func, "numpy")
-            aprox_num = sp.lambdify(x, aprox, "numpy")
-            
-            # Añadir resultados de evaluación al área de texto
-            self.texto_resultados.insert(tk.END, "\nEvaluación en puntos específicos:\n")
-            self.texto_resultados.insert(tk.END, "-" * 60 + "\n")
-            self.texto_resultados.insert(tk.END, f"{'x':^10} | {'Exacto':^15} | {'Aproximación':^15} | {'Error':^15}\n")
-            self.texto_resultados.insert(tk.END, "-" * 60 + "\n")
-            
-            for punto in puntos:
-                try:
-                    exacto = func_num(punto)
-                    val_aprox = aprox_num(punto)
-                    error = abs(exacto - val_aprox)
-                    
-                    self.texto_resultados.insert(tk.END, 
-                                           f"{punto:10.4f} | {exacto:15.6f} | {val_aprox:15.6f} | {error:15.6e}\n")
-                except Exception as e:
-                    self.texto_resultados.insert(tk.END, 
-                                           f"{punto:10.4f} | {'Error':^15} | {'Error':^15} | {'Error':^15} - {str(e)}\n")
-            
-            self.texto_resultados.insert(tk.END, "-" * 60 + "\n")
-            
-            # Actualizar estado
-            self.var_estado.set(f"Evaluación completada para {len(puntos)} puntos")
-            
-            # Desplazar para ver los nuevos resultados
-            self.texto_resultados.see(tk.END)
-        
-        except Exception as e:
-            # Manejar errores
-            mensaje_error = str(e)
-            self.var_estado.set(f"Error: {mensaje_error}")
-            messagebox.showerror("Error", mensaje_error)
+    def mostrar_evaluacion(self, resultado):
+        """Mostrar la tabla de evaluación devuelta por el proceso de cálculo."""
+        # Añadir resultados de evaluación al área de texto
+        self.texto_resultados.insert(tk.END, "\nEvaluación en puntos específicos:\n")
+        self.texto_resultados.insert(tk.END, "-" * 60 + "\n")
+        self.texto_resultados.insert(tk.END, f"{'x':^10} | {'Exacto':^15} | {'Aproximación':^15} | {'Error':^15}\n")
+        self.texto_resultados.insert(tk.END, "-" * 60 + "\n")
+        
+        for punto, exacto, val_aprox, error, mensaje in resultado["filas"]:
+            if mensaje is None:
+                self.texto_resultados.insert(tk.END, 
+                                       f"{punto:10.4f} | {exacto:15.6f} | {val_aprox:15.6f} | {error:15.6e}\n")
+            else:
+                self.texto_resultados.insert(tk.END, 
+                                       f"{punto:10.4f} | {'Error':^15} | {'Error':^15} | {'Error':^15} - {mensaje}\n")
+        
+        self.texto_resultados.insert(tk.END, "-" * 60 + "\n")
+        
+        # Actualizar estado
+        self.actualizar_panel_metricas(resultado)
+        self.var_estado.set(f"Evaluación completada para {len(resultado['filas'])} puntos")
+        
+        # Desplazar para ver los nuevos resultados
+        self.texto_resultados.see(tk.END)
     
     def guardar_informe(self):
         """Guardar un informe completo en un archivo."""
@@ -462,11 +685,8 @@ class InterfazTaylor:
             return
         
         # Obtener puntos de evaluación
-        puntos_str = self.entrada_puntos_eval.get()
-        try:
-            puntos = [float(x.strip()) for x in puntos_str.split(",")]
-        except ValueError:
-            messagebox.showerror("Error", "Puntos de evaluación inválidos")
+        puntos = self.obtener_puntos_evaluacion()
+        if puntos is None:
             return
         
         # Pedir directorio para guardar informe
@@ -476,30 +696,48 @@ class InterfazTaylor:
         
         # Actualizar estado
         self.var_estado.set("Generando informe...")
-        self.root.update_idletasks()
         
-        # Ejecutar generación de informe en un hilo separado
-        threading.Thread(target=self.generar_informe_completo, 
-                         args=(x0, ordenes, puntos, directorio_salida)).start()
+        # Ejecutar generación de informe en el proceso de cálculo
+        self.calculo.solicitar("informe", (x0, ordenes, puntos, directorio_salida), 
+                               self.informe_generado, self.mostrar_error)
     
-    def generar_informe_completo(self, x0, ordenes, puntos, directorio_salida):
-        """Función de hilo para guardar informe."""
+    def informe_generado(self, resultado):
+        """Notificar que el proceso de cálculo terminó el informe."""
+        archivo_informe = resultado["archivo"]
+        
+        # Actualizar estado
+        self.actualizar_panel_metricas(resultado)
+        self.var_estado.set(f"Informe guardado en: {archivo_informe}")
+        
+        # Mostrar mensaje de éxito
+        messagebox.showinfo("Informe Generado", 
+                          f"El informe se ha guardado exitosamente en:\n{archivo_informe}")
+
+    def exportar_datos(self):
+        """Exportar las curvas diezmadas de la función, las aproximaciones y los errores."""
         try:
-            # Generar el informe
-            archivo_informe = self.taylor.generar_informe(x0, ordenes, puntos, directorio_salida)
-            
-            # Actualizar estado
-            self.var_estado.set(f"Informe guardado en: {archivo_informe}")
-            
-            # Mostrar mensaje de éxito
-            messagebox.showinfo("Informe Generado", 
-                              f"El informe se ha guardado exitosamente en:\n{archivo_informe}")
-        
-        except Exception as e:
-            # Manejar errores
-            mensaje_error = str(e)
-            self.var_estado.set(f"Error: {mensaje_error}")
-            messagebox.showerror("Error", mensaje_error)
+            x0 = float(self.entrada_x0.get())
+            ordenes = self.obtener_ordenes_seleccionados()
+        except ValueError:
+            messagebox.showerror("Error", "Parámetros inválidos")
+            return
+        rango_x = self.obtener_rango_grafica()
+        
+        # Pedir archivo de salida; la extensión elige el formato
+        ruta = filedialog.asksaveasfilename(title="Exportar datos de las gráficas", defaultextension=".json",
+                                            filetypes=[("JSON", "*.json"), ("NumPy comprimido", "*.npz")])
+        if not ruta:
+            return
+        
+        # Ejecutar la exportación (diezmado LTTB) en el proceso de cálculo
+        self.var_estado.set("Exportando datos de las gráficas...")
+        self.calculo.solicitar("datos_grafica", (x0, ordenes, rango_x, ruta, "lttb"),
+                               self.datos_exportados, self.mostrar_error)
+    
+    def datos_exportados(self, resultado):
+        """Notificar que el proceso de cálculo terminó la exportación de datos."""
+        self.actualizar_panel_metricas(resultado)
+        self.var_estado.set(f"Datos de las gráficas guardados en: {resultado['archivo']}")
 
 def main():
     """Función principal para ejecutar la aplicación de interfaz gráfica."""
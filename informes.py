@@ -0,0 +1,261 @@
+"""
+Módulo de Informes Tabulares
+
+Este módulo escribe las tablas de evaluación de un informe de Taylor en bloque, a partir de
+arreglos ya evaluados para todos los puntos y órdenes:
+
+- CSV: una fila por punto con x, f(x) y, por cada orden, P_n(x) y el error.
+- JSON: los mismos arreglos como listas (NaN pasa a null) y un resumen por orden.
+- HTML: un documento autocontenido con el resumen, las primeras filas de la tabla y las
+  gráficas incrustadas en base64.
+- Texto: el resumen y las primeras filas, con los polinomios truncados.
+
+Los números se convierten a texto por columnas completas con repr (la representación más
+corta que se lee de vuelta sin pérdida), sin pasar por el codificador de json ni por un
+formato por fila, que dominan el tiempo con cientos de miles de puntos. Las tablas completas
+solo van al CSV y al JSON; el texto y el HTML muestran como mucho
+FILAS_VISIBLES filas para que el tamaño del informe no crezca con el número de puntos.
+"""
+
+import base64
+import html
+import json
+import os
+import numpy as np
+from typing import Dict, List, Sequence
+
+FORMATOS = ("txt", "csv", "json", "html")
+# Filas de la tabla de evaluación en los informes de texto y HTML
+FILAS_VISIBLES = 100
+# Términos de cada polinomio que se escriben en el informe de texto
+TERMINOS_VISIBLES = 12
+# Caracteres máximos de una expresión escrita en el informe de texto
+CARACTERES_EXPRESION = 2000
+# Filas por bloque al escribir el CSV
+FILAS_POR_BLOQUE = 1 << 15
+
+
+def validar_formatos(formatos: Sequence[str]) -> tuple:
+    """Comprueba los formatos pedidos y los devuelve sin repetir, en el orden de FORMATOS."""
+    desconocidos = set(formatos) - set(FORMATOS)
+    if desconocidos:
+        raise ValueError(f"Formatos de informe desconocidos: {', '.join(sorted(desconocidos))} "
+                         f"(disponibles: {', '.join(FORMATOS)})")
+    if not formatos:
+        raise ValueError("Debe pedirse al menos un formato de informe")
+    return tuple(f for f in FORMATOS if f in formatos)
+
+
+def resumen_errores(x: np.ndarray, errores: Dict[int, np.ndarray]) -> List[Dict]:
+    """
+    Estadísticas del error de cada orden en los puntos evaluados.
+
+    Returns:
+        Lista de diccionarios con "orden", "error_maximo", "x_error_maximo", "error_medio",
+        "error_rms" y "puntos_invalidos" (puntos sin valor finito).
+    """
+    filas = []
+    for orden, error in errores.items():
+        finitos = np.isfinite(error)
+        fila = {"orden": orden, "error_maximo": None, "x_error_maximo": None, "error_medio": None,
+                "error_rms": None, "puntos_invalidos": int(error.size - finitos.sum())}
+        if finitos.any():
+            validos = error[finitos]
+            indice = int(np.argmax(validos))
+            fila.update(error_maximo=float(validos[indice]), x_error_maximo=float(x[finitos][indice]),
+                        error_medio=float(validos.mean()), error_rms=float(np.sqrt(np.mean(validos**2))))
+        filas.append(fila)
+    return filas
+
+
+def _columnas(x: np.ndarray, exactos: np.ndarray, aproximaciones: Dict[int, np.ndarray],
+              errores: Dict[int, np.ndarray]) -> tuple:
+    """Nombres y matriz (puntos x columnas) de la tabla de evaluación."""
+    nombres = ["x", "exacto"]
+    columnas = [x, exactos]
+    for orden in aproximaciones:
+        nombres += [f"P_{orden}", f"error_{orden}"]
+        columnas += [aproximaciones[orden], errores[orden]]
+    return nombres, np.column_stack(columnas)
+
+
+def _textos(valores: np.ndarray, no_finito: str = None) -> List[str]:
+    """Texto de cada número con repr; los no finitos se sustituyen por no_finito si se indica."""
+    valores = np.asarray(valores, dtype=float)
+    textos = list(map(repr, valores.ravel().tolist()))
+    if no_finito is not None:
+        for i in np.flatnonzero(~np.isfinite(valores.ravel())).tolist():
+            textos[i] = no_finito
+    return textos
+
+
+def escribir_csv(ruta: str, x: np.ndarray, exactos: np.ndarray, aproximaciones: Dict[int, np.ndarray],
+                 errores: Dict[int, np.ndarray]) -> str:
+    """Escribe la tabla completa en CSV con precisión de ida y vuelta, por bloques de filas."""
+    nombres, tabla = _columnas(x, exactos, aproximaciones, errores)
+    columnas = tabla.shape[1]
+    with open(ruta, "w", encoding="utf-8") as f:
+        f.write(",".join(nombres) + "\n")
+        for inicio in range(0, len(tabla), FILAS_POR_BLOQUE):
+            textos = _textos(tabla[inicio:inicio + FILAS_POR_BLOQUE])
+            f.write("".join(",".join(textos[i:i + columnas]) + "\n" for i in range(0, len(textos), columnas)))
+    return ruta
+
+
+def _lista_json(valores: np.ndarray) -> str:
+    """Lista JSON de un arreglo, con null en lugar de NaN e infinitos (JSON estándar)."""
+    return "[" + ",".join(_textos(valores, "null")) + "]"
+
+
+def escribir_json(ruta: str, datos: Dict, x: np.ndarray, exactos: np.ndarray,
+                  aproximaciones: Dict[int, np.ndarray], errores: Dict[int, np.ndarray]) -> str:
+    """
+    Escribe el informe en JSON.
+
+    Args:
+        ruta: Archivo de salida.
+        datos: Metadatos (función, x0, órdenes, métodos, tiempos, resumen...), ya serializables.
+        x, exactos, aproximaciones, errores: La tabla de evaluación.
+    """
+    # Los metadatos pasan por json; la tabla se añade ya convertida a texto
+    metadatos = json.dumps(datos, ensure_ascii=False)
+
+    def columnas(arreglos):
+        return ",".join(f"\"{n}\":{_lista_json(v)}" for n, v in arreglos.items())
+    with open(ruta, "w", encoding="utf-8") as f:
+        f.write(metadatos[:-1] + (", " if datos else ""))
+        f.write(f"\"tabla\":{{\"x\":{_lista_json(x)},\"exacto\":{_lista_json(exactos)},"
+                f"\"aproximaciones\":{{{columnas(aproximaciones)}}},\"errores\":{{{columnas(errores)}}}}}}}")
+    return ruta
+
+
+def _formato(valor, especificacion: str = ".6e") -> str:
+    """Da formato a un número que puede ser None o no finito."""
+    if valor is None or not np.isfinite(valor):
+        return "-"
+    return format(valor, especificacion)
+
+
+def _filas_texto(x: np.ndarray, exactos: np.ndarray, aproximados: np.ndarray, errores: np.ndarray) -> str:
+    """Filas de la tabla de evaluación de un orden en el formato del informe de texto."""
+    filas = min(len(x), FILAS_VISIBLES)
+    return "".join(f"{xi:15.6f} | {e:15.6f} | {a:15.6f} | {err:15.6e}\n"
+                   for xi, e, a, err in zip(x[:filas].tolist(), exactos[:filas].tolist(),
+                                            aproximados[:filas].tolist(), errores[:filas].tolist()))
+
+
+def truncar_texto(texto: str, caracteres: int = CARACTERES_EXPRESION) -> str:
+    """Recorta un texto largo indicando cuántos caracteres se omiten."""
+    if len(texto) <= caracteres:
+        return texto
+    return f"{texto[:caracteres]} ... ({len(texto) - caracteres} caracteres omitidos)"
+
+
+def escribir_texto(ruta: str, datos: Dict, secciones: List[Dict], x: np.ndarray, exactos: np.ndarray,
+                   aproximaciones: Dict[int, np.ndarray], errores: Dict[int, np.ndarray],
+                   adicional: str = "") -> str:
+    """
+    Escribe el informe de texto.
+
+    Args:
+        ruta: Archivo de salida.
+        datos: Metadatos con "funcion" y "x0".
+        secciones: Una por orden con "orden", "tiempo", "metodo" y, opcionalmente,
+            "polinomio" y "simplificado" (ya como texto).
+        x, exactos, aproximaciones, errores: La tabla de evaluación.
+        adicional: Texto que se añade al final (aproximantes alternativos, gráficas...).
+    """
+    partes = ["INFORME DE APROXIMACIÓN DE SERIES DE TAYLOR\n",
+              "=========================================\n\n",
+              f"Función: f(x) = {datos['funcion']}\n",
+              f"Punto de expansión: x0 = {datos['x0']}\n",
+              f"Puntos evaluados: {len(x)}\n\n"]
+    omitidas = len(x) - FILAS_VISIBLES
+    for seccion in secciones:
+        orden = seccion["orden"]
+        partes += [f"\nAPROXIMACIÓN DE ORDEN {orden}\n", "-------------------------\n",
+                   f"Tiempo de cálculo: {seccion['tiempo']:.4f} segundos\n",
+                   f"Método de coeficientes: {seccion['metodo']}\n\n"]
+        if "polinomio" in seccion:
+            partes.append(f"Polinomio de Taylor:\n{seccion['polinomio']}\n\n")
+        if "simplificado" in seccion:
+            partes.append(f"Forma simplificada:\n{seccion['simplificado']}\n\n")
+        partes += ["Evaluación en puntos específicos:\n", "-" * 60 + "\n",
+                   f"{'x':^15} | {'Exacto':^15} | {'Aproximación':^15} | {'Error':^15}\n", "-" * 60 + "\n",
+                   _filas_texto(x, exactos, aproximaciones[orden], errores[orden])]
+        if omitidas > 0:
+            partes.append(f"... ({omitidas} puntos más en la tabla CSV/JSON)\n")
+        partes.append("-" * 60 + "\n\n")
+
+    partes += ["\nRESUMEN DEL ERROR\n", "-" * 80 + "\n",
+               f"{'Orden':>5} | {'Error máximo':>14} | {'en x':>12} | {'Error medio':>14} | {'Error RMS':>14} | {'Inválidos':>9}\n",
+               "-" * 80 + "\n"]
+    for fila in datos["resumen"]:
+        partes.append(f"{fila['orden']:>5d} | {_formato(fila['error_maximo']):>14} | "
+                      f"{_formato(fila['x_error_maximo'], '.6g'):>12} | {_formato(fila['error_medio']):>14} | "
+                      f"{_formato(fila['error_rms']):>14} | {fila['puntos_invalidos']:>9d}\n")
+    partes.append("-" * 80 + "\n")
+    partes.append(adicional)
+    with open(ruta, "w", encoding="utf-8") as f:
+        f.write("".join(partes))
+    return ruta
+
+
+def _imagen_incrustada(ruta: str) -> str:
+    """Etiqueta <img> con un PNG incrustado en base64 (vacía si el archivo no existe)."""
+    if not ruta or not os.path.exists(ruta):
+        return ""
+    with open(ruta, "rb") as f:
+        contenido = base64.b64encode(f.read()).decode("ascii")
+    return (f"<figure><img style=\"max-width:100%\" alt=\"{html.escape(os.path.basename(ruta))}\" "
+            f"src=\"data:image/png;base64,{contenido}\"></figure>\n")
+
+
+def escribir_html(ruta: str, datos: Dict, x: np.ndarray, exactos: np.ndarray,
+                  aproximaciones: Dict[int, np.ndarray], errores: Dict[int, np.ndarray],
+                  imagenes: Sequence[str] = (), enlaces: Dict[str, str] = None) -> str:
+    """
+    Escribe un informe HTML autocontenido (estilos y gráficas incrustados).
+
+    Args:
+        ruta: Archivo de salida.
+        datos: Metadatos con "funcion", "x0", "resumen" y "secciones" (orden, método, tiempo).
+        x, exactos, aproximaciones, errores: La tabla de evaluación (se muestran FILAS_VISIBLES filas).
+        imagenes: Rutas de PNG que se incrustan.
+        enlaces: Nombre → ruta relativa de otros archivos del informe (CSV, JSON, texto).
+    """
+    e = html.escape
+    partes = ["<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">",
+              f"<title>Informe de Taylor: {e(str(datos['funcion']))}</title>",
+              "<style>body{font-family:sans-serif;margin:2em}table{border-collapse:collapse}"
+              "td,th{border:1px solid #999;padding:3px 8px;text-align:right}"
+              "th{background:#eee}</style></head><body>\n",
+              f"<h1>Informe de aproximación de Taylor</h1>\n<p>f(x) = <code>{e(str(datos['funcion']))}</code>; "
+              f"x0 = {e(str(datos['x0']))}; {len(x)} puntos evaluados</p>\n"]
+    if enlaces:
+        partes.append("<p>" + " | ".join(f"<a href=\"{e(destino)}\">{e(nombre)}</a>"
+                                         for nombre, destino in enlaces.items()) + "</p>\n")
+
+    partes.append("<h2>Resumen del error</h2>\n<table><tr><th>Orden</th><th>Método</th><th>Tiempo (s)</th>"
+                  "<th>Error máximo</th><th>en x</th><th>Error medio</th><th>Error RMS</th><th>Inválidos</th></tr>\n")
+    for seccion, fila in zip(datos["secciones"], datos["resumen"]):
+        partes.append(f"<tr><td>{fila['orden']}</td><td>{e(str(seccion['metodo']))}</td>"
+                      f"<td>{seccion['tiempo']:.4f}</td><td>{_formato(fila['error_maximo'])}</td>"
+                      f"<td>{_formato(fila['x_error_maximo'], '.6g')}</td><td>{_formato(fila['error_medio'])}</td>"
+                      f"<td>{_formato(fila['error_rms'])}</td><td>{fila['puntos_invalidos']}</td></tr>\n")
+    partes.append("</table>\n")
+
+    for imagen in imagenes:
+        partes.append(_imagen_incrustada(imagen))
+
+    filas = min(len(x), FILAS_VISIBLES)
+    nombres, tabla = _columnas(x[:filas], exactos[:filas], {n: v[:filas] for n, v in aproximaciones.items()},
+                               {n: v[:filas] for n, v in errores.items()})
+    partes.append(f"<h2>Evaluación (primeros {filas} de {len(x)} puntos)</h2>\n<table><tr>"
+                  + "".join(f"<th>{e(nombre)}</th>" for nombre in nombres) + "</tr>\n")
+    partes += ["<tr>" + "".join(f"<td>{_formato(v, '.10g')}</td>" for v in fila) + "</tr>\n"
+               for fila in tabla.tolist()]
+    partes.append("</table>\n</body></html>\n")
+    with open(ruta, "w", encoding="utf-8") as f:
+        f.write("".join(partes))
+    return ruta
@@ -0,0 +1,309 @@
+"""
+Módulo de Límites de Recursos
+
+Este módulo limita el tiempo y la memoria de los cálculos simbólicos, de modo que una entrada
+patológica (funciones muy anidadas a orden 200, una simplificación enorme) no bloquee un lote
+ni agote la memoria de la máquina.
+
+Los límites se aplican en dos niveles:
+
+- Comprobaciones cooperativas entre órdenes de derivación (Limites.comprobar): al superar el
+  plazo o la memoria se lanza LimiteExcedido con el polinomio parcial calculado hasta entonces.
+- Límites del sistema operativo en procesos hijos (módulo resource, solo en POSIX): memoria
+  de datos y tiempo de CPU. Si un paso sin comprobaciones (una sola derivada o simplificación
+  enorme) se queda bloqueado, el proceso padre lo termina al vencer el plazo y conserva los
+  coeficientes que el hijo ya le había enviado. Si el plazo ya se había iniciado (un trabajo de
+  varios pasos), el hijo usa el tiempo que queda de él y no uno nuevo.
+"""
+
+import math
+import multiprocessing
+import os
+import time
+from typing import Any, Callable, Dict, Optional, Sequence
+
+try:
+    import resource
+except ImportError:  # Windows: solo se aplican las comprobaciones cooperativas
+    resource = None
+
+# Estados de un trabajo con límites
+COMPLETO = "completo"
+TIEMPO_AGOTADO = "tiempo_agotado"
+MEMORIA_AGOTADA = "memoria_agotada"
+ERROR = "error"
+
+# Segundos entre comprobaciones mientras se esperan los resultados de un grupo de procesos
+INTERVALO_SONDEO = 0.5
+
+OPERACIONES = ("serie", "simplificar", "informe")
+
+
+class LimiteExcedido(Exception):
+    """
+    Se superó el límite de tiempo o de memoria de un cálculo.
+
+    Attributes:
+        motivo: TIEMPO_AGOTADO o MEMORIA_AGOTADA.
+        parcial: Resultado parcial (por ejemplo, el polinomio con los coeficientes ya calculados) o None.
+    """
+
+    def __init__(self, motivo: str, mensaje: str, parcial: Any = None):
+        super().__init__(mensaje)
+        self.motivo = motivo
+        self.parcial = parcial
+
+
+def memoria_residente() -> Optional[int]:
+    """Memoria residente actual del proceso en bytes, o None si no se puede medir."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if resource is not None:
+        # Pico en lugar de la actual (kilobytes en Linux, bytes en macOS)
+        pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return pico if os.uname().sysname == "Darwin" else pico * 1024
+    return None
+
+
+class Limites:
+    """
+    Límites de tiempo de reloj y de memoria de un trabajo.
+    """
+
+    def __init__(self, tiempo: float = None, memoria: int = None):
+        """
+        Inicializa los límites. El plazo empieza a contar con iniciar().
+
+        Args:
+            tiempo: Segundos de reloj máximos. Si es None, no hay límite de tiempo.
+            memoria: Bytes máximos del proceso. Si es None, no hay límite de memoria.
+        """
+        if tiempo is not None and tiempo <= 0:
+            raise ValueError("El límite de tiempo debe ser positivo")
+        if memoria is not None and memoria <= 0:
+            raise ValueError("El límite de memoria debe ser positivo")
+        self.tiempo = tiempo
+        self.memoria = memoria
+        self.plazo = None
+        self.al_progresar = None  # Llamada con la función de resultado parcial en cada comprobación
+        self._originales = {}  # Límites del sistema operativo antes de aplicar_en_proceso
+
+    def __repr__(self) -> str:
+        return f"Limites(tiempo={self.tiempo}, memoria={self.memoria})"
+
+    @property
+    def activos(self) -> bool:
+        """Indica si hay algún límite configurado."""
+        return self.tiempo is not None or self.memoria is not None
+
+    def iniciar(self) -> "Limites":
+        """Empieza a contar el plazo de tiempo."""
+        self.plazo = time.monotonic() + self.tiempo if self.tiempo is not None else None
+        return self
+
+    def restante(self) -> Optional[float]:
+        """Segundos hasta el plazo (no negativos), o None si no hay límite de tiempo."""
+        if self.plazo is None:
+            return None
+        return max(0.0, self.plazo - time.monotonic())
+
+    def comprobar(self, parcial: Callable[[], Any] = None) -> None:
+        """
+        Comprobación cooperativa, pensada para llamarse entre órdenes de derivación.
+
+        Args:
+            parcial: Función que devuelve el resultado parcial, que se adjunta a la excepción
+                y se pasa a al_progresar.
+
+        Raises:
+            LimiteExcedido: Si se superó el plazo o la memoria.
+        """
+        if self.al_progresar is not None and parcial is not None:
+            self.al_progresar(parcial)
+        if self.plazo is not None and time.monotonic() > self.plazo:
+            raise LimiteExcedido(TIEMPO_AGOTADO, f"Se agotó el límite de tiempo ({self.tiempo:g} s)",
+                                 parcial() if parcial else None)
+        if self.memoria is not None:
+            actual = memoria_residente()
+            if actual is not None and actual > self.memoria:
+                raise LimiteExcedido(MEMORIA_AGOTADA,
+                                     f"Se superó el límite de memoria ({self.memoria / 1024**2:.0f} MB)",
+                                     parcial() if parcial else None)
+
+    def aplicar_en_proceso(self) -> None:
+        """
+        Fija los límites del sistema operativo en el proceso actual (solo en procesos hijos).
+
+        La memoria limita el segmento de datos (RLIMIT_DATA, que en Linux incluye las
+        reservas anónimas de malloc) para que una asignación excesiva lance MemoryError en
+        lugar de agotar la máquina; el tiempo limita la CPU con un segundo de margen.
+        """
+        if resource is None:
+            return
+        nuevos = {}
+        if self.memoria is not None:
+            nuevos[getattr(resource, "RLIMIT_DATA", resource.RLIMIT_AS)] = self.memoria
+        if self.tiempo is not None:
+            nuevos[resource.RLIMIT_CPU] = math.ceil(self.tiempo) + 1
+        for limite, valor in nuevos.items():
+            actual, maximo = resource.getrlimit(limite)
+            if maximo == resource.RLIM_INFINITY or valor < maximo:
+                self._originales[limite] = (actual, maximo)
+                resource.setrlimit(limite, (valor, maximo))
+
+    def restaurar_proceso(self) -> None:
+        """
+        Restaura los límites del sistema operativo anteriores a aplicar_en_proceso, por ejemplo
+        para poder enviar el resultado tras un MemoryError.
+        """
+        for limite, valores in self._originales.items():
+            resource.setrlimit(limite, valores)
+        self._originales.clear()
+
+
+def _ejecutar_trabajo_hijo(conexion, func_str: str, operacion: str, argumentos: Sequence,
+                           limites: Limites, opciones: Dict) -> None:
+    """
+    Proceso hijo de ejecutar_trabajo: calcula la operación y envía los coeficientes a medida que
+    se obtienen, para que el padre los conserve aunque tenga que terminar el proceso.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    from taylor_series import AproximacionTaylor
+
+    enviados = [0]
+    taylor = None
+
+    def enviar_parcial(parcial: Callable) -> None:
+        polinomio = parcial()
+        if polinomio is None:
+            return
+        coeficientes = list(polinomio.coeficientes)
+        if len(coeficientes) > enviados[0]:
+            conexion.send(("parcial", enviados[0], coeficientes[enviados[0]:]))
+            enviados[0] = len(coeficientes)
+
+    try:
+        limites.aplicar_en_proceso()
+        # El plazo lo fija el padre: el tiempo que le queda al trabajo, no uno nuevo
+        limites.plazo = opciones["plazo"]
+        limites.al_progresar = enviar_parcial
+        taylor = AproximacionTaylor(motor=opciones.get("motor", "numpy"))
+        if opciones.get("almacen"):
+            taylor.establecer_almacen(opciones["almacen"])
+        taylor.establecer_limites(limites)
+        taylor.establecer_funcion(func_str)
+
+        x0 = argumentos[0]
+        orden = max(argumentos[1]) if operacion == "informe" else argumentos[1]
+        polinomio = taylor.obtener_polinomio(x0, orden)
+        enviar_parcial(lambda: polinomio)
+
+        if operacion == "serie":
+            resultado = None
+        elif operacion == "simplificar":
+            resultado = str(taylor.forma_simplificada(x0, orden))
+        else:
+            resultado = taylor.generar_informe(*argumentos, **opciones["informe"])
+            if taylor.almacen is not None:
+                _, ordenes, x_eval = argumentos[:3]
+                rango_x = (min(x_eval), max(x_eval)) if min(x_eval) < max(x_eval) else None
+                for orden_informe in ordenes:
+                    taylor.registrar_resultados(x0, orden_informe, rango_x, x_eval, {"informe": resultado})
+        estado, mensaje = COMPLETO, ""
+    except LimiteExcedido as e:
+        limites.restaurar_proceso()
+        if e.parcial is not None:
+            enviar_parcial(lambda: e.parcial)
+        estado, mensaje, resultado = e.motivo, str(e), None
+    except MemoryError:
+        limites.restaurar_proceso()
+        estado, mensaje, resultado = (MEMORIA_AGOTADA,
+                                      f"Se superó el límite de memoria ({limites.memoria / 1024**2:.0f} MB)", None)
+    except Exception as e:
+        # establecer_funcion y otras envuelven los errores en ValueError: un MemoryError dentro
+        # sigue siendo un límite de memoria
+        limites.restaurar_proceso()
+        estado = MEMORIA_AGOTADA if isinstance(e.__context__, MemoryError) else ERROR
+        mensaje, resultado = str(e), None
+    try:
+        metodo = taylor.metodo_coeficientes(argumentos[0]) if taylor is not None else None
+        conexion.send(("resultado", estado, mensaje, resultado, metodo))
+    finally:
+        conexion.close()
+
+
+def ejecutar_trabajo(func_str: str, operacion: str, argumentos: Sequence, limites: Limites,
+                     motor: str = "numpy", almacen: str = None, opciones_informe: Dict = None) -> Dict:
+    """
+    Ejecuta una operación de series de Taylor en un proceso hijo con límites de tiempo y memoria.
+
+    Args:
+        func_str: La función a aproximar.
+        operacion: "serie" (coeficientes), "simplificar" (forma expandida) o "informe".
+        argumentos: (x0, orden) para "serie" y "simplificar"; los argumentos de
+            generar_informe (x0, ordenes, x_eval, directorio_salida) para "informe".
+        limites: Límites de tiempo y memoria del trabajo. Si su plazo ya se inició, el hijo
+            solo dispone del tiempo restante; si no, de limites.tiempo desde ahora.
+        motor: Motor numérico de AproximacionTaylor.
+        almacen: Ruta de un almacén de resultados a usar en el proceso hijo.
+        opciones_informe: Argumentos con nombre de generar_informe para "informe" (formatos,
+            polinomios).
+
+    Returns:
+        Diccionario con "estado" (COMPLETO, TIEMPO_AGOTADO, MEMORIA_AGOTADA o ERROR), "mensaje",
+        "coeficientes" (los calculados, completos o parciales), "orden_alcanzado" (-1 si ninguno),
+        "metodo" (de los coeficientes), "resultado" (cadena simplificada o ruta del informe; None
+        si no terminó) y "tiempo".
+    """
+    if operacion not in OPERACIONES:
+        raise ValueError(f"Operación desconocida: {operacion}. Opciones: {', '.join(OPERACIONES)}")
+
+    inicio = time.monotonic()
+    # time.monotonic usa el reloj del sistema, común al padre y al hijo
+    plazo = limites.plazo
+    if plazo is None and limites.tiempo is not None:
+        plazo = inicio + limites.tiempo
+    conexion, conexion_hija = multiprocessing.Pipe(duplex=False)
+    proceso = multiprocessing.Process(target=_ejecutar_trabajo_hijo, daemon=True,
+                                      args=(conexion_hija, func_str, operacion, tuple(argumentos), limites,
+                                            {"motor": motor, "almacen": almacen, "plazo": plazo,
+                                             "informe": opciones_informe or {}}))
+    proceso.start()
+    conexion_hija.close()
+
+    coeficientes = []
+    estado, mensaje, resultado, metodo = None, "", None, None
+    try:
+        while estado is None:
+            espera = None if plazo is None else max(0.0, plazo - time.monotonic())
+            if not conexion.poll(espera):
+                estado, mensaje = TIEMPO_AGOTADO, f"Se agotó el límite de tiempo ({limites.tiempo:g} s)"
+                break
+            try:
+                mensaje_hijo = conexion.recv()
+            except EOFError:
+                # El hijo terminó sin responder: lo mató el sistema por CPU o por memoria
+                proceso.join()
+                if plazo is not None and time.monotonic() >= plazo:
+                    estado, mensaje = TIEMPO_AGOTADO, f"Se agotó el límite de tiempo ({limites.tiempo:g} s)"
+                else:
+                    estado, mensaje = MEMORIA_AGOTADA, f"El proceso terminó (código {proceso.exitcode})"
+                break
+            if mensaje_hijo[0] == "parcial":
+                _, desde, nuevos = mensaje_hijo
+                coeficientes[desde:] = nuevos
+            else:
+                _, estado, mensaje, resultado, metodo = mensaje_hijo
+    finally:
+        if proceso.is_alive():
+            proceso.terminate()
+        proceso.join()
+        conexion.close()
+
+    return {"estado": estado, "mensaje": mensaje, "coeficientes": coeficientes,
+            "orden_alcanzado": len(coeficientes) - 1, "metodo": metodo, "resultado": resultado,
+            "tiempo": time.monotonic() - inicio}
@@ -0,0 +1,198 @@
+"""
+Módulo de Informes por Lotes
+
+Este módulo permite generar informes de aproximación de Taylor para muchas funciones
+y puntos de expansión en una sola ejecución, reutilizando un conjunto fijo de figuras
+de matplotlib (lienzo Agg, sin pyplot) para que la memoria no crezca con el número de gráficas.
+"""
+
+import os
+import html
+import time
+from typing import List, Tuple, Sequence
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from taylor_series import AproximacionTaylor
+from limites import Limites, ejecutar_trabajo, COMPLETO
+import informes
+
+
+class ReservaFiguras:
+    """
+    Conjunto fijo de figuras Agg que se limpian y reutilizan en lugar de crear figuras nuevas.
+    """
+
+    def __init__(self, tamano: int = 1, figsize: Tuple[float, float] = (12, 8)):
+        """
+        Inicializa la reserva.
+
+        Args:
+            tamano: Número de figuras a mantener.
+            figsize: Tamaño de cada figura en pulgadas.
+        """
+        self._figuras = []
+        for _ in range(max(1, tamano)):
+            figura = Figure(figsize=figsize)
+            FigureCanvasAgg(figura)
+            self._figuras.append(figura)
+        self._siguiente = 0
+
+    def obtener(self) -> Figure:
+        """Devuelve la siguiente figura de la reserva, ya limpia."""
+        if not self._figuras:
+            raise RuntimeError("La reserva de figuras está cerrada")
+        figura = self._figuras[self._siguiente % len(self._figuras)]
+        self._siguiente += 1
+        figura.clf()
+        return figura
+
+    def cerrar(self) -> None:
+        """Limpia y libera todas las figuras de la reserva."""
+        for figura in self._figuras:
+            figura.clf()
+        self._figuras = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+def leer_archivo_lote(ruta: str) -> List[Tuple[str, float]]:
+    """
+    Lee una lista de trabajos de un archivo de texto.
+
+    Cada línea tiene la forma "funcion; x0". Las líneas vacías y las que empiezan por '#' se ignoran.
+
+    Args:
+        ruta: Ruta del archivo.
+
+    Returns:
+        Lista de tuplas (funcion, x0).
+    """
+    trabajos = []
+    with open(ruta, encoding="utf-8") as f:
+        for numero, linea in enumerate(f, start=1):
+            linea = linea.strip()
+            if not linea or linea.startswith("#"):
+                continue
+            try:
+                funcion, x0 = linea.rsplit(";", 1)
+                trabajos.append((funcion.strip(), float(x0)))
+            except ValueError:
+                raise ValueError(f"Línea {numero} inválida en {ruta}: se esperaba 'funcion; x0'")
+    return trabajos
+
+
+def generar_informes_lote(trabajos: Sequence[Tuple[str, float]], ordenes: List[int],
+                          x_eval: List[float], directorio_salida: str = "resultados_lote", 
+                          motor: str = "numpy", memoria_cache: int = None,
+                          cache_compartida: bool = False, almacen: str = None,
+                          limites: Limites = None, formatos: Sequence[str] = informes.FORMATOS,
+                          polinomios: bool = True) -> str:
+    """
+    Genera un informe por cada par (función, x0) y un índice HTML que los enlaza.
+
+    Todas las gráficas se dibujan en la misma figura Agg, que se limpia antes de cada uso,
+    y un fallo en un trabajo se registra en el índice sin detener el lote.
+
+    Args:
+        trabajos: Secuencia de tuplas (funcion, x0).
+        ordenes: Lista de órdenes de aproximación a incluir en cada informe.
+        x_eval: Lista de valores x en los que evaluar cada aproximación.
+        directorio_salida: Directorio raíz donde se guardan los informes y el índice.
+        motor: Motor numérico de AproximacionTaylor para evaluar sobre mallas.
+        memoria_cache: Memoria estimada máxima (en bytes) de las derivadas en caché. Si es None, no hay límite.
+        cache_compartida: Si las derivadas en caché comparten las subexpresiones repetidas.
+        almacen: Ruta de un almacén SQLite de resultados. Los coeficientes guardados se reutilizan
+            y cada informe se registra en él.
+        limites: Límites de tiempo y memoria de cada informe. Si se indican, cada trabajo se
+            ejecuta en su propio proceso y uno que los supere no detiene el lote.
+        formatos: Formatos de cada informe (ver AproximacionTaylor.generar_informe); el índice
+            enlaza solo los escritos.
+        polinomios: Si los informes de texto incluyen los polinomios y su forma simplificada.
+
+    Returns:
+        La ruta del archivo de índice.
+    """
+    formatos = informes.validar_formatos(formatos)
+    opciones_informe = {"formatos": formatos, "polinomios": polinomios}
+    os.makedirs(directorio_salida, exist_ok=True)
+    taylor = AproximacionTaylor(motor=motor, memoria_cache=memoria_cache, cache_compartida=cache_compartida)
+    if almacen:
+        taylor.establecer_almacen(almacen)
+    resultados = []
+
+    with ReservaFiguras() as reserva:
+        for i, (funcion, x0) in enumerate(trabajos):
+            subdirectorio = f"{i:05d}"
+            ruta_trabajo = os.path.join(directorio_salida, subdirectorio)
+            inicio = time.perf_counter()
+            if limites is not None:
+                estado = _informe_limitado(funcion, x0, ordenes, x_eval, ruta_trabajo, limites, motor, almacen,
+                                           opciones_informe)
+                resultados.append((funcion, x0, subdirectorio, estado, time.perf_counter() - inicio))
+                continue
+            try:
+                taylor.establecer_funcion(funcion)
+                archivo = taylor.generar_informe(x0, ordenes, x_eval, ruta_trabajo, figura=reserva.obtener(),
+                                                 **opciones_informe)
+                if almacen:
+                    rango_x = (min(x_eval), max(x_eval))
+                    for orden in ordenes:
+                        taylor.registrar_resultados(x0, orden, rango_x if rango_x[0] < rango_x[1] else None,
+                                                    x_eval, {"informe": archivo})
+                estado = "ok"
+            except Exception as e:
+                estado = f"error: {e}"
+            resultados.append((funcion, x0, subdirectorio, estado, time.perf_counter() - inicio))
+
+    archivo_indice = os.path.join(directorio_salida, "indice.html")
+    _escribir_indice(archivo_indice, resultados, ordenes, formatos)
+    print(f"Índice del lote generado en {archivo_indice}")
+    return archivo_indice
+
+
+def _informe_limitado(funcion: str, x0: float, ordenes: List[int], x_eval: List[float], ruta_trabajo: str,
+                      limites: Limites, motor: str, almacen: str, opciones_informe: dict) -> str:
+    """Genera un informe en un proceso hijo con límites y devuelve su estado para el índice."""
+    resultado = ejecutar_trabajo(funcion, "informe", (x0, ordenes, x_eval, ruta_trabajo), limites, motor, almacen,
+                                 opciones_informe)
+    if resultado["estado"] == COMPLETO:
+        return "ok"
+    estado = f"{resultado['estado']}: {resultado['mensaje']}"
+    if resultado["orden_alcanzado"] >= 0:
+        estado += f" (coeficientes hasta el orden {resultado['orden_alcanzado']})"
+        # Conservar los coeficientes parciales junto al informe que no se pudo completar
+        os.makedirs(ruta_trabajo, exist_ok=True)
+        with open(os.path.join(ruta_trabajo, "coeficientes_parciales.txt"), "w", encoding="utf-8") as f:
+            f.write(f"Función: {funcion}\nPunto de expansión: x0 = {x0}\nEstado: {estado}\n\n")
+            for k, coeficiente in enumerate(resultado["coeficientes"]):
+                f.write(f"c_{k} = {coeficiente}\n")
+    return estado
+
+
+def _escribir_indice(archivo_indice: str, resultados: list, ordenes: List[int], formatos: Sequence[str]) -> None:
+    """Escribe el índice HTML con un enlace a cada informe (en los formatos escritos) y gráfica del lote."""
+    with open(archivo_indice, "w", encoding="utf-8") as f:
+        f.write("<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+                "<title>Informes de Taylor por lotes</title></head><body>\n")
+        f.write(f"<h1>Informes de Taylor por lotes</h1>\n<p>Órdenes: {html.escape(str(ordenes))}</p>\n")
+        f.write("<table border=\"1\" cellpadding=\"4\">\n")
+        f.write("<tr><th>#</th><th>f(x)</th><th>x0</th><th>Estado</th><th>Tiempo (s)</th>"
+                "<th>Informe</th><th>Gráficas</th></tr>\n")
+        for i, (funcion, x0, subdirectorio, estado, tiempo) in enumerate(resultados):
+            if estado == "ok":
+                enlaces = (" | ".join(f"<a href=\"{subdirectorio}/informe_taylor.{formato}\">{formato}</a>"
+                                      for formato in formatos),
+                           f"<a href=\"{subdirectorio}/aproximacion_taylor.png\">aproximación</a> | "
+                           f"<a href=\"{subdirectorio}/error_taylor.png\">error</a>")
+            elif "coeficientes hasta el orden" in estado:
+                enlaces = (f"<a href=\"{subdirectorio}/coeficientes_parciales.txt\">coeficientes parciales</a>", "-")
+            else:
+                enlaces = ("-", "-")
+            f.write(f"<tr><td>{i}</td><td>{html.escape(funcion)}</td><td>{x0}</td>"
+                    f"<td>{html.escape(estado)}</td><td>{tiempo:.3f}</td>"
+                    f"<td>{enlaces[0]}</td><td>{enlaces[1]}</td></tr>\n")
+        f.write("</table>\n</body></html>\n")
@@ -8,12 +8,23 @@ de series de Taylor y sus errores de truncamiento para funciones arbitrarias.
 import os
 import sys
 import argparse
-import sympy as sp
+import time
 from taylor_series import AproximacionTaylor
+from multivariable import AproximacionMultivariable
+from lote import generar_informes_lote, leer_archivo_lote
+from motores import MOTORES, motores_disponibles
+from animacion import formato_animacion
+from limites import Limites, LimiteExcedido, ejecutar_trabajo, COMPLETO, ERROR
+from parametros import analizar_rejilla, parametros_libres
+from informes import FORMATOS as FORMATOS_INFORME
+from diezmado import METODOS as METODOS_DIEZMADO, MUESTRAS, PUNTOS_SERIE
 import matplotlib.pyplot as plt
 import numpy as np
 from typing import List, Tuple
 
+# Código de salida cuando un límite deja resultados parciales (los errores salen con 1)
+CODIGO_LIMITE = 2
+
 def analizar_argumentos():
     """Analiza los argumentos de la línea de comandos."""
     parser = argparse.ArgumentParser(
@@ -23,22 +34,68 @@ def analizar_argumentos():
     parser.add_argument(
         "-f", "--funcion", 
         type=str, 
-        required=True,
         help="Función a aproximar (en términos de x, usando sintaxis de SymPy)"
     )
     
     parser.add_argument(
         "-x0", "--punto-expansion", 
         type=float, 
-        required=True,
         help="Punto alrededor del cual expandir la serie de Taylor"
     )
     
     parser.add_argument(
         "-o", "--orden", 
         type=int, 
-        required=True,
-        help="Orden de la aproximación de Taylor (máximo 200)"
+        help="Orden de la aproximación de Taylor (máximo 200). Con --tolerancia, es el orden máximo a considerar"
+    )
+    
+    parser.add_argument(
+        "-t", "--tolerancia", 
+        type=float,
+        help="Error máximo admitido; elige automáticamente el menor orden que lo cumple en el rango"
+    )
+    
+    parser.add_argument(
+        "--punto", 
+        type=float, 
+        nargs="+",
+        metavar="VALOR",
+        help="Punto de expansión de una función de varias variables (una coordenada por variable); "
+             "sustituye a -x0"
+    )
+    
+    parser.add_argument(
+        "--variables", 
+        type=str, 
+        nargs="+",
+        metavar="VARIABLE",
+        help="Variables de la función multivariable en el orden de --punto (por defecto, sus símbolos "
+             "ordenados por nombre)"
+    )
+    
+    parser.add_argument(
+        "--tramos", 
+        type=float,
+        metavar="TOLERANCIA",
+        help="Construir un aproximante por tramos que cumple esta tolerancia en todo el rango -r, con "
+             "centros y órdenes (hasta -o, por defecto 20) elegidos de forma adaptativa"
+    )
+    
+    parser.add_argument(
+        "--precision", 
+        type=float,
+        metavar="TOLERANCIA",
+        help="Evaluar la serie en los puntos de -e (y graficarla con -p) sumando términos solo hasta "
+             "que la cola estimada baja de esta tolerancia en cada punto (orden máximo -o, por defecto 200)"
+    )
+    
+    parser.add_argument(
+        "--parametros", 
+        type=str,
+        nargs="+",
+        metavar="NOMBRE=INICIO:FIN:N",
+        help="Valores de los parámetros libres de la función (además de x), como a=0:1:100 o "
+             "b=1,2,5; los coeficientes se derivan una vez y se evalúan en todas las combinaciones"
     )
     
     parser.add_argument(
@@ -62,6 +119,14 @@ def analizar_argumentos():
         help="Rango para graficar (min_x max_x)"
     )
     
+    parser.add_argument(
+        "--rango-y", 
+        type=float, 
+        nargs=2,
+        metavar=("MIN", "MAX"),
+        help="Rango de la segunda variable en la superficie de error multivariable (por defecto, el de -r)"
+    )
+    
     parser.add_argument(
         "-c", "--comparar", 
         type=int, 
@@ -81,11 +146,305 @@ def analizar_argumentos():
         help="Usar cálculo en paralelo para mejor rendimiento"
     )
     
+    parser.add_argument(
+        "--cauchy", 
+        nargs="?",
+        const=0.0,
+        type=float,
+        metavar="RADIO",
+        help="Obtener los coeficientes numéricamente con la integral de Cauchy (FFT de muestras en "
+             "circunferencias complejas) en lugar de derivar; RADIO fija el radio (por defecto, automático)"
+    )
+    
+    parser.add_argument(
+        "--pade", 
+        type=int, 
+        nargs=2,
+        metavar=("L", "M"),
+        help="Comparar con el aproximante de Padé [L/M] construido con los mismos coeficientes"
+    )
+    
+    parser.add_argument(
+        "--chebyshev", 
+        type=float,
+        metavar="TOLERANCIA",
+        help="Comparar con el polinomio economizado con Chebyshev en el rango con esta tolerancia"
+    )
+    
+    parser.add_argument(
+        "--exportar-nucleos", 
+        type=str,
+        metavar="DIRECTORIO",
+        help="Exportar los polinomios como núcleos de evaluación en C, NumPy y Numba (si está instalado)"
+    )
+    
+    parser.add_argument(
+        "--animacion", 
+        type=str,
+        metavar="RUTA",
+        help="Exportar una animación de la convergencia hasta el orden -o (.gif, .mp4 o un directorio "
+             "para una secuencia de PNG)"
+    )
+    
+    parser.add_argument(
+        "--fps", 
+        type=int,
+        default=10,
+        help="Fotogramas por segundo de --animacion (por defecto: 10)"
+    )
+    
+    parser.add_argument(
+        "--exportar-datos", 
+        type=str,
+        metavar="RUTA",
+        help="Exportar las curvas de f, de cada orden y de cada error en el rango, diezmadas, a un "
+             "archivo .json o .npz para paneles web"
+    )
+    
+    parser.add_argument(
+        "--diezmado", 
+        choices=METODOS_DIEZMADO,
+        default="lttb",
+        help="Método de diezmado de --exportar-datos: lttb (triángulo de mayor área) o minmax "
+             "(mínimo y máximo por columna). Por defecto: lttb"
+    )
+    
+    parser.add_argument(
+        "--puntos-serie", 
+        type=int,
+        default=PUNTOS_SERIE,
+        metavar="N",
+        help=f"Puntos de cada curva diezmada de --exportar-datos (por defecto: {PUNTOS_SERIE})"
+    )
+    
+    parser.add_argument(
+        "--muestras", 
+        type=int,
+        default=MUESTRAS,
+        metavar="N",
+        help=f"Puntos en los que se evalúa cada curva de --exportar-datos antes de diezmarla "
+             f"(por defecto: {MUESTRAS})"
+    )
+    
+    parser.add_argument(
+        "--backend", 
+        choices=MOTORES,
+        default="numpy",
+        help="Motor numérico para evaluar sobre mallas: numpy (un hilo), hilos (NumPy por bloques "
+             "en varios hilos), numexpr o numba"
+    )
+    
+    parser.add_argument(
+        "--memoria-cache", 
+        type=float,
+        metavar="MB",
+        help="Memoria máxima estimada (en MB) de las derivadas en caché; se desalojan las menos recientes"
+    )
+    
+    parser.add_argument(
+        "--cache-compartida", 
+        action="store_true",
+        help="Guardar las derivadas en caché compartiendo las subexpresiones repetidas entre órdenes"
+    )
+    
+    parser.add_argument(
+        "--almacen", 
+        type=str,
+        metavar="ARCHIVO",
+        help="Almacén SQLite de resultados: reutiliza los coeficientes ya calculados y guarda "
+             "coeficientes, errores, tiempos y archivos generados"
+    )
+    
+    parser.add_argument(
+        "--consultar", 
+        action="store_true",
+        help="Listar los desarrollos del --almacen; filtra con -f, -x0, -o (orden mínimo), -r y --error-max"
+    )
+    
+    parser.add_argument(
+        "--error-max", 
+        type=float,
+        metavar="TOLERANCIA",
+        help="Con --consultar, solo los desarrollos con error máximo menor en el rango -r"
+    )
+    
+    parser.add_argument(
+        "--limite-tiempo", 
+        type=float,
+        metavar="SEGUNDOS",
+        help="Tiempo máximo de cada cálculo de la serie, simplificación e informe; al agotarse se "
+             "continúa con los coeficientes ya calculados"
+    )
+    
+    parser.add_argument(
+        "--limite-memoria", 
+        type=float,
+        metavar="MB",
+        help="Memoria máxima (en MB) del proceso que calcula la serie o cada informe del lote"
+    )
+    
+    parser.add_argument(
+        "--formatos-informe", 
+        nargs="+",
+        choices=FORMATOS_INFORME,
+        default=list(FORMATOS_INFORME),
+        metavar="FORMATO",
+        help="Formatos del informe de -s con -e: txt, csv (tabla completa), json (tabla completa y "
+             "resumen) y html (con las gráficas incrustadas). Por defecto, todos"
+    )
+    
+    parser.add_argument(
+        "--sin-polinomios", 
+        action="store_true",
+        help="No escribir los polinomios ni su forma simplificada en el informe de texto"
+    )
+    
+    parser.add_argument(
+        "--lote", 
+        type=str,
+        metavar="ARCHIVO",
+        help="Generar informes para varias funciones; cada línea del archivo es 'funcion; x0'"
+    )
+    
+    parser.add_argument(
+        "--perfil", 
+        action="store_true",
+        help="Mostrar el desglose de tiempos por etapa y guardar un perfil de cProfile"
+    )
+    
     return parser.parse_args()
 
+def validar_opciones_comunes(args):
+    """Valida las opciones que usan todos los modos (límites, caché y motor numérico)."""
+    for opcion, valor in (("--limite-tiempo", args.limite_tiempo), ("--limite-memoria", args.limite_memoria)):
+        if valor is not None and valor <= 0:
+            print(f"Error: {opcion} debe ser positivo.")
+            sys.exit(1)
+    
+    if args.memoria_cache is not None and args.memoria_cache <= 0:
+        print("Error: --memoria-cache debe ser positivo.")
+        sys.exit(1)
+    
+    if args.backend not in motores_disponibles():
+        print(f"Error: El motor {args.backend} requiere el paquete {args.backend}, que no está instalado.")
+        sys.exit(1)
+
 def validar_args(args):
     """Valida los argumentos de la línea de comandos."""
-    if args.orden < 0 or args.orden > 200:
+    # Antes de las ramas de cada modo, que terminan la validación con return
+    validar_opciones_comunes(args)
+    
+    if args.consultar:
+        if not args.almacen:
+            print("Error: --consultar requiere un almacén (--almacen ARCHIVO).")
+            sys.exit(1)
+        if not os.path.exists(args.almacen):
+            print(f"Error: No existe el almacén {args.almacen}.")
+            sys.exit(1)
+        if args.error_max is not None and args.error_max <= 0:
+            print("Error: --error-max debe ser positivo.")
+            sys.exit(1)
+        return
+    
+    if args.error_max is not None:
+        print("Error: --error-max solo se usa con --consultar.")
+        sys.exit(1)
+    
+    if args.punto is not None:
+        if args.funcion is None or args.orden is None:
+            print("Error: --punto requiere la función (-f) y el orden (-o).")
+            sys.exit(1)
+        if args.orden < 0 or args.orden > 200:
+            print("Error: El orden debe estar entre 0 y 200.")
+            sys.exit(1)
+        if args.variables and len(args.variables) != len(args.punto):
+            print("Error: --punto debe tener una coordenada por cada variable de --variables.")
+            sys.exit(1)
+        if args.evaluar and len(args.evaluar) % len(args.punto):
+            print(f"Error: Los puntos de -e deben tener {len(args.punto)} coordenadas cada uno.")
+            sys.exit(1)
+        if args.limite_tiempo or args.limite_memoria:
+            print("Error: --punto no admite los límites (--limite-tiempo, --limite-memoria): las derivadas "
+                  "parciales se calculan sin comprobaciones de límites.")
+            sys.exit(1)
+        return
+    
+    if args.variables or args.rango_y:
+        print("Error: --variables y --rango-y solo se usan con --punto.")
+        sys.exit(1)
+    
+    if args.precision is not None:
+        if args.funcion is None or args.punto_expansion is None or not (args.evaluar or args.graficar):
+            print("Error: --precision requiere la función (-f), el punto de expansión (-x0) y puntos (-e) o -p.")
+            sys.exit(1)
+        if args.precision <= 0:
+            print("Error: La tolerancia de --precision debe ser positiva.")
+            sys.exit(1)
+        if args.orden is not None and (args.orden < 0 or args.orden > 200):
+            print("Error: El orden debe estar entre 0 y 200.")
+            sys.exit(1)
+        if (args.lote or args.tramos is not None or args.tolerancia is not None or args.parametros
+                or args.limite_tiempo or args.limite_memoria):
+            print("Error: --precision no se combina con --lote, --tramos, --tolerancia, --parametros ni los "
+                  "límites (--limite-tiempo, --limite-memoria): los coeficientes se piden a medida que se suman.")
+            sys.exit(1)
+        return
+    
+    if args.tramos is not None:
+        if args.funcion is None or not args.rango or args.lote or args.parametros:
+            print("Error: --tramos requiere la función (-f) y el rango (-r), y no se combina con --lote ni "
+                  "--parametros.")
+            sys.exit(1)
+        if args.tramos <= 0 or args.rango[0] >= args.rango[1]:
+            print("Error: La tolerancia de --tramos debe ser positiva y el rango debe cumplir min < max.")
+            sys.exit(1)
+        if args.orden is not None and (args.orden < 0 or args.orden > 200):
+            print("Error: El orden debe estar entre 0 y 200.")
+            sys.exit(1)
+        return
+    
+    if args.parametros:
+        if args.funcion is None or args.punto_expansion is None or args.orden is None:
+            print("Error: --parametros requiere la función (-f), el punto de expansión (-x0) y el orden (-o).")
+            sys.exit(1)
+        if args.orden < 0 or args.orden > 200:
+            print("Error: El orden debe estar entre 0 y 200.")
+            sys.exit(1)
+        if (args.lote or args.cauchy is not None or args.almacen or args.evaluar or args.tolerancia is not None
+                or args.limite_tiempo or args.limite_memoria):
+            print("Error: --parametros no se combina con --lote, --cauchy, --almacen, -e, --tolerancia ni los "
+                  "límites (--limite-tiempo, --limite-memoria).")
+            sys.exit(1)
+        try:
+            args.valores_parametros = dict(analizar_rejilla(p) for p in args.parametros)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        if len(args.valores_parametros) != len(args.parametros):
+            print("Error: Hay parámetros repetidos en --parametros.")
+            sys.exit(1)
+        if args.rango and args.rango[0] >= args.rango[1]:
+            print("Error: El rango debe cumplir min < max.")
+            sys.exit(1)
+        return
+    
+    if args.lote:
+        if args.orden is None or not args.evaluar:
+            print("Error: --lote requiere el orden (-o) y puntos de evaluación (-e).")
+            sys.exit(1)
+    elif args.funcion is None or args.punto_expansion is None:
+        print("Error: Debe especificar la función (-f) y el punto de expansión (-x0), o un archivo --lote.")
+        sys.exit(1)
+    
+    if args.orden is None and args.tolerancia is None:
+        print("Error: Debe especificar el orden (-o) o una tolerancia (--tolerancia).")
+        sys.exit(1)
+    
+    if args.tolerancia is not None and args.tolerancia <= 0:
+        print("Error: La tolerancia debe ser positiva.")
+        sys.exit(1)
+    
+    if args.orden is not None and (args.orden < 0 or args.orden > 200):
         print("Error: El orden debe estar entre 0 y 200.")
         sys.exit(1)
     
@@ -95,6 +454,41 @@ def validar_args(args):
                 print(f"Error: Orden inválido {orden} en --comparar. Los órdenes deben estar entre 0 y 200.")
                 sys.exit(1)
     
+    if args.pade and (min(args.pade) < 0 or sum(args.pade) > 200):
+        print("Error: Los grados de --pade deben ser no negativos y sumar como máximo 200.")
+        sys.exit(1)
+    
+    if args.cauchy is not None:
+        if args.cauchy < 0:
+            print("Error: El radio de --cauchy debe ser positivo.")
+            sys.exit(1)
+        if args.almacen or args.lote or args.limite_tiempo or args.limite_memoria:
+            print("Error: --cauchy no se combina con --almacen, --lote ni los límites (--limite-tiempo, "
+                  "--limite-memoria): el almacén guarda coeficientes exactos y el cálculo tarda milisegundos.")
+            sys.exit(1)
+    
+    if args.chebyshev is not None and args.chebyshev <= 0:
+        print("Error: La tolerancia de --chebyshev debe ser positiva.")
+        sys.exit(1)
+    
+    if args.animacion:
+        try:
+            formato_animacion(args.animacion)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        if args.fps <= 0:
+            print("Error: --fps debe ser positivo.")
+            sys.exit(1)
+    
+    if args.exportar_datos:
+        if args.puntos_serie <= 0 or args.muestras < 2:
+            print("Error: --puntos-serie debe ser positivo y --muestras al menos 2.")
+            sys.exit(1)
+        if args.rango and args.rango[0] >= args.rango[1]:
+            print("Error: El rango de --exportar-datos debe cumplir min < max.")
+            sys.exit(1)
+    
     if args.graficar and not args.rango:
         print("Advertencia: No se especificó rango para graficar. Usando rango predeterminado.")
 
@@ -118,15 +512,31 @@ def imprimir_aproximacion(taylor, x0, orden):
     # Calcular la aproximación
     aprox = taylor.visualizar_serie_taylor(x0, orden)
     print(f"\n{aprox}\n")
+    print(f"Método de coeficientes: {taylor.metodo_coeficientes(x0)}\n")
     
     # Intentar simplificar
     try:
-        simplificado = sp.simplify(aprox)
+        simplificado = taylor.forma_simplificada(x0, orden)
         print("Forma simplificada:")
         print(f"{simplificado}\n")
     except Exception as e:
         print(f"No se pudo simplificar: {e}\n")
 
+def imprimir_info_cauchy(taylor, x0, orden):
+    """Imprime los radios y el error estimado de los coeficientes obtenidos con la integral de Cauchy."""
+    resultado = taylor.coeficientes_cauchy(x0, orden)
+    radios = resultado["radios"][:orden + 1]
+    errores = resultado["errores"][:orden + 1]
+    print("Integral de Cauchy:")
+    print(f"  Radios usados: {np.nanmin(radios):.4g} a {np.nanmax(radios):.4g} "
+          f"({resultado['evaluaciones']} evaluaciones de f)")
+    print(f"  Error estimado de los coeficientes: máximo {np.max(errores):.3e} "
+          f"(relativo {np.max(errores) / (np.max(np.abs(resultado['coeficientes'][:orden + 1])) or 1.0):.3e})")
+    if resultado["cota"] is not None:
+        maximo, radio = resultado["cota"]
+        print(f"  Cota del resto: |f| <= {maximo:.4g} en |z - x0| = {radio:.4g}")
+    print()
+
 def evaluar_en_puntos(taylor, x0, orden, puntos):
     """Evalúa la aproximación en puntos específicos."""
     if not puntos:
@@ -138,17 +548,16 @@ def evaluar_en_puntos(taylor, x0, orden, puntos):
     print("-" * 80)
     
     # Calcular la aproximación
-    aprox = taylor.visualizar_serie_taylor(x0, orden)
+    polinomio = taylor.obtener_polinomio(x0, orden)
     
-    # Crear funciones numéricas
-    x = sp.Symbol('x')
-    func_num = sp.lambdify(x, taylor.func, "numpy")
-    aprox_num = sp.lambdify(x, aprox, "numpy")
+    # Crear funciones numéricas (reutiliza la compilada si la función ya se evaluó)
+    func_num = taylor._lambdificar(taylor.func)
     
     for punto in puntos:
         try:
-            exacto = func_num(punto)
-            val_aprox = aprox_num(punto)
+            with taylor.metricas.medir("evaluate"):
+                exacto = func_num(punto)
+                val_aprox = polinomio.evaluar(punto)
             error = abs(exacto - val_aprox)
             
             # Calcular límite de error
@@ -160,8 +569,8 @@ def evaluar_en_puntos(taylor, x0, orden, puntos):
     
     print("-" * 80)
 
-def generar_graficas(taylor, x0, ordenes, rango_x, dir_guardar=None):
-    """Genera gráficas para la aproximación y errores."""
+def generar_graficas(taylor, x0, ordenes, rango_x, dir_guardar=None, pade=None, tolerancia_chebyshev=None):
+    """Genera gráficas para la aproximación y errores y devuelve las rutas guardadas."""
     if not rango_x:
         # Rango predeterminado: x0 ± 2
         rango_x = (x0 - 2, x0 + 2)
@@ -173,15 +582,366 @@ def generar_graficas(taylor, x0, ordenes, rango_x, dir_guardar=None):
     # Graficar aproximaciones
     print("\nGenerando gráfica de aproximación...")
     ruta_aprox = os.path.join(dir_guardar, "aproximacion_taylor.png") if dir_guardar else None
-    taylor.graficar_aproximaciones(x0, ordenes, rango_x, ruta_guardar=ruta_aprox)
+    taylor.graficar_aproximaciones(x0, ordenes, rango_x, ruta_guardar=ruta_aprox, 
+                                   pade=pade, tolerancia_chebyshev=tolerancia_chebyshev)
     
     # Graficar errores
     print("Generando gráfica de error...")
     ruta_error = os.path.join(dir_guardar, "error_taylor.png") if dir_guardar else None
-    taylor.graficar_errores(x0, ordenes, rango_x, ruta_guardar=ruta_error)
+    taylor.graficar_errores(x0, ordenes, rango_x, ruta_guardar=ruta_error, 
+                            pade=pade, tolerancia_chebyshev=tolerancia_chebyshev)
     
     if dir_guardar:
         print(f"Gráficas guardadas en {dir_guardar}")
+        return {"grafica_aproximacion": ruta_aprox, "grafica_error": ruta_error}
+    return {}
+
+def comparar_aproximantes(taylor, x0, orden, rango_x, pade, tolerancia_chebyshev):
+    """Imprime el coste de evaluación y el error de Taylor frente a Padé y Chebyshev."""
+    if not rango_x:
+        rango_x = (x0 - 2, x0 + 2)
+    
+    print(f"\nComparación de aproximantes en [{rango_x[0]:g}, {rango_x[1]:g}]:")
+    print("-" * 80)
+    print(f"{'Aproximante':<25} | {'Operaciones':>11} | {'Tiempo (µs)':>12} | {'Error máximo':>14}")
+    print("-" * 80)
+    for fila in taylor.comparar_aproximantes(x0, orden, tuple(rango_x), pade, tolerancia_chebyshev):
+        print(f"{fila['nombre']:<25} | {fila['operaciones']:>11d} | {1e6 * fila['tiempo']:>12.1f} | "
+              f"{fila['error_maximo']:>14.6e}")
+    print("-" * 80)
+
+def exportar_nucleos(taylor, x0, ordenes, directorio, rango_x):
+    """Exporta los núcleos de evaluación, imprime su verificación y devuelve los archivos por formato."""
+    print(f"\nExportando núcleos de evaluación en {directorio}...")
+    resultado = taylor.exportar_nucleos(x0, ordenes, directorio, rango_x=tuple(rango_x) if rango_x else None)
+    
+    for formato, rutas in resultado["archivos"].items():
+        print(f"  {formato}: {', '.join(rutas)}")
+    for formato, motivo in resultado["omitidos"].items():
+        print(f"  {formato}: omitido ({motivo})")
+    
+    print("-" * 80)
+    print(f"{'Formato':<8} | {'Orden':>5} | {'Dif. polinomio':>14} | {'Error vs f':>12} | {'Tiempo (µs)':>11} | {'f (µs)':>9}")
+    print("-" * 80)
+    for fila in resultado["verificacion"]:
+        if fila["error"]:
+            print(f"{fila['formato']:<8} | {'-':>5} | Error: {fila['error']}")
+            continue
+        print(f"{fila['formato']:<8} | {fila['orden']:>5d} | {fila['error_vs_polinomio']:>14.3e} | "
+              f"{fila['error_vs_funcion']:>12.3e} | {1e6 * fila['tiempo']:>11.1f} | {1e6 * fila['tiempo_funcion']:>9.1f}")
+    print("-" * 80)
+    return resultado["archivos"]
+
+def exportar_animacion(taylor, x0, orden, rango_x, ruta, fps):
+    """Exporta la animación de la convergencia de P_n con n = 0..orden y devuelve los archivos escritos."""
+    if not rango_x:
+        rango_x = (x0 - 2, x0 + 2)
+    print(f"\nExportando animación de convergencia (órdenes 0 a {orden})...")
+    archivos = taylor.animar_convergencia(x0, orden, tuple(rango_x), ruta, fps=fps)
+    if len(archivos) > 1:
+        print(f"  {len(archivos)} fotogramas: {archivos[0]} ... {archivos[-1]}")
+    return archivos
+
+def exportar_datos_grafica(taylor, x0, ordenes, args):
+    """Exporta las curvas diezmadas de f, las aproximaciones y los errores y devuelve la ruta."""
+    rango_x = tuple(args.rango) if args.rango else (x0 - 2, x0 + 2)
+    print(f"\nExportando datos de las gráficas: {args.muestras} muestras por curva, diezmadas con "
+          f"{args.diezmado} a unos {args.puntos_serie} puntos...")
+    return taylor.exportar_datos_grafica(args.exportar_datos, x0, ordenes, rango_x, args.muestras,
+                                         args.puntos_serie, args.diezmado)
+
+def consultar_almacen(taylor, args):
+    """Imprime los desarrollos del almacén que cumplen los filtros de la línea de comandos."""
+    func_hash = None
+    if args.funcion:
+        taylor.establecer_funcion(args.funcion)
+        func_hash = taylor.func_hash
+    
+    filas = taylor.almacen.consultar(func_hash=func_hash, x0=args.punto_expansion, orden_minimo=args.orden,
+                                     error_maximo=args.error_max, rango_x=tuple(args.rango) if args.rango else None)
+    
+    print(f"Desarrollos en {args.almacen}: {len(filas)}")
+    print("-" * 110)
+    print(f"{'Función':<30} | {'x0':>8} | {'Orden':>5} | {'Motor':<7} | {'Método':<14} | "
+          f"{'Tiempo (s)':>10} | {'Error máx.':>10} | {'Intervalo':<17}")
+    print("-" * 110)
+    for fila in filas:
+        tiempo = f"{fila['tiempo']:10.4f}" if fila["tiempo"] is not None else f"{'-':>10}"
+        error = f"{fila['error']:10.3e}" if fila["error"] is not None else f"{'-':>10}"
+        intervalo = f"[{fila['intervalo'][0]:g}, {fila['intervalo'][1]:g}]" if fila["intervalo"] else "-"
+        print(f"{fila['funcion'][:30]:<30} | {fila['x0']:8.4g} | {fila['orden']:5d} | {fila['motor']:<7} | "
+              f"{(fila['metodo'] or '-'):<14} | {tiempo} | {error} | {intervalo:<17}")
+        for tipo, ruta in taylor.almacen.artefactos(fila["id"]):
+            print(f"{'':<30}   {tipo}: {ruta}")
+    print("-" * 110)
+
+def elegir_orden(taylor, x0, tolerancia, orden_max, rango_x, puntos):
+    """Elige el menor orden que cumple la tolerancia en el intervalo de interés."""
+    if rango_x:
+        intervalo = tuple(rango_x)
+    elif puntos:
+        intervalo = (min(puntos + [x0]), max(puntos + [x0]))
+    else:
+        # Mismo rango predeterminado que las gráficas: x0 ± 2
+        intervalo = (x0 - 2, x0 + 2)
+    
+    print(f"Buscando el menor orden con error < {tolerancia:g} en [{intervalo[0]:g}, {intervalo[1]:g}]...")
+    orden = taylor.orden_minimo(x0, intervalo, tolerancia, orden_max)
+    
+    radio = taylor.estimar_radio_convergencia(x0, min(orden + 1, 20))
+    print(f"Radio de convergencia estimado: {radio['radio']:g} (método: {radio['metodo']})")
+    print(f"Orden elegido: {orden}")
+    return orden
+
+def ejecutar_multivariable(args, memoria_cache=None):
+    """Calcula, imprime y grafica el desarrollo de Taylor de una función de varias variables."""
+    aprox = AproximacionMultivariable(memoria_cache=memoria_cache, cache_compartida=args.cache_compartida)
+    if args.perfil:
+        aprox.metricas.iniciar_perfil()
+    aprox.establecer_funcion(args.funcion, args.variables)
+    punto, orden = tuple(args.punto), args.orden
+    nombres = ", ".join(map(str, aprox.variables))
+    polinomio = aprox.obtener_polinomio(punto, orden)
+    
+    print(f"Función: f({nombres}) = {args.funcion}")
+    print(f"Punto de expansión: ({nombres}) = {punto}")
+    print(f"Orden total de aproximación: {orden}")
+    print("-" * 80)
+    
+    print("\nAproximación de Serie de Taylor:")
+    print(f"\n{polinomio.a_expresion()}\n")
+    metricas = aprox.obtener_metricas()
+    print(f"Términos: {len(polinomio)}; derivadas parciales distintas: {metricas['cache']['derivadas']['entradas']} "
+          f"(se evitan {metricas['ordenaciones_evitadas']} derivaciones por ordenaciones repetidas)")
+    
+    if orden >= 1:
+        print("\nSensibilidades en el punto de expansión:")
+        for nombre, valor in zip(aprox.variables, polinomio.gradiente()):
+            print(f"  ∂f/∂{nombre} = {valor:.10g}")
+    if orden >= 2:
+        print("Matriz hessiana:")
+        print("  " + np.array2string(polinomio.hessiana(), precision=6, prefix="  "))
+    
+    if args.evaluar:
+        puntos = np.array(args.evaluar).reshape(-1, aprox.dimension)
+        exactos = aprox.evaluar_funcion(puntos)
+        aproximados = aprox.evaluar(punto, orden, puntos)
+        print("\nEvaluación en puntos específicos:")
+        print("-" * 80)
+        print(f"{'Punto':^25} | {'Exacto':^15} | {'Aproximación':^15} | {'Error':^15}")
+        print("-" * 80)
+        for p, exacto, val_aprox in zip(puntos, exactos, aproximados):
+            texto = "(" + ", ".join(f"{c:g}" for c in p) + ")"
+            print(f"{texto:^25} | {exacto:15.6f} | {val_aprox:15.6f} | {abs(exacto - val_aprox):15.6e}")
+        print("-" * 80)
+    
+    if args.graficar:
+        if aprox.dimension < 2:
+            print("Advertencia: La superficie de error necesita al menos dos variables; no se grafica.")
+        else:
+            # Rangos predeterminados: cada coordenada ± 1
+            rango_x = tuple(args.rango) if args.rango else (punto[0] - 1, punto[0] + 1)
+            rango_y = tuple(args.rango_y or args.rango or (punto[1] - 1, punto[1] + 1))
+            ruta = None
+            if args.guardar:
+                os.makedirs(args.guardar, exist_ok=True)
+                ruta = os.path.join(args.guardar, "superficie_error.png")
+            print("\nGenerando superficie de error...")
+            aprox.graficar_superficie_error(punto, orden, (rango_x, rango_y), ruta_guardar=ruta)
+    
+    if args.perfil:
+        imprimir_perfil(aprox, args.guardar)
+
+def ejecutar_por_tramos(taylor, args):
+    """Construye, imprime, guarda y grafica el aproximante por tramos de la función."""
+    orden_max = args.orden if args.orden is not None else 20
+    rango_x = tuple(args.rango)
+    print(f"Función: f(x) = {taylor.func_str}")
+    print(f"Aproximante por tramos en [{rango_x[0]:g}, {rango_x[1]:g}] con tolerancia {args.tramos:g} "
+          f"(orden máximo {orden_max})")
+    print("-" * 80)
+    
+    inicio = time.perf_counter()
+    aproximante = taylor.aproximante_por_tramos(rango_x, args.tramos, orden_max)
+    tiempo = time.perf_counter() - inicio
+    
+    x_vals = np.linspace(rango_x[0], rango_x[1], 1000000)
+    inicio = time.perf_counter()
+    aproximante.evaluar(x_vals)
+    tiempo_evaluacion = time.perf_counter() - inicio
+    
+    print(f"Tramos: {len(aproximante)}; órdenes {int(aproximante.ordenes.min())} a {aproximante.orden_maximo}; "
+          f"índice {'uniforme (O(1))' if aproximante.indice is not None else 'por bisección'}")
+    print(f"Error máximo medido: {aproximante.error_maximo:.3e}")
+    print(f"Construcción: {tiempo:.3f} s; evaluación de 10⁶ puntos: {1e3 * tiempo_evaluacion:.1f} ms")
+    if len(aproximante) <= 40:
+        print(f"\n{'Tramo':>5} | {'Intervalo':^27} | {'Centro':>12} | {'Orden':>5}")
+        print("-" * 60)
+        for i in range(len(aproximante)):
+            intervalo = f"[{aproximante.bordes[i]:.6g}, {aproximante.bordes[i + 1]:.6g}]"
+            print(f"{i:>5d} | {intervalo:^27} | {aproximante.centros[i]:>12.6g} | {aproximante.ordenes[i]:>5d}")
+        print("-" * 60)
+    
+    if args.evaluar:
+        func_num = taylor._lambdificar(taylor.func)
+        print("\nEvaluación en puntos específicos:")
+        print("-" * 80)
+        print(f"{'x':^15} | {'Exacto':^15} | {'Aproximación':^15} | {'Error':^15} | {'Tramo':^6}")
+        print("-" * 80)
+        for punto in args.evaluar:
+            with np.errstate(all='ignore'):
+                exacto = float(np.real(func_num(punto)))
+            val_aprox = float(aproximante.evaluar(punto))
+            print(f"{punto:15.6f} | {exacto:15.6f} | {val_aprox:15.6f} | {abs(exacto - val_aprox):15.6e} | "
+                  f"{int(aproximante.tramo(punto)):^6d}")
+        print("-" * 80)
+    
+    ruta_grafica = None
+    if args.guardar:
+        ruta = aproximante.guardar(os.path.join(args.guardar, "aproximante_tramos.npz"))
+        print(f"\nAproximante guardado en {ruta} (cargar con AproximantePorTramos.cargar)")
+        ruta_grafica = os.path.join(args.guardar, "error_tramos.png")
+    if args.graficar:
+        print("\nGenerando gráfica de error por tramos...")
+        taylor.graficar_por_tramos(aproximante, ruta_guardar=ruta_grafica)
+
+def ejecutar_serie_perezosa(taylor, args):
+    """Evalúa y grafica la serie perezosa hasta la tolerancia de --precision."""
+    x0, tolerancia = args.punto_expansion, args.precision
+    orden_maximo = args.orden if args.orden is not None else 200
+    print(f"Función: f(x) = {taylor.func_str}")
+    print(f"Serie perezosa alrededor de x0 = {x0} hasta la tolerancia {tolerancia:g} (orden máximo {orden_maximo})")
+    print("-" * 80)
+    
+    serie = taylor.serie_perezosa(x0)
+    if args.evaluar:
+        inicio = time.perf_counter()
+        resultado = serie.evaluar(np.array(args.evaluar, dtype=float), tolerancia, orden_maximo)
+        tiempo = time.perf_counter() - inicio
+        func_num = taylor._lambdificar(taylor.func)
+        print("\nEvaluación en puntos específicos:")
+        print("-" * 96)
+        print(f"{'x':^15} | {'Exacto':^15} | {'Serie':^15} | {'Error':^15} | {'Cola estimada':^15} | {'Términos':^8}")
+        print("-" * 96)
+        for i, punto in enumerate(args.evaluar):
+            with np.errstate(all='ignore'):
+                exacto = float(np.real(func_num(punto)))
+            valor = float(np.real(resultado["valores"][i]))
+            aviso = "" if resultado["convergidos"][i] else " (sin converger)"
+            print(f"{punto:15.6f} | {exacto:15.6f} | {valor:15.6f} | {abs(exacto - valor):15.6e} | "
+                  f"{resultado['errores'][i]:15.6e} | {resultado['ordenes'][i] + 1:^8d}{aviso}")
+        print("-" * 96)
+        print(f"Coeficientes calculados: {serie.calculados} (de {orden_maximo + 1} posibles); {1e3 * tiempo:.1f} ms")
+    
+    if args.graficar:
+        rango_x = tuple(args.rango) if args.rango else (x0 - 2, x0 + 2)
+        ruta = None
+        if args.guardar:
+            os.makedirs(args.guardar, exist_ok=True)
+            ruta = os.path.join(args.guardar, "serie_perezosa.png")
+        print("\nGenerando gráfica de la serie perezosa...")
+        taylor.graficar_serie_perezosa(x0, rango_x, tolerancia, orden_maximo, ruta_guardar=ruta)
+
+def ejecutar_barrido(taylor, args):
+    """Calcula, imprime, guarda y grafica el barrido de los parámetros libres de la función."""
+    x0, orden = args.punto_expansion, args.orden
+    rango_x = tuple(args.rango) if args.rango else (x0 - 2, x0 + 2)
+    valores = args.valores_parametros
+    print(f"Función: f(x) = {taylor.func_str}")
+    print(f"Punto de expansión: x0 = {x0}; orden: {orden}")
+    print("Parámetros: " + "; ".join(f"{nombre}: {len(v)} valores en [{v.min():g}, {v.max():g}]"
+                                     for nombre, v in valores.items()))
+    print("-" * 80)
+    
+    inicio = time.perf_counter()
+    compilados = taylor.coeficientes_parametricos(x0, orden)
+    tiempo_simbolico = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    resultado = taylor.barrido_parametros(x0, orden, valores, rango_x)
+    tiempo_barrido = time.perf_counter() - inicio
+    
+    print("\nCoeficientes en función de los parámetros:")
+    for k, expresion in enumerate(compilados.expresiones[:8]):
+        print(f"  c_{k} = {expresion}")
+    if orden >= 8:
+        print(f"  ... ({orden - 7} coeficientes más)")
+    
+    combinaciones = resultado["coeficientes"][..., 0].size
+    print(f"\nCombinaciones: {combinaciones}; tensor de coeficientes {resultado['coeficientes'].shape}")
+    print(f"Derivación y compilación (una vez): {tiempo_simbolico:.3f} s; coeficientes y errores de todas "
+          f"las combinaciones: {tiempo_barrido:.3f} s")
+    
+    estadisticas = resultado["estadisticas"]
+    print(f"\nError máximo en [{rango_x[0]:g}, {rango_x[1]:g}] sobre la rejilla:")
+    print("-" * 80)
+    if estadisticas["maximo"] is None:
+        print("Ninguna combinación tiene un desarrollo finito en el rango.")
+    else:
+        def texto(combinacion):
+            return ", ".join(f"{nombre} = {valor:g}" for nombre, valor in combinacion.items())
+        print(f"  Peor:    {estadisticas['maximo']:.6e} ({texto(estadisticas['peor'])})")
+        print(f"  Mediana: {estadisticas['mediana']:.6e}")
+        print(f"  Mejor:   {estadisticas['minimo']:.6e} ({texto(estadisticas['mejor'])})")
+    if estadisticas["invalidas"]:
+        print(f"  Combinaciones sin desarrollo finito en el rango: {estadisticas['invalidas']}")
+    print("-" * 80)
+    
+    ruta_grafica = None
+    if args.guardar:
+        os.makedirs(args.guardar, exist_ok=True)
+        ruta = os.path.join(args.guardar, "barrido_parametros.npz")
+        np.savez(ruta, coeficientes=resultado["coeficientes"], error_maximo=resultado["error_maximo"],
+                 error_medio=resultado["error_medio"], x=resultado["x"],
+                 **{f"valores_{nombre}": v for nombre, v in resultado["valores"].items()})
+        print(f"\nTensores guardados en {ruta} (ejes: {', '.join(resultado['parametros'])}, orden)")
+        ruta_grafica = os.path.join(args.guardar, "barrido_parametros.png")
+    if args.graficar:
+        print("\nGenerando gráfica del barrido...")
+        taylor.graficar_barrido(resultado, ruta_guardar=ruta_grafica)
+
+def calcular_con_limites(taylor, x0, orden, limites, motor, almacen=None):
+    """
+    Calcula los coeficientes en un proceso hijo con límites de tiempo y memoria y los carga en taylor.
+    
+    Returns:
+        Tupla (orden, limite_alcanzado) con el orden disponible (el pedido o, si se alcanzó un
+        límite, el de los coeficientes obtenidos) y si se alcanzó un límite.
+    """
+    print(f"Calculando la serie con límites ({limites.tiempo or '-'} s, "
+          f"{f'{limites.memoria / 1024**2:.0f} MB' if limites.memoria else '-'})...")
+    resultado = ejecutar_trabajo(taylor.func_str, "serie", (x0, orden), limites, motor, almacen)
+    if resultado["estado"] == ERROR:
+        raise ValueError(resultado["mensaje"])
+    
+    taylor.cargar_coeficientes(x0, resultado["coeficientes"], resultado["metodo"] or "derivadas")
+    if resultado["estado"] == COMPLETO:
+        return orden, False
+    
+    alcanzado = resultado["orden_alcanzado"]
+    print(f"Aviso: {resultado['mensaje']} ({resultado['estado']}).")
+    if alcanzado < 0:
+        raise ValueError("No se calculó ningún coeficiente dentro de los límites")
+    print(f"Se continúa con los coeficientes calculados hasta el orden {alcanzado}.")
+    return alcanzado, True
+
+def imprimir_perfil(taylor, dir_guardar=None):
+    """Detiene la captura de perfil, la guarda e imprime el desglose por etapa."""
+    ruta_perfil = os.path.join(dir_guardar or ".", "perfil_taylor.prof")
+    if dir_guardar:
+        os.makedirs(dir_guardar, exist_ok=True)
+    stats = taylor.metricas.detener_perfil(ruta_perfil)
+    
+    print("\nPerfil de rendimiento por etapa:")
+    print("-" * 80)
+    print(taylor.metricas.formatear())
+    print("-" * 80)
+    
+    if stats is not None:
+        print("Funciones con mayor tiempo acumulado:")
+        stats.stream = sys.stdout
+        stats.sort_stats("cumulative").print_stats(10)
+    
+    print(f"Perfil guardado en {ruta_perfil} (ver con: python -m pstats {ruta_perfil})")
 
 def main():
     """Función principal para ejecutar la herramienta de aproximación de series de Taylor."""
@@ -202,16 +962,106 @@ def main():
     imprimir_encabezado()
     
     # Crear objeto de aproximación de Taylor
-    taylor = AproximacionTaylor()
+    memoria_cache = int(args.memoria_cache * 1024**2) if args.memoria_cache is not None else None
+    limites = Limites(args.limite_tiempo,
+                      int(args.limite_memoria * 1024**2) if args.limite_memoria is not None else None)
     
     try:
+        # Dentro del try: un motor que no se puede crear se informa como cualquier otro error
+        taylor = AproximacionTaylor(motor=args.backend, memoria_cache=memoria_cache,
+                                    cache_compartida=args.cache_compartida)
+        if args.perfil:
+            taylor.metricas.iniciar_perfil()
+        
+        if args.almacen:
+            taylor.establecer_almacen(args.almacen)
+        
+        # Consultas al almacén: no se calcula nada
+        if args.consultar:
+            consultar_almacen(taylor, args)
+            return
+        
+        # Funciones de varias variables: desarrollo alrededor de --punto
+        if args.punto is not None:
+            ejecutar_multivariable(args, memoria_cache)
+            print("\n¡Aproximación de serie de Taylor completada exitosamente!")
+            return
+        
+        # Modo por lotes: un informe por cada función del archivo y un índice común
+        if args.lote:
+            ordenes = [args.orden]
+            if args.comparar:
+                ordenes = sorted(set(ordenes + args.comparar))
+            trabajos = leer_archivo_lote(args.lote)
+            print(f"Generando {len(trabajos)} informes por lotes...")
+            archivo_indice = generar_informes_lote(trabajos, ordenes, args.evaluar, 
+                                                   args.guardar or "resultados_lote", args.backend,
+                                                   memoria_cache, args.cache_compartida, args.almacen,
+                                                   limites if limites.activos else None,
+                                                   args.formatos_informe, not args.sin_polinomios)
+            print(f"\n¡Lote completado! Índice: {archivo_indice}")
+            return
+        
         # Establecer la función
         taylor.establecer_funcion(args.funcion)
+        if args.cauchy is not None:
+            taylor.establecer_cauchy(radio=args.cauchy or None)
+        
+        # Familias con parámetros libres: sin --parametros no hay valores con los que evaluar
+        libres = ", ".join(s.name for s in parametros_libres(taylor.func, taylor.x))
+        if args.parametros:
+            ejecutar_barrido(taylor, args)
+            if args.perfil:
+                imprimir_perfil(taylor, args.guardar)
+            print("\n¡Aproximación de serie de Taylor completada exitosamente!")
+            return
+        if libres:
+            raise ValueError(f"La función tiene parámetros libres ({libres}); dé sus valores con "
+                             f"--parametros, por ejemplo --parametros a=0:1:100")
+        
+        # Serie perezosa: el orden de cada punto lo decide la tolerancia
+        if args.precision is not None:
+            ejecutar_serie_perezosa(taylor, args)
+            if args.perfil:
+                imprimir_perfil(taylor, args.guardar)
+            print("\n¡Aproximación de serie de Taylor completada exitosamente!")
+            return
+        
+        # Aproximante por tramos en todo el rango -r: no hay un único punto de expansión
+        if args.tramos is not None:
+            # Los límites se comprueban entre niveles de bisección y al derivar en este proceso
+            if limites.activos:
+                taylor.establecer_limites(limites)
+            ejecutar_por_tramos(taylor, args)
+            if args.perfil:
+                imprimir_perfil(taylor, args.guardar)
+            print("\n¡Aproximación de serie de Taylor completada exitosamente!")
+            return
         
         # Obtener parámetros
         x0 = args.punto_expansion
         orden = args.orden
         
+        # Comprobación previa del dominio: falla antes de derivar si x0 es singular
+        taylor.verificar_punto(x0)
+        
+        # Elegir automáticamente el orden si se especifica una tolerancia
+        if args.tolerancia is not None:
+            orden_max = orden if orden is not None else 200
+            orden = elegir_orden(taylor, x0, args.tolerancia, orden_max, args.rango, args.evaluar)
+        
+        # Con límites, los coeficientes se calculan en un proceso hijo que se puede terminar, y el
+        # resto de pasos (simplificación, informe) comprueba los límites entre órdenes
+        limite_alcanzado = False
+        if limites.activos:
+            # Un solo plazo para todo el trabajo: los pasos siguientes usan el tiempo que deje el hijo
+            limites.iniciar()
+            orden, limite_alcanzado = calcular_con_limites(taylor, x0, orden, limites, args.backend, args.almacen)
+            # Si el hijo agotó un límite, el resultado parcial ya está calculado: se muestra y se
+            # evalúa sin volver a imponer un plazo vencido
+            if not limite_alcanzado:
+                taylor.establecer_limites(limites)
+        
         # Imprimir información de la función
         imprimir_info_funcion(taylor, x0, orden)
         
@@ -219,15 +1069,15 @@ def main():
         if args.paralelo:
             print("Usando cálculo en paralelo...")
             try:
-                terminos = taylor.calcular_terminos_taylor_paralelo(x0, orden)
-                # Sumar los términos para obtener la aproximación
-                aprox = sum(terminos.values())
+                polinomio = taylor.calcular_polinomio_paralelo(x0, orden)
+                aprox = polinomio.a_expresion(taylor.x)
                 print("\nAproximación de Serie de Taylor (calculada en paralelo):")
                 print(f"\n{aprox}\n")
+                print(f"Método de coeficientes: {taylor.metodo_coeficientes(x0)}\n")
                 
                 # Intentar simplificar
                 try:
-                    simplificado = sp.simplify(aprox)
+                    simplificado = taylor.forma_simplificada(x0, orden)
                     print("Forma simplificada:")
                     print(f"{simplificado}\n")
                 except Exception as e:
@@ -239,17 +1089,45 @@ def main():
         else:
             imprimir_aproximacion(taylor, x0, orden)
         
+        if args.cauchy is not None:
+            imprimir_info_cauchy(taylor, x0, orden)
+        
         # Evaluar en puntos específicos si se solicita
         if args.evaluar:
             evaluar_en_puntos(taylor, x0, orden, args.evaluar)
         
+        # Comparar con aproximantes alternativos si se solicita
+        if args.pade or args.chebyshev is not None:
+            comparar_aproximantes(taylor, x0, orden, args.rango, args.pade, args.chebyshev)
+        
+        # Archivos generados, que se registran en el almacén con el desarrollo
+        artefactos = {}
+        
+        # Exportar núcleos de evaluación si se solicita
+        if args.exportar_nucleos:
+            ordenes_a_exportar = sorted(set([orden] + (args.comparar or [])))
+            archivos = exportar_nucleos(taylor, x0, ordenes_a_exportar, args.exportar_nucleos, args.rango)
+            for formato, rutas in archivos.items():
+                artefactos.update({f"nucleo_{formato}_{i}": ruta for i, ruta in enumerate(rutas)})
+        
+        # Exportar la animación de convergencia si se solicita
+        if args.animacion:
+            archivos = exportar_animacion(taylor, x0, orden, args.rango, args.animacion, args.fps)
+            artefactos["animacion"] = archivos[0] if len(archivos) == 1 else os.path.dirname(archivos[0]) or "."
+        
+        # Exportar los datos diezmados de las gráficas si se solicita
+        if args.exportar_datos:
+            ordenes_a_exportar = sorted(set([orden] + (args.comparar or [])))
+            artefactos["datos_grafica"] = exportar_datos_grafica(taylor, x0, ordenes_a_exportar, args)
+        
         # Generar gráficas si se solicita
         if args.graficar:
             ordenes_a_graficar = [orden]
             if args.comparar:
                 ordenes_a_graficar = sorted(set(ordenes_a_graficar + args.comparar))
             
-            generar_graficas(taylor, x0, ordenes_a_graficar, args.rango, args.guardar)
+            artefactos.update(generar_graficas(taylor, x0, ordenes_a_graficar, args.rango, args.guardar, 
+                                               args.pade, args.chebyshev))
         
         # Generar un informe completo si se especifica directorio para guardar
         if args.guardar and args.evaluar:
@@ -259,11 +1137,37 @@ def main():
             if args.comparar:
                 ordenes_a_informar = sorted(set(ordenes_a_informar + args.comparar))
             
-            archivo_informe = taylor.generar_informe(x0, ordenes_a_informar, args.evaluar, args.guardar)
+            archivo_informe = taylor.generar_informe(x0, ordenes_a_informar, args.evaluar, args.guardar, 
+                                                     pade=args.pade, tolerancia_chebyshev=args.chebyshev,
+                                                     formatos=args.formatos_informe,
+                                                     polinomios=not args.sin_polinomios)
             print(f"Informe generado: {archivo_informe}")
+            artefactos["informe"] = archivo_informe
         
+        # Registrar errores, evaluaciones y archivos en el almacén
+        if args.almacen:
+            rango_x = tuple(args.rango) if args.rango else (x0 - 2, x0 + 2)
+            for orden_registro in sorted(set([orden] + (args.comparar or []))):
+                taylor.registrar_resultados(x0, orden_registro, rango_x, args.evaluar,
+                                            artefactos if orden_registro == orden else None)
+            print(f"Resultados registrados en el almacén {args.almacen}")
+        
+        if args.perfil:
+            imprimir_perfil(taylor, args.guardar)
+        
+        if limite_alcanzado:
+            print(f"\nAproximación parcial hasta el orden {orden}: se alcanzó un límite antes del orden pedido.")
+            sys.exit(CODIGO_LIMITE)
         print("\n¡Aproximación de serie de Taylor completada exitosamente!")
     
+    except LimiteExcedido as e:
+        # Como en calcular_con_limites: se informa el estado y se conserva lo ya calculado
+        print(f"Aviso: {e} ({e.motivo}).")
+        if e.parcial is not None:
+            print(f"Coeficientes calculados hasta el orden {e.parcial.orden}.")
+        print("Se conservan los resultados y archivos generados antes de alcanzar el límite.")
+        sys.exit(CODIGO_LIMITE)
+    
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
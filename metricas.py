@@ -0,0 +1,183 @@
+"""
+Módulo de Métricas de Rendimiento
+
+Este módulo proporciona instrumentación ligera para medir el tiempo empleado en cada
+etapa del cálculo de series de Taylor (análisis, derivación, sustitución, compilación,
+evaluación, simplificación, graficación y acceso al almacén de resultados), así como la tasa de aciertos de las cachés.
+
+Las etapas se pueden anidar (una compilación dentro de una evaluación, por ejemplo): cada
+etapa acumula solo su tiempo propio, sin el de las etapas que contiene, de modo que la suma
+de las etapas es el tiempo medido y los porcentajes suman 100.
+"""
+
+import threading
+import time
+import io
+import cProfile
+import pstats
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+# Etapas instrumentadas en el orden en que se informan
+ETAPAS = ("parse", "differentiate", "substitute", "lambdify", "evaluate", "simplify", "render", "store")
+
+
+class RegistroMetricas:
+    """
+    Registro de tiempos, contadores y aciertos de caché por etapa.
+    """
+
+    def __init__(self):
+        """Inicializa el registro con todos los contadores a cero."""
+        self.reiniciar()
+        self._pilas = threading.local()  # Por hilo: tiempo de las etapas anidadas en las abiertas
+        self._perfilador = None
+        self._memoria_activa = False
+
+    def reiniciar(self) -> None:
+        """Pone a cero todos los tiempos, contadores y estadísticas de caché."""
+        self.tiempos = {etapa: 0.0 for etapa in ETAPAS}
+        self.llamadas = {etapa: 0 for etapa in ETAPAS}
+        self.contadores = {}
+        self.cache_aciertos = {}
+        self.cache_fallos = {}
+        self.memoria_pico = None
+
+    @contextmanager
+    def medir(self, etapa: str):
+        """
+        Mide el tiempo de un bloque y lo acumula en la etapa indicada, descontando el de las
+        etapas que se midan dentro del bloque.
+
+        Args:
+            etapa: Nombre de la etapa (ver ETAPAS).
+        """
+        pila = getattr(self._pilas, "pila", None)
+        if pila is None:
+            pila = self._pilas.pila = []
+        pila.append(0.0)
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            duracion = time.perf_counter() - inicio
+            anidado = pila.pop()
+            if pila:
+                pila[-1] += duracion
+            self.tiempos[etapa] = self.tiempos.get(etapa, 0.0) + duracion - anidado
+            self.llamadas[etapa] = self.llamadas.get(etapa, 0) + 1
+
+    def incrementar(self, contador: str, cantidad: int = 1) -> None:
+        """Incrementa un contador libre."""
+        self.contadores[contador] = self.contadores.get(contador, 0) + cantidad
+
+    def registrar_cache(self, nombre: str, acierto: bool) -> None:
+        """
+        Registra un acceso a una caché.
+
+        Args:
+            nombre: Nombre de la caché (por ejemplo, "derivadas").
+            acierto: True si el valor ya estaba en la caché.
+        """
+        destino = self.cache_aciertos if acierto else self.cache_fallos
+        destino[nombre] = destino.get(nombre, 0) + 1
+
+    def tasa_aciertos(self, nombre: str) -> Optional[float]:
+        """Devuelve la tasa de aciertos de una caché, o None si no hubo accesos."""
+        aciertos = self.cache_aciertos.get(nombre, 0)
+        total = aciertos + self.cache_fallos.get(nombre, 0)
+        return aciertos / total if total else None
+
+    def iniciar_perfil(self, memoria: bool = True) -> None:
+        """
+        Inicia la captura con cProfile y, opcionalmente, tracemalloc.
+
+        Args:
+            memoria: Si se debe rastrear también la memoria con tracemalloc.
+        """
+        self._perfilador = cProfile.Profile()
+        self._perfilador.enable()
+        if memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._memoria_activa = True
+
+    def detener_perfil(self, ruta_guardar: str = None) -> Optional[pstats.Stats]:
+        """
+        Detiene la captura iniciada con iniciar_perfil.
+
+        Args:
+            ruta_guardar: Ruta donde volcar el perfil en formato pstats. Si es None, no se guarda.
+
+        Returns:
+            Las estadísticas de cProfile, o None si no había una captura activa.
+        """
+        if self._perfilador is None:
+            return None
+
+        self._perfilador.disable()
+        if self._memoria_activa:
+            _, self.memoria_pico = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self._memoria_activa = False
+
+        if ruta_guardar:
+            self._perfilador.dump_stats(ruta_guardar)
+
+        stats = pstats.Stats(self._perfilador, stream=io.StringIO())
+        self._perfilador = None
+        return stats
+
+    def como_diccionario(self) -> Dict:
+        """
+        Devuelve las métricas acumuladas como un diccionario.
+
+        Returns:
+            Diccionario con las claves "etapas", "contadores", "cache" y "memoria_pico".
+        """
+        cache = {}
+        for nombre in sorted(set(self.cache_aciertos) | set(self.cache_fallos)):
+            cache[nombre] = {
+                "aciertos": self.cache_aciertos.get(nombre, 0),
+                "fallos": self.cache_fallos.get(nombre, 0),
+                "tasa_aciertos": self.tasa_aciertos(nombre),
+            }
+
+        return {
+            "etapas": {
+                etapa: {"tiempo": self.tiempos[etapa], "llamadas": self.llamadas[etapa]}
+                for etapa in self.tiempos
+            },
+            "tiempo_total": sum(self.tiempos.values()),
+            "contadores": dict(self.contadores),
+            "cache": cache,
+            "memoria_pico": self.memoria_pico,
+        }
+
+    def formatear(self) -> str:
+        """
+        Formatea las métricas como una tabla de texto.
+
+        Returns:
+            Cadena con el desglose por etapa y las tasas de acierto de caché.
+        """
+        datos = self.como_diccionario()
+        total = datos["tiempo_total"] or 1.0
+
+        lineas = [f"{'Etapa':<15} | {'Llamadas':>10} | {'Tiempo (s)':>12} | {'%':>6}", "-" * 52]
+        for etapa, valores in datos["etapas"].items():
+            lineas.append(f"{etapa:<15} | {valores['llamadas']:>10d} | {valores['tiempo']:>12.6f} | "
+                          f"{100 * valores['tiempo'] / total:>6.1f}")
+        lineas.append("-" * 52)
+
+        for nombre, valores in datos["cache"].items():
+            lineas.append(f"Caché {nombre}: {valores['aciertos']} aciertos, {valores['fallos']} fallos "
+                          f"({100 * valores['tasa_aciertos']:.1f}% aciertos)")
+
+        for contador, valor in datos["contadores"].items():
+            lineas.append(f"{contador}: {valor}")
+
+        if datos["memoria_pico"] is not None:
+            lineas.append(f"Memoria pico: {datos['memoria_pico'] / 1024**2:.2f} MiB")
+
+        return "\n".join(lineas)
@@ -0,0 +1,203 @@
+"""
+Módulo de Motores Numéricos
+
+Este módulo define los motores con los que se evalúan f(x) y los polinomios sobre mallas
+grandes:
+
+- "numpy": lambdify de SymPy con NumPy en un solo hilo (comportamiento original).
+- "hilos": la misma función de NumPy aplicada por bloques en un grupo de hilos. Los ufuncs
+  de NumPy liberan el GIL, así que los bloques se calculan en paralelo, y los temporales
+  tienen el tamaño de un bloque en lugar del de la malla completa.
+- "numexpr": expresiones compiladas por numexpr, que evalúa por bloques y en varios hilos.
+- "numba": funciones vectorizadas en paralelo con Numba.
+
+numexpr y Numba son opcionales; solo se importan al seleccionar su motor.
+"""
+
+import os
+import importlib.util
+import numpy as np
+import sympy as sp
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from polinomio import PolinomioTaylor
+
+MOTORES = ("numpy", "hilos", "numexpr", "numba")
+
+# Elementos por bloque en el motor de hilos
+TAMANO_BLOQUE = 1 << 16
+
+
+def motores_disponibles() -> tuple:
+    """Devuelve los motores cuyas dependencias están instaladas."""
+    return tuple(nombre for nombre in MOTORES
+                 if nombre in ("numpy", "hilos") or importlib.util.find_spec(nombre) is not None)
+
+
+class MotorNumpy:
+    """Evaluación directa con NumPy en el hilo actual."""
+
+    nombre = "numpy"
+
+    def compilar(self, expr: sp.Expr, x: sp.Symbol) -> Callable:
+        """Convierte una expresión en una función numérica."""
+        return sp.lambdify(x, expr, "numpy")
+
+    def polinomio(self, polinomio: PolinomioTaylor) -> Callable:
+        """Devuelve una función que evalúa el polinomio."""
+        return polinomio.evaluar
+
+
+class MotorHilos(MotorNumpy):
+    """NumPy por bloques repartidos en un grupo de hilos."""
+
+    nombre = "hilos"
+
+    def __init__(self, hilos: int = None, tamano_bloque: int = TAMANO_BLOQUE):
+        """
+        Inicializa el motor.
+
+        Args:
+            hilos: Número de hilos. Si es None, usa el número de CPUs.
+            tamano_bloque: Número de elementos por bloque.
+        """
+        self.hilos = hilos or os.cpu_count() or 1
+        self.tamano_bloque = tamano_bloque
+        self._grupo = ThreadPoolExecutor(max_workers=self.hilos)
+
+    def _por_bloques(self, funcion: Callable) -> Callable:
+        """Envuelve una función vectorizada para aplicarla por bloques en paralelo."""
+        def evaluar(valores):
+            valores = np.asarray(valores)
+            if valores.size <= self.tamano_bloque:
+                return funcion(valores)
+
+            plano = valores.ravel()
+            # El primer bloque fija el tipo de la salida (real o complejo)
+            primero = np.broadcast_to(funcion(plano[:self.tamano_bloque]), (self.tamano_bloque,))
+            salida = np.empty(plano.shape, dtype=np.result_type(primero, np.float64))
+            salida[:self.tamano_bloque] = primero
+
+            def bloque(inicio):
+                fin = min(inicio + self.tamano_bloque, plano.size)
+                salida[inicio:fin] = funcion(plano[inicio:fin])
+
+            list(self._grupo.map(bloque, range(self.tamano_bloque, plano.size, self.tamano_bloque)))
+            return salida.reshape(valores.shape)
+        return evaluar
+
+    def compilar(self, expr: sp.Expr, x: sp.Symbol) -> Callable:
+        return self._por_bloques(super().compilar(expr, x))
+
+    def polinomio(self, polinomio: PolinomioTaylor) -> Callable:
+        return self._por_bloques(polinomio.evaluar)
+
+
+class MotorNumexpr(MotorNumpy):
+    """Expresiones evaluadas con numexpr (por bloques y en varios hilos, sin temporales completos)."""
+
+    nombre = "numexpr"
+
+    def __init__(self, hilos: int = None):
+        import numexpr
+        self._numexpr = numexpr
+        if hilos:
+            numexpr.set_num_threads(hilos)
+
+    def compilar(self, expr: sp.Expr, x: sp.Symbol) -> Callable:
+        try:
+            funcion = sp.lambdify(x, expr, "numexpr")
+        except Exception:
+            # Funciones que numexpr no soporta: se usa NumPy
+            return super().compilar(expr, x)
+        return lambda valores: funcion(np.asarray(valores, dtype=np.float64))
+
+    def polinomio(self, polinomio: PolinomioTaylor) -> Callable:
+        flotante = polinomio.a_flotantes()
+        if np.iscomplexobj(flotante.coeficientes):
+            return flotante.evaluar
+        # Horner como una sola expresión: ((c_n*t + c_(n-1))*t + ...) + c_0
+        coefs = flotante.coeficientes
+        texto = repr(float(coefs[-1]))
+        for c in coefs[-2::-1]:
+            texto = f"({texto}) * t + {float(c)!r}"
+        texto = texto.replace("t", f"(x - {float(flotante.centro)!r})")
+        return lambda valores: self._numexpr.evaluate(
+            texto, local_dict={"x": np.asarray(valores, dtype=np.float64)})[()]
+
+
+class MotorNumba(MotorNumpy):
+    """Funciones vectorizadas con numba.vectorize(target="parallel")."""
+
+    nombre = "numba"
+
+    def __init__(self, hilos: int = None):
+        import numba
+        self._numba = numba
+        if hilos:
+            numba.set_num_threads(hilos)
+        self._horner = None
+
+    def compilar(self, expr: sp.Expr, x: sp.Symbol) -> Callable:
+        try:
+            escalar = sp.lambdify(x, expr, "math")
+            funcion = self._numba.vectorize(["float64(float64)"], target="parallel")(escalar)
+        except Exception:
+            return super().compilar(expr, x)
+        return lambda valores: funcion(np.asarray(valores, dtype=np.float64))
+
+    def polinomio(self, polinomio: PolinomioTaylor) -> Callable:
+        flotante = polinomio.a_flotantes()
+        if np.iscomplexobj(flotante.coeficientes):
+            return flotante.evaluar
+        if self._horner is None:
+            numba = self._numba
+
+            @numba.njit(parallel=True, cache=True)
+            def horner(coefs, centro, x, salida):
+                for i in numba.prange(x.size):
+                    t = x[i] - centro
+                    y = coefs[coefs.size - 1]
+                    for k in range(coefs.size - 2, -1, -1):
+                        y = y * t + coefs[k]
+                    salida[i] = y
+            self._horner = horner
+
+        coefs = np.ascontiguousarray(flotante.coeficientes, dtype=np.float64)
+        centro = float(flotante.centro)
+
+        def evaluar(valores):
+            valores = np.asarray(valores, dtype=np.float64)
+            plano = np.ascontiguousarray(valores.ravel())
+            salida = np.empty_like(plano)
+            self._horner(coefs, centro, plano, salida)
+            return salida.reshape(valores.shape)[()]
+        return evaluar
+
+
+def crear_motor(nombre: str = "numpy", hilos: int = None) -> MotorNumpy:
+    """
+    Crea un motor numérico por nombre.
+
+    Args:
+        nombre: Uno de MOTORES.
+        hilos: Número de hilos para los motores paralelos. Si es None, se usa el valor por defecto.
+
+    Returns:
+        El motor.
+
+    Raises:
+        ValueError: Si el motor no existe o su dependencia no está instalada.
+    """
+    if nombre not in MOTORES:
+        raise ValueError(f"Motor numérico desconocido: {nombre}. Opciones: {', '.join(MOTORES)}")
+    if nombre not in motores_disponibles():
+        raise ValueError(f"El motor {nombre} requiere el paquete {nombre}, que no está instalado")
+
+    if nombre == "hilos":
+        return MotorHilos(hilos)
+    if nombre == "numexpr":
+        return MotorNumexpr(hilos)
+    if nombre == "numba":
+        return MotorNumba(hilos)
+    return MotorNumpy()
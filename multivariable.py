@@ -0,0 +1,583 @@
+"""
+Módulo de Series de Taylor Multivariables
+
+Este módulo calcula desarrollos de Taylor de funciones de varias variables f(x, y, ...)
+alrededor de un punto:
+
+    P(v) = sum over |α| <= n of  D^α f(a) / α! * (v - a)^α
+
+Las derivadas parciales mixtas no dependen del orden de derivación, así que cada
+multi-índice α se deriva una sola vez (C(n + d - 1, d - 1) derivadas de orden n en lugar
+de d^n ordenaciones), y cada una se obtiene derivando una vez la de orden inferior
+α - e_i que ya está en caché.
+
+El polinomio se evalúa sobre nubes de puntos de N dimensiones con tablas de monomios por
+bloques de puntos: cada monomio (v - a)^α es el monomio α - e_i multiplicado por
+(v_i - a_i), un solo producto vectorizado por monomio, y el resultado es un producto
+matricial de los coeficientes con la tabla.
+"""
+
+import os
+import itertools
+import numpy as np
+import sympy as sp
+import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Sequence, Tuple
+from metricas import RegistroMetricas
+from polinomio import _a_numero
+from cache_derivadas import CacheDerivadas
+from dominio import PuntoNoAnalitico
+
+# Elementos (puntos x monomios) de la tabla de monomios de cada bloque
+ELEMENTOS_POR_BLOQUE = 1 << 20
+
+
+def indices_multiples(dimension: int, orden: int) -> List[Tuple[int, ...]]:
+    """
+    Enumera los multi-índices de grado total 0..orden en orden graduado.
+
+    Dentro de cada grado el orden es lexicográfico decreciente (x², xy, y² para d = 2).
+
+    Args:
+        dimension: Número de variables.
+        orden: Grado total máximo.
+
+    Returns:
+        Lista de tuplas α con sum(α) <= orden.
+    """
+    indices = []
+    for grado in range(orden + 1):
+        for combinacion in itertools.combinations_with_replacement(range(dimension), grado):
+            alfa = [0] * dimension
+            for i in combinacion:
+                alfa[i] += 1
+            indices.append(tuple(alfa))
+    return indices
+
+
+def factorial_multiple(alfa: Sequence[int]) -> sp.Integer:
+    """Devuelve α! = α_1! · α_2! · ... · α_d!."""
+    resultado = sp.Integer(1)
+    for a in alfa:
+        resultado *= sp.factorial(a)
+    return resultado
+
+
+class PolinomioMultivariable:
+    """
+    Polinomio P(v) = sum(c_α * (v - centro)^α) representado por coeficientes y exponentes.
+    """
+
+    def __init__(self, coeficientes: Sequence, exponentes: Sequence[Sequence[int]],
+                 centro: Sequence[float], variables: Sequence[sp.Symbol] = None):
+        """
+        Inicializa el polinomio.
+
+        Args:
+            coeficientes: Coeficientes c_α, uno por multi-índice.
+            exponentes: Multi-índices α, en el mismo orden que los coeficientes.
+            centro: Punto de expansión (a_1, ..., a_d).
+            variables: Símbolos de las variables (para convertir a expresión).
+        """
+        self.exponentes = np.asarray(exponentes, dtype=np.int64).reshape(len(coeficientes), len(centro))
+        if isinstance(coeficientes, np.ndarray):
+            self.coeficientes = coeficientes
+        else:
+            self.coeficientes = [sp.sympify(c) for c in coeficientes]
+        self.centro = tuple(centro)
+        self.variables = tuple(variables) if variables is not None else None
+        self._flotantes = None  # Coeficientes en punto flotante, calculados una sola vez
+        self._recurrencia = None  # Padre α - e_i y variable i de cada monomio, para la tabla
+
+    @property
+    def dimension(self) -> int:
+        """Número de variables."""
+        return len(self.centro)
+
+    @property
+    def orden(self) -> int:
+        """Grado total máximo de los monomios."""
+        return int(self.exponentes.sum(axis=1).max()) if len(self.exponentes) else 0
+
+    def __len__(self) -> int:
+        return len(self.coeficientes)
+
+    def __repr__(self) -> str:
+        return (f"PolinomioMultivariable(orden={self.orden}, dimension={self.dimension}, "
+                f"terminos={len(self)}, centro={self.centro})")
+
+    def coeficientes_flotantes(self) -> np.ndarray:
+        """Coeficientes como arreglo float64 (o complex128 si alguno es complejo)."""
+        if isinstance(self.coeficientes, np.ndarray):
+            return self.coeficientes
+        if self._flotantes is None:
+            valores = np.array([_a_numero(c) for c in self.coeficientes], dtype=complex)
+            if np.all((valores.imag == 0) | np.isnan(valores.imag)):
+                valores = valores.real.copy()
+            self._flotantes = valores
+        return self._flotantes
+
+    def evaluar(self, puntos, hilos: int = None):
+        """
+        Evalúa el polinomio sobre una nube de puntos con tablas de monomios por bloques.
+
+        Args:
+            puntos: Arreglo de forma (..., d): cada fila de la última dimensión es un punto.
+                Para una malla, np.stack([X, Y], axis=-1).
+            hilos: Número de hilos entre los que se reparten los bloques. Si es None, usa
+                el número de CPUs.
+
+        Returns:
+            Los valores del polinomio, con la forma de puntos sin la última dimensión.
+        """
+        puntos = np.asarray(puntos, dtype=np.float64)
+        if puntos.shape[-1] != self.dimension:
+            raise ValueError(f"Los puntos deben tener {self.dimension} coordenadas (última dimensión)")
+
+        forma = puntos.shape[:-1]
+        # Coordenadas por filas (d, N) para que cada columna de la tabla sea contigua
+        t = (puntos.reshape(-1, self.dimension) - np.asarray(self.centro, dtype=np.float64)).T.copy()
+        coefs = self.coeficientes_flotantes()
+        padres, variables = self._recurrencia_monomios()
+        salida = np.empty(t.shape[1], dtype=np.result_type(coefs, np.float64))
+
+        def bloque(inicio: int) -> None:
+            fin = min(inicio + filas, t.shape[1])
+            # Tabla (monomios, puntos): (v - a)^α = (v - a)^(α - e_i) * (v_i - a_i), un producto por monomio
+            monomios = np.empty((len(coefs), fin - inicio))
+            for k, (padre, i) in enumerate(zip(padres, variables)):
+                if padre < 0:
+                    monomios[k] = np.prod(t[:, inicio:fin] ** self.exponentes[k][:, None], axis=0)
+                else:
+                    np.multiply(monomios[padre], t[i, inicio:fin], out=monomios[k])
+            salida[inicio:fin] = coefs @ monomios
+
+        filas = max(1, ELEMENTOS_POR_BLOQUE // max(1, len(coefs)))
+        inicios = range(0, t.shape[1], filas)
+        if len(inicios) > 1:
+            with ThreadPoolExecutor(max_workers=hilos or os.cpu_count() or 1) as grupo:
+                list(grupo.map(bloque, inicios))
+        else:
+            for inicio in inicios:
+                bloque(inicio)
+        return salida.reshape(forma)[()]
+
+    def __call__(self, puntos):
+        return self.evaluar(puntos)
+
+    def _recurrencia_monomios(self) -> Tuple[List[int], List[int]]:
+        """
+        Para cada monomio α, la posición de un monomio anterior α - e_i y la variable i que lo completa.
+
+        Los multi-índices de un desarrollo están en orden graduado, así que todo α distinto de 0
+        tiene su padre antes que él; si no lo tiene (polinomios construidos a mano), el padre es
+        -1 y el monomio se calcula con potencias.
+        """
+        if self._recurrencia is not None:
+            return self._recurrencia
+        exponentes = self.exponentes.tolist()
+        posiciones = {tuple(alfa): k for k, alfa in enumerate(exponentes)}
+        padres, variables = [], []
+        for k, alfa in enumerate(exponentes):
+            padre, variable = -1, 0
+            for i, a in enumerate(alfa):
+                candidato = posiciones.get(tuple(alfa[:i] + [a - 1] + alfa[i + 1:]), -1) if a else -1
+                if 0 <= candidato < k:
+                    padre, variable = candidato, i
+                    break
+            padres.append(padre)
+            variables.append(variable)
+        self._recurrencia = (padres, variables)
+        return self._recurrencia
+
+    def truncar(self, orden: int) -> "PolinomioMultivariable":
+        """Devuelve el polinomio con los monomios de grado total <= orden."""
+        conservar = self.exponentes.sum(axis=1) <= orden
+        if isinstance(self.coeficientes, np.ndarray):
+            coefs = self.coeficientes[conservar]
+        else:
+            coefs = [c for c, si in zip(self.coeficientes, conservar) if si]
+        return PolinomioMultivariable(coefs, self.exponentes[conservar], self.centro, self.variables)
+
+    def gradiente(self) -> np.ndarray:
+        """Gradiente de f en el centro (los coeficientes de grado 1): las sensibilidades de primer orden."""
+        coefs = self.coeficientes_flotantes()
+        gradiente = np.zeros(self.dimension, dtype=coefs.dtype)
+        for alfa, c in zip(self.exponentes, coefs):
+            if alfa.sum() == 1:
+                gradiente[int(np.argmax(alfa))] = c
+        return gradiente
+
+    def hessiana(self) -> np.ndarray:
+        """Matriz hessiana de f en el centro, reconstruida de los coeficientes de grado 2."""
+        coefs = self.coeficientes_flotantes()
+        hessiana = np.zeros((self.dimension, self.dimension), dtype=coefs.dtype)
+        for alfa, c in zip(self.exponentes, coefs):
+            if alfa.sum() != 2:
+                continue
+            i, j = np.repeat(np.arange(self.dimension), alfa)
+            # c_α = ∂²f / α!: α! = 2 en la diagonal y 1 fuera de ella
+            hessiana[i, j] = hessiana[j, i] = 2 * c if i == j else c
+        return hessiana
+
+    def a_expresion(self, variables: Sequence[sp.Symbol] = None) -> sp.Expr:
+        """
+        Convierte el polinomio a una expresión de SymPy en potencias de (v_j - a_j).
+
+        Args:
+            variables: Símbolos de las variables. Si es None, se usan los del polinomio.
+        """
+        variables = variables or self.variables
+        if variables is None:
+            raise ValueError("Indique las variables del polinomio")
+        coefs = self.coeficientes
+        if isinstance(coefs, np.ndarray):
+            coefs = [sp.sympify(c) for c in coefs]
+        terminos = []
+        for c, alfa in zip(coefs, self.exponentes):
+            termino = c
+            for v, a, k in zip(variables, self.centro, alfa):
+                if k:
+                    termino *= (v - a)**int(k)
+            terminos.append(termino)
+        return sp.Add(*terminos)
+
+
+class AproximacionMultivariable:
+    """
+    Desarrollos de Taylor de funciones de varias variables con derivadas por multi-índice.
+    """
+
+    def __init__(self, memoria_cache: int = None, cache_compartida: bool = False, hilos: int = None):
+        """
+        Inicializa la clase AproximacionMultivariable.
+
+        Args:
+            memoria_cache: Memoria estimada máxima (en bytes) de las derivadas en caché. Si es
+                None, no hay límite.
+            cache_compartida: Si las derivadas se guardan compartiendo las subexpresiones repetidas.
+            hilos: Número de hilos para evaluar sobre nubes de puntos. Si es None, usa el número de CPUs.
+        """
+        self.memoria_cache = memoria_cache
+        self.cache_compartida = cache_compartida
+        self.hilos = hilos
+        self.metricas = RegistroMetricas()
+        self.func_str = None
+        self.func = None
+        self.variables = ()
+        self._reiniciar_caches()
+
+    def _reiniciar_caches(self) -> None:
+        self.cache = CacheDerivadas(self.memoria_cache, self.cache_compartida)  # α -> D^α f
+        self.cache_coeficientes = {}  # (punto, α) -> D^α f(punto) / α!
+        self.evaluador = None
+
+    @property
+    def dimension(self) -> int:
+        """Número de variables de la función actual."""
+        return len(self.variables)
+
+    def establecer_funcion(self, func_str: str, variables: Sequence[str] = None) -> None:
+        """
+        Establece la función a aproximar.
+
+        Args:
+            func_str: La función en términos de sus variables (por ejemplo, "exp(x)*sin(y)").
+            variables: Nombres de las variables en el orden de las coordenadas. Si es None, se
+                usan los símbolos libres de la función ordenados por nombre.
+        """
+        try:
+            func = sp.sympify(func_str)
+        except Exception as e:
+            raise ValueError(f"Expresión de función inválida: {e}")
+
+        if variables:
+            simbolos = tuple(sp.Symbol(nombre) for nombre in variables)
+            if len(set(simbolos)) != len(simbolos):
+                raise ValueError("Las variables no pueden repetirse")
+            sobrantes = func.free_symbols - set(simbolos)
+            if sobrantes:
+                raise ValueError("La función contiene símbolos que no son variables: "
+                                 f"{', '.join(sorted(map(str, sobrantes)))}")
+        else:
+            simbolos = tuple(sorted(func.free_symbols, key=lambda s: s.name))
+            if not simbolos:
+                raise ValueError("La función no tiene variables; indíquelas explícitamente")
+
+        if func_str == self.func_str and simbolos == self.variables:
+            self.metricas.registrar_cache("funciones", True)
+            return
+        self.metricas.registrar_cache("funciones", False)
+        self.func_str = func_str
+        self.func = func
+        self.variables = simbolos
+        self._reiniciar_caches()
+
+    def _validar_punto(self, punto: Sequence[float]) -> Tuple[float, ...]:
+        if self.func is None:
+            raise ValueError("No se ha establecido ninguna función")
+        punto = tuple(float(a) for a in punto)
+        if len(punto) != self.dimension:
+            raise ValueError(f"El punto debe tener {self.dimension} coordenadas "
+                             f"({', '.join(map(str, self.variables))})")
+        return punto
+
+    def derivada(self, alfa: Sequence[int]) -> sp.Expr:
+        """
+        Calcula la derivada parcial D^α f = ∂^|α| f / ∂v_1^α_1 ... ∂v_d^α_d.
+
+        Cada multi-índice se deriva una sola vez: la derivada se obtiene de una de orden
+        inferior α - e_i (preferentemente una que ya esté en caché) con una sola derivación.
+
+        Args:
+            alfa: Multi-índice (α_1, ..., α_d).
+
+        Returns:
+            La expresión simbólica de la derivada.
+        """
+        alfa = tuple(int(a) for a in alfa)
+        if alfa in self.cache:
+            self.metricas.registrar_cache("derivadas", True)
+            return self.cache[alfa]
+
+        self.metricas.registrar_cache("derivadas", False)
+        if not any(alfa):
+            resultado = self.func
+        else:
+            candidatos = [i for i, a in enumerate(alfa) if a]
+            # Derivar a partir de un padre en caché si lo hay; si no, del último (recursivamente)
+            i = next((i for i in candidatos if self._padre(alfa, i) in self.cache), candidatos[-1])
+            padre = self.derivada(self._padre(alfa, i))
+            if padre == 0:
+                resultado = sp.Integer(0)
+            else:
+                with self.metricas.medir("differentiate"):
+                    resultado = sp.diff(padre, self.variables[i])
+            self.metricas.incrementar("derivadas_parciales")
+
+        self.cache[alfa] = resultado
+        return resultado
+
+    @staticmethod
+    def _padre(alfa: Tuple[int, ...], i: int) -> Tuple[int, ...]:
+        """Devuelve α - e_i."""
+        return alfa[:i] + (alfa[i] - 1,) + alfa[i + 1:]
+
+    def coeficiente(self, alfa: Sequence[int], punto: Sequence[float]) -> sp.Expr:
+        """
+        Calcula el coeficiente D^α f(punto) / α! del desarrollo.
+
+        Raises:
+            PuntoNoAnalitico: Si la derivada no es finita en el punto.
+        """
+        alfa = tuple(int(a) for a in alfa)
+        punto = self._validar_punto(punto)
+        clave = (punto, alfa)
+        if clave in self.cache_coeficientes:
+            self.metricas.registrar_cache("coeficientes", True)
+            return self.cache_coeficientes[clave]
+
+        self.metricas.registrar_cache("coeficientes", False)
+        derivada = self.derivada(alfa)
+        with self.metricas.medir("substitute"):
+            valor = derivada.subs(dict(zip(self.variables, punto)))
+        if valor.has(sp.zoo, sp.nan, sp.oo, -sp.oo) or not valor.is_number:
+            raise PuntoNoAnalitico(f"La derivada D^{alfa} de {self.func_str} no es finita en {punto}; "
+                                   "no existe desarrollo de Taylor en ese punto")
+        coeficiente = valor / factorial_multiple(alfa)
+        self.cache_coeficientes[clave] = coeficiente
+        return coeficiente
+
+    def obtener_polinomio(self, punto: Sequence[float], orden: int) -> PolinomioMultivariable:
+        """
+        Obtiene el polinomio de Taylor de grado total <= orden alrededor de un punto.
+
+        Args:
+            punto: Punto de expansión (a_1, ..., a_d).
+            orden: Grado total máximo.
+
+        Returns:
+            El polinomio con coeficientes exactos.
+        """
+        if orden < 0:
+            raise ValueError("El orden no puede ser negativo")
+        punto = self._validar_punto(punto)
+        indices = indices_multiples(self.dimension, orden)
+        coeficientes = [self.coeficiente(alfa, punto) for alfa in indices]
+        return PolinomioMultivariable(coeficientes, indices, punto, self.variables)
+
+    def visualizar_serie_taylor(self, punto: Sequence[float], orden: int) -> sp.Expr:
+        """Devuelve el polinomio de Taylor como expresión de SymPy en potencias de (v_j - a_j)."""
+        return self.obtener_polinomio(punto, orden).a_expresion()
+
+    def evaluar_funcion(self, puntos) -> np.ndarray:
+        """
+        Evalúa la función exacta sobre una nube de puntos de forma (..., d).
+
+        Los valores complejos (fuera del dominio real) se devuelven como NaN.
+        """
+        puntos = np.asarray(puntos, dtype=np.float64)
+        if self.evaluador is None:
+            with self.metricas.medir("lambdify"):
+                self.evaluador = sp.lambdify(self.variables, self.func, "numpy")
+        with self.metricas.medir("evaluate"), np.errstate(all='ignore'):
+            valores = self.evaluador(*np.moveaxis(puntos, -1, 0))
+            valores = np.broadcast_to(valores, puntos.shape[:-1])
+            if np.iscomplexobj(valores):
+                valores = np.where(valores.imag == 0, valores.real, np.nan)
+        return np.asarray(valores, dtype=np.float64)
+
+    def evaluar(self, punto: Sequence[float], orden: int, puntos) -> np.ndarray:
+        """Evalúa el polinomio de Taylor de un punto y orden sobre una nube de puntos (..., d)."""
+        polinomio = self.obtener_polinomio(punto, orden)
+        with self.metricas.medir("evaluate"):
+            return polinomio.evaluar(puntos, self.hilos)
+
+    def superficie_error(self, punto: Sequence[float], orden: int,
+                         rangos: Sequence[Tuple[float, float]] = None,
+                         resolucion: Tuple[int, int] = (200, 200), ejes: Tuple[int, int] = (0, 1)) -> Dict:
+        """
+        Calcula f, P y |f - P| sobre una malla 2-D de dos variables; el resto queda fijo en el punto.
+
+        Args:
+            punto: Punto de expansión.
+            orden: Grado total del polinomio.
+            rangos: Intervalos (min, max) de las dos variables de la malla. Por defecto, a_j ± 1.
+            resolucion: Tupla (ancho, alto) de la malla.
+            ejes: Índices de las dos variables que recorren la malla.
+
+        Returns:
+            Diccionario con "variables" (nombres de los ejes), "fijas" (variable -> valor de las
+            que no recorren la malla), "x" e "y" (valores de los ejes) y las matrices (alto, ancho) "funcion", "aproximacion" y "error".
+        """
+        punto = self._validar_punto(punto)
+        if self.dimension < 2:
+            raise ValueError("La superficie de error necesita al menos dos variables")
+        i, j = ejes
+        if i == j or not (0 <= i < self.dimension and 0 <= j < self.dimension):
+            raise ValueError("Los ejes de la malla deben ser dos variables distintas")
+        ancho, alto = resolucion
+        if ancho < 2 or alto < 2:
+            raise ValueError("La resolución debe ser de al menos 2 x 2")
+        if rangos is None:
+            rangos = ((punto[i] - 1, punto[i] + 1), (punto[j] - 1, punto[j] + 1))
+
+        xs = np.linspace(rangos[0][0], rangos[0][1], ancho)
+        ys = np.linspace(rangos[1][0], rangos[1][1], alto)
+        malla = np.empty((alto, ancho, self.dimension))
+        malla[...] = punto
+        malla[..., i] = xs[None, :]
+        malla[..., j] = ys[:, None]
+
+        funcion = self.evaluar_funcion(malla)
+        aproximacion = self.evaluar(punto, orden, malla)
+        with np.errstate(all='ignore'):
+            error = np.abs(funcion - aproximacion)
+        fijas = {str(v): a for k, (v, a) in enumerate(zip(self.variables, punto)) if k not in (i, j)}
+        return {"variables": (str(self.variables[i]), str(self.variables[j])), "fijas": fijas,
+                "x": xs, "y": ys, "funcion": funcion, "aproximacion": aproximacion, "error": error}
+
+    def graficar_superficie_error(self, punto: Sequence[float], orden: int,
+                                  rangos: Sequence[Tuple[float, float]] = None,
+                                  resolucion: Tuple[int, int] = (200, 200), ejes: Tuple[int, int] = (0, 1),
+                                  ruta_guardar: str = None, figura=None):
+        """
+        Grafica las curvas de nivel de f y de P junto al mapa de log₁₀|f - P| sobre una malla 2-D.
+
+        Args:
+            punto: Punto de expansión.
+            orden: Grado total del polinomio.
+            rangos: Intervalos de las dos variables de la malla.
+            resolucion: Tupla (ancho, alto) de la malla.
+            ejes: Índices de las dos variables que recorren la malla.
+            ruta_guardar: Ruta para guardar la gráfica. Si es None, la gráfica se muestra.
+            figura: Figura de matplotlib a reutilizar (se limpia). Si es None, se crea una.
+
+        Returns:
+            La figura.
+        """
+        superficie = self.superficie_error(punto, orden, rangos, resolucion, ejes)
+        propia = figura is None
+        if propia:
+            figura = plt.figure(figsize=(14, 6))
+        else:
+            figura.clf()
+        dibujar_superficie_error(figura, superficie, punto, ejes, self.func_str, orden)
+
+        if ruta_guardar:
+            with self.metricas.medir("render"):
+                figura.savefig(ruta_guardar, dpi=300, bbox_inches='tight')
+            print(f"Superficie de error guardada en {ruta_guardar}")
+            if propia:
+                plt.close(figura)
+        else:
+            figura.tight_layout()
+            plt.show()
+        return figura
+
+    def obtener_metricas(self) -> Dict:
+        """
+        Devuelve las métricas de rendimiento acumuladas.
+
+        Además de las de RegistroMetricas, la caché de derivadas incluye sus entradas y nodos,
+        y "ordenaciones_evitadas" cuenta las derivaciones que costaría repetir cada ordenación de
+        las derivadas mixtas (d^n por orden n) en lugar de un multi-índice por derivada.
+        """
+        metricas = self.metricas.como_diccionario()
+        metricas["cache"].setdefault("derivadas", {"aciertos": 0, "fallos": 0, "tasa_aciertos": None})
+        metricas["cache"]["derivadas"]["entradas"] = len(self.cache)
+        metricas["cache"]["derivadas"]["nodos"] = self.cache.nodos
+        metricas["cache"]["derivadas"]["bytes_estimados"] = self.cache.bytes_estimados
+        grados = [sum(alfa) for alfa in self.cache]
+        metricas["ordenaciones_evitadas"] = sum(self.dimension**n for n in grados) - len(grados)
+        return metricas
+
+
+def dibujar_superficie_error(figura, superficie: Dict, punto: Sequence[float], ejes: Tuple[int, int],
+                             func_str: str, orden: int) -> None:
+    """
+    Dibuja en una figura (vacía) las curvas de nivel de f y P y el mapa de log₁₀|f - P|.
+
+    Args:
+        figura: Figura de matplotlib.
+        superficie: Diccionario devuelto por AproximacionMultivariable.superficie_error.
+        punto: Punto de expansión.
+        ejes: Índices de las variables de la malla.
+        func_str: La función, para los títulos.
+        orden: Grado total del polinomio.
+    """
+    xs, ys = superficie["x"], superficie["y"]
+    nombre_x, nombre_y = superficie["variables"]
+    extension = (xs[0], xs[-1], ys[0], ys[-1])
+    centro = (punto[ejes[0]], punto[ejes[1]])
+
+    ax_nivel, ax_error = figura.subplots(1, 2)
+    funcion = np.ma.masked_invalid(superficie["funcion"])
+    if funcion.count():
+        niveles = np.linspace(funcion.min(), funcion.max(), 15) if funcion.max() > funcion.min() else None
+        ax_nivel.contour(xs, ys, funcion, levels=niveles, colors='black', linewidths=1.0,
+                         negative_linestyles='solid')
+        # El polinomio, con los mismos niveles para comparar dónde se separa de f
+        ax_nivel.contour(xs, ys, np.ma.masked_invalid(superficie["aproximacion"]), levels=niveles,
+                         colors='tab:red', linestyles='--', linewidths=1.0)
+    ax_nivel.plot([], [], color='black', label='f')
+    ax_nivel.plot([], [], color='tab:red', linestyle='--', label=f'P_{orden}')
+    ax_nivel.set_title(f'Curvas de nivel de f = {func_str}')
+
+    with np.errstate(divide='ignore'):
+        log_error = np.log10(superficie["error"])
+    log_error[np.isneginf(log_error)] = np.nan
+    mapa = ax_error.imshow(log_error, origin='lower', extent=extension, cmap='magma', aspect='auto')
+    figura.colorbar(mapa, ax=ax_error, label=f'log₁₀|f - P_{orden}|')
+    fijas = ", ".join(f"{nombre} = {valor:g}" for nombre, valor in superficie["fijas"].items())
+    ax_error.set_title(f'Error de orden {orden}' + (f' ({fijas})' if fijas else ''))
+
+    for ax in (ax_nivel, ax_error):
+        ax.scatter([centro[0]], [centro[1]], color='white', edgecolor='black', s=40, zorder=5,
+                   label='Punto de expansión')
+        ax.set_xlim(extension[:2])
+        ax.set_ylim(extension[2:])
+        ax.set_xlabel(nombre_x)
+        ax.set_ylabel(nombre_y)
+    ax_nivel.legend(loc='upper right')
@@ -0,0 +1,295 @@
+"""
+Módulo de Núcleos de Evaluación
+
+Este módulo genera código fuente listo para compilar o importar que evalúa polinomios de
+Taylor en forma de Horner: C (cabecera y fuente), un módulo de Python con funciones
+vectorizadas de NumPy y, si Numba está instalado, un módulo con funciones compiladas con
+numba.njit. Los coeficientes se escriben una sola vez y se comparten entre todos los órdenes,
+y una función adicional calcula todos los órdenes en una única pasada. También verifica la
+exactitud y la velocidad del código generado.
+"""
+
+import os
+import time
+import ctypes
+import shutil
+import subprocess
+import importlib.util
+import numpy as np
+from typing import Callable, Dict, List, Tuple
+from polinomio import PolinomioTaylor
+
+
+def numba_disponible() -> bool:
+    """Indica si Numba está instalado."""
+    return importlib.util.find_spec("numba") is not None
+
+
+def _coeficientes_compartidos(polinomios: Dict[int, PolinomioTaylor]) -> Tuple[float, np.ndarray]:
+    """
+    Devuelve el centro y la tabla de coeficientes común a todos los órdenes.
+
+    Los polinomios de Taylor de una misma función y centro son prefijos del de mayor orden,
+    así que basta una sola tabla.
+    """
+    mayor = polinomios[max(polinomios)].a_flotantes()
+    coeficientes = mayor.coeficientes
+    if np.iscomplexobj(coeficientes):
+        if np.any(coeficientes.imag != 0):
+            raise ValueError("Solo se pueden exportar núcleos con coeficientes reales")
+        coeficientes = coeficientes.real
+    if not np.all(np.isfinite(coeficientes)):
+        raise ValueError("Los coeficientes contienen valores no finitos")
+
+    centro = float(np.real(mayor.centro))
+    for orden, polinomio in polinomios.items():
+        flotante = polinomio.a_flotantes()
+        if float(np.real(flotante.centro)) != centro or not np.array_equal(
+                np.real(flotante.coeficientes), coeficientes[:orden + 1]):
+            raise ValueError("Todos los polinomios deben compartir función y centro")
+    return centro, coeficientes
+
+
+def _horner(orden: int, tabla: str, t: str = "t") -> List[str]:
+    """Líneas de una evaluación de Horner desenrollada: y = C[n]; y = y*t + C[n-1]; ..."""
+    lineas = [f"y = {tabla}[{orden}]"]
+    for k in range(orden - 1, -1, -1):
+        lineas.append(f"y = y * {t} + {tabla}[{k}]")
+    return lineas
+
+
+def generar_c(polinomios: Dict[int, PolinomioTaylor], nombre: str = "taylor",
+              descripcion: str = "") -> Tuple[str, str]:
+    """
+    Genera la cabecera y la fuente en C de los núcleos.
+
+    Por cada orden n se generan {nombre}_orden_n(double x) y {nombre}_orden_n_arreglo(x, y, n),
+    y además {nombre}_todos(x, salida), que calcula todos los órdenes en una sola pasada.
+
+    Args:
+        polinomios: Diccionario orden -> polinomio (misma función y centro).
+        nombre: Prefijo de los símbolos generados.
+        descripcion: Comentario de cabecera (por ejemplo, la función y el centro).
+
+    Returns:
+        Tupla (cabecera, fuente).
+    """
+    centro, coeficientes = _coeficientes_compartidos(polinomios)
+    ordenes = sorted(polinomios)
+    macro = nombre.upper()
+
+    cabecera = [f"/* {descripcion} */" if descripcion else "/* Núcleos de Taylor generados */",
+                f"#ifndef {macro}_H", f"#define {macro}_H", "", "#include <stddef.h>", "",
+                f"#define {macro}_CENTRO {centro!r}", f"#define {macro}_NUM_ORDENES {len(ordenes)}", ""]
+    for orden in ordenes:
+        cabecera.append(f"double {nombre}_orden_{orden}(double x);")
+        cabecera.append(f"void {nombre}_orden_{orden}_arreglo(const double *x, double *y, size_t n);")
+    cabecera += [f"/* salida[i] recibe el valor del orden i-ésimo de {{{', '.join(map(str, ordenes))}}} */",
+                 f"void {nombre}_todos(double x, double *salida);", "", f"#endif /* {macro}_H */", ""]
+
+    fuente = [f"#include \"{nombre}.h\"", "",
+              f"static const double {nombre}_coef[{len(coeficientes)}] = {{"]
+    fuente += [f"    {c!r}," for c in coeficientes.tolist()]
+    fuente += ["};", ""]
+    for orden in ordenes:
+        fuente += [f"double {nombre}_orden_{orden}(double x)", "{",
+                   f"    const double t = x - {macro}_CENTRO;", "    double y;"]
+        fuente += [f"    {linea};" for linea in _horner(orden, f"{nombre}_coef")]
+        if orden == 0:
+            fuente.append("    (void)t;")
+        fuente += ["    return y;", "}", "",
+                   f"void {nombre}_orden_{orden}_arreglo(const double *x, double *y, size_t n)", "{",
+                   "    for (size_t i = 0; i < n; i++)",
+                   f"        y[i] = {nombre}_orden_{orden}(x[i]);", "}", ""]
+
+    fuente += [f"void {nombre}_todos(double x, double *salida)", "{",
+               f"    const double t = x - {macro}_CENTRO;",
+               f"    double potencia = 1.0, suma = {nombre}_coef[0];"]
+    if ordenes[0] == 0:
+        fuente.append("    salida[0] = suma;")
+    for k in range(1, ordenes[-1] + 1):
+        fuente += ["    potencia *= t;", f"    suma += {nombre}_coef[{k}] * potencia;"]
+        if k in ordenes:
+            fuente.append(f"    salida[{ordenes.index(k)}] = suma;")
+    fuente += ["}", ""]
+    return "\n".join(cabecera), "\n".join(fuente)
+
+
+def _generar_python(polinomios: Dict[int, PolinomioTaylor], nombre: str, descripcion: str,
+                    numba: bool) -> str:
+    """Fuente común de los módulos de NumPy y Numba."""
+    centro, coeficientes = _coeficientes_compartidos(polinomios)
+    ordenes = sorted(polinomios)
+    tipo = "Numba" if numba else "NumPy"
+
+    lineas = ['"""', f"Núcleos de Taylor generados ({tipo}).", ""]
+    if descripcion:
+        lineas += [descripcion, ""]
+    lineas += ['"""', "", "import numpy as np"]
+    if numba:
+        lineas.append("import numba")
+    lineas += ["", f"CENTRO = {centro!r}", f"ORDENES = {tuple(ordenes)!r}", "COEFICIENTES = np.array(["]
+    lineas += [f"    {c!r}," for c in coeficientes.tolist()]
+    lineas += ["])", "_C = COEFICIENTES", ""]
+
+    decorador = ["@numba.njit(cache=True)"] if numba else []
+    for orden in ordenes:
+        lineas += [""] + decorador + [f"def {nombre}_orden_{orden}(x):",
+                                      f'    """Polinomio de orden {orden} en forma de Horner."""']
+        lineas.append("    t = x - CENTRO" if numba else "    t = np.asarray(x, dtype=np.float64) - CENTRO")
+        if numba:
+            lineas += [f"    {linea}" for linea in _horner(orden, "_C")]
+        else:
+            # Operaciones en el lugar para no crear un arreglo temporal por término
+            lineas.append(f"    y = np.full_like(t, _C[{orden}])")
+            for k in range(orden - 1, -1, -1):
+                lineas += ["    y *= t", f"    y += _C[{k}]"]
+        lineas += ["    return y", ""]
+
+    # Todos los órdenes en una pasada: sumas parciales con potencias compartidas
+    lineas += [""] + decorador + [f"def {nombre}_todos(x):",
+                                  '    """Devuelve un arreglo con una fila por cada orden de ORDENES."""']
+    if numba:
+        lineas += ["    salida = np.empty((len(ORDENES), x.size))",
+                   "    for i in range(x.size):",
+                   "        t = x.flat[i] - CENTRO",
+                   "        potencia = 1.0",
+                   "        suma = _C[0]"]
+        if ordenes[0] == 0:
+            lineas.append("        salida[0, i] = suma")
+        for k in range(1, ordenes[-1] + 1):
+            lineas += ["        potencia *= t", f"        suma += _C[{k}] * potencia"]
+            if k in ordenes:
+                lineas.append(f"        salida[{ordenes.index(k)}, i] = suma")
+    else:
+        lineas += ["    t = np.asarray(x, dtype=np.float64) - CENTRO",
+                   "    salida = np.empty((len(ORDENES),) + t.shape)",
+                   "    potencia = np.ones_like(t)",
+                   "    suma = np.full_like(t, _C[0])"]
+        if ordenes[0] == 0:
+            lineas.append("    salida[0] = suma")
+        for k in range(1, ordenes[-1] + 1):
+            lineas += ["    potencia *= t", f"    suma += _C[{k}] * potencia"]
+            if k in ordenes:
+                lineas.append(f"    salida[{ordenes.index(k)}] = suma")
+    lineas += ["    return salida", ""]
+    return "\n".join(lineas)
+
+
+def generar_numpy(polinomios: Dict[int, PolinomioTaylor], nombre: str = "taylor",
+                  descripcion: str = "") -> str:
+    """
+    Genera un módulo de Python con funciones vectorizadas de NumPy {nombre}_orden_n(x) y {nombre}_todos(x).
+
+    Args:
+        polinomios: Diccionario orden -> polinomio (misma función y centro).
+        nombre: Prefijo de las funciones generadas.
+        descripcion: Texto para la cadena de documentación del módulo.
+    """
+    return _generar_python(polinomios, nombre, descripcion, numba=False)
+
+
+def generar_numba(polinomios: Dict[int, PolinomioTaylor], nombre: str = "taylor",
+                  descripcion: str = "") -> str:
+    """
+    Genera un módulo de Python con las mismas funciones compiladas con numba.njit.
+
+    Args:
+        polinomios: Diccionario orden -> polinomio (misma función y centro).
+        nombre: Prefijo de las funciones generadas.
+        descripcion: Texto para la cadena de documentación del módulo.
+    """
+    return _generar_python(polinomios, nombre, descripcion, numba=True)
+
+
+def _cronometrar(funcion: Callable, x_vals: np.ndarray, repeticiones: int = 5) -> float:
+    """Mejor tiempo de varias evaluaciones sobre el arreglo completo."""
+    mejor = np.inf
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion(x_vals)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def _cargar_modulo(ruta: str):
+    """Importa un módulo de Python a partir de su ruta."""
+    nombre_modulo = os.path.splitext(os.path.basename(ruta))[0]
+    especificacion = importlib.util.spec_from_file_location(nombre_modulo, ruta)
+    modulo = importlib.util.module_from_spec(especificacion)
+    especificacion.loader.exec_module(modulo)
+    return modulo
+
+
+def _cargar_c(ruta_fuente: str, directorio: str, nombre: str) -> ctypes.CDLL:
+    """Compila la fuente C como biblioteca compartida y la carga con ctypes."""
+    compilador = shutil.which("cc") or shutil.which("gcc") or shutil.which("clang")
+    if compilador is None:
+        raise RuntimeError("No se encontró un compilador de C")
+    ruta_biblioteca = os.path.join(directorio, f"lib{nombre}.so")
+    subprocess.run([compilador, "-O2", "-shared", "-fPIC", "-o", ruta_biblioteca, ruta_fuente],
+                   check=True, capture_output=True)
+    return ctypes.CDLL(os.path.abspath(ruta_biblioteca))
+
+
+def verificar_nucleos(archivos: Dict[str, str], polinomios: Dict[int, PolinomioTaylor], nombre: str,
+                      func_num: Callable, x_vals: np.ndarray) -> List[Dict]:
+    """
+    Comprueba la exactitud y la velocidad de los núcleos generados.
+
+    Args:
+        archivos: Diccionario formato ("c", "numpy", "numba") -> ruta de la fuente.
+        polinomios: Los polinomios exportados.
+        nombre: Prefijo usado al generar los núcleos.
+        func_num: La función exacta, vectorizada con NumPy (referencia de velocidad y error).
+        x_vals: Puntos de verificación.
+
+    Returns:
+        Lista de diccionarios con "formato", "orden", "error_vs_polinomio" (diferencia máxima
+        con PolinomioTaylor.evaluar), "error_vs_funcion", "tiempo", "tiempo_funcion" y "error"
+        (mensaje si el núcleo no se pudo compilar o cargar).
+    """
+    x_vals = np.ascontiguousarray(x_vals, dtype=np.float64)
+    with np.errstate(all='ignore'):
+        exactos = np.broadcast_to(func_num(x_vals), x_vals.shape)
+    tiempo_funcion = _cronometrar(func_num, x_vals)
+
+    resultados = []
+    for formato, ruta in archivos.items():
+        try:
+            if formato == "c":
+                biblioteca = _cargar_c(ruta, os.path.dirname(ruta), nombre)
+                funciones = {}
+                for orden in polinomios:
+                    funcion_c = getattr(biblioteca, f"{nombre}_orden_{orden}_arreglo")
+                    funcion_c.restype = None
+
+                    def evaluar(x, funcion_c=funcion_c):
+                        y = np.empty_like(x)
+                        funcion_c(x.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+                                  y.ctypes.data_as(ctypes.POINTER(ctypes.c_double)), ctypes.c_size_t(x.size))
+                        return y
+                    funciones[orden] = evaluar
+            else:
+                modulo = _cargar_modulo(ruta)
+                funciones = {orden: getattr(modulo, f"{nombre}_orden_{orden}") for orden in polinomios}
+                if formato == "numba":
+                    for funcion in funciones.values():
+                        funcion(x_vals)  # Compilar antes de cronometrar
+        except Exception as e:
+            resultados.append({"formato": formato, "orden": None, "error": str(e)})
+            continue
+
+        for orden, funcion in sorted(funciones.items()):
+            valores = funcion(x_vals)
+            with np.errstate(all='ignore'):
+                resultados.append({
+                    "formato": formato,
+                    "orden": orden,
+                    "error_vs_polinomio": float(np.nanmax(np.abs(valores - polinomios[orden].evaluar(x_vals)))),
+                    "error_vs_funcion": float(np.nanmax(np.abs(valores - exactos))),
+                    "tiempo": _cronometrar(funcion, x_vals),
+                    "tiempo_funcion": tiempo_funcion,
+                    "error": None,
+                })
+    return resultados
@@ -0,0 +1,192 @@
+"""
+Módulo de Barridos de Parámetros
+
+Este módulo evalúa el desarrollo de Taylor de una familia de funciones con parámetros libres
+además de x, como exp(a*x)*sin(b*x), sobre muchos valores de los parámetros.
+
+Los coeficientes se obtienen una sola vez como expresiones simbólicas de los parámetros y se
+compilan juntos (con eliminación de subexpresiones comunes) en una función de NumPy. Una
+rejilla de valores da entonces el tensor de coeficientes de todas las combinaciones en una sola
+llamada vectorizada, sin volver a derivar por cada valor. El error en un rango de x se mide por
+bloques de combinaciones para acotar la memoria.
+"""
+
+import numpy as np
+import sympy as sp
+from typing import Callable, Dict, List, Sequence, Tuple
+
+# Elementos (combinaciones x puntos) por bloque al medir el error
+ELEMENTOS_POR_BLOQUE = 1 << 20
+# Combinaciones máximas de la rejilla
+MAX_COMBINACIONES = 1 << 22
+
+
+def analizar_rejilla(especificacion: str) -> Tuple[str, np.ndarray]:
+    """
+    Interpreta la rejilla de un parámetro.
+
+    Formatos admitidos: "a=INICIO:FIN:N" (N valores equiespaciados, extremos incluidos),
+    "a=v1,v2,..." (valores explícitos) y "a=v" (un solo valor).
+
+    Args:
+        especificacion: Texto con el nombre del parámetro y sus valores.
+
+    Returns:
+        Tupla (nombre, valores).
+
+    Raises:
+        ValueError: Si el formato no es válido.
+    """
+    nombre, separador, valores = especificacion.partition("=")
+    nombre = nombre.strip()
+    if not separador or not nombre.isidentifier():
+        raise ValueError(f"Parámetro inválido '{especificacion}': use nombre=inicio:fin:n o nombre=v1,v2,...")
+    try:
+        if ":" in valores:
+            inicio, fin, n = valores.split(":")
+            n = int(n)
+            if n < 1:
+                raise ValueError("el número de valores debe ser positivo")
+            return nombre, np.linspace(float(inicio), float(fin), n)
+        return nombre, np.array([float(v) for v in valores.split(",")])
+    except ValueError as e:
+        raise ValueError(f"Valores inválidos para el parámetro '{nombre}': {e}")
+
+
+def parametros_libres(expr: sp.Expr, x: sp.Symbol) -> List[sp.Symbol]:
+    """Símbolos de la expresión distintos de x, ordenados por nombre."""
+    return sorted(expr.free_symbols - {x}, key=lambda s: s.name)
+
+
+class CoeficientesParametricos:
+    """
+    Coeficientes de Taylor c_0..c_n de una familia de funciones, compilados como funciones de
+    los parámetros.
+    """
+
+    def __init__(self, coeficientes: Sequence[sp.Expr], x0: float, parametros: Sequence[sp.Symbol]):
+        """
+        Compila los coeficientes.
+
+        Args:
+            coeficientes: Expresiones simbólicas de los coeficientes en función de los parámetros.
+            x0: Centro del desarrollo.
+            parametros: Símbolos de los parámetros, en el orden en que se pasan sus valores.
+        """
+        self.expresiones = list(coeficientes)
+        self.x0 = x0
+        self.parametros = list(parametros)
+        # Una sola función para todos los coeficientes: las potencias y productos de los
+        # parámetros que se repiten entre órdenes se calculan una vez
+        self._funcion = sp.lambdify(self.parametros, self.expresiones, "numpy", cse=True)
+
+    @property
+    def orden(self) -> int:
+        """Orden del desarrollo."""
+        return len(self.expresiones) - 1
+
+    def evaluar(self, *valores: np.ndarray) -> np.ndarray:
+        """
+        Evalúa los coeficientes para valores de los parámetros.
+
+        Args:
+            *valores: Un arreglo por parámetro; se combinan con las reglas de difusión de NumPy.
+
+        Returns:
+            Arreglo de forma (..., orden + 1) con los coeficientes de cada combinación (NaN
+            donde el desarrollo no existe para esos valores).
+        """
+        valores = [np.asarray(v, dtype=float) for v in valores]
+        forma = np.broadcast_shapes(*(v.shape for v in valores)) if valores else ()
+        with np.errstate(all='ignore'):
+            columnas = self._funcion(*valores)
+        tipo = np.result_type(np.float64, *columnas)
+        tensor = np.empty(forma + (len(columnas),), dtype=tipo)
+        for k, columna in enumerate(columnas):
+            tensor[..., k] = columna
+        tensor[~np.isfinite(tensor)] = np.nan
+        return tensor
+
+
+def rejilla(valores: Sequence[np.ndarray]) -> List[np.ndarray]:
+    """
+    Producto cartesiano de los valores de cada parámetro.
+
+    Returns:
+        Una malla por parámetro, de forma (n_1, ..., n_p).
+
+    Raises:
+        ValueError: Si la rejilla supera MAX_COMBINACIONES.
+    """
+    combinaciones = int(np.prod([len(v) for v in valores])) if valores else 1
+    if combinaciones > MAX_COMBINACIONES:
+        raise ValueError(f"La rejilla tiene {combinaciones} combinaciones; el máximo es {MAX_COMBINACIONES}")
+    return np.meshgrid(*valores, indexing="ij")
+
+
+def _horner(coeficientes: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Evalúa un polinomio por fila de coeficientes (B, n+1) en los desplazamientos t (P,): (B, P)."""
+    resultado = np.repeat(coeficientes[:, -1:], len(t), axis=1)
+    for k in range(coeficientes.shape[1] - 2, -1, -1):
+        resultado *= t
+        resultado += coeficientes[:, k:k + 1]
+    return resultado
+
+
+def errores_por_combinacion(funcion: Callable, tensor: np.ndarray, mallas: Sequence[np.ndarray],
+                            x0: float, x_vals: np.ndarray) -> Dict:
+    """
+    Mide el error del desarrollo de cada combinación de parámetros en los puntos x_vals.
+
+    Args:
+        funcion: f(x, p_1, ..., p_k) vectorizada.
+        tensor: Coeficientes de forma (n_1, ..., n_p, orden + 1).
+        mallas: Mallas de los parámetros, de forma (n_1, ..., n_p).
+        x0: Centro del desarrollo.
+        x_vals: Puntos en los que se mide el error.
+
+    Returns:
+        Diccionario con "error_maximo" y "error_medio" (absolutos, forma de la rejilla; NaN en
+        las combinaciones donde f o el desarrollo no son finitos en algún punto).
+    """
+    forma = tensor.shape[:-1]
+    coeficientes = tensor.reshape(-1, tensor.shape[-1])
+    planos = [m.ravel() for m in mallas]
+    x_vals = np.asarray(x_vals, dtype=float)
+    t = x_vals - x0
+    maximo = np.empty(len(coeficientes))
+    medio = np.empty(len(coeficientes))
+    bloque = max(1, ELEMENTOS_POR_BLOQUE // max(len(x_vals), 1))
+    for inicio in range(0, len(coeficientes), bloque):
+        fin = min(inicio + bloque, len(coeficientes))
+        with np.errstate(all='ignore'):
+            exactos = funcion(x_vals[None, :], *(p[inicio:fin, None] for p in planos))
+            exactos = np.broadcast_to(exactos, (fin - inicio, len(x_vals)))
+            errores = np.abs(exactos - _horner(coeficientes[inicio:fin], t))
+        # Un punto no finito invalida la combinación (dominio dependiente de los parámetros)
+        errores[~np.isfinite(errores)] = np.nan
+        maximo[inicio:fin] = errores.max(axis=1)
+        medio[inicio:fin] = errores.mean(axis=1)
+    return {"error_maximo": maximo.reshape(forma), "error_medio": medio.reshape(forma)}
+
+
+def resumen_errores(error_maximo: np.ndarray, nombres: Sequence[str], mallas: Sequence[np.ndarray]) -> Dict:
+    """
+    Estadísticas del error máximo sobre la rejilla.
+
+    Returns:
+        Diccionario con "maximo", "mediana" y "minimo" del error, "peor" y "mejor" (valores de
+        los parámetros de esas combinaciones) e "invalidas" (combinaciones sin error finito).
+    """
+    validos = np.isfinite(error_maximo)
+    resumen = {"invalidas": int(error_maximo.size - validos.sum()), "maximo": None, "mediana": None,
+               "minimo": None, "peor": None, "mejor": None}
+    if not validos.any():
+        return resumen
+    plano = np.where(validos, error_maximo, np.nan).ravel()
+    for clave, indice in (("peor", np.nanargmax(plano)), ("mejor", np.nanargmin(plano))):
+        resumen[clave] = {nombre: float(m.ravel()[indice]) for nombre, m in zip(nombres, mallas)}
+    resumen["maximo"] = float(np.nanmax(plano))
+    resumen["mediana"] = float(np.nanmedian(plano))
+    resumen["minimo"] = float(np.nanmin(plano))
+    return resumen
@@ -0,0 +1,103 @@
+"""
+Módulo del Plano Complejo
+
+Este módulo evalúa funciones sobre mallas del plano complejo por bloques de filas, de modo
+que imágenes de varios megapíxeles se calculan con memoria acotada (solo un bloque de la
+malla existe a la vez por hilo), y reparte los bloques entre hilos (los ufuncs de NumPy
+liberan el GIL). Incluye la coloración de dominio para representar valores complejos y el dibujo del disco
+de convergencia.
+"""
+
+import os
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+import matplotlib.pyplot as plt
+from matplotlib.colors import hsv_to_rgb
+from typing import Callable, Dict, Tuple
+
+# Filas de la malla que se evalúan juntas en cada bloque
+FILAS_POR_BLOQUE = 128
+
+
+def coloracion_dominio(w: np.ndarray) -> np.ndarray:
+    """
+    Colorea valores complejos: el tono representa el argumento y el brillo, anillos de |w|
+    en escala logarítmica (cada anillo duplica el módulo).
+
+    Args:
+        w: Arreglo de valores complejos.
+
+    Returns:
+        Arreglo RGB uint8 con una dimensión final de tamaño 3. Los valores no finitos se pintan de gris.
+    """
+    with np.errstate(all='ignore'):
+        tono = (np.angle(w) / (2 * np.pi)) % 1.0
+        anillos = np.log2(np.abs(w))
+        brillo = 0.65 + 0.35 * (anillos - np.floor(anillos))
+    hsv = np.stack([tono, np.full(w.shape, 0.9), brillo], axis=-1)
+    rgb = hsv_to_rgb(np.nan_to_num(hsv, nan=0.0, posinf=0.0, neginf=0.0))
+    rgb[~np.isfinite(w)] = 0.5
+    return (255 * rgb).astype(np.uint8)
+
+
+def evaluar_por_bloques(calcular: Callable[[np.ndarray], np.ndarray], rango_re: Tuple[float, float],
+                        rango_im: Tuple[float, float], resolucion: Tuple[int, int], canales: int = 0,
+                        dtype=np.float32, filas_por_bloque: int = FILAS_POR_BLOQUE,
+                        hilos: int = None) -> np.ndarray:
+    """
+    Rellena una imagen evaluando una función sobre la malla z = re + i·im por bloques de filas.
+
+    La fila 0 corresponde a la parte imaginaria mínima (usar origin="lower" con imshow).
+
+    Args:
+        calcular: Función que recibe un bloque de la malla (filas, ancho) complejo y devuelve
+            los píxeles del bloque, con forma (filas, ancho) o (filas, ancho, canales).
+        rango_re: Tupla (min, max) de la parte real.
+        rango_im: Tupla (min, max) de la parte imaginaria.
+        resolucion: Tupla (ancho, alto) en píxeles.
+        canales: Número de canales por píxel (0 para imágenes escalares).
+        dtype: Tipo de la imagen de salida.
+        filas_por_bloque: Filas evaluadas juntas en cada bloque.
+        hilos: Número de hilos. Si es None, usa el número de CPUs.
+
+    Returns:
+        La imagen completa, de forma (alto, ancho) o (alto, ancho, canales).
+    """
+    ancho, alto = resolucion
+    if ancho < 1 or alto < 1:
+        raise ValueError("La resolución debe ser positiva")
+
+    reales = np.linspace(rango_re[0], rango_re[1], ancho)
+    imaginarias = np.linspace(rango_im[0], rango_im[1], alto)
+    forma = (alto, ancho, canales) if canales else (alto, ancho)
+    imagen = np.empty(forma, dtype=dtype)
+
+    def bloque(inicio: int) -> None:
+        fin = min(inicio + filas_por_bloque, alto)
+        z = reales[None, :] + 1j * imaginarias[inicio:fin, None]
+        imagen[inicio:fin] = calcular(z)
+
+    inicios = range(0, alto, max(1, filas_por_bloque))
+    with ThreadPoolExecutor(max_workers=hilos or os.cpu_count() or 1) as grupo:
+        list(grupo.map(bloque, inicios))
+    return imagen
+
+
+def dibujar_disco(ax, disco: Dict) -> None:
+    """
+    Superpone el disco de convergencia y las singularidades sobre unos ejes del plano complejo.
+
+    Args:
+        ax: Ejes de matplotlib.
+        disco: Diccionario con "centro", "radio" y "singularidades", como el de
+            AproximacionTaylor.disco_convergencia.
+    """
+    if np.isfinite(disco["radio"]):
+        ax.add_patch(plt.Circle((disco["centro"], 0), disco["radio"], fill=False, color='white',
+                                linestyle='--', linewidth=1.5, label=f'|z - x₀| = {disco["radio"]:.4g}'))
+    if disco["singularidades"]:
+        ax.scatter([s.real for s in disco["singularidades"]], [s.imag for s in disco["singularidades"]],
+                   marker='x', color='red', s=60, zorder=5, label='Singularidades')
+    ax.scatter([disco["centro"]], [0], color='white', edgecolor='black', s=40, zorder=5)
+    ax.set_xlabel('Re(z)')
+    ax.set_ylabel('Im(z)')
@@ -0,0 +1,232 @@
+"""
+Módulo de Polinomios de Taylor
+
+Este módulo proporciona una representación compacta de un polinomio de Taylor como
+un arreglo de coeficientes alrededor de un centro, con evaluación vectorizada por
+el método de Horner y conversión a expresiones de SymPy solo cuando se necesita.
+"""
+
+import sympy as sp
+import numpy as np
+from typing import Iterator, Sequence, Tuple, Union
+
+
+def _a_numero(coef) -> complex:
+    """Convierte un coeficiente (SymPy o numérico) a complejo; los infinitos y NaN pasan a NaN."""
+    try:
+        valor = complex(sp.N(coef)) if isinstance(coef, sp.Basic) else complex(coef)
+    except TypeError:
+        # zoo, nan y similares no tienen valor numérico finito
+        if isinstance(coef, sp.Basic) and coef.is_number:
+            return complex(np.nan)
+        raise
+    return valor
+
+
+class PolinomioTaylor:
+    """
+    Polinomio P(x) = sum(c_k * (x - centro)**k) representado por sus coeficientes.
+
+    Los coeficientes pueden ser exactos (números de SymPy) o de punto flotante (arreglo de NumPy).
+    """
+
+    def __init__(self, coeficientes: Sequence, centro: Union[float, sp.Expr] = 0):
+        """
+        Inicializa el polinomio.
+
+        Args:
+            coeficientes: Coeficientes c_0, c_1, ..., c_n en orden ascendente de potencia.
+            centro: El punto alrededor del cual está expandido el polinomio.
+        """
+        if len(coeficientes) == 0:
+            coeficientes = [sp.Integer(0)]
+        if isinstance(coeficientes, np.ndarray):
+            self.coeficientes = coeficientes
+        else:
+            self.coeficientes = [sp.sympify(c) for c in coeficientes]
+        self.centro = centro
+        self._flotantes = None  # Conversión a punto flotante, calculada una sola vez
+
+    @property
+    def exacto(self) -> bool:
+        """Indica si los coeficientes son números de SymPy (exactos o de precisión arbitraria)."""
+        return not isinstance(self.coeficientes, np.ndarray)
+
+    @property
+    def orden(self) -> int:
+        """El grado nominal del polinomio (número de coeficientes menos uno)."""
+        return len(self.coeficientes) - 1
+
+    @property
+    def operaciones(self) -> int:
+        """Número de operaciones aritméticas de una evaluación de Horner (incluida la resta del centro)."""
+        return 2 * self.orden + (1 if self.centro != 0 else 0)
+
+    def __len__(self) -> int:
+        return len(self.coeficientes)
+
+    def __repr__(self) -> str:
+        return f"PolinomioTaylor(orden={self.orden}, centro={self.centro}, exacto={self.exacto})"
+
+    def _nuevo(self, coeficientes: list, centro=None) -> "PolinomioTaylor":
+        """Crea un polinomio del mismo tipo de coeficientes (exacto o flotante)."""
+        if centro is None:
+            centro = self.centro
+        if not self.exacto:
+            coeficientes = np.asarray(coeficientes, dtype=self.coeficientes.dtype)
+        return PolinomioTaylor(coeficientes, centro)
+
+    def a_flotantes(self) -> "PolinomioTaylor":
+        """
+        Convierte los coeficientes a un arreglo de NumPy.
+
+        Returns:
+            Un polinomio con coeficientes float64 (o complex128 si alguno es complejo).
+        """
+        if not self.exacto:
+            return self
+        if self._flotantes is not None:
+            return self._flotantes
+
+        valores = np.array([_a_numero(c) for c in self.coeficientes], dtype=complex)
+        if np.all((valores.imag == 0) | np.isnan(valores.imag)):
+            valores = valores.real.copy()
+        centro = self.centro
+        if isinstance(centro, sp.Basic):
+            centro = _a_numero(centro)
+            centro = centro.real if centro.imag == 0 else centro
+        self._flotantes = PolinomioTaylor(valores, centro)
+        return self._flotantes
+
+    def evaluar(self, x):
+        """
+        Evalúa el polinomio con el método de Horner.
+
+        Args:
+            x: Un escalar o arreglo de NumPy con los puntos de evaluación.
+
+        Returns:
+            Los valores del polinomio en x, con la misma forma que x.
+        """
+        flotante = self.a_flotantes()
+        coefs = flotante.coeficientes
+        t = np.asarray(x) - flotante.centro
+        resultado = np.full(np.shape(t), coefs[-1], dtype=np.result_type(coefs, t))
+        for c in coefs[-2::-1]:
+            resultado *= t
+            resultado += c
+        return resultado[()]
+
+    def __call__(self, x):
+        return self.evaluar(x)
+
+    def sumas_parciales(self, x) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Genera las sumas parciales P_0(x), P_1(x), ..., P_n(x) de forma incremental.
+
+        Cada suma se obtiene de la anterior añadiendo c_k * (x - centro)**k, con la potencia
+        acumulada, así que todas juntas cuestan lo mismo que una evaluación de orden n.
+
+        Args:
+            x: Un escalar o arreglo de NumPy con los puntos de evaluación.
+
+        Yields:
+            Tuplas (k, P_k(x)). El arreglo se actualiza en el sitio: cópielo si debe conservarse.
+        """
+        flotante = self.a_flotantes()
+        coefs = flotante.coeficientes
+        t = np.asarray(x) - flotante.centro
+        tipo = np.result_type(coefs, t)
+        potencia = np.ones(np.shape(t), dtype=tipo)
+        suma = np.full(np.shape(t), coefs[0], dtype=tipo)
+        yield 0, suma
+        for k in range(1, len(coefs)):
+            potencia *= t
+            suma += coefs[k] * potencia
+            yield k, suma
+
+    def truncar(self, orden: int) -> "PolinomioTaylor":
+        """
+        Devuelve el polinomio truncado al orden indicado.
+
+        Args:
+            orden: El orden máximo a conservar.
+        """
+        return self._nuevo(list(self.coeficientes[:orden + 1]))
+
+    def derivada(self) -> "PolinomioTaylor":
+        """Devuelve la derivada del polinomio alrededor del mismo centro."""
+        coefs = self.coeficientes
+        return self._nuevo([k * coefs[k] for k in range(1, len(coefs))])
+
+    def integral(self, constante=0) -> "PolinomioTaylor":
+        """
+        Devuelve la primitiva del polinomio alrededor del mismo centro.
+
+        Args:
+            constante: El valor de la primitiva en el centro.
+        """
+        coefs = self.coeficientes
+        if self.exacto:
+            nuevos = [sp.sympify(constante)] + [coefs[k] / sp.Integer(k + 1) for k in range(len(coefs))]
+        else:
+            nuevos = [constante] + [coefs[k] / (k + 1) for k in range(len(coefs))]
+        return self._nuevo(nuevos)
+
+    def desplazar(self, nuevo_centro) -> "PolinomioTaylor":
+        """
+        Reexpresa el mismo polinomio alrededor de otro centro (desplazamiento de Taylor).
+
+        Usa divisiones sintéticas repetidas, con coste O(n²) operaciones aritméticas.
+
+        Args:
+            nuevo_centro: El nuevo punto de expansión.
+
+        Returns:
+            Un polinomio equivalente expandido alrededor de nuevo_centro.
+        """
+        if self.exacto:
+            h = sp.sympify(nuevo_centro) - sp.sympify(self.centro)
+            coefs = list(self.coeficientes)
+        else:
+            h = nuevo_centro - self.centro
+            coefs = self.coeficientes.astype(np.result_type(self.coeficientes, h)).copy()
+
+        n = len(coefs) - 1
+        if h != 0:
+            for i in range(n):
+                for j in range(n - 1, i - 1, -1):
+                    coefs[j] = coefs[j] + h * coefs[j + 1]
+
+        if self.exacto:
+            coefs = [sp.expand(c) for c in coefs]
+        return PolinomioTaylor(coefs, nuevo_centro)
+
+    def a_expresion(self, x: sp.Symbol, expandir: bool = False) -> sp.Expr:
+        """
+        Convierte el polinomio a una expresión de SymPy.
+
+        Args:
+            x: El símbolo de la variable.
+            expandir: Si es True, la expresión se da en potencias de x; si no, en potencias de (x - centro).
+
+        Returns:
+            La expresión simbólica del polinomio.
+        """
+        if expandir and self.centro != 0:
+            return self.desplazar(0).a_expresion(x)
+
+        base = x - self.centro
+        coefs = self.coeficientes if self.exacto else [sp.sympify(c) for c in self.coeficientes]
+        return sp.Add(*[c * base**k for k, c in enumerate(coefs)])
+
+    def a_poly(self, x: sp.Symbol) -> sp.Poly:
+        """
+        Convierte el polinomio a un sp.Poly en potencias de x.
+
+        Args:
+            x: El símbolo de la variable.
+        """
+        pol = self.desplazar(0) if self.centro != 0 else self
+        coefs = pol.coeficientes if pol.exacto else [sp.sympify(c) for c in pol.coeficientes]
+        return sp.Poly.from_list(list(reversed(coefs)), x)
@@ -0,0 +1,384 @@
+"""
+Módulo de Aproximantes de Taylor por Tramos
+
+Un solo desarrollo de Taylor solo es preciso cerca de su centro, así que para cubrir un rango
+amplio como [-50, 50] con una tolerancia se divide el rango en tramos, cada uno con su propio
+centro y el menor orden que cumple la tolerancia. Los tramos se colocan de forma adaptativa:
+un tramo que no la cumple con el orden máximo se parte por la mitad.
+
+Todos los coeficientes se guardan en una única tabla contigua (potencia, tramo) y el tramo de
+cada punto se localiza en O(1) con un índice uniforme: como los tramos salen de bisecciones,
+cada celda de la malla más fina pertenece a un solo tramo. Si esa malla fuera demasiado fina
+se usa una búsqueda binaria sobre los bordes. La evaluación es un Horner vectorizado sobre
+bloques de puntos repartidos entre hilos.
+
+El aproximante se guarda y se carga como .npz (o .json) para usarlo sin TaylorViz ni SymPy.
+"""
+
+import json
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Sequence, Tuple
+from polinomio import PolinomioTaylor
+
+# Celdas máximas del índice uniforme (4 bytes cada una)
+MAX_CELDAS_INDICE = 1 << 20
+# Puntos por bloque de evaluación
+PUNTOS_POR_BLOQUE = 1 << 16
+# Nodos de Chebyshev-Lobatto donde se mide el error de cada tramo
+MUESTRAS_TRAMO = 64
+# Fracción de la tolerancia exigida en los nodos, como margen para el error entre ellos
+FACTOR_SEGURIDAD = 0.5
+# Bisecciones seguidas sin reducir el error tras las que se abandona un tramo
+BISECCIONES_SIN_MEJORA = 3
+
+
+class AproximantePorTramos:
+    """
+    Aproximante definido por polinomios de Taylor en tramos consecutivos de un intervalo.
+    """
+
+    def __init__(self, bordes: Sequence[float], centros: Sequence[float], coeficientes: Sequence[np.ndarray],
+                 profundidades: Sequence[int] = None, funcion: str = None, tolerancia: float = None,
+                 error_maximo: float = None):
+        """
+        Inicializa el aproximante.
+
+        Args:
+            bordes: Los m + 1 bordes crecientes de los m tramos.
+            centros: El centro de expansión de cada tramo.
+            coeficientes: Coeficientes (float64) del polinomio de cada tramo, de longitud variable.
+            profundidades: Número de bisecciones de cada tramo respecto al intervalo completo. Con
+                ellas (o con tramos de igual anchura) se construye el índice uniforme.
+            funcion: La función aproximada, como referencia.
+            tolerancia: La tolerancia con la que se construyó.
+            error_maximo: El error máximo medido tras construirlo.
+        """
+        self.bordes = np.asarray(bordes, dtype=np.float64)
+        self.centros = np.asarray(centros, dtype=np.float64)
+        if len(self.bordes) != len(self.centros) + 1 or len(coeficientes) != len(self.centros):
+            raise ValueError("Debe haber un centro y unos coeficientes por tramo, y un borde más que tramos")
+        if len(self.centros) == 0 or np.any(np.diff(self.bordes) <= 0):
+            raise ValueError("Los bordes de los tramos deben ser estrictamente crecientes")
+
+        self.ordenes = np.array([len(c) - 1 for c in coeficientes], dtype=np.int64)
+        # Tabla (potencia, tramo): cada fila es contigua y Horner la recorre fila a fila. Los
+        # tramos de orden menor se rellenan con ceros en las potencias altas
+        self.tabla = np.zeros((int(self.ordenes.max()) + 1, len(self.centros)))
+        for i, c in enumerate(coeficientes):
+            self.tabla[:len(c), i] = np.asarray(c, dtype=np.float64)
+        self.profundidades = None if profundidades is None else np.asarray(profundidades, dtype=np.int64)
+        self.funcion = funcion
+        self.tolerancia = tolerancia
+        self.error_maximo = error_maximo
+        self.indice = self._construir_indice()
+
+    def _construir_indice(self):
+        """Tabla celda -> tramo de la malla uniforme más fina, o None si no cabe en MAX_CELDAS_INDICE."""
+        anchuras = np.diff(self.bordes)
+        total = self.bordes[-1] - self.bordes[0]
+        if self.profundidades is not None:
+            nivel = int(self.profundidades.max())
+            celdas_por_tramo = 1 << (nivel - self.profundidades) if nivel < 63 else None
+            if (celdas_por_tramo is not None and (1 << nivel) <= MAX_CELDAS_INDICE
+                    and celdas_por_tramo.sum() == 1 << nivel
+                    and np.allclose(anchuras, total * celdas_por_tramo / (1 << nivel))):
+                return np.repeat(np.arange(len(self.centros), dtype=np.int32), celdas_por_tramo)
+        if len(self.centros) <= MAX_CELDAS_INDICE and np.allclose(anchuras, anchuras[0]):
+            return np.arange(len(self.centros), dtype=np.int32)
+        return None
+
+    @property
+    def rango(self) -> Tuple[float, float]:
+        """El intervalo cubierto por los tramos."""
+        return float(self.bordes[0]), float(self.bordes[-1])
+
+    @property
+    def orden_maximo(self) -> int:
+        """El mayor orden de los tramos."""
+        return int(self.ordenes.max())
+
+    def __len__(self) -> int:
+        return len(self.centros)
+
+    def __repr__(self) -> str:
+        return (f"AproximantePorTramos(tramos={len(self)}, rango={self.rango}, "
+                f"ordenes={int(self.ordenes.min())}..{self.orden_maximo}, "
+                f"indice={'uniforme' if self.indice is not None else 'bisección'})")
+
+    def polinomio(self, i: int) -> PolinomioTaylor:
+        """El polinomio de Taylor del tramo i."""
+        return PolinomioTaylor(self.tabla[:self.ordenes[i] + 1, i].copy(), float(self.centros[i]))
+
+    def tramo(self, x) -> np.ndarray:
+        """
+        Localiza el tramo de cada punto.
+
+        Args:
+            x: Un escalar o arreglo de NumPy.
+
+        Returns:
+            Arreglo de índices de tramo con la forma de x (-1 fuera del rango o en NaN).
+        """
+        x = np.asarray(x, dtype=np.float64)
+        inicio, fin = self.rango
+        dentro = (x >= inicio) & (x <= fin)
+        if self.indice is not None:
+            escala = len(self.indice) / (fin - inicio)
+            celda = np.where(dentro, (x - inicio) * escala, 0.0).astype(np.int64)
+            indices = self.indice[np.minimum(celda, len(self.indice) - 1)]
+        else:
+            indices = np.searchsorted(self.bordes[1:-1], x, side='right')
+        return np.where(dentro, indices, -1)
+
+    def evaluar(self, x, hilos: int = None):
+        """
+        Evalúa el aproximante; fuera del rango devuelve NaN.
+
+        Args:
+            x: Un escalar o arreglo de NumPy con los puntos de evaluación.
+            hilos: Número de hilos entre los que se reparten los bloques. Si es None, usa
+                el número de CPUs.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        planos = x.ravel()
+        salida = np.empty_like(planos)
+
+        def bloque(inicio: int) -> None:
+            fin = min(inicio + PUNTOS_POR_BLOQUE, len(planos))
+            xb = planos[inicio:fin]
+            indices = self.tramo(xb)
+            fuera = indices < 0
+            indices[fuera] = 0
+            t = xb - self.centros[indices]
+            valores = self.tabla[-1][indices]
+            for k in range(len(self.tabla) - 2, -1, -1):
+                valores *= t
+                valores += self.tabla[k][indices]
+            valores[fuera] = np.nan
+            salida[inicio:fin] = valores
+
+        inicios = range(0, len(planos), PUNTOS_POR_BLOQUE)
+        if len(inicios) > 1:
+            with ThreadPoolExecutor(max_workers=hilos or os.cpu_count() or 1) as grupo:
+                list(grupo.map(bloque, inicios))
+        else:
+            for inicio in inicios:
+                bloque(inicio)
+        return salida.reshape(x.shape)[()]
+
+    def __call__(self, x):
+        return self.evaluar(x)
+
+    def a_diccionario(self) -> Dict:
+        """Representación serializable en JSON (los coeficientes de cada tramo sin relleno)."""
+        return {"bordes": self.bordes.tolist(), "centros": self.centros.tolist(),
+                "coeficientes": [self.tabla[:n + 1, i].tolist() for i, n in enumerate(self.ordenes)],
+                "profundidades": None if self.profundidades is None else self.profundidades.tolist(),
+                "funcion": self.funcion, "tolerancia": self.tolerancia, "error_maximo": self.error_maximo}
+
+    @classmethod
+    def desde_diccionario(cls, datos: Dict) -> "AproximantePorTramos":
+        """Reconstruye un aproximante a partir de a_diccionario."""
+        return cls(datos["bordes"], datos["centros"], [np.asarray(c) for c in datos["coeficientes"]],
+                   datos.get("profundidades"), datos.get("funcion"), datos.get("tolerancia"),
+                   datos.get("error_maximo"))
+
+    def guardar(self, ruta: str) -> str:
+        """
+        Guarda el aproximante en un archivo .json o, con cualquier otra extensión, .npz.
+
+        Returns:
+            La ruta del archivo escrito (np.savez añade .npz si falta).
+        """
+        directorio = os.path.dirname(ruta)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        if ruta.endswith(".json"):
+            with open(ruta, "w", encoding="utf-8") as f:
+                json.dump(self.a_diccionario(), f)
+            return ruta
+
+        metadatos = {"funcion": self.funcion, "tolerancia": self.tolerancia, "error_maximo": self.error_maximo}
+        if not ruta.endswith(".npz"):
+            ruta += ".npz"
+        np.savez(ruta, bordes=self.bordes, centros=self.centros, ordenes=self.ordenes, tabla=self.tabla,
+                 profundidades=self.profundidades if self.profundidades is not None else np.array([], np.int64),
+                 metadatos=np.array(json.dumps(metadatos)))
+        return ruta
+
+    @classmethod
+    def cargar(cls, ruta: str) -> "AproximantePorTramos":
+        """Carga un aproximante guardado con guardar (.npz o .json)."""
+        if ruta.endswith(".json"):
+            with open(ruta, encoding="utf-8") as f:
+                return cls.desde_diccionario(json.load(f))
+
+        with np.load(ruta) as datos:
+            metadatos = json.loads(str(datos["metadatos"]))
+            tabla, ordenes = datos["tabla"], datos["ordenes"]
+            profundidades = datos["profundidades"] if len(datos["profundidades"]) else None
+            return cls(datos["bordes"], datos["centros"], [tabla[:n + 1, i] for i, n in enumerate(ordenes)],
+                       profundidades, **metadatos)
+
+
+def _analizar_tramo(taylor, izquierda: float, derecha: float, orden_max: int, tolerancia: float,
+                    muestras: int) -> Dict:
+    """
+    Busca el menor orden con el que el desarrollo en el punto medio cumple la tolerancia en el tramo.
+
+    Returns:
+        Diccionario con "centro", "orden" (None si ningún orden la cumple o el centro no es
+        analítico), "coeficientes" (float64), "error" (el menor error medido) y "resolucion"
+        (eps * max|f| en los nodos: el menor error alcanzable en float64; 0 si f no es finita).
+    """
+    centro = 0.5 * (izquierda + derecha)
+    # Los nodos de Chebyshev-Lobatto incluyen los extremos, donde el error de Taylor es mayor
+    x_vals = centro + 0.5 * (derecha - izquierda) * np.cos(np.pi * np.arange(muestras) / (muestras - 1))
+    fallo = {"centro": centro, "orden": None, "coeficientes": None, "error": np.inf, "resolucion": 0.0}
+    try:
+        polinomio = taylor.obtener_polinomio(centro, orden_max).a_flotantes()
+        with np.errstate(all='ignore'):
+            exactos = np.broadcast_to(taylor._lambdificar(taylor.func)(x_vals), x_vals.shape)
+    except (ValueError, TypeError, ZeroDivisionError, OverflowError):
+        # PuntoNoAnalitico es un ValueError: el tramo se parte y el centro queda en un borde
+        return fallo
+    if np.iscomplexobj(polinomio.coeficientes) or (np.iscomplexobj(exactos) and np.any(exactos.imag != 0)):
+        return fallo
+    exactos = np.real(exactos).astype(np.float64)
+    if not (np.all(np.isfinite(exactos)) and np.all(np.isfinite(polinomio.coeficientes))):
+        return fallo
+    resolucion = np.finfo(np.float64).eps * float(np.max(np.abs(exactos)))
+    if FACTOR_SEGURIDAD * tolerancia < resolucion:
+        # Ningún orden ni ninguna bisección bajan del redondeo de f: no se suma nada
+        return dict(fallo, resolucion=resolucion)
+    fallo["resolucion"] = resolucion
+
+    mejor = np.inf
+    with np.errstate(all='ignore'):
+        for k, suma in polinomio.sumas_parciales(x_vals):
+            error = float(np.max(np.abs(suma - exactos)))
+            mejor = min(mejor, error)
+            if error <= FACTOR_SEGURIDAD * tolerancia:
+                return {"centro": centro, "orden": k, "coeficientes": polinomio.coeficientes[:k + 1].copy(),
+                        "error": error, "resolucion": resolucion}
+    return dict(fallo, error=mejor)
+
+
+# Instancia de AproximacionTaylor de cada proceso del grupo, reutilizada entre tramos
+_TAYLOR_PROCESO = {}
+
+
+def _analizar_tramo_proceso(args) -> Dict:
+    """Versión de _analizar_tramo para ProcessPoolExecutor: recibe la función como cadena."""
+    func_str, cauchy, izquierda, derecha, orden_max, tolerancia, muestras = args
+    if (func_str, cauchy) not in _TAYLOR_PROCESO:
+        from taylor_series import AproximacionTaylor
+        taylor = AproximacionTaylor()
+        taylor.establecer_funcion(func_str)
+        taylor.establecer_cauchy(*cauchy)
+        _TAYLOR_PROCESO.clear()
+        _TAYLOR_PROCESO[(func_str, cauchy)] = taylor
+    return _analizar_tramo(_TAYLOR_PROCESO[(func_str, cauchy)], izquierda, derecha, orden_max,
+                           tolerancia, muestras)
+
+
+def construir_por_tramos(taylor, rango_x: Tuple[float, float], tolerancia: float, orden_max: int = 20,
+                         profundidad_maxima: int = 20, muestras: int = MUESTRAS_TRAMO,
+                         procesos: int = None, puntos_verificacion: int = 100000) -> AproximantePorTramos:
+    """
+    Cubre rango_x con tramos de Taylor que cumplen la tolerancia, partiendo por la mitad los que no.
+
+    Los tramos de cada nivel de bisección se analizan en paralelo en un grupo de procesos (las
+    funciones simbólicas con coeficientes exactos) o en este proceso (funciones de Python y
+    coeficientes de la integral de Cauchy, que cuestan milisegundos).
+
+    Args:
+        taylor: AproximacionTaylor con la función ya establecida.
+        rango_x: Intervalo (min, max) a cubrir.
+        tolerancia: Error absoluto máximo.
+        orden_max: Orden máximo de cada tramo.
+        profundidad_maxima: Bisecciones máximas de un tramo (hasta 2^profundidad_maxima tramos).
+        muestras: Nodos por tramo en los que se mide el error.
+        procesos: Procesos del grupo. Si es None, usa el número de CPUs; con 1 no se usa grupo.
+        puntos_verificacion: Puntos de la malla en la que se mide el error máximo final.
+
+    Returns:
+        El aproximante, con el error máximo medido en su atributo error_maximo.
+
+    Raises:
+        ValueError: Si un tramo no cumple la tolerancia tras profundidad_maxima bisecciones
+            (normalmente, por una singularidad dentro del rango), si la tolerancia está por
+            debajo de la resolución de float64 de f en un tramo o si BISECCIONES_SIN_MEJORA
+            bisecciones seguidas no reducen su error.
+        LimiteExcedido: Si taylor tiene límites activos y se agotan (se comprueban entre
+            niveles de bisección).
+    """
+    inicio, fin = float(rango_x[0]), float(rango_x[1])
+    if not inicio < fin:
+        raise ValueError("El rango debe tener min < max")
+    if tolerancia <= 0:
+        raise ValueError("La tolerancia debe ser positiva")
+    if not 0 <= orden_max <= 200:
+        raise ValueError("El orden máximo debe estar entre 0 y 200")
+
+    en_procesos = taylor.funcion_numerica is None and not taylor.cauchy and procesos != 1
+    cauchy = (taylor.cauchy, taylor.radio_cauchy)
+    grupo = None
+    # (izquierda, derecha, profundidad, error del tramo padre, bisecciones seguidas sin mejora)
+    pendientes = [(inicio, fin, 0, np.inf, 0)]
+    tramos = []
+    try:
+        while pendientes:
+            taylor._comprobar_limites()
+            if en_procesos and len(pendientes) > 1:
+                if grupo is None:
+                    grupo = ProcessPoolExecutor(max_workers=procesos)
+                resultados = list(grupo.map(_analizar_tramo_proceso, [
+                    (taylor.func_str, cauchy, izquierda, derecha, orden_max, tolerancia, muestras)
+                    for izquierda, derecha, *_ in pendientes]))
+            else:
+                resultados = [_analizar_tramo(taylor, izquierda, derecha, orden_max, tolerancia, muestras)
+                              for izquierda, derecha, *_ in pendientes]
+
+            siguientes = []
+            for (izquierda, derecha, profundidad, error_padre, sin_mejora), resultado in zip(pendientes, resultados):
+                if resultado["orden"] is not None:
+                    tramos.append((izquierda, derecha, profundidad, resultado))
+                    continue
+                intervalo = f"[{izquierda:.6g}, {derecha:.6g}]"
+                if FACTOR_SEGURIDAD * tolerancia < resultado["resolucion"]:
+                    raise ValueError(f"La tolerancia {tolerancia:g} está por debajo de la resolución de float64 "
+                                     f"de f en {intervalo} (eps·max|f| = {resultado['resolucion']:.3g}); "
+                                     f"use una tolerancia mayor o un rango menor")
+                if profundidad >= profundidad_maxima:
+                    raise ValueError(f"No se alcanza la tolerancia {tolerancia:g} en {intervalo} "
+                                     f"tras {profundidad} bisecciones (error mínimo {resultado['error']:.3g}); "
+                                     f"¿hay una singularidad en el rango?")
+                # Un error finito que no baja al partir el tramo ya está en el redondeo de f
+                sin_mejora = sin_mejora + 1 if np.isfinite(error_padre) and resultado["error"] >= error_padre else 0
+                if sin_mejora >= BISECCIONES_SIN_MEJORA:
+                    raise ValueError(f"No se alcanza la tolerancia {tolerancia:g} en {intervalo}: "
+                                     f"{sin_mejora} bisecciones seguidas no reducen el error "
+                                     f"({resultado['error']:.3g}); use una tolerancia mayor")
+                medio = 0.5 * (izquierda + derecha)
+                siguientes += [(izquierda, medio, profundidad + 1, resultado["error"], sin_mejora),
+                               (medio, derecha, profundidad + 1, resultado["error"], sin_mejora)]
+            pendientes = siguientes
+            taylor.metricas.incrementar("tramos_analizados", len(resultados))
+    finally:
+        if grupo is not None:
+            grupo.shutdown()
+
+    tramos.sort(key=lambda tramo: tramo[0])
+    aproximante = AproximantePorTramos([t[0] for t in tramos] + [fin], [t[3]["centro"] for t in tramos],
+                                       [t[3]["coeficientes"] for t in tramos], [t[2] for t in tramos],
+                                       taylor.func_str, tolerancia)
+
+    x_vals = np.linspace(inicio, fin, max(puntos_verificacion, 2))
+    with taylor.metricas.medir("evaluate"), np.errstate(all='ignore'):
+        exactos = np.broadcast_to(taylor._lambdificar(taylor.func)(x_vals), x_vals.shape)
+        errores = np.abs(np.real(exactos) - aproximante.evaluar(x_vals))
+    aproximante.error_maximo = float(np.nanmax(errores)) if np.any(np.isfinite(errores)) else None
+    return aproximante
@@ -0,0 +1,264 @@
+"""
+Módulo de Series Perezosas
+
+Este módulo define una serie de potencias cuyos coeficientes se calculan bajo demanda:
+sum(c_k * (x - centro)**k) con c_k obtenido por una función fuente solo cuando alguien lo
+pide, y guardado para las siguientes peticiones.
+
+En lugar de fijar un orden de antemano, la serie se evalúa "hasta una tolerancia": se suman
+términos hasta que la estimación de la cola baja de la tolerancia en cada punto. La cola se
+estima con la razón geométrica de los términos recientes: si M_1 es el mayor |c_k t^k| de los
+últimos VENTANA términos y M_0 el de los VENTANA anteriores, q = (M_1 / M_0)^(1/VENTANA) y
+
+    |resto| ≈ M_1 * q / (1 - q)   (q < 1).
+
+Tomar máximos sobre una ventana evita confundir con convergencia los coeficientes nulos por
+paridad. La estimación es heurística: una serie con huecos de ceros más largos que la ventana
+puede darse por convergida antes de tiempo.
+
+Las operaciones aritméticas entre series (suma, producto de Cauchy, cociente, derivada e
+integral) producen nuevas series perezosas: el coeficiente k del resultado solo pide los
+coeficientes 0..k (o k + 1) de los operandos.
+"""
+
+import numpy as np
+import sympy as sp
+from typing import Callable, Dict, Iterator, List, Union
+from polinomio import PolinomioTaylor, _a_numero
+
+# Términos por ventana en la estimación de la cola
+VENTANA = 6
+# Orden máximo por defecto al evaluar hasta una tolerancia
+ORDEN_MAXIMO = 200
+
+
+class SeriePerezosa:
+    """
+    Serie de potencias alrededor de un centro con coeficientes calculados bajo demanda.
+    """
+
+    def __init__(self, fuente: Callable[[int], object], centro: Union[float, sp.Expr] = 0):
+        """
+        Inicializa la serie.
+
+        Args:
+            fuente: Función que devuelve el coeficiente c_k dado k. Se llama una sola vez por
+                coeficiente y en orden creciente de k.
+            centro: El punto alrededor del cual está expandida la serie.
+        """
+        self._fuente = fuente
+        self.centro = centro
+        self._coeficientes = []  # c_0..c_n ya calculados
+        self._numericos = []  # Los mismos coeficientes como números complejos
+
+    @classmethod
+    def constante(cls, valor, centro=0) -> "SeriePerezosa":
+        """Serie con c_0 = valor y el resto de coeficientes nulos."""
+        valor = sp.sympify(valor)
+        return cls(lambda k: valor if k == 0 else sp.Integer(0), centro)
+
+    @property
+    def calculados(self) -> int:
+        """Número de coeficientes ya calculados."""
+        return len(self._coeficientes)
+
+    def __repr__(self) -> str:
+        return f"SeriePerezosa(centro={self.centro}, calculados={self.calculados})"
+
+    def coeficiente(self, k: int):
+        """Devuelve c_k, calculando antes los coeficientes que falten hasta k."""
+        if k < 0:
+            raise IndexError("Los índices de una serie no pueden ser negativos")
+        while len(self._coeficientes) <= k:
+            self._coeficientes.append(self._fuente(len(self._coeficientes)))
+        return self._coeficientes[k]
+
+    def _numerico(self, k: int) -> complex:
+        """c_k como número complejo (NaN si no es finito)."""
+        while len(self._numericos) <= k:
+            self._numericos.append(_a_numero(self.coeficiente(len(self._numericos))))
+        return self._numericos[k]
+
+    def __getitem__(self, indice):
+        """
+        c_k con un índice entero, o la lista de coeficientes de un corte (que debe tener final:
+        la serie es infinita).
+        """
+        if isinstance(indice, slice):
+            if indice.stop is None or indice.stop < 0 or (indice.start or 0) < 0:
+                raise ValueError("El corte de una serie infinita necesita un final y límites no negativos")
+            return [self.coeficiente(k) for k in range(*indice.indices(indice.stop))]
+        return self.coeficiente(indice)
+
+    def __iter__(self) -> Iterator:
+        """Genera c_0, c_1, ... indefinidamente."""
+        k = 0
+        while True:
+            yield self.coeficiente(k)
+            k += 1
+
+    def truncar(self, orden: int) -> PolinomioTaylor:
+        """Polinomio con los coeficientes 0..orden."""
+        return PolinomioTaylor(self[:orden + 1], self.centro)
+
+    def _operando(self, otra) -> "SeriePerezosa":
+        """Convierte un escalar en serie constante y comprueba que los centros coinciden."""
+        if not isinstance(otra, SeriePerezosa):
+            return SeriePerezosa.constante(otra, self.centro)
+        if sp.sympify(otra.centro) != sp.sympify(self.centro):
+            raise ValueError(f"Las series tienen centros distintos ({self.centro} y {otra.centro})")
+        return otra
+
+    def __add__(self, otra) -> "SeriePerezosa":
+        otra = self._operando(otra)
+        return SeriePerezosa(lambda k: self.coeficiente(k) + otra.coeficiente(k), self.centro)
+
+    __radd__ = __add__
+
+    def __neg__(self) -> "SeriePerezosa":
+        return SeriePerezosa(lambda k: -self.coeficiente(k), self.centro)
+
+    def __sub__(self, otra) -> "SeriePerezosa":
+        return self + (-self._operando(otra))
+
+    def __rsub__(self, otra) -> "SeriePerezosa":
+        return self._operando(otra) - self
+
+    def __mul__(self, otra) -> "SeriePerezosa":
+        if not isinstance(otra, SeriePerezosa):
+            factor = sp.sympify(otra)
+            return SeriePerezosa(lambda k: factor * self.coeficiente(k), self.centro)
+        otra = self._operando(otra)
+        # Producto de Cauchy: c_k = sum(a_i * b_(k-i))
+        return SeriePerezosa(lambda k: sum((self.coeficiente(i) * otra.coeficiente(k - i) for i in range(k + 1)),
+                                           sp.Integer(0)), self.centro)
+
+    __rmul__ = __mul__
+
+    def __pow__(self, exponente: int) -> "SeriePerezosa":
+        """Potencia entera no negativa por multiplicaciones sucesivas (cuadrados)."""
+        if not isinstance(exponente, (int, np.integer)) or exponente < 0:
+            raise ValueError("Solo se admiten potencias enteras no negativas de una serie")
+        resultado, base = SeriePerezosa.constante(1, self.centro), self
+        while exponente:
+            if exponente & 1:
+                resultado = resultado * base
+            exponente >>= 1
+            if exponente:
+                base = base * base
+        return resultado
+
+    def __truediv__(self, otra) -> "SeriePerezosa":
+        otra = self._operando(otra)
+        if otra.coeficiente(0) == 0:
+            raise ValueError("El divisor tiene término independiente nulo: el cociente no es una serie de potencias")
+        cociente = []
+
+        # c_k = (a_k - sum(b_i * c_(k-i), i = 1..k)) / b_0
+        def fuente(k):
+            resto = self.coeficiente(k) - sum((otra.coeficiente(i) * cociente[k - i] for i in range(1, k + 1)),
+                                              sp.Integer(0))
+            cociente.append(resto / otra.coeficiente(0))
+            return cociente[k]
+        return SeriePerezosa(fuente, self.centro)
+
+    def __rtruediv__(self, otra) -> "SeriePerezosa":
+        return self._operando(otra) / self
+
+    def derivada(self) -> "SeriePerezosa":
+        """Serie de la derivada: c'_k = (k + 1) c_(k+1)."""
+        return SeriePerezosa(lambda k: (k + 1) * self.coeficiente(k + 1), self.centro)
+
+    def integral(self, constante=0) -> "SeriePerezosa":
+        """Serie de la primitiva con valor `constante` en el centro."""
+        constante = sp.sympify(constante)
+        return SeriePerezosa(lambda k: constante if k == 0 else self.coeficiente(k - 1) / sp.Integer(k),
+                             self.centro)
+
+    def evaluar(self, x, tolerancia: float = 1e-12, orden_maximo: int = ORDEN_MAXIMO) -> Dict:
+        """
+        Evalúa la serie en x sumando términos hasta que la cola estimada baja de la tolerancia.
+
+        Cada punto se detiene por separado; solo se calculan los coeficientes que necesita el
+        punto más exigente.
+
+        Args:
+            x: Escalar o arreglo de puntos (reales o complejos).
+            tolerancia: Error absoluto admitido (estimado con la cola de la serie).
+            orden_maximo: Último término que se suma si la cola no baja de la tolerancia.
+
+        Returns:
+            Diccionario con "valores", "ordenes" (último término sumado en cada punto),
+            "errores" (cola estimada; inf si los términos no decrecen) y "convergidos" (si la
+            cola bajó de la tolerancia), con la forma de x.
+        """
+        if tolerancia <= 0:
+            raise ValueError("La tolerancia debe ser positiva")
+        x = np.asarray(x)
+        t = (x - complex(_a_numero(self.centro))).ravel()
+        n = t.size
+        valores = np.zeros(n, dtype=complex)
+        ordenes = np.full(n, orden_maximo)
+        errores = np.full(n, np.inf)
+        convergidos = np.zeros(n, dtype=bool)
+
+        # Puntos aún activos, sus potencias t^k y los últimos 2*VENTANA |términos|
+        activos = np.arange(n)
+        potencias = np.ones(n, dtype=complex)
+        historial = np.zeros((2 * VENTANA, n))
+        complejo = False
+        for k in range(orden_maximo + 1):
+            if activos.size == 0:
+                break
+            coeficiente = self._numerico(k)
+            complejo = complejo or coeficiente.imag != 0
+            termino = coeficiente * potencias
+            valores[activos] += termino
+            historial[k % (2 * VENTANA)] = np.abs(termino)
+
+            if k >= 2 * VENTANA - 1:
+                filas = np.arange(k + 1, k + 1 + 2 * VENTANA) % (2 * VENTANA)
+                previos = historial[filas[:VENTANA]].max(axis=0)
+                recientes = historial[filas[VENTANA:]].max(axis=0)
+                with np.errstate(all='ignore'):
+                    q = np.where(recientes == 0, 0.0, (recientes / previos)**(1 / VENTANA))
+                    cola = np.where(q < 1, recientes * q / (1 - q), np.inf)
+                cola[~np.isfinite(recientes)] = np.inf
+                errores[activos] = cola
+                listos = cola <= tolerancia
+                if listos.any():
+                    ordenes[activos[listos]] = k
+                    convergidos[activos[listos]] = True
+                    activos, potencias = activos[~listos], potencias[~listos]
+                    historial = historial[:, ~listos]
+            potencias = potencias * t[activos]
+
+        if not complejo and not np.iscomplexobj(x):
+            valores = valores.real
+        resultado = {"valores": valores, "ordenes": ordenes, "errores": errores, "convergidos": convergidos}
+        if x.ndim == 0:
+            return {clave: valor[0].item() for clave, valor in resultado.items()}
+        return {clave: valor.reshape(x.shape) for clave, valor in resultado.items()}
+
+    def __call__(self, x, tolerancia: float = 1e-12, orden_maximo: int = ORDEN_MAXIMO):
+        """Valores de la serie en x hasta la tolerancia (ver evaluar)."""
+        return self.evaluar(x, tolerancia, orden_maximo)["valores"]
+
+    def sumas_parciales(self, x, orden_maximo: int = ORDEN_MAXIMO) -> Iterator:
+        """
+        Genera (k, P_k(x)) para k = 0, 1, ... calculando cada coeficiente solo cuando se pide
+        la suma siguiente.
+        """
+        t = np.asarray(x) - complex(_a_numero(self.centro))
+        suma, potencia = np.zeros_like(t, dtype=complex), np.ones_like(t, dtype=complex)
+        real = not np.iscomplexobj(x)
+        for k in range(orden_maximo + 1):
+            coeficiente = self._numerico(k)
+            real = real and coeficiente.imag == 0
+            suma = suma + coeficiente * potencia
+            potencia = potencia * t
+            yield k, (suma.real if real else suma)
+
+    def coeficientes_calculados(self) -> List:
+        """Copia de los coeficientes ya calculados, sin pedir ninguno nuevo."""
+        return list(self._coeficientes)
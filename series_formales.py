@@ -0,0 +1,212 @@
+"""
+Módulo de Series Formales
+
+Este módulo calcula los coeficientes de Taylor de una expresión recorriendo su árbol de
+SymPy y combinando series truncadas: sumas, productos por convolución, cocientes, y
+funciones elementales mediante sus recurrencias conocidas (exp, log, potencias, sin, cos,
+sinh, cosh, tan, tanh, atan, asin, acos, asinh, atanh). Cada operación cuesta O(n²)
+operaciones sobre coeficientes, sin derivar simbólicamente.
+"""
+
+import sympy as sp
+from typing import List
+
+
+class SerieNoSoportada(Exception):
+    """La expresión contiene una operación sin recurrencia conocida o no es analítica en x0."""
+
+
+def _normalizar(c: sp.Expr) -> sp.Expr:
+    """Mantiene los coeficientes en forma canónica para que no crezcan al combinarse."""
+    return c if c.is_Rational or c.is_Float else sp.expand(c)
+
+
+def _sumar(a: List[sp.Expr], b: List[sp.Expr]) -> List[sp.Expr]:
+    return [_normalizar(ai + bi) for ai, bi in zip(a, b)]
+
+
+def _multiplicar(a: List[sp.Expr], b: List[sp.Expr]) -> List[sp.Expr]:
+    """Producto de Cauchy truncado: c_k = sum(a_j * b_(k-j))."""
+    return [_normalizar(sp.Add(*[a[j] * b[k - j] for j in range(k + 1)])) for k in range(len(a))]
+
+
+def _dividir(a: List[sp.Expr], b: List[sp.Expr]) -> List[sp.Expr]:
+    """Cociente truncado a/b, con b_0 != 0."""
+    if b[0] == 0:
+        raise SerieNoSoportada("División por una serie que se anula en x0")
+    q = []
+    for k in range(len(a)):
+        q.append(_normalizar((a[k] - sp.Add(*[b[j] * q[k - j] for j in range(1, k + 1)])) / b[0]))
+    return q
+
+
+def _derivar(a: List[sp.Expr]) -> List[sp.Expr]:
+    """Derivada de la serie, completada con un cero para conservar la longitud."""
+    return [k * a[k] for k in range(1, len(a))] + [sp.Integer(0)]
+
+
+def _integrar(a: List[sp.Expr], constante: sp.Expr) -> List[sp.Expr]:
+    """Primitiva de la serie con término independiente dado, truncada a la misma longitud."""
+    return [constante] + [a[k] / (k + 1) for k in range(len(a) - 1)]
+
+
+def _exp(a: List[sp.Expr]) -> List[sp.Expr]:
+    """b = exp(a): b_0 = exp(a_0), b_k = (1/k) sum(j a_j b_(k-j))."""
+    b = [sp.exp(a[0])]
+    for k in range(1, len(a)):
+        b.append(_normalizar(sp.Add(*[j * a[j] * b[k - j] for j in range(1, k + 1)]) / k))
+    return b
+
+
+def _log(a: List[sp.Expr]) -> List[sp.Expr]:
+    """b = log(a): b_k = (a_k - (1/k) sum(j b_j a_(k-j), j<k)) / a_0."""
+    if a[0] == 0:
+        raise SerieNoSoportada("log no es analítico donde su argumento se anula")
+    b = [sp.log(a[0])]
+    for k in range(1, len(a)):
+        suma = sp.Add(*[j * b[j] * a[k - j] for j in range(1, k)])
+        b.append(_normalizar((a[k] - suma / k) / a[0]))
+    return b
+
+
+def _potencia(a: List[sp.Expr], p: sp.Expr) -> List[sp.Expr]:
+    """
+    b = a**p con p constante, por la recurrencia de J. C. P. Miller:
+    b_k = (1/(k a_0)) sum(((p+1) j - k) a_j b_(k-j)).
+    """
+    if p.is_Integer and p >= 0:
+        resultado = [sp.Integer(1)] + [sp.Integer(0)] * (len(a) - 1)
+        base = a
+        n = int(p)
+        while n:
+            if n & 1:
+                resultado = _multiplicar(resultado, base)
+            n >>= 1
+            if n:
+                base = _multiplicar(base, base)
+        return resultado
+    if a[0] == 0:
+        raise SerieNoSoportada("Potencia no entera de una serie que se anula en x0")
+
+    b = [a[0]**p]
+    for k in range(1, len(a)):
+        suma = sp.Add(*[((p + 1) * j - k) * a[j] * b[k - j] for j in range(1, k + 1)])
+        b.append(_normalizar(suma / (k * a[0])))
+    return b
+
+
+def _sin_cos(a: List[sp.Expr], hiperbolico: bool = False):
+    """Calcula a la vez sin(a) y cos(a) (o sinh y cosh), cada uno a partir del otro."""
+    if hiperbolico:
+        s, c, signo = [sp.sinh(a[0])], [sp.cosh(a[0])], 1
+    else:
+        s, c, signo = [sp.sin(a[0])], [sp.cos(a[0])], -1
+    for k in range(1, len(a)):
+        s.append(_normalizar(sp.Add(*[j * a[j] * c[k - j] for j in range(1, k + 1)]) / k))
+        c.append(_normalizar(signo * sp.Add(*[j * a[j] * s[k - j] for j in range(1, k + 1)]) / k))
+    return s, c
+
+
+def _constante(valor: sp.Expr, n: int) -> List[sp.Expr]:
+    return [valor] + [sp.Integer(0)] * (n - 1)
+
+
+def serie_de_expresion(expr: sp.Expr, x: sp.Symbol, x0, orden: int) -> List[sp.Expr]:
+    """
+    Calcula los coeficientes de Taylor c_0..c_orden de una expresión alrededor de x0.
+
+    Args:
+        expr: La expresión de SymPy.
+        x: La variable de la expansión.
+        x0: El punto de expansión.
+        orden: El orden máximo.
+
+    Returns:
+        Lista de coeficientes c_k = f^(k)(x0)/k!.
+
+    Raises:
+        SerieNoSoportada: Si la expresión usa una función sin recurrencia conocida o no es
+            analítica en x0 (polos, ramas de log o raíces).
+    """
+    x0 = sp.sympify(x0)
+    n = orden + 1
+    memo = {}
+
+    def serie(e: sp.Expr) -> List[sp.Expr]:
+        if e in memo:
+            return memo[e]
+
+        if not e.has(x):
+            resultado = _constante(e, n)
+        elif e == x:
+            resultado = _constante(x0, n)
+            if n > 1:
+                resultado[1] = sp.Integer(1)
+        elif e.is_Add:
+            resultado = serie(e.args[0])
+            for arg in e.args[1:]:
+                resultado = _sumar(resultado, serie(arg))
+        elif e.is_Mul:
+            # Los factores con exponente negativo se acumulan en un único divisor
+            numerador, denominador = [], []
+            for arg in e.args:
+                if arg.is_Pow and arg.exp.is_number and arg.exp.is_negative:
+                    denominador.append(sp.Pow(arg.base, -arg.exp))
+                else:
+                    numerador.append(arg)
+            resultado = serie(numerador[0]) if numerador else _constante(sp.Integer(1), n)
+            for arg in numerador[1:]:
+                resultado = _multiplicar(resultado, serie(arg))
+            if denominador:
+                divisor = serie(denominador[0])
+                for arg in denominador[1:]:
+                    divisor = _multiplicar(divisor, serie(arg))
+                resultado = _dividir(resultado, divisor)
+        elif e.is_Pow:
+            base, exponente = e.args
+            if not exponente.has(x):
+                if exponente.is_number and exponente.is_negative:
+                    resultado = _dividir(_constante(sp.Integer(1), n), serie(sp.Pow(base, -exponente)))
+                else:
+                    resultado = _potencia(serie(base), exponente)
+            else:
+                # b**g = exp(g * log(b))
+                resultado = _exp(_multiplicar(serie(exponente), _log(serie(base))))
+        elif isinstance(e, sp.exp):
+            resultado = _exp(serie(e.args[0]))
+        elif isinstance(e, sp.log) and len(e.args) == 1:
+            resultado = _log(serie(e.args[0]))
+        elif isinstance(e, (sp.sin, sp.cos)):
+            s, c = _sin_cos(serie(e.args[0]))
+            resultado = s if isinstance(e, sp.sin) else c
+        elif isinstance(e, (sp.sinh, sp.cosh)):
+            s, c = _sin_cos(serie(e.args[0]), hiperbolico=True)
+            resultado = s if isinstance(e, sp.sinh) else c
+        elif isinstance(e, (sp.tan, sp.tanh)):
+            s, c = _sin_cos(serie(e.args[0]), hiperbolico=isinstance(e, sp.tanh))
+            resultado = _dividir(s, c)
+        elif isinstance(e, (sp.atan, sp.asin, sp.acos, sp.asinh, sp.atanh)):
+            # Se integra la derivada: g' / (1 + g²), g' / sqrt(1 - g²), ...
+            g = serie(e.args[0])
+            g2 = _multiplicar(g, g)
+            uno = _constante(sp.Integer(1), n)
+            if isinstance(e, sp.atan):
+                derivada = _dividir(_derivar(g), _sumar(uno, g2))
+            elif isinstance(e, sp.atanh):
+                derivada = _dividir(_derivar(g), _sumar(uno, [-c for c in g2]))
+            elif isinstance(e, sp.asinh):
+                derivada = _dividir(_derivar(g), _potencia(_sumar(uno, g2), sp.Rational(1, 2)))
+            else:
+                derivada = _dividir(_derivar(g), _potencia(_sumar(uno, [-c for c in g2]), sp.Rational(1, 2)))
+                if isinstance(e, sp.acos):
+                    derivada = [-c for c in derivada]
+            resultado = _integrar(derivada, type(e)(g[0]))
+        else:
+            raise SerieNoSoportada(f"Sin recurrencia para {type(e).__name__}")
+
+        if any(c.has(sp.zoo, sp.nan, sp.oo, -sp.oo) for c in resultado):
+            raise SerieNoSoportada("La expresión no es analítica en x0")
+        memo[e] = resultado
+        return resultado
+
+    return serie(sp.sympify(expr))
@@ -8,177 +8,1703 @@ y sus errores de truncamiento para funciones arbitrarias.
 import sympy as sp
 import numpy as np
 import matplotlib.pyplot as plt
-from sympy.utilities.lambdify import lambdify
-from typing import Callable, Tuple, List, Union, Dict
+from typing import Callable, Tuple, List, Union, Dict, Sequence
 import time
 import os
+import hashlib
+from collections import OrderedDict
+from contextlib import contextmanager
 from concurrent.futures import ProcessPoolExecutor
 import multiprocessing
+from metricas import RegistroMetricas
+from polinomio import PolinomioTaylor
+from series_formales import serie_de_expresion, SerieNoSoportada
+from aproximantes import AproximanteRacional, pade, economizar_chebyshev, comparar_costes
+import nucleos
+from motores import crear_motor
+from plano_complejo import coloracion_dominio, dibujar_disco, evaluar_por_bloques, FILAS_POR_BLOQUE
+from animacion import escribir_animacion, formato_animacion
+import dominio
+from dominio import PuntoNoAnalitico
+from cache_derivadas import CacheDerivadas
+from almacen import AlmacenResultados
+from limites import Limites, LimiteExcedido, MEMORIA_AGOTADA, INTERVALO_SONDEO
+import cauchy
+from por_tramos import AproximantePorTramos, construir_por_tramos
+import parametros as barridos
+from parametros import CoeficientesParametricos
+from serie_perezosa import SeriePerezosa
+import informes
+import diezmado
+
+# Periodo máximo y orden inicial máximo de los ciclos de derivadas f^(k+p) = c * f^(k), k >= s
+PERIODO_MAXIMO_CICLO = 4
+INICIO_MAXIMO_CICLO = 1
+# Orden a partir del cual compensa buscar patrones antes de seguir derivando
+ORDEN_DETECCION_PATRONES = 8
+# Coeficientes del primer bloque de una serie perezosa (los siguientes bloques duplican el orden)
+BLOQUE_SERIE_PEREZOSA = 16
 
 # Función auxiliar para cálculo en paralelo
-def _calcular_termino_paralelo(args):
+def _calcular_coeficiente_paralelo(args):
     """
-    Función auxiliar para calcular un término de Taylor en paralelo.
+    Función auxiliar para calcular un coeficiente de Taylor en paralelo.
     
     Args:
         args: Tupla con (orden, x0, func_str)
         
     Returns:
-        Tupla (orden, término)
+        Tupla (orden, coeficiente)
     """
     orden, x0, func_str = args
     x = sp.Symbol('x')
     func = sp.sympify(func_str)
     
-    if orden == 0:
-        derivada = func
-    else:
-        derivada = sp.diff(func, x, orden)
+    if orden == 0:
+        derivada = func
+    else:
+        derivada = sp.diff(func, x, orden)
+    
+    derivada_en_x0 = derivada.subs(x, x0)
+    
+    return orden, derivada_en_x0 / sp.factorial(orden)
+
+class AproximacionTaylor:
+    """
+    Una clase para calcular aproximaciones de series de Taylor y errores de truncamiento.
+    """
+    
+    def __init__(self, max_funciones: int = 8, motor: str = "numpy", hilos: int = None,
+                 memoria_cache: int = None, cache_compartida: bool = False):
+        """
+        Inicializa la clase AproximacionTaylor.
+        
+        Args:
+            max_funciones: Número de funciones recientes cuyas cachés se conservan.
+            motor: Motor numérico para evaluar sobre mallas ("numpy", "hilos", "numexpr" o "numba").
+            hilos: Número de hilos de los motores paralelos. Si es None, se usa el número de CPUs.
+            memoria_cache: Memoria estimada máxima (en bytes) de las derivadas en caché de todas
+                las funciones recientes. Si es None, no hay límite.
+            cache_compartida: Si las derivadas se guardan compartiendo las subexpresiones repetidas.
+        """
+        if memoria_cache is not None and memoria_cache < 0:
+            raise ValueError("La memoria de la caché no puede ser negativa")
+        self.x = sp.Symbol('x')
+        self.memoria_cache = memoria_cache
+        self.cache_compartida = cache_compartida
+        self.cache = CacheDerivadas(memoria_cache, cache_compartida)  # Caché para almacenar derivadas calculadas
+        self.cache_coeficientes = {}  # Caché de coeficientes f^(k)(x0)/k! indexada por (x0, k)
+        self.evaluadores = {}  # Funciones numéricas compiladas indexadas por (motor, expresión)
+        self.patrones = {}  # Ciclo de derivadas y paridad detectados para la función actual
+        self.metodos_coeficientes = {}  # x0 -> método con el que se obtuvieron los coeficientes
+        self.dominio = {"condiciones": [], "puntos": {}, "rangos": {}}  # Análisis de dominio de la función actual
+        self.metricas = RegistroMetricas()  # Tiempos por etapa y aciertos de caché
+        self.almacen = None  # Almacén SQLite de desarrollos ya calculados (opcional)
+        self.limites = None  # Límites de tiempo y memoria comprobados entre órdenes (opcional)
+        self.funcion_numerica = None  # Función de Python de la función actual, si no es simbólica
+        self.resultados_cauchy = {}  # (x0, radio) -> coeficientes por la integral de Cauchy
+        self.cauchy = False  # Coeficientes numéricos por la integral de Cauchy en lugar de derivar
+        self.radio_cauchy = None  # Radio fijo de la integral de Cauchy (None: elección automática)
+        self.motor = crear_motor(motor, hilos)
+        self.max_funciones = max_funciones
+        self.funciones_recientes = OrderedDict()  # LRU: hash de la función -> cachés de esa función
+        self.func_hash = None
+        
+    @staticmethod
+    def hash_expresion(expr: sp.Expr) -> str:
+        """
+        Calcula un hash estable de una expresión canónica de SymPy.
+        
+        Dos cadenas que SymPy reduce a la misma expresión (por ejemplo "1 + sin(x)" y
+        "sin(x) + 1") producen el mismo hash.
+        
+        Args:
+            expr: La expresión simbólica.
+            
+        Returns:
+            El resumen SHA-1 en hexadecimal de la representación srepr de la expresión.
+        """
+        return hashlib.sha1(sp.srepr(expr).encode("utf-8")).hexdigest()
+    
+    def establecer_funcion(self, func_str: Union[str, Callable], nombre: str = "f") -> None:
+        """
+        Establece la función a aproximar.
+        
+        Si la función es la actual o una de las usadas recientemente, se reutilizan sus
+        derivadas, coeficientes y funciones compiladas en lugar de recalcularlos.
+        
+        La función también puede ser una función de Python (una caja negra o una función que
+        SymPy no maneja bien). Debe aceptar arreglos complejos de NumPy, porque sus coeficientes
+        se obtienen siempre con la integral de Cauchy (ver establecer_cauchy).
+        
+        Args:
+            func_str: Una representación en cadena de la función en términos de x, o una función
+                de Python vectorizada.
+            nombre: Nombre con el que se muestra una función de Python en gráficas e informes.
+        """
+        if callable(func_str):
+            self._establecer_funcion_numerica(func_str, nombre)
+            return
+        
+        if func_str == getattr(self, "func_str", None) and self.funcion_numerica is None:
+            self.metricas.registrar_cache("funciones", True)
+            return
+        
+        try:
+            with self.metricas.medir("parse"):
+                func = sp.sympify(func_str)
+            clave = self.hash_expresion(func)
+        except Exception as e:
+            raise ValueError(f"Expresión de función inválida: {e}")
+        
+        self.func_str = func_str
+        if clave == self.func_hash:
+            self.metricas.registrar_cache("funciones", True)
+            return
+        
+        estado = self.funciones_recientes.get(clave)
+        self.metricas.registrar_cache("funciones", estado is not None)
+        if estado is None:
+            # Función nueva: cachés vacías, registradas en la LRU. Las condiciones de dominio
+            # se anotan ahora para comprobar cada x0 sin derivar
+            with self.metricas.medir("parse"):
+                condiciones = dominio.condiciones_dominio(func, self.x)
+            estado = self._registrar_funcion(clave, func, condiciones)
+        else:
+            self.funciones_recientes.move_to_end(clave)
+        self._activar_funcion(clave, estado)
+    
+    def _establecer_funcion_numerica(self, funcion: Callable, nombre: str) -> None:
+        """Establece una función de Python como función actual (ver establecer_funcion)."""
+        # El estado guarda la función, así que su id no se reutiliza mientras siga en la LRU
+        clave = f"python:{id(funcion)}"
+        self.func_str = nombre
+        if clave == self.func_hash:
+            self.metricas.registrar_cache("funciones", True)
+            return
+        
+        estado = self.funciones_recientes.get(clave)
+        self.metricas.registrar_cache("funciones", estado is not None)
+        if estado is None:
+            # Sin expresión: un símbolo de función indefinida ocupa su lugar en las expresiones
+            estado = self._registrar_funcion(clave, sp.Function(nombre)(self.x), [])
+            estado["funcion_numerica"] = funcion
+        else:
+            self.funciones_recientes.move_to_end(clave)
+        self._activar_funcion(clave, estado)
+    
+    def _registrar_funcion(self, clave: str, func: sp.Expr, condiciones: list) -> Dict:
+        """Crea las cachés vacías de una función nueva y las registra en la LRU."""
+        estado = {"func": func, "cache": CacheDerivadas(self.memoria_cache, self.cache_compartida),
+                  "cache_coeficientes": {}, "evaluadores": {},
+                  "patrones": {}, "metodos_coeficientes": {},
+                  "dominio": {"condiciones": condiciones, "puntos": {}, "rangos": {}},
+                  "funcion_numerica": None, "resultados_cauchy": {}}
+        self.funciones_recientes[clave] = estado
+        while len(self.funciones_recientes) > max(1, self.max_funciones):
+            self.funciones_recientes.popitem(last=False)
+        return estado
+    
+    def _activar_funcion(self, clave: str, estado: Dict) -> None:
+        """Hace de la función registrada con esta clave la función actual."""
+        self.func = estado["func"]
+        self.func_hash = clave
+        self.cache = estado["cache"]
+        self.cache_coeficientes = estado["cache_coeficientes"]
+        self.evaluadores = estado["evaluadores"]
+        self.patrones = estado["patrones"]
+        self.metodos_coeficientes = estado["metodos_coeficientes"]
+        self.dominio = estado["dominio"]
+        self.funcion_numerica = estado["funcion_numerica"]
+        self.resultados_cauchy = estado["resultados_cauchy"]
+        self._ajustar_memoria_cache()
+    
+    @contextmanager
+    def _funcion_activa(self, clave: str, estado: Dict, func_str: str):
+        """Activa temporalmente una función registrada y restaura la función actual al salir."""
+        if clave == self.func_hash:
+            yield
+            return
+        anterior = (self.func_hash, self.funciones_recientes.get(self.func_hash), getattr(self, "func_str", None))
+        self.func_str = func_str
+        self._activar_funcion(clave, estado)
+        try:
+            yield
+        finally:
+            if anterior[1] is not None:
+                self.func_str = anterior[2]
+                self._activar_funcion(anterior[0], anterior[1])
+    
+    def _ajustar_memoria_cache(self) -> None:
+        """
+        Reparte el límite de memoria entre las cachés de derivadas de las funciones recientes.
+        
+        La función actual puede usar todo el límite; el resto se asigna por orden de uso
+        reciente y las cachés de las funciones menos recientes se recortan o se vacían.
+        """
+        if self.memoria_cache is None:
+            return
+        self.cache.limite_bytes = self.memoria_cache
+        disponible = self.memoria_cache - self.cache.bytes_estimados
+        for estado in reversed(self.funciones_recientes.values()):
+            cache = estado["cache"]
+            if cache is self.cache:
+                continue
+            desalojos = cache.desalojos
+            cache.establecer_limite(max(0, disponible))
+            self.metricas.incrementar("desalojos_derivadas", cache.desalojos - desalojos)
+            disponible -= cache.bytes_estimados
+    
+    def verificar_punto(self, x0: float) -> sp.Expr:
+        """
+        Comprueba, sin derivar, que la función es analítica en x0.
+        
+        Detecta polos, puntos de ramificación, puntos fuera del dominio real y puntos de ruptura
+        de piezas no analíticas (Abs, sign, floor, Piecewise, ...). El veredicto se guarda por x0.
+        
+        Args:
+            x0: El punto de expansión.
+            
+        Returns:
+            La forma local de la función en x0: la propia función o, si tiene piezas no
+            analíticas, la expresión analítica que coincide con ella en un entorno de x0.
+            
+        Raises:
+            PuntoNoAnalitico: Si no existe serie de Taylor (real) en x0.
+        """
+        puntos = self.dominio["puntos"]
+        if x0 not in puntos:
+            self.metricas.incrementar("verificaciones_dominio")
+            try:
+                if self.funcion_numerica is not None:
+                    puntos[x0] = self._verificar_punto_numerico(x0)
+                else:
+                    puntos[x0] = dominio.verificar_punto(self.func, self.x, x0, self.dominio["condiciones"])
+            except PuntoNoAnalitico as e:
+                puntos[x0] = e
+        
+        resultado = puntos[x0]
+        if isinstance(resultado, PuntoNoAnalitico):
+            raise resultado
+        return resultado
+    
+    def _verificar_punto_numerico(self, x0: float) -> sp.Expr:
+        """Sin expresión solo se puede comprobar que la función de Python es finita en x0."""
+        with np.errstate(all='ignore'):
+            try:
+                valor = complex(np.asarray(self.funcion_numerica(np.array([complex(x0)]))).ravel()[0])
+            except (TypeError, ValueError, ZeroDivisionError, OverflowError) as e:
+                raise PuntoNoAnalitico(f"No se pudo evaluar f en x0 = {x0}: {e}")
+        if not np.isfinite(valor):
+            raise PuntoNoAnalitico(f"f no es finita en x0 = {x0}")
+        return self.func
+    
+    def singularidades_en_rango(self, rango_x: Tuple[float, float]) -> List[float]:
+        """
+        Devuelve los puntos reales del rango donde la función es singular o no analítica.
+        
+        Args:
+            rango_x: Tupla (min_x, max_x).
+            
+        Returns:
+            Lista ordenada de abscisas (solo las que SymPy resuelve como conjunto finito; vacía
+            para una función de Python).
+        """
+        if self.funcion_numerica is not None:
+            return []
+        clave = (float(rango_x[0]), float(rango_x[1]))
+        if clave not in self.dominio["rangos"]:
+            self.dominio["rangos"][clave] = dominio.singularidades_en_rango(
+                self.func, self.x, clave, self.dominio["condiciones"])
+        return self.dominio["rangos"][clave]
+    
+    def _enmascarar_singularidades(self, x_vals: np.ndarray, valores: np.ndarray, 
+                                   rango_x: Tuple[float, float]) -> np.ndarray:
+        """Pone a NaN las muestras vecinas a las singularidades para no unir ramas con líneas verticales."""
+        singulares = self.singularidades_en_rango(rango_x)
+        if not singulares or len(x_vals) < 2:
+            return valores
+        paso = abs(x_vals[1] - x_vals[0])
+        valores = np.array(valores, dtype=np.result_type(valores, np.float64))
+        for s in singulares:
+            valores[np.abs(x_vals - s) < 1.5 * paso] = np.nan
+        return valores
+    
+    def derivar_funcion(self, orden: int) -> sp.Expr:
+        """
+        Calcula la derivada n-ésima de la función.
+        
+        Args:
+            orden: El orden de la derivada.
+            
+        Returns:
+            La expresión simbólica para la derivada n-ésima.
+        """
+        if orden in self.cache:
+            self.metricas.registrar_cache("derivadas", True)
+            return self.cache[orden]
+        
+        self.metricas.registrar_cache("derivadas", False)
+        self._comprobar_limites()
+        ciclo = self.detectar_patrones()["ciclo"] if orden >= ORDEN_DETECCION_PATRONES else None
+        if orden == 0:
+            result = self.func
+        elif ciclo is not None:
+            # f^(q*p + r) = c^q * f^(r): no hace falta derivar
+            q, r = divmod(orden - ciclo["inicio"], ciclo["periodo"])
+            result = ciclo["factor"]**q * self.derivar_funcion(ciclo["inicio"] + r)
+            self.metricas.incrementar("derivadas_ciclo")
+        elif orden - 1 in self.cache:
+            # Derivar incrementalmente a partir de la derivada anterior en caché
+            with self.metricas.medir("differentiate"):
+                result = sp.diff(self.cache[orden - 1], self.x)
+        else:
+            with self.metricas.medir("differentiate"):
+                result = sp.diff(self.func, self.x, orden)
+        
+        # Almacenar el resultado en caché; si se supera el límite de memoria se desalojan
+        # las derivadas usadas hace más tiempo
+        desalojos = self.cache.desalojos
+        self.cache[orden] = result
+        if self.cache.desalojos > desalojos:
+            self.metricas.incrementar("desalojos_derivadas", self.cache.desalojos - desalojos)
+        self._ajustar_memoria_cache()
+        return result
+    
+    def detectar_patrones(self) -> Dict:
+        """
+        Busca patrones que permiten obtener derivadas y coeficientes sin derivar de nuevo.
+        
+        Se detectan dos patrones:
+        
+        - Ciclo de derivadas: f^(k+p) = c * f^(k) para k >= s, con c constante,
+          p <= PERIODO_MAXIMO_CICLO y s <= INICIO_MAXIMO_CICLO (sin y cos con p=2 y c=-1,
+          exp(a*x) con p=1 y c=a, exp(x)*sin(x) con p=4 y c=-4, cos(x)**2 desde s=1, ...).
+          Entonces f^(s + q*p + r) = c^q * f^(s + r) para todo orden.
+        - Paridad: si f es par, sus coeficientes impares en x0=0 son nulos; si es impar, los pares.
+        
+        El resultado se calcula una vez por función y queda en caché.
+        
+        Returns:
+            Diccionario con "ciclo" ({"periodo": p, "factor": c, "inicio": s} o None) y "paridad"
+            ("par", "impar" o None).
+        """
+        if "ciclo" in self.patrones:
+            return self.patrones
+        
+        ciclo = None
+        # Los polinomios terminan en derivadas nulas, que no forman un ciclo útil
+        if not self.func.is_polynomial(self.x):
+            derivadas = [self.derivar_funcion(k) 
+                         for k in range(INICIO_MAXIMO_CICLO + PERIODO_MAXIMO_CICLO + 3)]
+            for inicio, periodo in ((s, p) for s in range(INICIO_MAXIMO_CICLO + 1) 
+                                    for p in range(1, PERIODO_MAXIMO_CICLO + 1)):
+                factor = self._cociente_constante(derivadas[inicio + periodo], derivadas[inicio])
+                if factor is None:
+                    continue
+                # Confirmar la relación en los dos órdenes siguientes
+                if all(self._es_cero(derivadas[k + periodo] - factor * derivadas[k]) 
+                       for k in (inicio + 1, inicio + 2)):
+                    ciclo = {"periodo": periodo, "factor": factor, "inicio": inicio}
+                    break
+        
+        paridad = None
+        reflejada = self.func.subs(self.x, -self.x)
+        if self._es_cero(reflejada - self.func):
+            paridad = "par"
+        elif self._es_cero(reflejada + self.func):
+            paridad = "impar"
+        
+        self.patrones.update({"ciclo": ciclo, "paridad": paridad})
+        return self.patrones
+    
+    def _cociente_constante(self, numerador: sp.Expr, denominador: sp.Expr):
+        """Devuelve numerador/denominador si es una constante no nula independiente de x, o None."""
+        if denominador == 0 or numerador == 0:
+            return None
+        cociente = numerador / denominador
+        if self.x in cociente.free_symbols:
+            # Solo se intenta simplificar expresiones pequeñas para acotar el coste de la detección
+            if sp.count_ops(cociente) > 60:
+                return None
+            cociente = sp.simplify(cociente)
+        if self.x in cociente.free_symbols or cociente.has(sp.zoo, sp.nan, sp.oo, -sp.oo):
+            return None
+        return cociente
+    
+    @staticmethod
+    def _es_cero(expr: sp.Expr) -> bool:
+        """Comprueba si una expresión es idénticamente cero (expand y, si es pequeña, simplify)."""
+        if expr == 0 or sp.expand(expr) == 0:
+            return True
+        return sp.count_ops(expr) <= 60 and sp.simplify(expr) == 0
+    
+    def establecer_motor(self, motor: str, hilos: int = None) -> None:
+        """
+        Cambia el motor numérico usado para evaluar f(x) y los polinomios sobre mallas.
+        
+        Args:
+            motor: "numpy" (un hilo), "hilos" (NumPy por bloques en un grupo de hilos),
+                "numexpr" o "numba" (requieren el paquete correspondiente).
+            hilos: Número de hilos de los motores paralelos. Si es None, se usa el número de CPUs.
+        """
+        self.motor = crear_motor(motor, hilos)
+    
+    def establecer_almacen(self, almacen: Union[AlmacenResultados, str, None]) -> None:
+        """
+        Conecta un almacén de resultados: los coeficientes guardados se recuperan en lugar de
+        recalcularse y los nuevos desarrollos se guardan en él.
+        
+        Args:
+            almacen: Un AlmacenResultados, la ruta de su archivo SQLite o None para desconectarlo.
+        """
+        self.almacen = AlmacenResultados(almacen) if isinstance(almacen, str) else almacen
+    
+    def establecer_limites(self, limites: Limites = None) -> None:
+        """
+        Activa límites de tiempo y memoria comprobados entre órdenes de derivación.
+        
+        Al superarlos, obtener_polinomio y calcular_polinomio_paralelo lanzan LimiteExcedido
+        con el polinomio de los coeficientes calculados hasta entonces en su atributo parcial.
+        
+        Args:
+            limites: Los límites, o None para desactivarlos. Si su plazo no se había iniciado,
+                empieza a contar ahora; si ya se había iniciado, se conserva el tiempo restante.
+        """
+        if limites is not None and limites.activos and limites.plazo is None:
+            limites.iniciar()
+        self.limites = limites if limites is not None and limites.activos else None
+    
+    def establecer_cauchy(self, activo: bool = True, radio: float = None) -> None:
+        """
+        Obtiene los coeficientes numéricamente con la integral de Cauchy en lugar de derivar.
+        
+        Los coeficientes 0..n salen de FFTs de muestras de f en circunferencias complejas
+        alrededor de x0 (ver el módulo cauchy), en milisegundos incluso para n = 200, con
+        precisión de punto flotante y un error estimado por coeficiente. Las funciones de
+        Python siempre usan este método.
+        
+        Args:
+            activo: Si se usa la integral de Cauchy con las funciones simbólicas.
+            radio: Radio fijo de la circunferencia. Si es None, se elige por coeficiente.
+        """
+        if radio is not None and radio <= 0:
+            raise ValueError("El radio de la integral de Cauchy debe ser positivo")
+        self.cauchy = activo
+        self.radio_cauchy = radio
+    
+    def _usar_cauchy(self) -> bool:
+        """Indica si los coeficientes de la función actual se obtienen con la integral de Cauchy."""
+        return self.cauchy or self.funcion_numerica is not None
+    
+    def coeficientes_cauchy(self, x0: float, orden: int) -> Dict:
+        """
+        Calcula (o recupera de la caché) los coeficientes 0..orden en x0 con la integral de Cauchy.
+        
+        Args:
+            x0: El punto alrededor del cual expandir.
+            orden: El orden máximo de los coeficientes.
+            
+        Returns:
+            El diccionario de cauchy.coeficientes_cauchy (coeficientes, errores estimados,
+            radios, error relativo, cota del resto y evaluaciones), con orden mayor o igual.
+        """
+        clave = (x0, self.radio_cauchy)
+        resultado = self.resultados_cauchy.get(clave)
+        self.metricas.registrar_cache("cauchy", resultado is not None and len(resultado["coeficientes"]) > orden)
+        if resultado is None or len(resultado["coeficientes"]) <= orden:
+            local = self.verificar_punto(x0)
+            funcion = self.funcion_numerica or self._lambdificar_complejo(local)
+            with self.metricas.medir("evaluate"):
+                resultado = cauchy.coeficientes_cauchy(funcion, float(x0), orden, self.radio_cauchy)
+            self.metricas.incrementar("polinomios_cauchy")
+            self.metricas.incrementar("evaluaciones_cauchy", resultado["evaluaciones"])
+            self.resultados_cauchy[clave] = resultado
+        return resultado
+    
+    def _limite_cauchy(self, x0: float, orden: int, x_vals: np.ndarray) -> np.ndarray:
+        """
+        Cota del error de P_n con coeficientes de Cauchy: cota de Cauchy del resto más el
+        error estimado de los coeficientes, sum(e_k |x - x0|^k).
+        """
+        resultado = self.coeficientes_cauchy(x0, orden)
+        distancias = np.abs(np.asarray(x_vals, dtype=float) - float(x0))
+        errores = PolinomioTaylor(resultado["errores"][:orden + 1], 0.0)
+        with np.errstate(all='ignore'):
+            return cauchy.cota_resto(resultado["cota"], orden, distancias) + errores.evaluar(distancias)
+    
+    def _polinomio_parcial(self, x0: float) -> PolinomioTaylor:
+        """Polinomio con los coeficientes consecutivos ya calculados en x0, o None si no hay ninguno."""
+        orden = self._orden_en_cache(x0)
+        if orden < 0:
+            return None
+        return PolinomioTaylor([self.cache_coeficientes[(x0, k)] for k in range(orden + 1)], x0)
+    
+    def _comprobar_limites(self, x0: float = None) -> None:
+        """Comprobación cooperativa de los límites activos (ver establecer_limites)."""
+        if self.limites is not None:
+            self.limites.comprobar(None if x0 is None else lambda: self._polinomio_parcial(x0))
+    
+    def _cargar_de_almacen(self, x0: float, orden: int) -> bool:
+        """
+        Recupera del almacén los coeficientes 0..orden en x0 y los guarda en la caché de coeficientes.
+        
+        Returns:
+            True si el almacén tenía un desarrollo de orden suficiente.
+        """
+        with self.metricas.medir("store"):
+            encontrado = self.almacen.buscar_coeficientes(self.func_hash, x0, orden)
+        self.metricas.registrar_cache("almacen", encontrado is not None)
+        if encontrado is None:
+            return False
+        
+        coeficientes, metodo = encontrado
+        self.cargar_coeficientes(x0, coeficientes, f"{metodo} (almacén)" if metodo else "almacén")
+        return True
+    
+    def cargar_coeficientes(self, x0: float, coeficientes: List[sp.Expr], metodo: str) -> None:
+        """
+        Guarda en la caché coeficientes calculados fuera de esta instancia (almacén, proceso hijo).
+        
+        Args:
+            x0: El punto de expansión.
+            coeficientes: Coeficientes exactos c_0, c_1, ... en x0.
+            metodo: Método con el que se obtuvieron (ver metodo_coeficientes).
+        """
+        for k, coeficiente in enumerate(coeficientes):
+            self.cache_coeficientes[(x0, k)] = coeficiente
+        self.metodos_coeficientes[x0] = metodo
+    
+    def registrar_resultados(self, x0: float, orden: int, rango_x: Tuple[float, float] = None,
+                             puntos: List[float] = None, artefactos: Dict[str, str] = None,
+                             muestras: int = 1000) -> int:
+        """
+        Guarda en el almacén el error máximo en un rango, las evaluaciones en puntos concretos y
+        los archivos generados para el desarrollo de orden dado en x0.
+        
+        Args:
+            x0: El punto alrededor del cual expandir.
+            orden: El orden de la aproximación.
+            rango_x: Intervalo (min, max) donde medir el error máximo |f - P|.
+            puntos: Puntos donde evaluar f, P y el error.
+            artefactos: Diccionario tipo -> ruta de los archivos generados.
+            muestras: Puntos de la malla con la que se mide el error en rango_x.
+            
+        Returns:
+            El identificador del desarrollo en el almacén.
+        """
+        if self.almacen is None:
+            raise ValueError("No hay un almacén de resultados conectado")
+        if self._usar_cauchy():
+            raise ValueError("El almacén guarda coeficientes exactos; no admite los de la integral de Cauchy")
+        
+        polinomio = self.obtener_polinomio(x0, orden)
+        expansion_id = self.almacen.identificador(self.func_hash, x0, orden, self.motor.nombre)
+        if expansion_id is None:
+            metodo = (self.metodo_coeficientes(x0) or "").replace(" (almacén)", "") or None
+            expansion_id = self.almacen.guardar_expansion(self.func_hash, self.func_str, polinomio,
+                                                          self.motor.nombre, metodo)
+        
+        # Los errores que no se pueden evaluar numéricamente simplemente no se registran
+        func_num = self._lambdificar(self.func)
+        if rango_x is not None:
+            x_vals = np.linspace(rango_x[0], rango_x[1], muestras)
+            try:
+                with self.metricas.medir("evaluate"), np.errstate(all='ignore'):
+                    errores = np.abs(np.broadcast_to(func_num(x_vals), x_vals.shape) - polinomio.evaluar(x_vals))
+                errores = self._enmascarar_singularidades(x_vals, errores, rango_x)
+                error_maximo = np.nanmax(errores) if np.any(np.isfinite(errores)) else np.nan
+                self.almacen.guardar_error(expansion_id, rango_x, muestras, error_maximo)
+            except (TypeError, ValueError):
+                pass
+        
+        filas = []
+        for punto in puntos or []:
+            try:
+                with self.metricas.medir("evaluate"), np.errstate(all='ignore'):
+                    exacto = complex(func_num(punto)).real
+                    aproximacion = complex(polinomio.evaluar(punto)).real
+                filas.append((punto, exacto, aproximacion, abs(exacto - aproximacion)))
+            except (TypeError, ValueError, ZeroDivisionError, OverflowError):
+                pass
+        if filas:
+            self.almacen.guardar_evaluaciones(expansion_id, filas)
+        
+        for tipo, ruta in (artefactos or {}).items():
+            self.almacen.guardar_artefacto(expansion_id, tipo, ruta)
+        return expansion_id
+    
+    def _lambdificar(self, expr: sp.Expr) -> Callable:
+        """Convierte una expresión en una función numérica con el motor actual, reutilizando las ya compiladas."""
+        if self.funcion_numerica is not None and expr == self.func:
+            return self.funcion_numerica
+        clave = (self.motor.nombre, expr)
+        if clave in self.evaluadores:
+            self.metricas.registrar_cache("evaluadores", True)
+            return self.evaluadores[clave]
+        
+        self.metricas.registrar_cache("evaluadores", False)
+        with self.metricas.medir("lambdify"):
+            func_num = self.motor.compilar(expr, self.x)
+        self.evaluadores[clave] = func_num
+        return func_num
+    
+    def _evaluar(self, func_num: Callable, valores):
+        """Evalúa una función numérica, midiendo el tiempo."""
+        with self.metricas.medir("evaluate"):
+            return func_num(valores)
+    
+    def obtener_metricas(self) -> Dict:
+        """
+        Devuelve las métricas de rendimiento acumuladas.
+        
+        Returns:
+            Diccionario con tiempos y llamadas por etapa, contadores, tasas de acierto
+            de caché y memoria pico (si se capturó con tracemalloc).
+        """
+        metricas = self.metricas.como_diccionario()
+        metricas["cache"].setdefault("derivadas", {"aciertos": 0, "fallos": 0, "tasa_aciertos": None})
+        metricas["cache"]["derivadas"]["entradas"] = len(self.cache)
+        metricas["cache"]["derivadas"]["nodos"] = self.cache.nodos
+        metricas["cache"]["derivadas"]["bytes_estimados"] = self.cache.bytes_estimados
+        metricas["cache"]["derivadas"]["bytes_totales"] = self.memoria_cache_derivadas()
+        metricas["cache"]["derivadas"]["limite_bytes"] = self.memoria_cache
+        if "coeficientes" in metricas["cache"]:
+            metricas["cache"]["coeficientes"]["entradas"] = len(self.cache_coeficientes)
+        return metricas
+    
+    def memoria_cache_derivadas(self) -> int:
+        """Memoria estimada (en bytes) de las derivadas en caché de todas las funciones recientes."""
+        caches = [estado["cache"] for estado in self.funciones_recientes.values()]
+        if all(cache is not self.cache for cache in caches):
+            caches.append(self.cache)
+        return sum(cache.bytes_estimados for cache in caches)
+    
+    def reiniciar_metricas(self) -> None:
+        """Pone a cero las métricas de rendimiento acumuladas."""
+        self.metricas.reiniciar()
+    
+    def coeficiente_taylor(self, orden: int, x0: float) -> sp.Expr:
+        """
+        Calcula el coeficiente f^(n)(x0)/n! de la serie de Taylor.
+        
+        Args:
+            orden: El orden del coeficiente.
+            x0: El punto alrededor del cual expandir.
+            
+        Returns:
+            El valor del coeficiente como número de SymPy (de punto flotante con la integral de Cauchy).
+        """
+        if self._usar_cauchy():
+            return sp.sympify(self.coeficientes_cauchy(x0, orden)["coeficientes"][orden])
+        
+        clave = (x0, orden)
+        if clave in self.cache_coeficientes:
+            self.metricas.registrar_cache("coeficientes", True)
+            return self.cache_coeficientes[clave]
+        
+        self.metricas.registrar_cache("coeficientes", False)
+        local = self.verificar_punto(x0)
+        if local is not self.func:
+            self._coeficientes_locales(x0, orden, local)
+            return self.cache_coeficientes[clave]
+        
+        patrones = self.detectar_patrones() if orden >= ORDEN_DETECCION_PATRONES else self.patrones
+        paridad = patrones.get("paridad")
+        ciclo = patrones.get("ciclo")
+        
+        if x0 == 0 and (paridad == "par" and orden % 2 == 1 or paridad == "impar" and orden % 2 == 0):
+            # Coeficiente nulo por paridad
+            coeficiente = sp.Integer(0)
+            self.metricas.incrementar("coeficientes_paridad")
+        elif ciclo is not None and orden >= ciclo["inicio"] + ciclo["periodo"]:
+            # f^(n)(x0) = c^q * f^(m)(x0) con n = s + q*p + r y m = s + r, a partir de un coeficiente ya calculado
+            q, r = divmod(orden - ciclo["inicio"], ciclo["periodo"])
+            m = ciclo["inicio"] + r
+            coeficiente = (ciclo["factor"]**q * self.coeficiente_taylor(m, x0) 
+                           * sp.factorial(m) / sp.factorial(orden))
+            self.metricas.incrementar("coeficientes_ciclo")
+        else:
+            derivada = self.derivar_funcion(orden)
+            with self.metricas.medir("substitute"):
+                derivada_en_x0 = derivada.subs(self.x, x0)
+            coeficiente = derivada_en_x0 / sp.factorial(orden)
+        
+        self.cache_coeficientes[clave] = coeficiente
+        return coeficiente
+    
+    def analizar_termino_taylor(self, orden: int, x0: float) -> sp.Expr:
+        """
+        Calcula un solo término de la serie de Taylor.
+        
+        Args:
+            orden: El orden del término.
+            x0: El punto alrededor del cual expandir.
+            
+        Returns:
+            La expresión simbólica para el término.
+        """
+        coeficiente = self.coeficiente_taylor(orden, x0)
+        
+        if orden == 0:
+            return coeficiente
+        
+        return coeficiente * (self.x - x0)**orden
+    
+    def obtener_polinomio(self, x0: float, orden: int) -> PolinomioTaylor:
+        """
+        Calcula el polinomio de Taylor como arreglo de coeficientes.
+        
+        Args:
+            x0: El punto alrededor del cual expandir.
+            orden: El orden máximo de la aproximación.
+            
+        Returns:
+            El polinomio de Taylor con coeficientes exactos alrededor de x0 (float64 o
+            complex128 con la integral de Cauchy).
+        """
+        if orden > 200:
+            raise ValueError("El orden máximo es 200")
+        
+        # La integral de Cauchy no deriva ni usa el almacén, que guarda coeficientes exactos
+        if self._usar_cauchy():
+            self._comprobar_limites()
+            return PolinomioTaylor(self.coeficientes_cauchy(x0, orden)["coeficientes"][:orden + 1], x0)
+        
+        # Comprobación previa: falla antes de derivar si x0 es singular
+        local = self.verificar_punto(x0)
+        calcular = self._orden_en_cache(x0) < orden
+        if calcular and self.almacen is not None and self._cargar_de_almacen(x0, orden):
+            calcular = False
+        
+        inicio = time.perf_counter()
+        try:
+            if calcular:
+                if local is not self.func:
+                    self._coeficientes_locales(x0, orden, local)
+                else:
+                    self._coeficientes_por_recurrencia(x0, orden)
+            
+            coeficientes = []
+            for i in range(orden + 1):
+                self._comprobar_limites(x0)
+                coeficientes.append(self.coeficiente_taylor(i, x0))
+        except LimiteExcedido as e:
+            # Las comprobaciones entre derivadas no conocen x0: se adjuntan aquí los coeficientes
+            if e.parcial is None:
+                e.parcial = self._polinomio_parcial(x0)
+            raise
+        except MemoryError:
+            if self.limites is None:
+                raise
+            raise LimiteExcedido(MEMORIA_AGOTADA, "Memoria agotada al calcular los coeficientes",
+                                 self._polinomio_parcial(x0))
+        self.metodos_coeficientes.setdefault(x0, "derivadas")
+        polinomio = PolinomioTaylor(coeficientes, x0)
+        if calcular and self.almacen is not None:
+            duracion = time.perf_counter() - inicio
+            with self.metricas.medir("store"):
+                self.almacen.guardar_expansion(self.func_hash, self.func_str, polinomio, self.motor.nombre,
+                                               self.metodo_coeficientes(x0), duracion)
+        return polinomio
+    
+    def _coeficientes_por_recurrencia(self, x0: float, orden: int) -> bool:
+        """
+        Intenta obtener los coeficientes 0..orden con series formales (recurrencias y convoluciones)
+        y los guarda en la caché de coeficientes.
+        
+        Returns:
+            True si la expresión se pudo descomponer en operaciones con recurrencia conocida.
+        """
+        try:
+            with self.metricas.medir("differentiate"):
+                coeficientes = serie_de_expresion(self.func, self.x, x0, orden)
+        except SerieNoSoportada:
+            self.metricas.incrementar("recurrencias_no_soportadas")
+            return False
+        
+        for k, coeficiente in enumerate(coeficientes):
+            self.cache_coeficientes.setdefault((x0, k), coeficiente)
+        self.metodos_coeficientes[x0] = "recurrencias"
+        self.metricas.incrementar("polinomios_por_recurrencia")
+        return True
+    
+    def _coeficientes_locales(self, x0: float, orden: int, local: sp.Expr) -> None:
+        """
+        Calcula los coeficientes 0..orden en x0 a partir de la forma local de la función
+        (con las piezas no analíticas ya resueltas) y los guarda en la caché de coeficientes.
+        
+        Las derivadas de la forma local no se guardan en la caché de derivadas, que es
+        común a todos los puntos de expansión.
+        """
+        self.metricas.incrementar("polinomios_locales")
+        try:
+            with self.metricas.medir("differentiate"):
+                coeficientes = serie_de_expresion(local, self.x, x0, orden)
+            self.metodos_coeficientes[x0] = "recurrencias"
+        except SerieNoSoportada:
+            coeficientes = []
+            derivada = local
+            for k in range(orden + 1):
+                if k > 0:
+                    self._comprobar_limites()
+                    with self.metricas.medir("differentiate"):
+                        derivada = sp.diff(derivada, self.x)
+                with self.metricas.medir("substitute"):
+                    coeficientes.append(derivada.subs(self.x, x0) / sp.factorial(k))
+            self.metodos_coeficientes[x0] = "derivadas"
+        
+        for k, coeficiente in enumerate(coeficientes):
+            self.cache_coeficientes[(x0, k)] = coeficiente
+    
+    def metodo_coeficientes(self, x0: float) -> str:
+        """
+        Indica cómo se obtuvieron los coeficientes en x0.
+        
+        Returns:
+            "recurrencias" (series formales), "derivadas" (derivación simbólica, con los atajos
+            de detectar_patrones), "paralelo", "desplazamiento", "cauchy" (integral de Cauchy), el
+            método original seguido de "(almacén)" si se recuperaron del almacén, o None si aún
+            no se han calculado.
+        """
+        if self._usar_cauchy():
+            return "cauchy" if (x0, self.radio_cauchy) in self.resultados_cauchy else None
+        return self.metodos_coeficientes.get(x0)
+    
+    def serie_perezosa(self, x0: float) -> SeriePerezosa:
+        """
+        Devuelve la serie de Taylor en x0 como serie perezosa, sin fijar el orden.
+        
+        Los coeficientes se piden bajo demanda a las cachés de la función: con recurrencias,
+        en bloques que duplican el orden; si no, derivando uno a uno a partir de la derivada
+        anterior en caché; con la integral de Cauchy, en bloques de una FFT. La serie sigue
+        ligada a esta función aunque después se establezca otra.
+        
+        Args:
+            x0: El punto alrededor del cual expandir.
+            
+        Returns:
+            La serie (ver serie_perezosa.SeriePerezosa).
+        """
+        self.verificar_punto(x0)
+        clave, estado, func_str = self.func_hash, self.funciones_recientes[self.func_hash], self.func_str
+        recurrencia = [self.funcion_numerica is None]
+        
+        def fuente(k: int):
+            self.metricas.incrementar("coeficientes_perezosos")
+            with self._funcion_activa(clave, estado, func_str):
+                bloque = max(2 * k, BLOQUE_SERIE_PEREZOSA)
+                if self._usar_cauchy():
+                    return self.coeficientes_cauchy(x0, bloque)["coeficientes"][k]
+                if (x0, k) not in self.cache_coeficientes and recurrencia[0]:
+                    local = self.verificar_punto(x0)
+                    if local is not self.func:
+                        self._coeficientes_locales(x0, bloque, local)
+                    else:
+                        recurrencia[0] = self._coeficientes_por_recurrencia(x0, bloque)
+                return self.coeficiente_taylor(k, x0)
+        return SeriePerezosa(fuente, x0)
+    
+    def visualizar_serie_taylor(self, x0: float, orden: int) -> sp.Expr:
+        """
+        Calcula la aproximación de la serie de Taylor hasta el orden especificado.
+        
+        Args:
+            x0: El punto alrededor del cual expandir.
+            orden: El orden máximo de la aproximación.
+            
+        Returns:
+            La expresión simbólica para la serie de Taylor.
+        """
+        return self.obtener_polinomio(x0, orden).a_expresion(self.x)
+    
+    def forma_simplificada(self, x0: float, orden: int) -> sp.Expr:
+        """
+        Devuelve el polinomio de Taylor expandido en potencias de x.
+        
+        Para un polinomio, la forma expandida es la simplificación canónica, y se obtiene
+        con un desplazamiento de los coeficientes en lugar de llamar a sp.simplify.
+        
+        Args:
+            x0: El punto alrededor del cual expandir.
+            orden: El orden máximo de la aproximación.
+            
+        Returns:
+            La expresión simbólica expandida.
+        """
+        polinomio = self.obtener_polinomio(x0, orden)
+        with self.metricas.medir("simplify"):
+            return polinomio.a_expresion(self.x, expandir=True)
+    
+    def _orden_en_cache(self, x0: float) -> int:
+        """Devuelve el mayor orden n tal que los coeficientes 0..n en x0 están en caché (-1 si ninguno)."""
+        orden = -1
+        while (x0, orden + 1) in self.cache_coeficientes:
+            orden += 1
+        return orden
+    
+    def recentrar_polinomio(self, x1: float, orden: int, x0: float = None, 
+                            tolerancia: float = 1e-6, terminos_verificacion: int = 3
+                            ) -> Tuple[PolinomioTaylor, Dict]:
+        """
+        Obtiene el polinomio de Taylor en x1 desplazando coeficientes ya calculados en otro centro.
+        
+        El desplazamiento de Taylor cuesta O(n²) operaciones aritméticas y no requiere
+        derivar de nuevo. Si la función es un polinomio de grado menor o igual al orden
+        en caché, el resultado es exacto; en otro caso es una aproximación cuyo error se
+        estima con la cola omitida (a partir de los últimos coeficientes del origen) y
+        comparando los primeros coeficientes con sus valores verdaderos en x1. Si el
+        error estimado supera la tolerancia, se recurre al cálculo completo.
+        
+        Args:
+            x1: El nuevo punto de expansión.
+            orden: El orden del polinomio deseado.
+            x0: Centro de origen. Si es None, se usa el centro en caché más cercano a x1.
+            tolerancia: Error máximo admitido antes de recurrir al cálculo completo.
+            terminos_verificacion: Número de coeficientes a comparar para estimar el error.
+            
+        Returns:
+            Tupla (polinomio, info) donde info contiene "metodo" ("desplazamiento",
+            "exacto" o "completo"), "origen" y "error_estimado".
+        """
+        if orden > 200:
+            raise ValueError("El orden máximo es 200")
+        
+        # Con piezas no analíticas otro centro puede estar en una rama distinta: no se desplaza.
+        # Con la integral de Cauchy calcular en x1 cuesta menos que desplazar
+        if self._usar_cauchy() or self.verificar_punto(x1) is not self.func:
+            polinomio = self.obtener_polinomio(x1, orden)
+            return polinomio, {"metodo": "completo", "origen": None, "error_estimado": 0.0}
+        
+        # Elegir el centro de origen con suficientes coeficientes en caché
+        if x0 is None:
+            candidatos = {centro for centro, _ in self.cache_coeficientes 
+                          if self._orden_en_cache(centro) >= orden}
+            if candidatos:
+                x0 = min(candidatos, key=lambda centro: abs(float(centro) - float(x1)))
+        
+        orden_origen = self._orden_en_cache(x0) if x0 is not None else -1
+        if orden_origen < orden:
+            polinomio = self.obtener_polinomio(x1, orden)
+            return polinomio, {"metodo": "completo", "origen": None, "error_estimado": 0.0}
+        
+        origen = self.obtener_polinomio(x0, orden_origen)
+        self.metricas.incrementar("recentrados")
+        
+        # Un polinomio de grado <= orden_origen se desplaza sin error y con coeficientes exactos
+        if self.func.is_polynomial(self.x) and sp.degree(self.func, self.x) <= orden_origen:
+            polinomio = origen.desplazar(x1).truncar(orden)
+            for k, coeficiente in enumerate(polinomio.coeficientes):
+                self.cache_coeficientes[(x1, k)] = coeficiente
+            self.metodos_coeficientes[x1] = "desplazamiento"
+            return polinomio, {"metodo": "exacto", "origen": x0, "error_estimado": 0.0}
+        
+        with self.metricas.medir("evaluate"):
+            flotante = origen.a_flotantes()
+            polinomio = flotante.desplazar(float(x1)).truncar(orden)
+        
+        # Cota de la cola omitida: el término a_(N+1) (x - x0)^(N+1) aporta
+        # C(N+1, j) h^(N+1-j) a_(N+1) al coeficiente j tras el desplazamiento
+        h = abs(float(x1) - float(x0))
+        a_siguiente = np.max(np.abs(flotante.coeficientes[-2:]))
+        error_estimado = 0.0
+        for j in range(orden + 1):
+            cola = a_siguiente * float(sp.binomial(orden_origen + 1, j)) * h**(orden_origen + 1 - j)
+            error_estimado = max(error_estimado, float(cola / max(1.0, abs(polinomio.coeficientes[j]))))
+        
+        # Comparar los primeros coeficientes con f^(j)(x1)/j!
+        for j in range(min(terminos_verificacion, orden + 1)):
+            with self.metricas.medir("substitute"):
+                verdadero = complex(self.derivar_funcion(j).evalf(subs={self.x: x1}) / sp.factorial(j))
+            diferencia = abs(verdadero - polinomio.coeficientes[j]) / max(1.0, abs(verdadero))
+            if not np.isfinite(diferencia):
+                error_estimado = np.inf
+                break
+            error_estimado = max(error_estimado, diferencia)
+        
+        if error_estimado > tolerancia:
+            polinomio = self.obtener_polinomio(x1, orden)
+            return polinomio, {"metodo": "completo", "origen": x0, "error_estimado": error_estimado}
+        
+        return polinomio, {"metodo": "desplazamiento", "origen": x0, "error_estimado": error_estimado}
+    
+    def integrar_error_taylor(self, x0: float, orden: int, x_val: float) -> float:
+        """
+        Calcula el error de truncamiento en un punto específico.
+        
+        Args:
+            x0: El punto alrededor del cual expandir.
+            orden: El orden de la aproximación.
+            x_val: El punto en el que evaluar el error.
+            
+        Returns:
+            El valor del error de truncamiento.
+        """
+        # Calcular el valor exacto
+        func_exacta = self._lambdificar(self.func)
+        valor_exacto = float(self._evaluar(func_exacta, x_val))
+        
+        # Calcular la aproximación
+        polinomio = self.obtener_polinomio(x0, orden)
+        valor_aprox = float(self._evaluar(polinomio.evaluar, x_val))
+        
+        return abs(valor_exacto - valor_aprox)
+    
+    def determinar_limite_error(self, x0: float, orden: int, x_val: float) -> float:
+        """
+        Calcula el límite teórico del error basado en el resto de Lagrange.
+        
+        Args:
+            x0: El punto alrededor del cual expandir.
+            orden: El orden de la aproximación.
+            x_val: El punto en el que evaluar el límite del error.
+            
+        Returns:
+            El límite teórico del error.
+        """
+        if self._usar_cauchy():
+            return float(self._limite_cauchy(x0, orden, np.array([x_val]))[0])
+        
+        # El límite del error es |f^(n+1)(ξ)| * |x - x0|^(n+1) / (n+1)!
+        # donde ξ es algún punto entre x0 y x
+        # Usaremos una estimación conservadora encontrando el valor máximo de la derivada
+        
+        siguiente_derivada = self.derivar_funcion(orden + 1)
+        
+        # Crear una función numérica para el valor absoluto de la derivada
+        abs_derivada = sp.Lambda(self.x, sp.Abs(siguiente_derivada))
+        num_derivada = self._lambdificar(abs_derivada(self.x))
+        
+        # Muestrear puntos entre x0 y x_val
+        if x0 != x_val:
+            puntos_muestra = np.linspace(min(x0, x_val), max(x0, x_val), 100)
+            max_derivada = max(self._evaluar(num_derivada, puntos_muestra))
+        else:
+            max_derivada = abs(float(siguiente_derivada.subs(self.x, x0)))
+        
+        return float(max_derivada * abs(x_val - x0)**(orden + 1) / sp.factorial(orden + 1))
+    
+    def limite_error_vectorizado(self, x0: float, orden: int, x_vals: np.ndarray, 
+                                 muestras: int = 200) -> np.ndarray:
+        """
+        Calcula el límite del resto de Lagrange en muchos puntos a la vez.
+        
+        Se muestrea |f^(n+1)| una sola vez en una malla que cubre x0 y todos los puntos,
+        y el máximo entre x0 y cada x se obtiene con un máximo acumulado hacia fuera de x0.
+        Con la integral de Cauchy se usa en su lugar la cota de Cauchy M (t/r)^(n+1) / (1 - t/r)
+        más el error estimado de los coeficientes.
+        
+        Args:
+            x0: El punto alrededor del cual expandir.
+            orden: El orden de la aproximación.
+            x_vals: Arreglo de puntos en los que evaluar el límite del error.
+            muestras: Número de puntos de la malla de muestreo de la derivada.
+            
+        Returns:
+            Arreglo con el límite teórico del error en cada punto (inf donde no está acotado).
+        """
+        if self._usar_cauchy():
+            return self._limite_cauchy(x0, orden, x_vals)
+        
+        x_vals = np.asarray(x_vals, dtype=float)
+        x0 = float(x0)
+        malla = np.union1d(np.linspace(min(x0, x_vals.min()), max(x0, x_vals.max()), muestras), [x0])
+        
+        num_derivada = self._lambdificar(self.derivar_funcion(orden + 1))
+        with np.errstate(all='ignore'):
+            valores = np.abs(np.broadcast_to(self._evaluar(num_derivada, malla), malla.shape)).astype(float)
+        valores[~np.isfinite(valores)] = np.inf
+        
+        # Máximo acumulado desde x0 hacia cada lado
+        i0 = np.searchsorted(malla, x0)
+        derecha = np.maximum.accumulate(valores[i0:])
+        izquierda = np.maximum.accumulate(valores[:i0 + 1][::-1])
+        
+        maximos = np.empty_like(x_vals)
+        a_derecha = x_vals >= x0
+        indices = np.searchsorted(malla[i0:], x_vals[a_derecha], side='left')
+        maximos[a_derecha] = derecha[np.minimum(indices, len(derecha) - 1)]
+        indices = np.searchsorted(-malla[:i0 + 1][::-1], -x_vals[~a_derecha], side='left')
+        maximos[~a_derecha] = izquierda[np.minimum(indices, len(izquierda) - 1)]
+        
+        with np.errstate(all='ignore'):
+            factor = np.abs(x_vals - x0)**(orden + 1) / float(sp.factorial(orden + 1))
+            limites = maximos * factor
+        limites[factor == 0] = 0.0
+        return limites
+    
+    def estimar_radio_convergencia(self, x0: float, orden: int = 20) -> Dict:
+        """
+        Estima el radio de convergencia de la serie de Taylor alrededor de x0.
+        
+        Primero se buscan singularidades de la expresión en el plano complejo; si SymPy
+        no devuelve un conjunto finito, se estima el radio con los criterios de la raíz
+        y del cociente sobre los coeficientes.
+        
+        Args:
+            x0: El punto alrededor del cual expandir.
+            orden: Número de coeficientes a usar en los criterios numéricos.
+            
+        Returns:
+            Diccionario con "radio" (np.inf si la función parece entera), "metodo"
+            ("singularidades" o "coeficientes"), "singularidades", "raiz" y "cociente".
+        """
+        resultado = {"radio": None, "metodo": None, "singularidades": [], "raiz": None, "cociente": None}
+        
+        singulares = self._singularidades_finitas()
+        if singulares:
+            distancias = [abs(complex(s) - complex(x0)) for s in singulares]
+            resultado.update(radio=min(distancias), metodo="singularidades", singularidades=singulares)
+        
+        # Criterios de la raíz y del cociente sobre los coeficientes no nulos
+        coefs = np.abs(self.obtener_polinomio(x0, orden).a_flotantes().coeficientes)
+        indices = np.nonzero((coefs > 0) & np.isfinite(coefs))[0]
+        indices = indices[indices > 0]
+        if len(indices) >= 3:
+            raices = coefs[indices] ** (-1.0 / indices)
+            cola = raices[len(raices) // 3:]
+            if cola[-1] > 1.2 * cola[0]:
+                # |a_k|^(-1/k) crece sin límite: decaimiento superexponencial (función entera)
+                resultado["raiz"] = np.inf
+            else:
+                resultado["raiz"] = float(cola[-1])
+            j, k = indices[-2], indices[-1]
+            resultado["cociente"] = float((coefs[j] / coefs[k]) ** (1.0 / (k - j)))
+        
+        if resultado["radio"] is None:
+            resultado["metodo"] = "coeficientes"
+            resultado["radio"] = resultado["raiz"] if resultado["raiz"] is not None else np.inf
+        return resultado
+    
+    def _singularidades_finitas(self) -> List[sp.Expr]:
+        """Devuelve las singularidades complejas de la función si SymPy las da como conjunto finito."""
+        if self.funcion_numerica is not None:
+            return []
+        try:
+            singulares = sp.singularities(self.func, self.x, sp.S.Complexes)
+        except Exception:
+            return []
+        if isinstance(singulares, sp.FiniteSet):
+            return [s for s in singulares if s.is_number]
+        return []
+    
+    def orden_minimo(self, x0: float, intervalo: Tuple[float, float], tolerancia: float, 
+                     orden_max: int = 200, muestras: int = 200) -> int:
+        """
+        Busca el menor orden cuyo límite de error es menor que la tolerancia en un intervalo.
+        
+        Los órdenes se prueban en orden creciente, por lo que solo se calculan las derivadas
+        hasta el orden encontrado más uno.
+        
+        Args:
+            x0: El punto alrededor del cual expandir.
+            intervalo: Tupla (min_x, max_x) donde se exige la tolerancia.
+            tolerancia: Error absoluto máximo admitido.
+            orden_max: Orden máximo a considerar.
+            muestras: Número de puntos usados para evaluar el límite del error.
+            
+        Returns:
+            El orden mínimo que cumple la tolerancia.
+        """
+        if orden_max > 200:
+            raise ValueError("El orden máximo es 200")
+        
+        x_vals = np.linspace(intervalo[0], intervalo[1], muestras)
+        distancia = float(np.max(np.abs(x_vals - x0)))
+        
+        singulares = self._singularidades_finitas()
+        if singulares:
+            radio = min(abs(complex(s) - complex(x0)) for s in singulares)
+            if distancia >= radio:
+                raise ValueError(f"El intervalo se extiende más allá del radio de convergencia ({radio:.6g}); "
+                                 f"ningún orden cumple la tolerancia")
+        
+        for orden in range(orden_max + 1):
+            if np.max(self.limite_error_vectorizado(x0, orden, x_vals, muestras)) <= tolerancia:
+                return orden
+        
+        raise ValueError(f"Ningún orden hasta {orden_max} cumple la tolerancia {tolerancia} en {intervalo}")
+    
+    def aproximante_pade(self, x0: float, L: int, M: int) -> AproximanteRacional:
+        """
+        Calcula el aproximante de Padé [L/M] a partir de los coeficientes de Taylor en caché.
+        
+        Args:
+            x0: El punto alrededor del cual expandir.
+            L: Grado del numerador.
+            M: Grado del denominador.
+            
+        Returns:
+            El aproximante racional P/Q, que coincide con la serie de Taylor hasta el orden L + M.
+        """
+        return pade(self.obtener_polinomio(x0, L + M), L, M)
+    
+    def economizar_chebyshev(self, x0: float, orden: int, rango_x: Tuple[float, float], 
+                             tolerancia: float) -> Tuple[PolinomioTaylor, float]:
+        """
+        Reduce el grado del polinomio de Taylor en rango_x mediante economización de Chebyshev.
+        
+        Args:
+            x0: El punto alrededor del cual expandir.
+            orden: El orden del polinomio de Taylor de partida.
+            rango_x: Tupla (min_x, max_x) del intervalo de uso.
+            tolerancia: Error máximo que puede añadir la economización.
+            
+        Returns:
+            Tupla (polinomio de menor grado centrado en el punto medio del intervalo,
+            cota del error añadido a la aproximación de Taylor).
+        """
+        return economizar_chebyshev(self.obtener_polinomio(x0, orden), rango_x, tolerancia)
     
-    derivada_en_x0 = derivada.subs(x, x0)
-    termino = derivada_en_x0 * (x - x0)**orden / sp.factorial(orden)
+    def _aproximantes_alternativos(self, x0: float, orden: int, rango_x: Tuple[float, float], 
+                                   pade: Tuple[int, int] = None, 
+                                   tolerancia_chebyshev: float = None) -> Dict[str, object]:
+        """Construye los aproximantes de Padé y Chebyshev pedidos, con su etiqueta para gráficas e informes."""
+        aproximantes = {}
+        if pade is not None:
+            L, M = pade
+            aproximantes[f"Padé [{L}/{M}]"] = self.aproximante_pade(x0, L, M)
+        if tolerancia_chebyshev is not None:
+            economizado, _ = self.economizar_chebyshev(x0, orden, rango_x, tolerancia_chebyshev)
+            aproximantes[f"Chebyshev grado {economizado.orden}"] = economizado
+        return aproximantes
     
-    return orden, termino
-
-class AproximacionTaylor:
-    """
-    Una clase para calcular aproximaciones de series de Taylor y errores de truncamiento.
-    """
+    def comparar_aproximantes(self, x0: float, orden: int, rango_x: Tuple[float, float], 
+                              pade: Tuple[int, int] = None, tolerancia_chebyshev: float = None, 
+                              puntos: int = 1000) -> List[Dict]:
+        """
+        Compara el polinomio de Taylor con sus aproximantes de Padé y Chebyshev en rango_x.
+        
+        Args:
+            x0: El punto alrededor del cual expandir.
+            orden: El orden del polinomio de Taylor.
+            rango_x: Tupla (min_x, max_x) del intervalo de comparación.
+            pade: Grados (L, M) del aproximante de Padé, o None para omitirlo.
+            tolerancia_chebyshev: Tolerancia de la economización, o None para omitirla.
+            puntos: Número de puntos de muestreo.
+            
+        Returns:
+            Lista de diccionarios con "nombre", "operaciones", "tiempo" y "error_maximo".
+        """
+        aproximantes = {f"Taylor orden {orden}": self.obtener_polinomio(x0, orden)}
+        aproximantes.update(self._aproximantes_alternativos(x0, orden, rango_x, pade, tolerancia_chebyshev))
+        x_vals = np.linspace(rango_x[0], rango_x[1], puntos)
+        with self.metricas.medir("evaluate"):
+            return comparar_costes(aproximantes, self._lambdificar(self.func), x_vals)
     
-    def __init__(self):
-        """Inicializa la clase AproximacionTaylor."""
-        self.x = sp.Symbol('x')
-        self.cache = {}  # Caché para almacenar derivadas calculadas
+    def aproximante_por_tramos(self, rango_x: Tuple[float, float], tolerancia: float, orden_max: int = 20,
+                               profundidad_maxima: int = 20, procesos: int = None) -> AproximantePorTramos:
+        """
+        Construye un aproximante por tramos que cumple la tolerancia en todo rango_x.
+        
+        El rango se parte por bisección hasta que el desarrollo en el punto medio de cada tramo,
+        con el menor orden posible hasta orden_max, cumple la tolerancia (ver el módulo por_tramos).
         
-    def establecer_funcion(self, func_str: str) -> None:
+        Args:
+            rango_x: Tupla (min_x, max_x) a cubrir.
+            tolerancia: Error absoluto máximo.
+            orden_max: Orden máximo de cada tramo.
+            profundidad_maxima: Bisecciones máximas de un tramo.
+            procesos: Procesos entre los que se reparten los tramos. Si es None, usa el número de CPUs.
+            
+        Returns:
+            El aproximante (evaluación vectorizada, guardar/cargar), con el error máximo medido.
         """
-        Establece la función a aproximar.
+        return construir_por_tramos(self, rango_x, tolerancia, orden_max, profundidad_maxima,
+                                    procesos=procesos)
+    
+    def graficar_por_tramos(self, aproximante: AproximantePorTramos, puntos: int = 5000,
+                            ruta_guardar: str = None, figura=None) -> None:
+        """
+        Grafica el error del aproximante por tramos con los bordes de los tramos y su orden.
         
         Args:
-            func_str: Una representación en cadena de la función en términos de x.
+            aproximante: El aproximante de aproximante_por_tramos.
+            puntos: Número de puntos de muestreo.
+            ruta_guardar: Ruta para guardar la gráfica. Si es None, la gráfica se muestra.
+            figura: Figura de matplotlib a reutilizar (se limpia). Si es None, se crea una.
         """
-        try:
-            self.func = sp.sympify(func_str)
-            self.func_str = func_str
-            # Limpiar caché al establecer una nueva función
-            self.cache = {}
-        except Exception as e:
-            raise ValueError(f"Expresión de función inválida: {e}")
+        x_vals = np.linspace(*aproximante.rango, puntos)
+        with np.errstate(all='ignore'):
+            exactos = np.real(np.broadcast_to(self._evaluar(self._lambdificar(self.func), x_vals), x_vals.shape))
+            errores = np.abs(exactos - self._evaluar(aproximante.evaluar, x_vals))
+        
+        propia = figura is None
+        figura, ax = self._preparar_figura(figura)
+        # Los errores por debajo del redondeo (ceros exactos en los centros) se llevan a ε·max|f|
+        suelo = np.finfo(float).eps * max(float(np.nanmax(np.abs(exactos))), 1.0)
+        ax.semilogy(x_vals, np.maximum(errores, suelo), 'b-', linewidth=1, label='|f - A|')
+        if aproximante.tolerancia is not None:
+            ax.axhline(aproximante.tolerancia, color='r', linestyle='--', label=f'Tolerancia {aproximante.tolerancia:g}')
+        # Los bordes solo se marcan si no saturan la gráfica
+        if len(aproximante) <= 200:
+            for borde in aproximante.bordes[1:-1]:
+                ax.axvline(borde, color='gray', alpha=0.3, linewidth=0.8)
+        eje_orden = ax.twinx()
+        eje_orden.step(aproximante.bordes, np.append(aproximante.ordenes, aproximante.ordenes[-1]), 
+                       where='post', color='green', alpha=0.6)
+        eje_orden.set_ylabel('Orden del tramo', color='green')
+        
+        ax.grid(True, alpha=0.3)
+        ax.legend(loc='upper left')
+        ax.set_title(f'Aproximante por tramos de f(x) = {self.func_str}: {len(aproximante)} tramos')
+        ax.set_xlabel('x')
+        ax.set_ylabel('Error (absoluto)')
+        self._finalizar_figura(figura, propia, ruta_guardar)
     
-    def derivar_funcion(self, orden: int) -> sp.Expr:
+    def coeficientes_parametricos(self, x0: float, orden: int) -> CoeficientesParametricos:
         """
-        Calcula la derivada n-ésima de la función.
+        Obtiene los coeficientes 0..orden en x0 como funciones compiladas de los parámetros libres.
+        
+        Los coeficientes se calculan una sola vez, en forma simbólica, con los mismos métodos que
+        obtener_polinomio (recurrencias o derivadas), y se guardan en la caché de la función.
         
         Args:
-            orden: El orden de la derivada.
+            x0: El punto alrededor del cual expandir.
+            orden: El orden máximo de la aproximación.
             
         Returns:
-            La expresión simbólica para la derivada n-ésima.
+            Los coeficientes compilados (ver parametros.CoeficientesParametricos).
         """
-        if orden in self.cache:
-            return self.cache[orden]
+        if self.funcion_numerica is not None or self._usar_cauchy():
+            raise ValueError("Los barridos de parámetros necesitan una función simbólica derivada "
+                             "exactamente (sin integral de Cauchy)")
+        if orden > 200:
+            raise ValueError("El orden máximo es 200")
         
-        if orden == 0:
-            result = self.func
-        else:
-            result = sp.diff(self.func, self.x, orden)
+        clave = ("parametros", x0, orden)
+        if clave in self.evaluadores:
+            self.metricas.registrar_cache("evaluadores", True)
+            return self.evaluadores[clave]
         
-        # Almacenar el resultado en caché
-        self.cache[orden] = result
-        return result
+        self.metricas.registrar_cache("evaluadores", False)
+        try:
+            coeficientes = self.obtener_polinomio(x0, orden).coeficientes
+        except PuntoNoAnalitico:
+            # El dominio puede depender de los parámetros (log(a + x) en x0 = 0): se calcula el
+            # desarrollo genérico y las combinaciones sin desarrollo dan coeficientes no finitos
+            self._coeficientes_locales(x0, orden, self.func)
+            coeficientes = [self.cache_coeficientes[(x0, k)] for k in range(orden + 1)]
+        with self.metricas.medir("lambdify"):
+            compilados = CoeficientesParametricos(coeficientes, x0, barridos.parametros_libres(self.func, self.x))
+        self.evaluadores[clave] = compilados
+        return compilados
     
-    def analizar_termino_taylor(self, orden: int, x0: float) -> sp.Expr:
+    def barrido_parametros(self, x0: float, orden: int, parametros: Dict[str, Sequence[float]],
+                           rango_x: Tuple[float, float] = None, puntos: int = 200) -> Dict:
         """
-        Calcula un solo término de la serie de Taylor.
+        Evalúa el desarrollo de una familia de funciones sobre una rejilla de valores de sus
+        parámetros libres (todos los símbolos distintos de x).
+        
+        Los coeficientes se derivan una sola vez como expresiones de los parámetros; cada
+        combinación de la rejilla solo cuesta una evaluación vectorizada.
         
         Args:
-            orden: El orden del término.
             x0: El punto alrededor del cual expandir.
+            orden: El orden máximo de la aproximación.
+            parametros: Valores de cada parámetro ({"a": [...], "b": [...]}); se combinan todos
+                con todos.
+            rango_x: Tupla (min_x, max_x) en la que medir el error de cada combinación. Si es
+                None, solo se calculan los coeficientes.
+            puntos: Número de puntos de x en los que se mide el error.
             
         Returns:
-            La expresión simbólica para el término.
+            Diccionario con "parametros" (nombres en el orden de los ejes), "valores" (valores
+            de cada parámetro), "coeficientes" (tensor de forma (n_1, ..., n_p, orden + 1)),
+            "expresiones" (coeficientes simbólicos), "x0" y "orden". Con rango_x, además "x",
+            "error_maximo" y "error_medio" (forma de la rejilla) y "estadisticas" (ver
+            parametros.resumen_errores).
         """
-        if orden == 0:
-            return self.derivar_funcion(0).subs(self.x, x0)
+        compilados = self.coeficientes_parametricos(x0, orden)
+        nombres = [s.name for s in compilados.parametros]
+        if not nombres:
+            raise ValueError(f"La función {self.func_str} no tiene parámetros libres además de x")
+        if set(parametros) != set(nombres):
+            raise ValueError(f"Se deben dar valores para los parámetros {', '.join(nombres)} "
+                             f"(recibidos: {', '.join(parametros) or 'ninguno'})")
+        valores = [np.atleast_1d(np.asarray(parametros[nombre], dtype=float)) for nombre in nombres]
+        mallas = barridos.rejilla(valores)
         
-        derivada = self.derivar_funcion(orden)
-        derivada_en_x0 = derivada.subs(self.x, x0)
+        with self.metricas.medir("evaluate"):
+            tensor = compilados.evaluar(*mallas)
+        self.metricas.incrementar("barridos_parametros")
+        self.metricas.incrementar("combinaciones_parametros", tensor[..., 0].size)
+        resultado = {"parametros": nombres, "valores": dict(zip(nombres, valores)), "coeficientes": tensor,
+                     "expresiones": compilados.expresiones, "x0": x0, "orden": orden}
+        if rango_x is None:
+            return resultado
         
-        return derivada_en_x0 * (self.x - x0)**orden / sp.factorial(orden)
+        clave = ("parametros", self.func)
+        if clave not in self.evaluadores:
+            with self.metricas.medir("lambdify"):
+                self.evaluadores[clave] = sp.lambdify([self.x] + compilados.parametros, self.func, "numpy")
+        x_vals = np.linspace(rango_x[0], rango_x[1], puntos)
+        with self.metricas.medir("evaluate"):
+            errores = barridos.errores_por_combinacion(self.evaluadores[clave], tensor, mallas, x0, x_vals)
+        resultado.update(errores, x=x_vals,
+                         estadisticas=barridos.resumen_errores(errores["error_maximo"], nombres, mallas))
+        return resultado
     
-    def visualizar_serie_taylor(self, x0: float, orden: int) -> sp.Expr:
+    def graficar_barrido(self, resultado: Dict, ruta_guardar: str = None, figura=None) -> None:
         """
-        Calcula la aproximación de la serie de Taylor hasta el orden especificado.
+        Grafica el error máximo de un barrido de parámetros: una curva con un parámetro y un
+        mapa de log₁₀ del error con dos (con más, el peor caso sobre el resto de parámetros).
+        
+        Args:
+            resultado: Diccionario de barrido_parametros calculado con rango_x.
+            ruta_guardar: Ruta para guardar la gráfica. Si es None, la gráfica se muestra.
+            figura: Figura de matplotlib a reutilizar (se limpia). Si es None, se crea una.
+        """
+        if "error_maximo" not in resultado:
+            raise ValueError("El barrido no tiene errores: calcúlelo con rango_x")
+        nombres, valores = resultado["parametros"], resultado["valores"]
+        error = resultado["error_maximo"]
+        if error.ndim > 2:
+            with np.errstate(all='ignore'):
+                error = np.nanmax(error.reshape(error.shape[:2] + (-1,)), axis=2)
+        
+        propia = figura is None
+        figura, ax = self._preparar_figura(figura)
+        if error.ndim == 1:
+            ax.semilogy(valores[nombres[0]], error, 'b.-', linewidth=1)
+            ax.set_xlabel(nombres[0])
+            ax.set_ylabel('Error máximo (absoluto)')
+            ax.grid(True, alpha=0.3)
+        else:
+            x_par, y_par = valores[nombres[0]], valores[nombres[1]]
+            with np.errstate(divide='ignore'):
+                log_error = np.log10(error.T)
+            mapa = ax.pcolormesh(x_par, y_par, log_error, cmap='magma', shading='nearest')
+            figura.colorbar(mapa, ax=ax, label='log₁₀ del error máximo')
+            ax.set_xlabel(nombres[0])
+            ax.set_ylabel(nombres[1])
+        resto = f" (peor caso en {', '.join(nombres[2:])})" if len(nombres) > 2 else ""
+        ax.set_title(f'Error de P_{resultado["orden"]} de f(x) = {self.func_str} en '
+                     f'[{resultado["x"][0]:g}, {resultado["x"][-1]:g}] alrededor de x0 = {resultado["x0"]}{resto}')
+        self._finalizar_figura(figura, propia, ruta_guardar)
+    
+    def graficar_serie_perezosa(self, x0: float, rango_x: Tuple[float, float], tolerancia: float,
+                                orden_maximo: int = 200, puntos: int = 1000, ruta_guardar: str = None,
+                                figura=None) -> Dict:
+        """
+        Grafica la función y su serie de Taylor evaluada hasta una tolerancia, con el número de
+        términos que necesitó cada punto.
         
         Args:
             x0: El punto alrededor del cual expandir.
-            orden: El orden máximo de la aproximación.
+            rango_x: Tupla (min_x, max_x).
+            tolerancia: Error absoluto admitido en cada punto.
+            orden_maximo: Último término que se suma si la cola no baja de la tolerancia.
+            puntos: Número de puntos de muestreo.
+            ruta_guardar: Ruta para guardar la gráfica. Si es None, la gráfica se muestra.
+            figura: Figura de matplotlib a reutilizar (se limpia). Si es None, se crea una.
             
         Returns:
-            La expresión simbólica para la serie de Taylor.
+            El diccionario de SeriePerezosa.evaluar en los puntos de muestreo.
         """
-        if orden > 200:
-            raise ValueError("El orden máximo es 200")
+        serie = self.serie_perezosa(x0)
+        x_vals = np.linspace(rango_x[0], rango_x[1], puntos)
+        with self.metricas.medir("evaluate"):
+            resultado = serie.evaluar(x_vals, tolerancia, orden_maximo)
+        with np.errstate(all='ignore'):
+            exactos = np.real(np.broadcast_to(self._evaluar(self._lambdificar(self.func), x_vals), x_vals.shape))
+        aproximados = np.where(resultado["convergidos"], np.real(resultado["valores"]), np.nan)
+        
+        propia = figura is None
+        figura, ax = self._preparar_figura(figura)
+        ax.plot(x_vals, self._enmascarar_singularidades(x_vals, exactos, rango_x), 'k-', linewidth=2,
+                label=f'f(x) = {self.func_str}')
+        ax.plot(x_vals, aproximados, 'b--', linewidth=1.5, label=f'Serie hasta tolerancia {tolerancia:g}')
+        ax.axvline(x=x0, color='gray', linestyle='--', alpha=0.5)
+        eje_orden = ax.twinx()
+        eje_orden.plot(x_vals, np.where(resultado["convergidos"], resultado["ordenes"], np.nan), 
+                       color='green', alpha=0.6)
+        eje_orden.set_ylabel('Términos sumados', color='green')
         
-        terminos = [self.analizar_termino_taylor(i, x0) for i in range(orden + 1)]
-        return sum(terminos)
+        # Límites del eje y según los valores de la función, como en graficar_aproximaciones
+        finitos = exactos[np.isfinite(exactos)]
+        if finitos.size:
+            margen = 0.2 * (finitos.max() - finitos.min()) or 1.0
+            ax.set_ylim(finitos.min() - margen, finitos.max() + margen)
+        ax.grid(True, alpha=0.3)
+        ax.legend(loc='upper left')
+        ax.set_title(f'Serie de Taylor perezosa de f(x) = {self.func_str} alrededor de x0 = {x0} '
+                     f'(máx. {int(resultado["ordenes"].max())} términos; {serie.calculados} coeficientes calculados)')
+        ax.set_xlabel('x')
+        ax.set_ylabel('y')
+        self._finalizar_figura(figura, propia, ruta_guardar)
+        return resultado
     
-    def integrar_error_taylor(self, x0: float, orden: int, x_val: float) -> float:
+    def _lambdificar_complejo(self, expr: sp.Expr) -> Callable:
+        """Función numérica de NumPy que admite argumentos complejos (independiente del motor)."""
+        if self.funcion_numerica is not None and expr == self.func:
+            return self.funcion_numerica
+        clave = ("complejo", expr)
+        if clave not in self.evaluadores:
+            with self.metricas.medir("lambdify"):
+                self.evaluadores[clave] = sp.lambdify(self.x, expr, "numpy")
+        return self.evaluadores[clave]
+    
+    def plano_complejo(self, x0: float, orden: int, rango_re: Tuple[float, float], 
+                       rango_im: Tuple[float, float], resolucion: Tuple[int, int] = (800, 600), 
+                       modo: str = "error", filas_por_bloque: int = FILAS_POR_BLOQUE, 
+                       hilos: int = None) -> np.ndarray:
         """
-        Calcula el error de truncamiento en un punto específico.
+        Evalúa f(z), P_n(z) o su error sobre una malla del plano complejo.
+        
+        La malla se procesa por bloques de filas repartidos entre hilos, así que la memoria
+        adicional es proporcional al tamaño de un bloque y no al de la imagen.
         
         Args:
             x0: El punto alrededor del cual expandir.
-            orden: El orden de la aproximación.
-            x_val: El punto en el que evaluar el error.
+            orden: El orden del polinomio de Taylor.
+            rango_re: Tupla (min, max) de la parte real.
+            rango_im: Tupla (min, max) de la parte imaginaria.
+            resolucion: Tupla (ancho, alto) en píxeles.
+            modo: "funcion" o "polinomio" (coloración de dominio de f o de P_n, RGB uint8)
+                o "error" (log10|f(z) - P_n(z)| en float32).
+            filas_por_bloque: Filas de la malla evaluadas juntas.
+            hilos: Número de hilos. Si es None, usa el número de CPUs.
             
         Returns:
-            El valor del error de truncamiento.
+            La imagen, de forma (alto, ancho, 3) o (alto, ancho); la fila 0 es la parte imaginaria mínima.
         """
-        # Calcular el valor exacto
-        func_exacta = lambdify(self.x, self.func, "numpy")
-        valor_exacto = float(func_exacta(x_val))
+        if modo not in ("funcion", "polinomio", "error"):
+            raise ValueError(f"Modo de plano complejo inválido: {modo}")
         
-        # Calcular la aproximación
-        aprox = self.visualizar_serie_taylor(x0, orden)
-        func_aprox = lambdify(self.x, aprox, "numpy")
-        valor_aprox = float(func_aprox(x_val))
+        polinomio = self.obtener_polinomio(x0, orden).a_flotantes()
+        func_num = self._lambdificar_complejo(self.func)
         
-        return abs(valor_exacto - valor_aprox)
+        def valores_f(z):
+            with np.errstate(all='ignore'):
+                return np.broadcast_to(np.asarray(func_num(z), dtype=complex), z.shape)
+        
+        if modo == "funcion":
+            calcular = lambda z: coloracion_dominio(valores_f(z))
+        elif modo == "polinomio":
+            calcular = lambda z: coloracion_dominio(np.asarray(polinomio.evaluar(z), dtype=complex))
+        else:
+            def calcular(z):
+                with np.errstate(all='ignore'):
+                    # Por debajo de la precisión de float64 el error no es significativo
+                    return np.maximum(np.log10(np.abs(valores_f(z) - polinomio.evaluar(z))), -16)
+        
+        canales = 0 if modo == "error" else 3
+        with self.metricas.medir("evaluate"):
+            return evaluar_por_bloques(calcular, rango_re, rango_im, resolucion, canales, 
+                                       np.float32 if modo == "error" else np.uint8, filas_por_bloque, hilos)
     
-    def determinar_limite_error(self, x0: float, orden: int, x_val: float) -> float:
+    def disco_convergencia(self, x0: float, orden: int = 20) -> Dict:
         """
-        Calcula el límite teórico del error basado en el resto de Lagrange.
+        Devuelve el disco de convergencia estimado y las singularidades complejas conocidas.
         
         Args:
             x0: El punto alrededor del cual expandir.
-            orden: El orden de la aproximación.
-            x_val: El punto en el que evaluar el límite del error.
+            orden: Número de coeficientes usados si no se encuentran singularidades.
             
         Returns:
-            El límite teórico del error.
+            Diccionario con "centro", "radio" (np.inf si la función parece entera), "metodo" y
+            "singularidades" (lista de números complejos).
         """
-        # El límite del error es |f^(n+1)(ξ)| * |x - x0|^(n+1) / (n+1)!
-        # donde ξ es algún punto entre x0 y x
-        # Usaremos una estimación conservadora encontrando el valor máximo de la derivada
+        estimacion = self.estimar_radio_convergencia(x0, orden)
+        singularidades = []
+        for s in estimacion["singularidades"]:
+            try:
+                singularidades.append(complex(s))
+            except TypeError:
+                continue
+        return {"centro": x0, "radio": float(estimacion["radio"]), "metodo": estimacion["metodo"], 
+                "singularidades": singularidades}
+    
+    @staticmethod
+    def _rangos_plano(disco: Dict, rango_re: Tuple[float, float] = None, 
+                      rango_im: Tuple[float, float] = None) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+        """Completa los rangos no indicados con una ventana cuadrada que abarca el disco de convergencia."""
+        semiancho = 1.5 * disco["radio"] if 0 < disco["radio"] < np.inf else 2.0
+        if rango_re is None:
+            rango_re = (disco["centro"] - semiancho, disco["centro"] + semiancho)
+        if rango_im is None:
+            mitad = (rango_re[1] - rango_re[0]) / 2
+            rango_im = (-mitad, mitad)
+        return rango_re, rango_im
+    
+    def graficar_plano_complejo(self, x0: float, orden: int, rango_re: Tuple[float, float] = None, 
+                                rango_im: Tuple[float, float] = None, resolucion: Tuple[int, int] = (600, 600), 
+                                modo: str = "error", ruta_guardar: str = None, figura=None) -> None:
+        """
+        Grafica la función y su polinomio de Taylor en el plano complejo con el disco de convergencia.
         
-        siguiente_derivada = self.derivar_funcion(orden + 1)
+        Args:
+            x0: El punto alrededor del cual expandir.
+            orden: El orden del polinomio de Taylor.
+            rango_re: Tupla (min, max) de la parte real. Si es None, se ajusta al disco de convergencia.
+            rango_im: Tupla (min, max) de la parte imaginaria. Si es None, igual que rango_re centrado en 0.
+            resolucion: Tupla (ancho, alto) en píxeles.
+            modo: "error" (mapa de calor de log10|f - P_n|) o "dominio" (coloración de dominio
+                de f y de P_n lado a lado).
+            ruta_guardar: Ruta para guardar la gráfica. Si es None, la gráfica se muestra.
+            figura: Figura de matplotlib a reutilizar. Si es None, se crea una y se cierra al guardarla.
+        """
+        if modo not in ("error", "dominio"):
+            raise ValueError(f"Modo de gráfica compleja inválido: {modo}")
         
-        # Crear una función numérica para el valor absoluto de la derivada
-        abs_derivada = sp.Lambda(self.x, sp.Abs(siguiente_derivada))
-        num_derivada = lambdify(self.x, abs_derivada(self.x), "numpy")
+        disco = self.disco_convergencia(x0, min(max(orden, 10), 20))
+        rango_re, rango_im = self._rangos_plano(disco, rango_re, rango_im)
+        extension = (rango_re[0], rango_re[1], rango_im[0], rango_im[1])
         
-        # Muestrear puntos entre x0 y x_val
-        if x0 != x_val:
-            puntos_muestra = np.linspace(min(x0, x_val), max(x0, x_val), 100)
-            max_derivada = max(num_derivada(puntos_muestra))
+        propia = figura is None
+        figura, ax = self._preparar_figura(figura)
+        
+        if modo == "error":
+            imagen = self.plano_complejo(x0, orden, rango_re, rango_im, resolucion, "error")
+            with self.metricas.medir("render"):
+                mapa = ax.imshow(imagen, origin='lower', extent=extension, cmap='magma', aspect='equal')
+                figura.colorbar(mapa, ax=ax, label='log₁₀|f(z) - Pₙ(z)|')
+                dibujar_disco(ax, disco)
+                ax.set_title(f'Error de Taylor de orden {orden} de f(z) = {self.func_str} en el plano complejo')
+                ax.legend(loc='upper right')
         else:
-            max_derivada = abs(float(siguiente_derivada.subs(self.x, x0)))
+            figura.clf()
+            ejes = figura.subplots(1, 2)
+            for ax, modo_imagen, titulo in zip(ejes, ("funcion", "polinomio"), 
+                                               (f'f(z) = {self.func_str}', f'P_{orden}(z) alrededor de x₀ = {x0}')):
+                imagen = self.plano_complejo(x0, orden, rango_re, rango_im, resolucion, modo_imagen)
+                with self.metricas.medir("render"):
+                    ax.imshow(imagen, origin='lower', extent=extension, aspect='equal')
+                    dibujar_disco(ax, disco)
+                    ax.set_title(titulo)
         
-        return max_derivada * abs(x_val - x0)**(orden + 1) / sp.factorial(orden + 1)
+        self._finalizar_figura(figura, propia, ruta_guardar, "Gráfica del plano complejo guardada en")
+    
+    def _preparar_figura(self, figura=None):
+        """
+        Devuelve la figura y los ejes sobre los que dibujar.
+        
+        Si se proporciona una figura (por ejemplo, de una reserva reutilizable), se limpia
+        y se reutiliza; si no, se crea una nueva figura de pyplot.
+        """
+        if figura is None:
+            figura = plt.figure(figsize=(12, 8))
+        else:
+            figura.clf()
+        return figura, figura.add_subplot(111)
+    
+    def _finalizar_figura(self, figura, propia: bool, ruta_guardar: str = None, 
+                          mensaje: str = "Gráfica guardada en") -> None:
+        """Guarda o muestra la figura y cierra las figuras de pyplot creadas por este objeto."""
+        if ruta_guardar:
+            with self.metricas.medir("render"):
+                figura.savefig(ruta_guardar, dpi=300, bbox_inches='tight')
+            print(f"{mensaje} {ruta_guardar}")
+            if propia:
+                plt.close(figura)
+        else:
+            figura.tight_layout()
+            plt.show()
     
     def graficar_aproximaciones(self, x0: float, ordenes: List[int], rango_x: Tuple[float, float], 
-                           puntos: int = 1000, ruta_guardar: str = None) -> None:
+                           puntos: int = 1000, ruta_guardar: str = None, figura=None, 
+                           pade: Tuple[int, int] = None, tolerancia_chebyshev: float = None) -> None:
         """
         Grafica la función original y sus aproximaciones de Taylor.
         
@@ -188,56 +1714,72 @@ class AproximacionTaylor:
             rango_x: Tupla (min_x, max_x) que define el rango del eje x.
             puntos: Número de puntos a usar para graficar.
             ruta_guardar: Ruta para guardar la gráfica. Si es None, la gráfica se muestra.
+            figura: Figura de matplotlib a reutilizar. Si es None, se crea una y se cierra al guardarla.
+            pade: Grados (L, M) de un aproximante de Padé a graficar además de Taylor.
+            tolerancia_chebyshev: Si se indica, grafica también el polinomio de mayor orden
+                economizado con Chebyshev en rango_x con esta tolerancia.
         """
+        # Falla una sola vez, antes de derivar, si x0 es singular
+        self.verificar_punto(x0)
         x_vals = np.linspace(rango_x[0], rango_x[1], puntos)
         
         # Crear una función para evaluación numérica
-        func_num = lambdify(self.x, self.func, "numpy")
+        func_num = self._lambdificar(self.func)
         
-        plt.figure(figsize=(12, 8))
+        propia = figura is None
+        figura, ax = self._preparar_figura(figura)
         
-        # Graficar la función original
+        # Graficar la función original, cortada en sus singularidades
         try:
-            y_vals = func_num(x_vals)
-            plt.plot(x_vals, y_vals, 'k-', linewidth=2, label=f'f(x) = {self.func_str}')
+            y_vals = self._enmascarar_singularidades(x_vals, self._evaluar(func_num, x_vals), rango_x)
+            ax.plot(x_vals, y_vals, 'k-', linewidth=2, label=f'f(x) = {self.func_str}')
         except Exception as e:
             print(f"Error al graficar la función original: {e}")
+        for i, singular in enumerate(self.singularidades_en_rango(rango_x)):
+            ax.axvline(x=singular, color='red', linestyle=':', alpha=0.6, 
+                       label='Singularidades' if i == 0 else None)
         
         # Graficar las aproximaciones
         colors = plt.cm.viridis(np.linspace(0, 1, len(ordenes)))
         
         for i, orden in enumerate(ordenes):
-            aprox = self.visualizar_serie_taylor(x0, orden)
-            aprox_num = lambdify(self.x, aprox, "numpy")
-            
             try:
-                y_aprox = aprox_num(x_vals)
-                plt.plot(x_vals, y_aprox, '-', color=colors[i], linewidth=1.5, 
-                         label=f'Orden {orden}')
+                polinomio = self.obtener_polinomio(x0, orden)
+                y_aprox = self._evaluar(self.motor.polinomio(polinomio), x_vals)
+                ax.plot(x_vals, y_aprox, '-', color=colors[i], linewidth=1.5, 
+                        label=f'Orden {orden}')
             except Exception as e:
                 print(f"Error al graficar la aproximación de orden {orden}: {e}")
         
+        # Graficar los aproximantes alternativos con línea discontinua
+        try:
+            alternativos = self._aproximantes_alternativos(x0, max(ordenes), rango_x, pade, tolerancia_chebyshev)
+        except Exception as e:
+            print(f"Error al calcular los aproximantes alternativos: {e}")
+            alternativos = {}
+        for nombre, aproximante in alternativos.items():
+            with np.errstate(all='ignore'):
+                y_aprox = self._evaluar(aproximante.evaluar, x_vals)
+            ax.plot(x_vals, y_aprox, '--', linewidth=1.5, label=nombre)
+        
         # Marcar el punto de expansión
-        plt.axvline(x=x0, color='gray', linestyle='--', alpha=0.5)
-        plt.scatter([x0], [func_num(x0)], color='red', s=50, zorder=5)
-        plt.annotate(f'x₀ = {x0}', (x0, func_num(x0)), xytext=(10, -20), 
+        ax.axvline(x=x0, color='gray', linestyle='--', alpha=0.5)
+        ax.scatter([x0], [func_num(x0)], color='red', s=50, zorder=5)
+        ax.annotate(f'x₀ = {x0}', (x0, func_num(x0)), xytext=(10, -20), 
                     textcoords='offset points', color='red')
         
-        plt.grid(True, alpha=0.3)
-        plt.legend(loc='best')
-        plt.title(f'Aproximaciones de Series de Taylor de f(x) = {self.func_str} alrededor de x₀ = {x0}')
-        plt.xlabel('x')
-        plt.ylabel('y')
+        ax.grid(True, alpha=0.3)
+        ax.legend(loc='best')
+        ax.set_title(f'Aproximaciones de Series de Taylor de f(x) = {self.func_str} alrededor de x₀ = {x0}')
+        ax.set_xlabel('x')
+        ax.set_ylabel('y')
         
-        if ruta_guardar:
-            plt.savefig(ruta_guardar, dpi=300, bbox_inches='tight')
-            print(f"Gráfica guardada en {ruta_guardar}")
-        else:
-            plt.tight_layout()
-            plt.show()
+        self._finalizar_figura(figura, propia, ruta_guardar)
     
     def graficar_errores(self, x0: float, ordenes: List[int], rango_x: Tuple[float, float], 
-                   puntos: int = 1000, escala_log: bool = True, ruta_guardar: str = None) -> None:
+                   puntos: int = 1000, escala_log: bool = True, ruta_guardar: str = None, 
+                   figura=None, pade: Tuple[int, int] = None, 
+                   tolerancia_chebyshev: float = None) -> None:
         """
         Grafica los errores de truncamiento para diferentes órdenes de aproximación.
         
@@ -248,55 +1790,239 @@ class AproximacionTaylor:
             puntos: Número de puntos a usar para graficar.
             escala_log: Si se debe usar escala logarítmica para el eje y.
             ruta_guardar: Ruta para guardar la gráfica. Si es None, la gráfica se muestra.
+            figura: Figura de matplotlib a reutilizar. Si es None, se crea una y se cierra al guardarla.
+            pade: Grados (L, M) de un aproximante de Padé cuyo error se grafica además.
+            tolerancia_chebyshev: Si se indica, grafica también el error del polinomio de mayor
+                orden economizado con Chebyshev en rango_x con esta tolerancia.
         """
+        self.verificar_punto(x0)
         x_vals = np.linspace(rango_x[0], rango_x[1], puntos)
         
-        plt.figure(figsize=(12, 8))
+        propia = figura is None
+        figura, ax = self._preparar_figura(figura)
         
         # Crear una función para evaluación numérica
-        func_num = lambdify(self.x, self.func, "numpy")
+        func_num = self._lambdificar(self.func)
+        y_vals = None
         
         # Calcular y graficar errores para cada orden
         colors = plt.cm.viridis(np.linspace(0, 1, len(ordenes)))
         
         for i, orden in enumerate(ordenes):
-            aprox = self.visualizar_serie_taylor(x0, orden)
-            aprox_num = lambdify(self.x, aprox, "numpy")
-            
             try:
                 # Calcular errores
-                y_vals = func_num(x_vals)
-                y_aprox = aprox_num(x_vals)
+                if y_vals is None:
+                    y_vals = self._enmascarar_singularidades(x_vals, self._evaluar(func_num, x_vals), rango_x)
+                polinomio = self.obtener_polinomio(x0, orden)
+                y_aprox = self._evaluar(self.motor.polinomio(polinomio), x_vals)
                 errores = np.abs(y_vals - y_aprox)
                 
-                plt.plot(x_vals, errores, '-', color=colors[i], linewidth=1.5, 
-                         label=f'Orden {orden}')
+                ax.plot(x_vals, errores, '-', color=colors[i], linewidth=1.5, 
+                        label=f'Orden {orden}')
             except Exception as e:
                 print(f"Error al graficar el error de orden {orden}: {e}")
         
+        # Errores de los aproximantes alternativos con línea discontinua
+        try:
+            alternativos = self._aproximantes_alternativos(x0, max(ordenes), rango_x, pade, tolerancia_chebyshev)
+            if alternativos and y_vals is None:
+                y_vals = self._enmascarar_singularidades(x_vals, self._evaluar(func_num, x_vals), rango_x)
+        except Exception as e:
+            print(f"Error al calcular los aproximantes alternativos: {e}")
+            alternativos = {}
+        for nombre, aproximante in alternativos.items():
+            with np.errstate(all='ignore'):
+                errores = np.abs(y_vals - self._evaluar(aproximante.evaluar, x_vals))
+            ax.plot(x_vals, errores, '--', linewidth=1.5, label=nombre)
+        
         # Marcar el punto de expansión
-        plt.axvline(x=x0, color='gray', linestyle='--', alpha=0.5)
+        ax.axvline(x=x0, color='gray', linestyle='--', alpha=0.5)
         
-        plt.grid(True, alpha=0.3)
-        plt.legend(loc='best')
-        plt.title(f'Errores de Truncamiento para Aproximaciones de Taylor de f(x) = {self.func_str}')
-        plt.xlabel('x')
-        plt.ylabel('Error (absoluto)')
+        ax.grid(True, alpha=0.3)
+        ax.legend(loc='best')
+        ax.set_title(f'Errores de Truncamiento para Aproximaciones de Taylor de f(x) = {self.func_str}')
+        ax.set_xlabel('x')
+        ax.set_ylabel('Error (absoluto)')
         
         if escala_log:
-            plt.yscale('log')
+            ax.set_yscale('log')
         
-        if ruta_guardar:
-            plt.savefig(ruta_guardar, dpi=300, bbox_inches='tight')
-            print(f"Gráfica de error guardada en {ruta_guardar}")
-        else:
-            plt.tight_layout()
-            plt.show()
+        self._finalizar_figura(figura, propia, ruta_guardar, "Gráfica de error guardada en")
+
+    def datos_grafica(self, x0: float, ordenes: List[int], rango_x: Tuple[float, float],
+                      muestras: int = diezmado.MUESTRAS, puntos_serie: int = diezmado.PUNTOS_SERIE,
+                      metodo: str = "lttb") -> Dict:
+        """
+        Calcula las curvas de graficar_aproximaciones y graficar_errores, diezmadas para exportarlas.
+        
+        Las curvas se evalúan en `muestras` puntos y cada una se reduce por separado a unos
+        `puntos_serie` puntos con LTTB o mínimo/máximo por columna (las de error, en escala
+        logarítmica), de modo que al dibujarlas se ven igual que con todas las muestras.
+        
+        Args:
+            x0: El punto alrededor del cual expandir.
+            ordenes: Lista de órdenes de aproximación.
+            rango_x: Tupla (min_x, max_x).
+            muestras: Puntos en los que se evalúa cada curva antes de diezmarla.
+            puntos_serie: Puntos aproximados de cada serie diezmada.
+            metodo: "lttb" o "minmax".
+            
+        Returns:
+            Diccionario con "funcion", "x0", "rango", "muestras", "metodo" y "series": una
+            lista de diccionarios con "nombre" ("f", "P_n", "error_n"), "tipo" ("funcion",
+            "aproximacion" o "error"), "orden", "x" e "y" (NaN en los cortes).
+        """
+        if metodo not in diezmado.METODOS:
+            raise ValueError(f"Método de diezmado desconocido: {metodo} (disponibles: {', '.join(diezmado.METODOS)})")
+        if muestras < 2 or rango_x[0] >= rango_x[1]:
+            raise ValueError("Se necesitan al menos 2 muestras y un rango con min_x < max_x")
+        self.verificar_punto(x0)
+        ordenes = list(dict.fromkeys(ordenes))
+        x_vals = np.linspace(rango_x[0], rango_x[1], muestras)
+        
+        def serie(nombre, tipo, orden, valores, logaritmico=False):
+            x_serie, y_serie = diezmado.diezmar(x_vals, valores, puntos_serie, metodo, logaritmico)
+            return {"nombre": nombre, "tipo": tipo, "orden": orden, "x": x_serie, "y": y_serie}
+        
+        with np.errstate(all='ignore'):
+            y_vals = np.real(np.broadcast_to(self._evaluar(self._lambdificar(self.func), x_vals), x_vals.shape))
+            y_vals = self._enmascarar_singularidades(x_vals, y_vals, rango_x)
+        series = [serie("f", "funcion", None, y_vals)]
+        
+        # Una curva de aproximación y una de error por orden, sin guardar las muestras de las anteriores
+        for orden in ordenes:
+            polinomio = self.obtener_polinomio(x0, orden)
+            with np.errstate(all='ignore'):
+                y_aprox = np.real(self._evaluar(self.motor.polinomio(polinomio), x_vals))
+                errores = np.abs(y_vals - y_aprox)
+            series += [serie(f"P_{orden}", "aproximacion", orden, y_aprox),
+                       serie(f"error_{orden}", "error", orden, errores, logaritmico=True)]
+        self.metricas.incrementar("puntos_diezmados", muestras * len(series))
+        
+        return {"funcion": self.func_str, "x0": float(x0), "rango": [float(rango_x[0]), float(rango_x[1])],
+                "muestras": muestras, "metodo": metodo, "series": series}
     
-    def calcular_terminos_taylor_paralelo(self, x0: float, orden_max: int, 
-                                     num_procesos: int = None) -> Dict[int, sp.Expr]:
+    def exportar_datos_grafica(self, ruta: str, x0: float, ordenes: List[int], rango_x: Tuple[float, float],
+                               muestras: int = diezmado.MUESTRAS, puntos_serie: int = diezmado.PUNTOS_SERIE,
+                               metodo: str = "lttb") -> str:
         """
-        Calcula términos de la serie de Taylor en paralelo para mejor rendimiento.
+        Exporta las curvas diezmadas de datos_grafica a un archivo .json o .npz.
+        
+        Args:
+            ruta: Archivo de salida (.json; con cualquier otra extensión, .npz).
+            x0, ordenes, rango_x, muestras, puntos_serie, metodo: Como en datos_grafica.
+            
+        Returns:
+            La ruta del archivo escrito.
+        """
+        datos = self.datos_grafica(x0, ordenes, rango_x, muestras, puntos_serie, metodo)
+        with self.metricas.medir("render"):
+            ruta = diezmado.guardar_series(ruta, datos)
+        print(f"Datos de las gráficas exportados a {ruta}")
+        return ruta
+    
+    def animar_convergencia(self, x0: float, orden_maximo: int, rango_x: Tuple[float, float],
+                            ruta_guardar: str, paso: int = 1, fps: int = 10, puntos: int = 1000,
+                            dpi: int = 100, hilos: int = None, figura=None) -> List[str]:
+        """
+        Exporta una animación de P_n convergiendo a f a medida que crece n.
+
+        Los coeficientes se calculan una sola vez hasta orden_maximo y las sumas parciales se
+        acumulan término a término; cada fotograma solo actualiza las curvas de una misma figura.
+
+        Args:
+            x0: El punto alrededor del cual expandir.
+            orden_maximo: El orden del último fotograma.
+            rango_x: Tupla (min_x, max_x) que define el rango del eje x.
+            ruta_guardar: Archivo .gif o .mp4, patrón .png o directorio para una secuencia de PNG.
+            paso: Incremento de orden entre fotogramas consecutivos.
+            fps: Fotogramas por segundo.
+            puntos: Número de puntos de cada curva.
+            dpi: Resolución de los fotogramas.
+            hilos: Hilos de compresión de la secuencia de PNG. Si es None, usa el número de CPUs.
+            figura: Figura de matplotlib a reutilizar. Si es None, se crea una y se cierra al terminar.
+
+        Returns:
+            Lista de archivos escritos.
+        """
+        if orden_maximo < 0 or paso < 1:
+            raise ValueError("El orden máximo debe ser no negativo y el paso positivo")
+        formato_animacion(ruta_guardar)
+        self.verificar_punto(x0)
+
+        x_vals = np.linspace(rango_x[0], rango_x[1], puntos)
+        func_num = self._lambdificar(self.func)
+        with np.errstate(all='ignore'):
+            y_vals = np.real(self._enmascarar_singularidades(
+                x_vals, np.broadcast_to(self._evaluar(func_num, x_vals), x_vals.shape), rango_x))
+        polinomio = self.obtener_polinomio(x0, orden_maximo)
+
+        ordenes = list(range(0, orden_maximo + 1, paso))
+        if ordenes[-1] != orden_maximo:
+            ordenes.append(orden_maximo)
+
+        propia = figura is None
+        if propia:
+            figura = plt.figure(figsize=(10, 8))
+        else:
+            figura.clf()
+        ax, ax_error = figura.subplots(2, 1, sharex=True)
+
+        # Artistas fijos y curvas que se actualizan en cada fotograma
+        ax.plot(x_vals, y_vals, 'k-', linewidth=2, label=f'f(x) = {self.func_str}')
+        linea_aprox, = ax.plot(x_vals, np.full_like(x_vals, np.nan), '-', color='tab:blue',
+                               linewidth=1.5, label='Pₙ(x)')
+        linea_error, = ax_error.plot(x_vals, np.full_like(x_vals, np.nan), '-', color='tab:red', linewidth=1.5)
+        for eje in (ax, ax_error):
+            eje.axvline(x=x0, color='gray', linestyle='--', alpha=0.5)
+            eje.grid(True, alpha=0.3)
+
+        # Los límites se fijan con la función para que las sumas divergentes no muevan los ejes
+        finitos = y_vals[np.isfinite(y_vals)]
+        if finitos.size:
+            margen = 0.25 * max(finitos.max() - finitos.min(), 1.0)
+            ax.set_ylim(finitos.min() - margen, finitos.max() + margen)
+        ax_error.set_yscale('log')
+        ax_error.set_ylim(1e-16, 1e4)
+        ax.legend(loc='upper right')
+        ax.set_ylabel('y')
+        ax_error.set_xlabel('x')
+        ax_error.set_ylabel('Error (absoluto)')
+        ax.set_title(f'Convergencia de Taylor de f(x) = {self.func_str} alrededor de x₀ = {x0}')
+        # Texto corto para el orden: redibujar un título largo en cada fotograma es costoso
+        etiqueta = ax.text(0.02, 0.95, '', transform=ax.transAxes, va='top', fontsize=12,
+                           bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+
+        figura.tight_layout()
+        sumas = polinomio.sumas_parciales(x_vals)
+
+        def actualizar(i: int) -> tuple:
+            with self.metricas.medir("evaluate"), np.errstate(all='ignore'):
+                k, suma = next(sumas)
+                while k < ordenes[i]:
+                    k, suma = next(sumas)
+                aproximacion = np.real(suma)
+                error = np.abs(y_vals - suma)
+            linea_aprox.set_ydata(aproximacion)
+            linea_error.set_ydata(error)
+            etiqueta.set_text(f'n = {ordenes[i]}')
+            self.metricas.incrementar("fotogramas")
+            return linea_aprox, linea_error, etiqueta
+
+        try:
+            with self.metricas.medir("render"):
+                archivos = escribir_animacion(figura, actualizar, len(ordenes), ruta_guardar, fps, dpi, hilos)
+        finally:
+            if propia:
+                plt.close(figura)
+
+        print(f"Animación de {len(ordenes)} fotogramas guardada en {ruta_guardar}")
+        return archivos
+
+    def calcular_polinomio_paralelo(self, x0: float, orden_max: int, 
+                                    num_procesos: int = None) -> PolinomioTaylor:
+        """
+        Calcula los coeficientes de la serie de Taylor en paralelo para mejor rendimiento.
         
         Args:
             x0: El punto alrededor del cual expandir.
@@ -304,11 +2030,20 @@ class AproximacionTaylor:
             num_procesos: Número de procesos a usar. Si es None, usa el número de CPUs.
             
         Returns:
-            Diccionario que mapea orden a expresiones de términos.
+            El polinomio de Taylor con coeficientes exactos alrededor de x0.
         """
         if orden_max > 200:
             raise ValueError("El orden máximo es 200")
         
+        if self._usar_cauchy() or self.verificar_punto(x0) is not self.func:
+            return self.obtener_polinomio(x0, orden_max)
+        
+        # Con series formales o un ciclo de derivadas los coeficientes salen en O(n²) o en forma
+        # cerrada: no compensa repartirlos entre procesos
+        if self._coeficientes_por_recurrencia(x0, orden_max) or (
+                orden_max >= ORDEN_DETECCION_PATRONES and self.detectar_patrones()["ciclo"] is not None):
+            return self.obtener_polinomio(x0, orden_max)
+        
         if num_procesos is None:
             num_procesos = multiprocessing.cpu_count()
         
@@ -316,12 +2051,76 @@ class AproximacionTaylor:
         func_str = str(self.func)
         args_list = [(orden, x0, func_str) for orden in range(orden_max + 1)]
         
-        terminos = {}
+        if self.limites is not None:
+            return self._polinomio_paralelo_limitado(x0, args_list, num_procesos)
+        
+        coeficientes = [None] * (orden_max + 1)
         with ProcessPoolExecutor(max_workers=num_procesos) as executor:
-            for orden, termino in executor.map(_calcular_termino_paralelo, args_list):
-                terminos[orden] = termino
+            for orden, coeficiente in executor.map(_calcular_coeficiente_paralelo, args_list):
+                coeficientes[orden] = coeficiente
+                self.cache_coeficientes[(x0, orden)] = coeficiente
+        self.metodos_coeficientes[x0] = "paralelo"
+        
+        return PolinomioTaylor(coeficientes, x0)
+    
+    def _polinomio_paralelo_limitado(self, x0: float, args_list: List[tuple], 
+                                     num_procesos: int) -> PolinomioTaylor:
+        """
+        Reparte los coeficientes entre procesos con los límites activos.
+        
+        Cada proceso tiene los límites de memoria y CPU del sistema operativo, y el grupo se
+        termina al vencer el plazo (ProcessPoolExecutor no puede interrumpir una tarea en curso).
+        Los resultados se esperan a intervalos cortos para comprobar entre tanto el plazo y que
+        ningún proceso haya muerto: Pool reemplaza sin avisar un proceso que el sistema mata
+        (RLIMIT_DATA, RLIMIT_CPU) y su tarea no llega nunca.
+        
+        Raises:
+            LimiteExcedido: Con el polinomio de los coeficientes consecutivos ya recibidos.
+        """
+        limites = self.limites
+        parcial = lambda: self._polinomio_parcial(x0)
+        with multiprocessing.Pool(num_procesos, initializer=limites.aplicar_en_proceso) as grupo:
+            procesos = {proceso.pid for proceso in grupo._pool}
+            resultados = grupo.imap_unordered(_calcular_coeficiente_paralelo, args_list)
+            try:
+                for _ in args_list:
+                    while True:
+                        restante = limites.restante()
+                        try:
+                            orden, coeficiente = resultados.next(
+                                timeout=INTERVALO_SONDEO if restante is None else min(restante, INTERVALO_SONDEO))
+                            break
+                        except multiprocessing.TimeoutError:
+                            if (any(proceso.exitcode is not None for proceso in grupo._pool)
+                                    or {proceso.pid for proceso in grupo._pool} != procesos):
+                                raise LimiteExcedido(MEMORIA_AGOTADA, "Un proceso del cálculo paralelo terminó "
+                                                     "inesperadamente (límite de memoria o de CPU)", parcial())
+                            limites.comprobar(parcial)
+                    self.cache_coeficientes[(x0, orden)] = coeficiente
+                    limites.comprobar(parcial)
+            except MemoryError:
+                raise LimiteExcedido(MEMORIA_AGOTADA, "Un proceso superó el límite de memoria",
+                                     self._polinomio_parcial(x0))
+        self.metodos_coeficientes[x0] = "paralelo"
+        
+        return self._polinomio_parcial(x0)
+    
+    def calcular_terminos_taylor_paralelo(self, x0: float, orden_max: int, 
+                                     num_procesos: int = None) -> Dict[int, sp.Expr]:
+        """
+        Calcula términos de la serie de Taylor en paralelo para mejor rendimiento.
         
-        return terminos
+        Args:
+            x0: El punto alrededor del cual expandir.
+            orden_max: El orden máximo a calcular.
+            num_procesos: Número de procesos a usar. Si es None, usa el número de CPUs.
+            
+        Returns:
+            Diccionario que mapea orden a expresiones de términos.
+        """
+        polinomio = self.calcular_polinomio_paralelo(x0, orden_max, num_procesos)
+        return {orden: coeficiente * (self.x - x0)**orden
+                for orden, coeficiente in enumerate(polinomio.coeficientes)}
     
     def exportar_aproximacion(self, x0: float, orden: int, nombre_archivo: str) -> None:
         """
@@ -337,97 +2136,203 @@ class AproximacionTaylor:
         with open(nombre_archivo, 'w') as f:
             f.write(f"Función: {self.func_str}\n")
             f.write(f"Punto de expansión: x0 = {x0}\n")
-            f.write(f"Orden: {orden}\n\n")
+            f.write(f"Orden: {orden}\n")
+            f.write(f"Método de coeficientes: {self.metodo_coeficientes(x0)}\n\n")
             f.write(f"Aproximación de Taylor:\n{aprox}\n\n")
             
             # También escribir la forma simplificada si es posible
             try:
-                simplificado = sp.simplify(aprox)
+                simplificado = self.forma_simplificada(x0, orden)
                 f.write(f"Forma simplificada:\n{simplificado}\n")
             except Exception as e:
                 f.write(f"No se pudo simplificar: {e}\n")
         
         print(f"Aproximación exportada a {nombre_archivo}")
     
+    def exportar_nucleos(self, x0: float, ordenes: List[int], directorio_salida: str, 
+                         nombre: str = "taylor", formatos: Tuple[str, ...] = ("c", "numpy", "numba"), 
+                         rango_x: Tuple[float, float] = None, verificar: bool = True) -> Dict:
+        """
+        Exporta los polinomios como núcleos de evaluación en forma de Horner.
+        
+        Genera {nombre}.h y {nombre}.c, {nombre}_numpy.py y, si Numba está instalado,
+        {nombre}_numba.py. Todos los órdenes comparten una única tabla de coeficientes, y la
+        función {nombre}_todos los calcula en una sola pasada. Con verificar=True, el código
+        generado se compila o importa y se compara con el polinomio y con la función original.
+        
+        Args:
+            x0: El punto alrededor del cual expandir.
+            ordenes: Órdenes a exportar.
+            directorio_salida: Directorio donde escribir los archivos.
+            nombre: Prefijo de los archivos y de los símbolos generados (identificador válido).
+            formatos: Subconjunto de ("c", "numpy", "numba").
+            rango_x: Intervalo de verificación. Si es None, se usa x0 ± 1.
+            verificar: Si se deben comprobar la exactitud y la velocidad de los núcleos.
+            
+        Returns:
+            Diccionario con "archivos" (formato -> rutas), "omitidos" (formato -> motivo) y
+            "verificacion" (ver nucleos.verificar_nucleos).
+        """
+        if not nombre.isidentifier():
+            raise ValueError(f"Nombre de núcleo inválido: {nombre}")
+        if not ordenes:
+            raise ValueError("Debe indicar al menos un orden")
+        
+        polinomios = {orden: self.obtener_polinomio(x0, orden) for orden in sorted(set(ordenes))}
+        descripcion = f"f(x) = {self.func_str}, x0 = {x0}"
+        os.makedirs(directorio_salida, exist_ok=True)
+        
+        archivos, fuentes, omitidos = {}, {}, {}
+        if "c" in formatos:
+            cabecera, fuente = nucleos.generar_c(polinomios, nombre, descripcion)
+            ruta_cabecera = os.path.join(directorio_salida, f"{nombre}.h")
+            ruta_fuente = os.path.join(directorio_salida, f"{nombre}.c")
+            for ruta, texto in ((ruta_cabecera, cabecera), (ruta_fuente, fuente)):
+                with open(ruta, "w", encoding="utf-8") as f:
+                    f.write(texto)
+            archivos["c"] = [ruta_cabecera, ruta_fuente]
+            fuentes["c"] = ruta_fuente
+        
+        for formato, generador in (("numpy", nucleos.generar_numpy), ("numba", nucleos.generar_numba)):
+            if formato not in formatos:
+                continue
+            if formato == "numba" and not nucleos.numba_disponible():
+                omitidos["numba"] = "Numba no está instalado"
+                continue
+            ruta = os.path.join(directorio_salida, f"{nombre}_{formato}.py")
+            with open(ruta, "w", encoding="utf-8") as f:
+                f.write(generador(polinomios, nombre, descripcion))
+            archivos[formato] = [ruta]
+            fuentes[formato] = ruta
+        
+        verificacion = []
+        if verificar and fuentes:
+            if rango_x is None:
+                rango_x = (x0 - 1, x0 + 1)
+            x_vals = np.linspace(rango_x[0], rango_x[1], 10000)
+            with self.metricas.medir("evaluate"):
+                verificacion = nucleos.verificar_nucleos(fuentes, polinomios, nombre, 
+                                                         self._lambdificar(self.func), x_vals)
+        
+        return {"archivos": archivos, "omitidos": omitidos, "verificacion": verificacion}
+    
     def generar_informe(self, x0: float, ordenes: List[int], x_eval: List[float], 
-                       directorio_salida: str = "resultados_taylor") -> None:
+                       directorio_salida: str = "resultados_taylor", figura=None, 
+                       pade: Tuple[int, int] = None, tolerancia_chebyshev: float = None,
+                       formatos: Sequence[str] = informes.FORMATOS, polinomios: bool = True) -> str:
         """
         Genera un informe completo con aproximaciones y errores.
         
+        Todos los puntos y órdenes se evalúan en una sola pasada vectorizada (f una vez y las
+        sumas parciales del mayor orden para el resto), y las tablas se escriben en bloque.
+        
         Args:
             x0: El punto alrededor del cual expandir.
             ordenes: Lista de órdenes de aproximación a incluir.
             x_eval: Lista de valores x en los que evaluar la aproximación.
             directorio_salida: Directorio para guardar el informe y las gráficas.
+            figura: Figura de matplotlib a reutilizar para las gráficas. Si es None, se crean y cierran.
+            pade: Grados (L, M) de un aproximante de Padé a comparar con Taylor.
+            tolerancia_chebyshev: Tolerancia de la economización de Chebyshev a comparar con Taylor.
+            formatos: Archivos a escribir: "txt" (informe_taylor.txt), "csv" (tabla completa),
+                "json" (tabla completa y resumen) y "html" (autocontenido, con las gráficas).
+            polinomios: Si el informe de texto incluye los polinomios (truncados a
+                informes.TERMINOS_VISIBLES términos) y su forma simplificada.
+            
+        Returns:
+            La ruta del informe de texto o, si no se pidió, la del primer formato escrito.
         """
-        # Crear directorio de salida si no existe
+        formatos = informes.validar_formatos(formatos)
         os.makedirs(directorio_salida, exist_ok=True)
+        ordenes = list(dict.fromkeys(ordenes))
+        x_vals = np.asarray(x_eval, dtype=float)
+        self.metricas.incrementar("puntos_informe", x_vals.size)
         
-        # Generar archivo de informe
-        archivo_informe = os.path.join(directorio_salida, "informe_taylor.txt")
-        
-        with open(archivo_informe, 'w') as f:
-            f.write(f"INFORME DE APROXIMACIÓN DE SERIES DE TAYLOR\n")
-            f.write(f"=========================================\n\n")
-            f.write(f"Función: f(x) = {self.func_str}\n")
-            f.write(f"Punto de expansión: x0 = {x0}\n\n")
-            
-            # Para cada orden, calcular e informar la aproximación
-            for orden in ordenes:
-                tiempo_inicio = time.time()
-                aprox = self.visualizar_serie_taylor(x0, orden)
-                tiempo_fin = time.time()
-                
-                f.write(f"\nAPROXIMACIÓN DE ORDEN {orden}\n")
-                f.write(f"-------------------------\n")
-                f.write(f"Tiempo de cálculo: {tiempo_fin - tiempo_inicio:.4f} segundos\n\n")
-                
-                # Escribir la aproximación
-                f.write(f"Polinomio de Taylor:\n{aprox}\n\n")
-                
-                # Intentar simplificar
+        # Coeficientes de cada orden (los de órdenes menores salen de la caché del mayor)
+        secciones, polinomio_mayor = [], None
+        for orden in ordenes:
+            tiempo_inicio = time.perf_counter()
+            polinomio = self.obtener_polinomio(x0, orden)
+            seccion = {"orden": orden, "tiempo": time.perf_counter() - tiempo_inicio,
+                       "metodo": self.metodo_coeficientes(x0)}
+            if polinomios and "txt" in formatos:
+                seccion["polinomio"] = self._texto_polinomio(polinomio)
                 try:
-                    simplificado = sp.simplify(aprox)
-                    f.write(f"Forma simplificada:\n{simplificado}\n\n")
+                    seccion["simplificado"] = informes.truncar_texto(str(self.forma_simplificada(x0, orden)))
                 except Exception:
-                    f.write("No se pudo simplificar la expresión.\n\n")
-                
-                # Evaluar en puntos específicos
-                f.write("Evaluación en puntos específicos:\n")
-                f.write("-" * 60 + "\n")
-                f.write(f"{'x':^15} | {'Exacto':^15} | {'Aproximación':^15} | {'Error':^15}\n")
-                f.write("-" * 60 + "\n")
-                
-                # Crear funciones numéricas
-                func_num = lambdify(self.x, self.func, "numpy")
-                aprox_num = lambdify(self.x, aprox, "numpy")
-                
-                for x_val in x_eval:
-                    try:
-                        exacto = func_num(x_val)
-                        val_aprox = aprox_num(x_val)
-                        error = abs(exacto - val_aprox)
-                        
-                        f.write(f"{x_val:15.6f} | {exacto:15.6f} | {val_aprox:15.6f} | {error:15.6e}\n")
-                    except Exception as e:
-                        f.write(f"{x_val:15.6f} | {'Error':^15} | {'Error':^15} | {'Error':^15} - {str(e)}\n")
-                
-                f.write("-" * 60 + "\n\n")
-            
-            # Generar gráficas
-            f.write("\nGRÁFICAS\n")
-            f.write("--------\n")
-            f.write(f"Se han generado las siguientes gráficas en el directorio {directorio_salida}:\n")
-            
-            # Generar gráfica de aproximación
-            ruta_aprox = os.path.join(directorio_salida, "aproximacion_taylor.png")
-            self.graficar_aproximaciones(x0, ordenes, (min(x_eval), max(x_eval)), ruta_guardar=ruta_aprox)
-            f.write(f"- Aproximación: {ruta_aprox}\n")
-            
-            # Generar gráfica de error
-            ruta_error = os.path.join(directorio_salida, "error_taylor.png")
-            self.graficar_errores(x0, ordenes, (min(x_eval), max(x_eval)), ruta_guardar=ruta_error)
-            f.write(f"- Error: {ruta_error}\n")
+                    seccion["simplificado"] = "No se pudo simplificar la expresión."
+            secciones.append(seccion)
+            if polinomio_mayor is None or orden > polinomio_mayor.orden:
+                polinomio_mayor = polinomio
         
+        # Una evaluación de f y una pasada de sumas parciales para todos los órdenes
+        with np.errstate(all='ignore'):
+            exactos = np.real(np.broadcast_to(self._evaluar(self._lambdificar(self.func), x_vals), x_vals.shape))
+            pedidos, aproximaciones = set(ordenes), {}
+            with self.metricas.medir("evaluate"):
+                for k, suma in polinomio_mayor.sumas_parciales(x_vals):
+                    if k in pedidos:
+                        aproximaciones[k] = np.real(suma).astype(float)
+            aproximaciones = {orden: aproximaciones[orden] for orden in ordenes}
+            errores = {orden: np.abs(exactos - valores) for orden, valores in aproximaciones.items()}
+        
+        datos = {"funcion": self.func_str, "x0": float(x0), "ordenes": ordenes,
+                 "secciones": [{clave: seccion[clave] for clave in ("orden", "tiempo", "metodo")}
+                               for seccion in secciones],
+                 "resumen": informes.resumen_errores(x_vals, errores)}
+        
+        # Comparar el coste de Taylor con los aproximantes alternativos en el rango evaluado
+        adicional = []
+        rango_x = (float(np.nanmin(x_vals)), float(np.nanmax(x_vals)))
+        if (pade is not None or tolerancia_chebyshev is not None) and rango_x[0] < rango_x[1]:
+            adicional.append(f"\nAPROXIMANTES ALTERNATIVOS EN [{rango_x[0]}, {rango_x[1]}]\n" + "-" * 80 + "\n")
+            try:
+                filas = self.comparar_aproximantes(x0, max(ordenes), rango_x, pade, tolerancia_chebyshev)
+                adicional.append(f"{'Aproximante':<25} | {'Operaciones':>11} | {'Tiempo (µs)':>12} | {'Error máximo':>14}\n"
+                                 + "-" * 80 + "\n")
+                adicional += [f"{fila['nombre']:<25} | {fila['operaciones']:>11d} | "
+                              f"{1e6 * fila['tiempo']:>12.1f} | {fila['error_maximo']:>14.6e}\n" for fila in filas]
+                datos["aproximantes"] = [{clave: fila[clave] for clave in ("nombre", "operaciones", "tiempo", "error_maximo")}
+                                         for fila in filas]
+            except Exception as e:
+                adicional.append(f"No se pudieron calcular los aproximantes alternativos: {e}\n")
+            adicional.append("-" * 80 + "\n\n")
+        
+        # Generar gráficas de aproximación y de error
+        ruta_aprox = os.path.join(directorio_salida, "aproximacion_taylor.png")
+        self.graficar_aproximaciones(x0, ordenes, rango_x, ruta_guardar=ruta_aprox, 
+                                     figura=figura, pade=pade, tolerancia_chebyshev=tolerancia_chebyshev)
+        ruta_error = os.path.join(directorio_salida, "error_taylor.png")
+        self.graficar_errores(x0, ordenes, rango_x, ruta_guardar=ruta_error, 
+                              figura=figura, pade=pade, tolerancia_chebyshev=tolerancia_chebyshev)
+        adicional.append(f"\nGRÁFICAS\n--------\nSe han generado las siguientes gráficas en el directorio "
+                         f"{directorio_salida}:\n- Aproximación: {ruta_aprox}\n- Error: {ruta_error}\n")
+        datos["graficas"] = {"aproximacion": ruta_aprox, "error": ruta_error}
+        
+        # Escribir las tablas en bloque en cada formato
+        tabla = (x_vals, exactos, aproximaciones, errores)
+        rutas = {formato: os.path.join(directorio_salida, f"informe_taylor.{formato}") for formato in formatos}
+        with self.metricas.medir("render"):
+            if "csv" in rutas:
+                informes.escribir_csv(rutas["csv"], *tabla)
+            if "json" in rutas:
+                informes.escribir_json(rutas["json"], datos, *tabla)
+            if "txt" in rutas:
+                informes.escribir_texto(rutas["txt"], datos, secciones, *tabla, adicional="".join(adicional))
+            if "html" in rutas:
+                enlaces = {f"Tabla {formato.upper()}": os.path.basename(ruta) 
+                           for formato, ruta in rutas.items() if formato != "html"}
+                informes.escribir_html(rutas["html"], datos, *tabla, imagenes=(ruta_aprox, ruta_error), 
+                                       enlaces=enlaces)
+        
+        archivo_informe = rutas.get("txt", rutas[formatos[0]])
         print(f"Informe generado en {archivo_informe}")
         return archivo_informe
+    
+    def _texto_polinomio(self, polinomio: PolinomioTaylor) -> str:
+        """Texto del polinomio con a lo sumo informes.TERMINOS_VISIBLES términos."""
+        if polinomio.orden < informes.TERMINOS_VISIBLES:
+            return informes.truncar_texto(str(polinomio.a_expresion(self.x)))
+        visibles = polinomio.truncar(informes.TERMINOS_VISIBLES - 1).a_expresion(self.x)
+        omitidos = polinomio.orden + 1 - informes.TERMINOS_VISIBLES
+        return informes.truncar_texto(f"{visibles} + ... ({omitidos} términos más)")
@@ -0,0 +1,324 @@
+"""
+Módulo del Proceso de Cálculo
+
+Este módulo ejecuta el trabajo simbólico de la interfaz gráfica en un proceso hijo con una
+instancia persistente de AproximacionTaylor. El proceso principal solo recibe arreglos de
+coeficientes, datos muestreados de NumPy y textos, de modo que el bucle de eventos de Tk
+nunca queda bloqueado por SymPy (que retiene el GIL).
+"""
+
+import os
+import sqlite3
+import multiprocessing
+import numpy as np
+from typing import Callable, Dict, List, Tuple
+
+# Memoria estimada máxima de las derivadas en caché del proceso hijo, que vive toda la sesión
+MEMORIA_CACHE_DERIVADAS = 256 * 1024**2
+# Almacén de resultados de la interfaz gráfica, compartido entre sesiones (solo si se activa)
+RUTA_ALMACEN = os.path.join(os.path.expanduser("~"), ".taylorviz", "resultados.db")
+
+
+class _ServidorCalculo:
+    """
+    Operaciones disponibles en el proceso hijo. Cada método público es una operación.
+    """
+
+    def __init__(self, almacen: str = None):
+        """
+        Inicializa la instancia persistente de AproximacionTaylor y la figura Agg de informes.
+
+        Args:
+            almacen: Ruta del almacén de resultados a usar, o None para no guardar nada.
+        """
+        from taylor_series import AproximacionTaylor
+        from multivariable import AproximacionMultivariable
+        from lote import ReservaFiguras
+
+        self.taylor = AproximacionTaylor(memoria_cache=MEMORIA_CACHE_DERIVADAS, cache_compartida=True)
+        self.taylor_multivariable = AproximacionMultivariable(memoria_cache=MEMORIA_CACHE_DERIVADAS,
+                                                              cache_compartida=True)
+        self.reserva = ReservaFiguras()
+        if almacen:
+            try:
+                self.taylor.establecer_almacen(almacen)
+            except (OSError, sqlite3.Error):
+                # Al reiniciar tras un fallo: sin almacén (base de datos bloqueada...) se calcula todo
+                pass
+
+    def _registrar(self, x0: float, ordenes: List[int], rango_x: Tuple[float, float] = None,
+                   puntos: List[float] = None, artefactos: Dict[str, str] = None) -> None:
+        """Registra en el almacén los errores, evaluaciones y archivos de los órdenes calculados."""
+        if self.taylor.almacen is None:
+            return
+        for orden in ordenes:
+            try:
+                self.taylor.registrar_resultados(x0, orden, rango_x, puntos, artefactos)
+            except (ValueError, sqlite3.Error):
+                pass
+
+    def _estado(self) -> Dict:
+        """Métricas que acompañan a cada respuesta."""
+        return {"metricas": self.taylor.metricas.formatear(), "entradas_cache": len(self.taylor.cache),
+                "memoria_cache": self.taylor.memoria_cache_derivadas(),
+                "metricas_multivariable": self.taylor_multivariable.metricas.formatear(),
+                "entradas_multivariable": len(self.taylor_multivariable.cache)}
+
+    def graficas(self, func_str: str, x0: float, ordenes: List[int], rango_x: Tuple[float, float],
+                 puntos: int, vista_previa: bool) -> Dict:
+        """
+        Calcula las curvas de la función y de cada aproximación en el rango indicado.
+
+        Returns:
+            Diccionario con los arreglos muestreados, los coeficientes por orden y los textos del polinomio.
+        """
+        # Volver a establecer la misma función conserva sus derivadas y coeficientes en caché
+        self.taylor.establecer_funcion(func_str)
+        # Un x0 singular se notifica una vez, antes de derivar, en lugar de fallar orden a orden
+        self.taylor.verificar_punto(x0)
+
+        metricas = self.taylor.metricas
+        x = self.taylor.x
+        x_vals = np.linspace(rango_x[0], rango_x[1], puntos)
+        func_num = self.taylor._lambdificar(self.taylor.func)
+
+        resultado = {"func_str": func_str, "x": x_vals, "y": None, "y0": np.nan, "aproximaciones": {},
+                     "coeficientes": {}, "fallos": {}, "info_recentrado": {}}
+        try:
+            with metricas.medir("evaluate"), np.errstate(all='ignore'):
+                resultado["y"] = np.array(self.taylor._enmascarar_singularidades(
+                    x_vals, np.broadcast_to(func_num(x_vals), x_vals.shape), rango_x))
+                resultado["y0"] = complex(func_num(x0)).real
+        except Exception as e:
+            resultado["fallos"]["f"] = str(e)
+
+        polinomio_principal = None
+        for orden in ordenes:
+            try:
+                if vista_previa:
+                    polinomio, info = self.taylor.recentrar_polinomio(x0, orden)
+                    resultado["info_recentrado"][orden] = info
+                else:
+                    polinomio = self.taylor.obtener_polinomio(x0, orden)
+                with metricas.medir("evaluate"), np.errstate(all='ignore'):
+                    resultado["aproximaciones"][orden] = polinomio.evaluar(x_vals)
+                resultado["coeficientes"][orden] = polinomio.a_flotantes().coeficientes
+                if polinomio_principal is None:
+                    polinomio_principal = polinomio
+            except Exception as e:
+                resultado["fallos"][orden] = str(e)
+
+        if not vista_previa:
+            self._registrar(x0, list(resultado["aproximaciones"]), tuple(rango_x))
+
+        # Textos del polinomio del orden principal (el primero de la lista)
+        if polinomio_principal is not None:
+            resultado["polinomio"] = str(polinomio_principal.a_expresion(x))
+            resultado["metodo_coeficientes"] = self.taylor.metodo_coeficientes(polinomio_principal.centro)
+            with metricas.medir("simplify"):
+                resultado["simplificado"] = str(polinomio_principal.a_expresion(x, expandir=True))
+
+        resultado.update(self._estado())
+        return resultado
+
+    def evaluar(self, x0: float, orden: int, puntos: List[float]) -> Dict:
+        """
+        Evalúa la función y la aproximación en puntos concretos.
+
+        Returns:
+            Diccionario con "filas": tuplas (punto, exacto, aproximación, error, mensaje de error).
+        """
+        polinomio = self.taylor.obtener_polinomio(x0, orden)
+        func_num = self.taylor._lambdificar(self.taylor.func)
+
+        filas = []
+        for punto in puntos:
+            try:
+                with self.taylor.metricas.medir("evaluate"):
+                    exacto = float(func_num(punto))
+                    val_aprox = float(polinomio.evaluar(punto))
+                filas.append((punto, exacto, val_aprox, abs(exacto - val_aprox), None))
+            except Exception as e:
+                filas.append((punto, None, None, None, str(e)))
+
+        resultado = {"filas": filas}
+        resultado.update(self._estado())
+        return resultado
+
+    def informe(self, x0: float, ordenes: List[int], puntos: List[float], directorio_salida: str) -> Dict:
+        """Genera el informe completo usando la figura Agg reutilizable del proceso hijo."""
+        archivo = self.taylor.generar_informe(x0, ordenes, puntos, directorio_salida,
+                                              figura=self.reserva.obtener())
+        self._registrar(x0, ordenes, puntos=puntos, artefactos={"informe": archivo})
+        resultado = {"archivo": archivo}
+        resultado.update(self._estado())
+        return resultado
+
+    def datos_grafica(self, x0: float, ordenes: List[int], rango_x: Tuple[float, float], ruta: str,
+                      metodo: str) -> Dict:
+        """Exporta las curvas diezmadas de la función actual a un archivo .json o .npz."""
+        archivo = self.taylor.exportar_datos_grafica(ruta, x0, ordenes, rango_x, metodo=metodo)
+        resultado = {"archivo": archivo}
+        resultado.update(self._estado())
+        return resultado
+
+    def plano_complejo(self, func_str: str, x0: float, orden: int, resolucion: Tuple[int, int],
+                       modo: str) -> Dict:
+        """
+        Calcula la imagen del plano complejo alrededor del disco de convergencia.
+
+        Returns:
+            Diccionario con "imagen" (RGB uint8 o log10 del error en float32), "extension"
+            (re_min, re_max, im_min, im_max) y "disco".
+        """
+        self.taylor.establecer_funcion(func_str)
+        disco = self.taylor.disco_convergencia(x0, min(max(orden, 10), 20))
+        rango_re, rango_im = self.taylor._rangos_plano(disco)
+        imagen = self.taylor.plano_complejo(x0, orden, rango_re, rango_im, resolucion, modo)
+
+        resultado = {"imagen": imagen, "disco": disco, "modo": modo,
+                     "extension": (rango_re[0], rango_re[1], rango_im[0], rango_im[1])}
+        resultado.update(self._estado())
+        return resultado
+
+    def multivariable(self, func_str: str, variables: List[str], punto: Tuple[float, ...], orden: int,
+                      rangos: Tuple[Tuple[float, float], Tuple[float, float]] = None,
+                      resolucion: Tuple[int, int] = (300, 300)) -> Dict:
+        """
+        Calcula el desarrollo de una función de varias variables y su superficie de error.
+
+        Returns:
+            Diccionario con la superficie (ver AproximacionMultivariable.superficie_error, o None
+            con una sola variable), el texto del polinomio, el gradiente, la hessiana y las variables.
+        """
+        aprox = self.taylor_multivariable
+        aprox.establecer_funcion(func_str, variables or None)
+        polinomio = aprox.obtener_polinomio(punto, orden)
+
+        resultado = {"func_str": func_str, "variables": [str(v) for v in aprox.variables],
+                     "polinomio": str(polinomio.a_expresion()), "terminos": len(polinomio),
+                     "gradiente": polinomio.gradiente() if orden >= 1 else None,
+                     "hessiana": polinomio.hessiana() if orden >= 2 else None, "superficie": None}
+        if aprox.dimension >= 2:
+            resultado["superficie"] = aprox.superficie_error(punto, orden, rangos, resolucion)
+        resultado.update(self._estado())
+        return resultado
+
+    def establecer_almacen(self, ruta: str = None) -> Dict:
+        """Conecta el almacén de resultados de la ruta indicada, o lo desconecta con None."""
+        self.taylor.establecer_almacen(ruta)
+        return self._estado()
+
+    def reiniciar_metricas(self) -> Dict:
+        """Pone a cero las métricas del proceso hijo."""
+        self.taylor.reiniciar_metricas()
+        self.taylor_multivariable.metricas.reiniciar()
+        return self._estado()
+
+
+def _bucle_trabajador(conexion, almacen: str = None) -> None:
+    """Bucle del proceso hijo: recibe (id, operación, argumentos) y responde (id, éxito, resultado)."""
+    import matplotlib
+    matplotlib.use("Agg")
+
+    servidor = _ServidorCalculo(almacen)
+    while True:
+        try:
+            mensaje = conexion.recv()
+        except EOFError:
+            break
+        if mensaje is None:
+            break
+
+        identificador, operacion, args = mensaje
+        try:
+            conexion.send((identificador, True, getattr(servidor, operacion)(*args)))
+        except Exception as e:
+            conexion.send((identificador, False, str(e)))
+
+
+class ProcesoCalculo:
+    """
+    Proceso hijo persistente que atiende solicitudes de cálculo en orden de llegada.
+
+    Las respuestas se recogen sin bloquear con procesar_respuestas(), pensado para llamarse
+    periódicamente desde el bucle de eventos de la interfaz (por ejemplo, con root.after).
+    """
+
+    def __init__(self):
+        """Inicia el proceso hijo, sin almacén de resultados (ver establecer_almacen)."""
+        self._siguiente_id = 0
+        self._pendientes = {}
+        self._almacen = None
+        self._iniciar()
+
+    def _iniciar(self) -> None:
+        # "spawn" evita heredar el estado de Tk del proceso principal
+        contexto = multiprocessing.get_context("spawn")
+        self._conexion, conexion_hija = contexto.Pipe()
+        self._proceso = contexto.Process(target=_bucle_trabajador, args=(conexion_hija, self._almacen), daemon=True)
+        self._proceso.start()
+        conexion_hija.close()
+
+    @property
+    def ocupado(self) -> bool:
+        """Indica si hay solicitudes sin respuesta."""
+        return bool(self._pendientes)
+
+    def solicitar(self, operacion: str, args: tuple, al_terminar: Callable, al_fallar: Callable) -> None:
+        """
+        Envía una solicitud al proceso hijo.
+
+        Args:
+            operacion: Nombre de la operación (método de _ServidorCalculo).
+            args: Argumentos de la operación.
+            al_terminar: Función llamada con el resultado cuando la operación termina.
+            al_fallar: Función llamada con el mensaje de error si la operación falla.
+        """
+        identificador = self._siguiente_id
+        self._siguiente_id += 1
+        self._pendientes[identificador] = (al_terminar, al_fallar)
+        self._conexion.send((identificador, operacion, args))
+
+    def establecer_almacen(self, ruta: str, al_terminar: Callable, al_fallar: Callable) -> None:
+        """
+        Conecta (o, con None, desconecta) el almacén de resultados del proceso hijo. La elección
+        se conserva si el proceso se reinicia.
+
+        Args:
+            ruta: Ruta del almacén SQLite, por ejemplo RUTA_ALMACEN, o None.
+            al_terminar: Función llamada con las métricas cuando el almacén queda conectado.
+            al_fallar: Función llamada con el mensaje de error si no se puede abrir.
+        """
+        def conectado(estado):
+            self._almacen = ruta
+            al_terminar(estado)
+
+        self.solicitar("establecer_almacen", (ruta,), conectado, al_fallar)
+
+    def procesar_respuestas(self) -> None:
+        """Entrega las respuestas disponibles a sus funciones de retorno sin bloquear."""
+        try:
+            while self._conexion.poll():
+                identificador, exito, resultado = self._conexion.recv()
+                al_terminar, al_fallar = self._pendientes.pop(identificador)
+                (al_terminar if exito else al_fallar)(resultado)
+        except (EOFError, OSError):
+            pass
+
+        if not self._proceso.is_alive():
+            # El proceso hijo terminó inesperadamente: fallar lo pendiente y reiniciarlo
+            pendientes, self._pendientes = self._pendientes, {}
+            for _, al_fallar in pendientes.values():
+                al_fallar("El proceso de cálculo terminó inesperadamente")
+            self._iniciar()
+
+    def cerrar(self) -> None:
+        """Detiene el proceso hijo."""
+        try:
+            self._conexion.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self._proceso.join(timeout=1)
+        if self._proceso.is_alive():
+            self._proceso.terminate()